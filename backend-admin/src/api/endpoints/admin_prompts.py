@@ -2,6 +2,7 @@
 from bson import ObjectId
 from fastapi import APIRouter, Query, HTTPException
 from src.core.deps import CURRENT_ADMIN_DEP, MAIN_DB_DEP
+from src.core.pagination import after_filter, encode_cursor
 
 router = APIRouter(prefix="/admin/prompts", tags=["admin"])
 
@@ -27,6 +28,63 @@ def _raw_tools_metrics(prompt_data: dict) -> tuple[int, list[str]]:
     ]
     return len(raw_tools), raw_tools
 
+
+def _summarize_prompt(p: dict) -> None:
+    """Fills the list fields of a prompt log in place."""
+    if "_id" in p:
+        p["id"] = str(p["_id"])
+        p["_id"] = str(p["_id"])
+
+    # Campos basicos para o frontend
+    p["model"] = p.get("model", "unknown")
+    p["requested_model"] = p.get("requested_model", p["model"])
+    p["resolved_model"] = p.get("resolved_model", p["model"])
+    p["resolved_provider"] = p.get("resolved_provider")
+    p["usage_cost"] = p.get("usage_cost")
+    p["tokens_input"] = p.get("tokens_input", 0)
+    p["tokens_output"] = p.get("tokens_output", 0)
+    p["duration_ms"] = p.get("duration_ms", 0)
+    p["status"] = p.get("status", "success")
+    p["prompt_name"] = p.get("prompt_name", "N/A")
+
+    if "prompt" in p and isinstance(p["prompt"], dict):
+        prompt_data = p["prompt"]
+        prompt_text = prompt_data.get("prompt", "")
+        p["prompt_format"] = _detect_prompt_format(prompt_text)
+        raw_count, raw_tools = _raw_tools_metrics(prompt_data)
+        p["raw_tools_called_count"] = raw_count
+        p["raw_tools_called"] = raw_tools
+
+        if "messages" in prompt_data:
+            messages = prompt_data["messages"]
+            p["messages_count"] = len(messages) if isinstance(messages, list) else 0
+            p["messages_preview"] = (
+                str(messages[0].get("content", ""))[:200] + "..."
+                if messages and isinstance(messages, list) and isinstance(messages[0], dict)
+                else ""
+            )
+        else:
+            p["messages_count"] = 1
+            p["messages_preview"] = str(prompt_data.get("input", "N/A"))[:200]
+
+
+def _find_prompts(
+    collection, query: dict, page_size: int, cursor: str | None, page: int
+) -> tuple[list[dict], str | None]:
+    """One page of prompt logs, newest first, and the cursor of the next one."""
+    order = [("timestamp", -1), ("_id", -1)]
+    if cursor:
+        after = after_filter(cursor, "timestamp", -1)
+        found = collection.find({"$and": [query, after]}).sort(order)
+    else:
+        found = collection.find(query).sort(order).skip((page - 1) * page_size)
+    prompts = list(found.limit(page_size + 1))
+    if len(prompts) <= page_size:
+        return prompts, None
+    prompts = prompts[:page_size]
+    return prompts, encode_cursor(prompts[-1].get("timestamp"), prompts[-1].get("_id"))
+
+
 @router.get("/")
 def list_prompts(
     _admin: CURRENT_ADMIN_DEP,
@@ -34,66 +92,26 @@ def list_prompts(
     user_id: str | None = Query(None, alias="user_id"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=50),
+    cursor: str | None = Query(None, description="next_cursor da página anterior"),
+    include_total: bool = Query(False),
 ) -> dict:
-    """Lista prompts logados."""
-    query = {}
+    """Lista prompts logados (paginação por página ou cursor)."""
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    query: dict = {}
     if user_id:
         query = {"user_email": user_id}
 
-    skip = (page - 1) * page_size
-
-    prompts_cursor = (
-        db.prompt_logs.find(query)
-        .sort("timestamp", -1)
-        .skip(skip)
-        .limit(page_size)
-    )
-    prompts = list(prompts_cursor)
-
+    prompts, next_cursor = _find_prompts(db.prompt_logs, query, page_size, cursor, page)
+    total = db.prompt_logs.count_documents(query) if include_total or not cursor else None
     for p in prompts:
-        if "_id" in p:
-            p["id"] = str(p["_id"])
-            p["_id"] = str(p["_id"])
-
-        # Campos basicos para o frontend
-        p["model"] = p.get("model", "unknown")
-        p["requested_model"] = p.get("requested_model", p["model"])
-        p["resolved_model"] = p.get("resolved_model", p["model"])
-        p["resolved_provider"] = p.get("resolved_provider")
-        p["usage_cost"] = p.get("usage_cost")
-        p["tokens_input"] = p.get("tokens_input", 0)
-        p["tokens_output"] = p.get("tokens_output", 0)
-        p["duration_ms"] = p.get("duration_ms", 0)
-        p["status"] = p.get("status", "success")
-        p["prompt_name"] = p.get("prompt_name", "N/A")
-
-        if "prompt" in p and isinstance(p["prompt"], dict):
-            prompt_data = p["prompt"]
-            prompt_text = prompt_data.get("prompt", "")
-            p["prompt_format"] = _detect_prompt_format(prompt_text)
-            raw_count, raw_tools = _raw_tools_metrics(prompt_data)
-            p["raw_tools_called_count"] = raw_count
-            p["raw_tools_called"] = raw_tools
-
-            if "messages" in prompt_data:
-                messages = prompt_data["messages"]
-                p["messages_count"] = len(messages) if isinstance(messages, list) else 0
-                p["messages_preview"] = (
-                    str(messages[0].get("content", ""))[:200] + "..."
-                    if messages and isinstance(messages, list) and isinstance(messages[0], dict)
-                    else ""
-                )
-            else:
-                p["messages_count"] = 1
-                p["messages_preview"] = str(prompt_data.get("input", "N/A"))[:200]
-
-    total = db.prompt_logs.count_documents(query)
+        _summarize_prompt(p)
 
     return {
         "prompts": prompts,
         "total": total,
         "page": page,
-        "total_pages": (total + page_size - 1) // page_size,
+        "total_pages": (total + page_size - 1) // page_size if total is not None else None,
+        "next_cursor": next_cursor,
     }
 
 @router.get("/{prompt_id}")
@@ -7,6 +7,40 @@ from src.core.deps import CURRENT_ADMIN_DEP, MAIN_DB_DEP
 
 router = APIRouter(prefix="/admin/tokens", tags=["admin"])
 
+# Latency histogram buckets of the usage rollups written by the backend
+# (UsageRollupRepository): upper bounds in ms, the last bucket is open.
+LATENCY_BUCKETS_MS = (250, 500, 1000, 2000, 3000, 5000, 8000, 13000, 21000, 34000, 60000, 120000)
+LATENCY_KEYS = [str(bound) for bound in LATENCY_BUCKETS_MS] + ["inf"]
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+def _since_day(days: int) -> datetime:
+    """Start (UTC midnight, naive like the rollup dates) of the window."""
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    return datetime(since.year, since.month, since.day)
+
+
+def _latency_sums() -> dict[str, Any]:
+    return {f"latency_{key}": {"$sum": f"$latency_hist.{key}"} for key in LATENCY_KEYS}
+
+
+def _latency_percentiles(item: dict[str, Any]) -> dict[str, int | None]:
+    """Pops the merged histogram off an aggregate and estimates percentiles."""
+    counts = [int(item.pop(f"latency_{key}", 0) or 0) for key in LATENCY_KEYS]
+    total = sum(counts)
+    result: dict[str, int | None] = {}
+    for percentile in LATENCY_PERCENTILES:
+        result[f"p{percentile}_ms"] = None
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if total and seen >= total * percentile / 100:
+                result[f"p{percentile}_ms"] = LATENCY_BUCKETS_MS[
+                    min(index, len(LATENCY_BUCKETS_MS) - 1)
+                ]
+                break
+    return result
+
 def _format_token_item(item: Any) -> dict[str, Any]:
     """Helper to format a single token usage item for the summary response."""
     user_email = str(item.get("_id", "unknown"))
@@ -15,6 +49,7 @@ def _format_token_item(item: Any) -> dict[str, Any]:
     resolved_provider = item.get("resolved_provider")
     total_input = int(item.get("total_input", 0))
     total_output = int(item.get("total_output", 0))
+    latency = _latency_percentiles(item)
     cost_usd = float(item.get("total_cost", 0.0))
     last_activity_val = item.get("last_activity")
     last_activity_str = ""
@@ -25,12 +60,16 @@ def _format_token_item(item: Any) -> dict[str, Any]:
         "user_email": user_email,
         "total_input": total_input,
         "total_output": total_output,
+        "total_cache_read": int(item.get("total_cache_read", 0)),
+        "total_cache_write": int(item.get("total_cache_write", 0)),
         "message_count": int(item.get("message_count", 0)),
+        "tool_call_count": int(item.get("tool_call_count", 0)),
         "requested_model": requested_model,
         "resolved_model": resolved_model,
         "resolved_provider": resolved_provider,
         "cost_usd": cost_usd,
-        "last_activity": last_activity_str
+        "last_activity": last_activity_str,
+        **latency,
     }
 
 @router.get("/summary")
@@ -40,25 +79,28 @@ def get_token_summary(
     days: int = Query(30, ge=1, le=365),
 ) -> dict:
     """Consumo de tokens por usuário."""
-    since = datetime.now(timezone.utc) - timedelta(days=days)
-
     pipeline = [
-        {"$match": {"timestamp": {"$gte": since}}},
+        {"$match": {"date": {"$gte": _since_day(days)}}},
+        {"$sort": {"date": 1}},
         {"$group": {
             "_id": "$user_email",
             "total_input": {"$sum": "$tokens_input"},
             "total_output": {"$sum": "$tokens_output"},
-            "message_count": {"$sum": 1},
+            "total_cache_read": {"$sum": "$cache_read_tokens"},
+            "total_cache_write": {"$sum": "$cache_write_tokens"},
+            "message_count": {"$sum": "$request_count"},
+            "tool_call_count": {"$sum": "$tool_call_count"},
             "requested_model": {"$last": "$requested_model"},
             "resolved_model": {"$last": "$resolved_model"},
             "resolved_provider": {"$last": "$resolved_provider"},
-            "total_cost": {"$sum": {"$ifNull": ["$usage_cost", 0]}},
-            "last_activity": {"$max": "$timestamp"}
+            "total_cost": {"$sum": "$cost"},
+            "last_activity": {"$max": "$last_activity"},
+            **_latency_sums(),
         }},
         {"$sort": {"total_input": -1}}
     ]
 
-    results = list(db.prompt_logs.aggregate(pipeline))
+    results = list(db.usage_rollups.aggregate(pipeline))
     final_results: Any = []
     for item in results:
         final_results.append(_format_token_item(item))  # type: ignore
@@ -77,36 +119,32 @@ def get_token_timeseries(
     user_email: str | None = Query(None),
 ) -> dict:
     """Dados temporais de consumo de tokens para o gráfico."""
-    since = datetime.now(timezone.utc) - timedelta(days=days)
-
-    match_query = {"timestamp": {"$gte": since}}
+    match_query: dict[str, Any] = {"date": {"$gte": _since_day(days)}}
     if user_email:
         match_query["user_email"] = user_email
 
     pipeline = [
         {"$match": match_query},
-        {"$project": {
-            "date": {"$dateToString": {"format": "%Y-%m-%d", "date": "$timestamp"}},
-            "tokens_input": 1,
-            "tokens_output": 1
-        }},
         {"$group": {
             "_id": "$date",
             "tokens_input": {"$sum": "$tokens_input"},
             "tokens_output": {"$sum": "$tokens_output"},
-            "count": {"$sum": 1}
-        }},
-        {"$project": {
-            "_id": 0,
-            "date": "$_id",
-            "tokens_input": 1,
-            "tokens_output": 1,
-            "count": 1
+            "cache_read_tokens": {"$sum": "$cache_read_tokens"},
+            "cache_write_tokens": {"$sum": "$cache_write_tokens"},
+            "cost_usd": {"$sum": "$cost"},
+            "count": {"$sum": "$request_count"},
+            "tool_call_count": {"$sum": "$tool_call_count"},
+            **_latency_sums(),
         }},
-        {"$sort": {"date": 1}}
+        {"$sort": {"_id": 1}}
     ]
 
-    results = list(db.prompt_logs.aggregate(pipeline))
+    results = []
+    for item in db.usage_rollups.aggregate(pipeline):
+        day = item.pop("_id")
+        item["date"] = day.strftime("%Y-%m-%d") if isinstance(day, datetime) else str(day)
+        item.update(_latency_percentiles(item))
+        results.append(item)
     return {
         "data": results,
         "days": days,
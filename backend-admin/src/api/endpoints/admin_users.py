@@ -2,6 +2,7 @@
 from datetime import datetime
 from fastapi import APIRouter, Query, HTTPException
 from src.core.deps import CURRENT_ADMIN_DEP, MAIN_DB_DEP
+from src.core.pagination import after_filter, encode_cursor
 
 router = APIRouter(prefix="/admin/users", tags=["admin"])
 DEMO_READ_ONLY_DETAIL = "demo_read_only"
@@ -26,39 +27,56 @@ def _published_demo_episodes(db, email: str) -> list[dict]:
 
 @router.get("/")
 def list_users(
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     _admin: CURRENT_ADMIN_DEP,
     db: MAIN_DB_DEP,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     search: str | None = None,
+    cursor: str | None = Query(None, description="next_cursor da página anterior"),
+    include_total: bool = Query(False),
 ) -> dict:
-    """Lista usuários com paginação e busca."""
-    skip = (page - 1) * page_size
-    query = {}
+    """Lista usuários com paginação (página ou cursor) e busca."""
+    query: dict = {}
 
     if search:
         query = {"email": {"$regex": search, "$options": "i"}}
 
     # Buscar usuários (excluir campos sensíveis)
     exclude_fields = {
-        "_id": 0,
         "password_hash": 0,
         "hevy_api_key": 0,
         "photo_base64": 0
     }
-    users = list(
-        db.users.find(query, exclude_fields)
-        .skip(skip)
-        .limit(page_size)
-    )
+    if cursor:
+        users = list(
+            db.users.find({"$and": [query, after_filter(cursor, None, 1)]}, exclude_fields)
+            .sort("_id", 1)
+            .limit(page_size + 1)
+        )
+        has_more = len(users) > page_size
+        users = users[:page_size]
+        total = db.users.count_documents(query) if include_total else None
+    else:
+        users = list(
+            db.users.find(query, exclude_fields)
+            .sort("_id", 1)
+            .skip((page - 1) * page_size)
+            .limit(page_size)
+        )
+        total = db.users.count_documents(query)
+        has_more = page * page_size < total
 
-    total = db.users.count_documents(query)
+    next_cursor = encode_cursor(users[-1]["_id"]) if has_more and users else None
+    for user in users:
+        user.pop("_id", None)
 
     return {
         "users": users,
         "total": total,
         "page": page,
-        "total_pages": (total + page_size - 1) // page_size,
+        "total_pages": (total + page_size - 1) // page_size if total is not None else None,
+        "next_cursor": next_cursor,
     }
 
 @router.get("/{email}")
@@ -70,6 +88,17 @@ def get_user_details(email: str, _admin: CURRENT_ADMIN_DEP, db: MAIN_DB_DEP) ->
 
     # Contar mensagens
     message_count = db.message_store.count_documents({"SessionId": email})
+    # Old messages are moved to compressed chunks by the chat archival job.
+    archived = list(
+        db.message_archive.aggregate(
+            [
+                {"$match": {"SessionId": email}},
+                {"$group": {"_id": None, "count": {"$sum": "$count"}}},
+            ]
+        )
+    )
+    if archived:
+        message_count += archived[0]["count"]
 
     # Contar treinos
     workout_count = db.workout_logs.count_documents({"user_email": email})
@@ -135,7 +164,7 @@ def update_user(
 ) -> dict:
     """Permite admin editar perfil de usuário."""
     # Campos protegidos
-    protected_fields = {"password_hash", "email"}
+    protected_fields = {"password_hash", "email", "profile_version"}
     for field in protected_fields:
         if field in updates:
             raise HTTPException(
@@ -156,7 +185,10 @@ def update_user(
         if "stripe_subscription_id" not in updates:
             updates["stripe_subscription_id"] = None
 
-    result = db.users.update_one({"email": email}, {"$set": updates})
+    # O backend cacheia perfis por processo e detecta escritas pela versão
+    result = db.users.update_one(
+        {"email": email}, {"$set": updates, "$inc": {"profile_version": 1}}
+    )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -180,6 +212,7 @@ def delete_user(email: str, admin: CURRENT_ADMIN_DEP, db: MAIN_DB_DEP) -> dict:
     db.users.delete_one({"email": email})
     db.trainer_profiles.delete_many({"email": email})
     db.message_store.delete_many({"SessionId": email})
+    db.message_archive.delete_many({"SessionId": email})
     db.workout_logs.delete_many({"user_email": email})
     db.nutrition_logs.delete_many({"user_email": email})
     db.weight_logs.delete_many({"user_email": email})
@@ -0,0 +1,40 @@
+"""
+Cursor pagination helpers for the admin listings.
+
+Same token format as the main backend (``src/utils/pagination.py``): the
+BSON-encoded sort key and ``_id`` of the last item served, URL-safe base64.
+"""
+import base64
+from typing import Any
+
+import bson
+from bson.errors import BSONError
+from fastapi import HTTPException
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encodes keyset values as a URL-safe token."""
+    raw = bson.encode({"k": list(values)})
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decodes a token with ``size`` values; 400 when it is not one of ours."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = bson.decode(raw)["k"]
+    except (BSONError, KeyError, TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    return values
+
+
+def after_filter(cursor: str, sort_field: str | None, direction: int) -> dict:
+    """Query for the documents after ``cursor`` in ``(sort_field, _id)`` order."""
+    op = "$lt" if direction < 0 else "$gt"
+    if sort_field is None:
+        (doc_id,) = decode_cursor(cursor, 1)
+        return {"_id": {op: doc_id}}
+    value, doc_id = decode_cursor(cursor, 2)
+    return {"$or": [{sort_field: {op: value}}, {sort_field: value, "_id": {op: doc_id}}]}
@@ -0,0 +1,203 @@
+"""
+Precomputed admin dashboard statistics.
+
+The overview and quality metrics used to count and aggregate the main
+collections on every page load. A background job now computes them into
+the admin database (``stats_snapshots``) and the endpoints serve the stored
+snapshot together with the time it was computed. Totals come from
+``estimated_document_count`` (collection metadata) and per-user counters
+kept by the main backend instead of scans.
+"""
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+
+STATS_REFRESH_SECONDS = int(os.getenv("ADMIN_STATS_REFRESH_SECONDS", "300"))
+
+OVERVIEW = "overview"
+QUALITY_METRICS = "quality_metrics"
+
+
+def _active_users_since(db: Database[Any], since: datetime) -> int:
+    """Users with LLM usage since ``since``, from the daily usage rollups."""
+    day_start = datetime(since.year, since.month, since.day)
+    return len(
+        db.usage_rollups.distinct(
+            "user_email",
+            {"date": {"$gte": day_start}, "last_activity": {"$gte": since}},
+        )
+    )
+
+
+def _stored_message_count(db: Database[Any]) -> int:
+    """Messages in ``message_store`` plus those moved to ``message_archive``."""
+    archived = list(
+        db.message_archive.aggregate(
+            [{"$group": {"_id": None, "count": {"$sum": "$count"}}}]
+        )
+    )
+    hot = db.message_store.estimated_document_count()
+    return hot + (archived[0]["count"] if archived else 0)
+
+
+def compute_overview(db: Database[Any]) -> dict[str, Any]:
+    """KPIs of the main database."""
+    now = datetime.now(timezone.utc)
+    return {
+        "total_users": db.users.estimated_document_count(),
+        "total_admins": db.users.count_documents({"role": "admin"}),
+        "total_messages": _stored_message_count(db),
+        "total_workouts": db.workout_logs.estimated_document_count(),
+        "total_nutrition_logs": db.nutrition_logs.estimated_document_count(),
+        # Counter bumped by the backend on every chat turn.
+        "active_users_total": db.users.count_documents({"total_messages_sent": {"$gt": 0}}),
+        "active_users_7d": _active_users_since(db, now - timedelta(days=7)),
+        "active_users_24h": _active_users_since(db, now - timedelta(days=1)),
+    }
+
+
+def compute_quality_metrics(db: Database[Any]) -> dict[str, Any]:
+    """Engagement and distribution metrics of the main database."""
+    total_users = db.users.estimated_document_count()
+    users_with_workouts = len(db.workout_logs.distinct("user_email"))
+    users_with_nutrition = len(db.nutrition_logs.distinct("user_email"))
+    return {
+        "avg_messages_per_user": _calculate_avg_messages(db),
+        "trainer_distribution": _calculate_trainer_distribution(db),
+        "goal_distribution": _calculate_goal_distribution(db),
+        "workout_engagement_rate": round(
+            (users_with_workouts / total_users * 100) if total_users > 0 else 0, 2
+        ),
+        "nutrition_engagement_rate": round(
+            (users_with_nutrition / total_users * 100) if total_users > 0 else 0, 2
+        ),
+        "users_with_workouts": users_with_workouts,
+        "users_with_nutrition": users_with_nutrition,
+    }
+
+
+_COMPUTE = {OVERVIEW: compute_overview, QUALITY_METRICS: compute_quality_metrics}
+
+
+def refresh_snapshot(main_db: Database[Any], admin_db: Database[Any], name: str) -> dict:
+    """Recomputes one snapshot, stores it and returns the stored document."""
+    snapshot = {"data": _COMPUTE[name](main_db), "computed_at": datetime.now(timezone.utc)}
+    admin_db.stats_snapshots.replace_one({"_id": name}, snapshot, upsert=True)
+    return {"_id": name, **snapshot}
+
+
+def refresh_stale_snapshots(
+    main_db: Database[Any], admin_db: Database[Any], max_age: float = STATS_REFRESH_SECONDS
+) -> list[str]:
+    """
+    Refreshes the snapshots older than ``max_age`` seconds.
+
+    Every admin worker runs the job; the age check keeps them from
+    recomputing a snapshot another worker just stored.
+    """
+    refreshed = []
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age)
+    for name in _COMPUTE:
+        stored = admin_db.stats_snapshots.find_one({"_id": name}, {"computed_at": 1})
+        if stored and _aware(stored["computed_at"]) > cutoff:
+            continue
+        refresh_snapshot(main_db, admin_db, name)
+        refreshed.append(name)
+    return refreshed
+
+
+def get_snapshot(main_db: Database[Any], admin_db: Database[Any], name: str) -> dict[str, Any]:
+    """
+    Snapshot data with its freshness (``computed_at``, ``age_seconds``).
+
+    Computed on the spot only when no snapshot exists yet.
+    """
+    stored = admin_db.stats_snapshots.find_one({"_id": name})
+    if stored is None:
+        stored = refresh_snapshot(main_db, admin_db, name)
+    computed_at = _aware(stored["computed_at"])
+    age = (datetime.now(timezone.utc) - computed_at).total_seconds()
+    return {
+        **stored["data"],
+        "timestamp": computed_at.isoformat(),
+        "computed_at": computed_at.isoformat(),
+        "age_seconds": max(0, int(age)),
+    }
+
+
+class StatsSnapshotRefresher:
+    """Daemon thread refreshing the snapshots every ``interval`` seconds."""
+
+    def __init__(self, main_db: Database[Any], admin_db: Database[Any],
+                 interval: float = STATS_REFRESH_SECONDS):
+        self.main_db = main_db
+        self.admin_db = admin_db
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Starts the refresh loop (first refresh right away)."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="admin-stats-refresher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stops the refresh loop."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                refresh_stale_snapshots(self.main_db, self.admin_db, self.interval)
+            except PyMongoError as e:
+                print(f"⚠️  Admin stats refresh failed: {e}")
+            self._stop.wait(self.interval)
+
+
+def _aware(value: datetime) -> datetime:
+    # Mongo returns naive UTC datetimes.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _calculate_avg_messages(db) -> float:
+    """Average number of stored messages per user who has chatted."""
+    try:
+        chatting = db.users.count_documents({"total_messages_sent": {"$gt": 0}})
+        if not chatting:
+            return 0.0
+        return round(_stored_message_count(db) / chatting, 2)
+    except PyMongoError:
+        return 0.0
+
+
+def _calculate_trainer_distribution(db) -> dict:
+    """Calculate distribution of selected trainer types among users."""
+    try:
+        pipeline = [{"$group": {"_id": "$trainer_type", "count": {"$sum": 1}}}]
+        result = list(db.trainer_profiles.aggregate(pipeline))
+        return {
+            str(t["_id"]): t["count"] for t in result if t["_id"] is not None
+        }
+    except PyMongoError:
+        return {}
+
+
+def _calculate_goal_distribution(db) -> dict:
+    """Calculate distribution of user goals (e.g., weight loss, muscle gain)."""
+    try:
+        pipeline = [{"$group": {"_id": "$goal_type", "count": {"$sum": 1}}}]
+        result = list(db.users.aggregate(pipeline))
+        return {
+            str(g["_id"]): g["count"] for g in result if g["_id"] is not None
+        }
+    except PyMongoError:
+        return {}
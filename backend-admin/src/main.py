@@ -13,7 +13,8 @@ from pydantic import BaseModel
 from pymongo.errors import PyMongoError
 
 # Project imports
-from src.core.deps import get_admin_db
+from src.core.deps import get_admin_db, get_main_db
+from src.core.stats_snapshot import StatsSnapshotRefresher
 from src.api.endpoints import (
     admin_analytics,
     admin_users,
@@ -119,6 +120,18 @@ def startup_event():
         # on startup if the admin initialization fails.
         print(f"⚠️  Admin collection init warning: {e}")
 
+stats_refresher = StatsSnapshotRefresher(get_main_db(), get_admin_db())
+
+@app.on_event("startup")
+def start_stats_refresher():
+    """Keep the dashboard stats snapshots fresh in the background"""
+    stats_refresher.start()
+
+@app.on_event("shutdown")
+def stop_stats_refresher():
+    """Stop the dashboard stats refresh loop"""
+    stats_refresher.stop()
+
 async def _verify_admin_access(request: Request) -> Optional[JSONResponse]:
     """Helper to verify admin access and return error response if invalid."""
     # 1. Check Shield Key and Secret Configuration
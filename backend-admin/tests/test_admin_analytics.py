@@ -0,0 +1,89 @@
+"""Tests for the precomputed admin dashboard statistics."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.api.endpoints.admin_analytics import get_overview, get_quality_metrics
+from src.core.stats_snapshot import OVERVIEW, compute_overview, refresh_stale_snapshots
+
+
+def _main_db():
+    db = SimpleNamespace(
+        users=MagicMock(),
+        message_store=MagicMock(),
+        message_archive=MagicMock(),
+        workout_logs=MagicMock(),
+        nutrition_logs=MagicMock(),
+        usage_rollups=MagicMock(),
+        trainer_profiles=MagicMock(),
+    )
+    db.users.estimated_document_count.return_value = 40
+    db.users.count_documents.return_value = 10
+    db.message_store.estimated_document_count.return_value = 500
+    db.message_archive.aggregate.return_value = [{"_id": None, "count": 25}]
+    db.workout_logs.estimated_document_count.return_value = 70
+    db.nutrition_logs.estimated_document_count.return_value = 90
+    db.usage_rollups.distinct.return_value = ["a@x.com", "b@x.com"]
+    db.workout_logs.distinct.return_value = ["a@x.com"] * 8
+    db.nutrition_logs.distinct.return_value = ["a@x.com"] * 4
+    db.trainer_profiles.aggregate.return_value = [{"_id": "atlas", "count": 3}]
+    db.users.aggregate.return_value = [{"_id": "lose", "count": 5}, {"_id": None, "count": 1}]
+    return db
+
+
+def test_compute_overview_uses_estimated_counts():
+    db = _main_db()
+
+    overview = compute_overview(db)
+
+    assert overview["total_users"] == 40
+    # Archived messages count too, or the total drops on every archive run.
+    assert overview["total_messages"] == 525
+    assert overview["active_users_7d"] == 2
+    db.message_store.count_documents.assert_not_called()
+    db.message_store.distinct.assert_not_called()
+    db.message_store.aggregate.assert_not_called()
+
+
+def test_endpoints_serve_stored_snapshot_with_freshness():
+    db = _main_db()
+    admin_db = SimpleNamespace(stats_snapshots=MagicMock())
+    computed_at = datetime.now(timezone.utc) - timedelta(minutes=2)
+    admin_db.stats_snapshots.find_one.return_value = {
+        "_id": OVERVIEW,
+        "data": {"total_users": 7},
+        "computed_at": computed_at.replace(tzinfo=None),
+    }
+
+    resp = get_overview({"email": "admin@test.com"}, db, admin_db)
+
+    assert resp["total_users"] == 7
+    assert resp["computed_at"] == computed_at.isoformat()
+    assert 110 <= resp["age_seconds"] <= 130
+    db.users.estimated_document_count.assert_not_called()
+
+
+def test_missing_snapshot_is_computed_and_stored():
+    db = _main_db()
+    admin_db = SimpleNamespace(stats_snapshots=MagicMock())
+    admin_db.stats_snapshots.find_one.return_value = None
+
+    resp = get_quality_metrics({"email": "admin@test.com"}, db, admin_db)
+
+    assert resp["avg_messages_per_user"] == 52.5
+    assert resp["workout_engagement_rate"] == 20.0
+    assert resp["goal_distribution"] == {"lose": 5}
+    assert resp["age_seconds"] == 0
+    admin_db.stats_snapshots.replace_one.assert_called_once()
+
+
+def test_refresh_skips_snapshots_another_worker_just_stored():
+    db = _main_db()
+    admin_db = SimpleNamespace(stats_snapshots=MagicMock())
+    fresh = {"computed_at": datetime.now(timezone.utc).replace(tzinfo=None)}
+    stale = {"computed_at": fresh["computed_at"] - timedelta(hours=1)}
+    admin_db.stats_snapshots.find_one.side_effect = [fresh, stale]
+
+    assert refresh_stale_snapshots(db, admin_db, max_age=300) == ["quality_metrics"]
+    admin_db.stats_snapshots.replace_one.assert_called_once()
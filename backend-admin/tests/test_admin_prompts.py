@@ -31,7 +31,7 @@ def test_list_prompts_adds_prompt_format_and_raw_tools_fields():
     db.prompt_logs.find.return_value = _build_cursor(docs)
     db.prompt_logs.count_documents.return_value = 1
 
-    resp = list_prompts({"email": "admin@test.com"}, db, None, 1, 20)
+    resp = list_prompts({"email": "admin@test.com"}, db, None, 1, 20, None, False)
 
     prompt = resp["prompts"][0]
     assert prompt["prompt_format"] == "markdown"
@@ -54,3 +54,23 @@ def test_get_prompt_details_adds_prompt_format_and_raw_tools_fields():
     assert resp["prompt_format"] == "markdown"
     assert resp["raw_tools_called_count"] == 1
     assert resp["raw_tools_called"] == ["get_workouts_raw"]
+
+
+def test_list_prompts_cursor_mode_links_pages_without_counting():
+    docs = [
+        {"_id": f"id{i}", "timestamp": f"2026-04-0{3 - i}T10:00:00", "prompt": {}}
+        for i in range(3)
+    ]
+    db = SimpleNamespace(prompt_logs=MagicMock())
+    db.prompt_logs.find.return_value = _build_cursor(docs)
+
+    first = list_prompts({"email": "admin@test.com"}, db, None, 1, 2, None, False)
+    second = list_prompts(
+        {"email": "admin@test.com"}, db, None, 1, 2, first["next_cursor"], False
+    )
+
+    assert [p["id"] for p in first["prompts"]] == ["id0", "id1"]
+    assert first["total"] == db.prompt_logs.count_documents.return_value
+    assert "$and" in db.prompt_logs.find.call_args.args[0]
+    assert second["total"] is None
+    db.prompt_logs.count_documents.assert_called_once()
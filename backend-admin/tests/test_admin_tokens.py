@@ -0,0 +1,54 @@
+"""Tests for admin token analytics read from the usage rollups."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.api.endpoints.admin_tokens import get_token_summary, get_token_timeseries
+
+
+def test_token_summary_reads_rollups_with_latency_percentiles():
+    db = SimpleNamespace(usage_rollups=MagicMock(), prompt_logs=MagicMock())
+    db.usage_rollups.aggregate.return_value = [
+        {
+            "_id": "user@test.com",
+            "total_input": 1200,
+            "total_output": 300,
+            "total_cache_read": 800,
+            "message_count": 10,
+            "tool_call_count": 4,
+            "total_cost": 0.25,
+            "last_activity": datetime(2026, 4, 3, 10, 0),
+            "latency_1000": 5,
+            "latency_3000": 4,
+            "latency_inf": 1,
+        }
+    ]
+
+    resp = get_token_summary({"email": "admin@test.com"}, db, 30)
+
+    db.prompt_logs.aggregate.assert_not_called()
+    pipeline = db.usage_rollups.aggregate.call_args[0][0]
+    assert "date" in pipeline[0]["$match"]
+    item = resp["data"][0]
+    assert item["total_input"] == 1200
+    assert item["total_cache_read"] == 800
+    assert item["tool_call_count"] == 4
+    assert (item["p50_ms"], item["p90_ms"], item["p99_ms"]) == (1000, 3000, 120000)
+    assert not any(key.startswith("latency_") for key in item)
+
+
+def test_token_timeseries_formats_rollup_days():
+    db = SimpleNamespace(usage_rollups=MagicMock())
+    db.usage_rollups.aggregate.return_value = [
+        {"_id": datetime(2026, 4, 2), "tokens_input": 10, "tokens_output": 5, "count": 1},
+        {"_id": datetime(2026, 4, 3), "tokens_input": 20, "tokens_output": 8, "count": 2,
+         "latency_500": 2},
+    ]
+
+    resp = get_token_timeseries({"email": "admin@test.com"}, db, 7, "user@test.com")
+
+    assert db.usage_rollups.aggregate.call_args[0][0][0]["$match"]["user_email"] == "user@test.com"
+    assert [point["date"] for point in resp["data"]] == ["2026-04-02", "2026-04-03"]
+    assert resp["data"][0]["p50_ms"] is None
+    assert resp["data"][1]["p50_ms"] == 500
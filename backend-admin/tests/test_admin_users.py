@@ -4,6 +4,7 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
+from bson import ObjectId
 from fastapi import HTTPException
 
 from src.api.endpoints.admin_users import (
@@ -22,7 +23,7 @@ def _build_cursor(items: list[dict]):
     cursor = MagicMock()
     cursor.skip.return_value = cursor
     cursor.limit.return_value = items
-    cursor.sort.return_value = items
+    cursor.sort.return_value = cursor
     cursor.__iter__.return_value = iter(items)
     return cursor
 
@@ -34,15 +35,45 @@ def test_list_users_keeps_demo_flag_visible():
     db.users.find.return_value = _build_cursor([user_doc])
     db.users.count_documents.return_value = 1
 
-    response = list_users({"email": "admin@test.com"}, db, 1, 20, None)
+    response = list_users({"email": "admin@test.com"}, db, 1, 20, None, None, False)
 
     assert response["users"][0]["is_demo"] is True
 
 
+def test_list_users_cursor_mode_reads_after_last_id():
+    first_page = [{"_id": ObjectId(), "email": f"u{i}@test.com"} for i in range(2)]
+    db = SimpleNamespace(users=MagicMock())
+    db.users.find.return_value = _build_cursor(first_page)
+    db.users.count_documents.return_value = 5
+    last_id = first_page[-1]["_id"]
+
+    first = list_users({"email": "admin@test.com"}, db, 1, 2, None, None, False)
+
+    assert "_id" not in first["users"][0]
+    second_page = [{"_id": ObjectId(), "email": "u2@test.com"}]
+    db.users.find.return_value = _build_cursor(second_page)
+    db.users.count_documents.reset_mock()
+
+    second = list_users(
+        {"email": "admin@test.com"}, db, 1, 2, None, first["next_cursor"], False
+    )
+
+    query = db.users.find.call_args.args[0]
+    assert query == {"$and": [{}, {"_id": {"$gt": last_id}}]}
+    assert second["next_cursor"] is None
+    assert second["total"] is None
+    db.users.count_documents.assert_not_called()
+
+    with pytest.raises(HTTPException) as exc:
+        list_users({"email": "admin@test.com"}, db, 1, 2, None, "garbage", False)
+    assert exc.value.status_code == 400
+
+
 def test_get_user_details_includes_demo_snapshot_and_episodes():
     db = SimpleNamespace(
         users=MagicMock(),
         message_store=MagicMock(),
+        message_archive=MagicMock(),
         workout_logs=MagicMock(),
         nutrition_logs=MagicMock(),
         demo_snapshots=MagicMock(),
@@ -51,6 +82,7 @@ def test_get_user_details_includes_demo_snapshot_and_episodes():
     )
     db.users.find_one.return_value = {"email": "demo@test.com", "is_demo": True}
     db.message_store.count_documents.return_value = 5
+    db.message_archive.aggregate.return_value = [{"_id": None, "count": 40}]
     db.workout_logs.count_documents.return_value = 2
     db.nutrition_logs.count_documents.return_value = 3
     db.demo_snapshots.find_one.return_value = {"snapshot_id": "snap-1", "demo_email": "demo@test.com"}
@@ -61,6 +93,7 @@ def test_get_user_details_includes_demo_snapshot_and_episodes():
 
     response = get_user_details("demo@test.com", {"email": "admin@test.com"}, db)
 
+    assert response["stats"]["message_count"] == 45
     assert response["demo_snapshot"]["snapshot_id"] == "snap-1"
     assert response["demo_episodes"][0]["episode_id"] == "ep-1"
 
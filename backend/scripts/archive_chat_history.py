@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Archive old chat history into compressed per-session chunks.
+
+Moves message_store messages older than --days into message_archive, where
+each chunk holds up to --chunk-size messages as one compressed document.
+History reads fall through to the archive, so nothing changes for users.
+Chunks are written before the messages are deleted and keyed by their
+first message, so an interrupted run can simply be started again. Demo
+sessions stay in message_store, where the admin prunes their messages.
+
+Usage:
+    python scripts/archive_chat_history.py
+    python scripts/archive_chat_history.py --yes --days 365 --chunk-size 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+from pymongo import MongoClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scripts.utils import confirm_execution  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.repositories.chat_archive_repository import (  # noqa: E402
+    ChatArchiveRepository,
+)
+
+
+def _report(session_id: str, totals: dict) -> None:
+    print(
+        f"   {totals['sessions']:>6} sessions | {totals['messages']:>9} messages | "
+        f"{totals['messages_per_second']:>8} msg/s | last: {session_id}",
+        flush=True,
+    )
+
+
+def run(days: int, chunk_size: int) -> dict:
+    """Archives the messages older than ``days`` and returns the totals."""
+    client = MongoClient(settings.MONGO_URI)
+    db = client[settings.DB_NAME]
+    repository = ChatArchiveRepository(db)
+    repository.ensure_indexes()
+
+    older_than = datetime.now(timezone.utc) - timedelta(days=days)
+    totals = repository.archive_older_than(
+        db.message_store, older_than, chunk_size=chunk_size, progress=_report
+    )
+    if totals["raw_bytes"]:
+        totals["compression_ratio"] = round(totals["raw_bytes"] / totals["stored_bytes"], 2)
+    return totals
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=settings.CHAT_ARCHIVE_AFTER_DAYS,
+        help="Archive messages older than this many days",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.CHAT_ARCHIVE_CHUNK_MESSAGES,
+        help="Messages per archive chunk",
+    )
+    parser.add_argument(
+        "--yes", action="store_true", help="Skip the confirmation (scheduled runs)"
+    )
+    args = parser.parse_args()
+
+    if not args.yes:
+        confirm_execution(
+            "Archive chat history",
+            {"older_than_days": args.days, "chunk_size": args.chunk_size},
+        )
+
+    totals = run(args.days, args.chunk_size)
+    print("\n✅ Chat history archived!")
+    for key, value in totals.items():
+        print(f"   {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Backfill the normalized chat message schema in message_store.
+
+Adds top-level ``sender``, ``is_public`` and ``ts`` to messages written
+before them and stores the History of public messages as a plain document,
+so history reads filter on the (SessionId, is_public, _id) index without
+decoding anything in Python. Only documents without ``is_public`` are
+touched, so running it again (e.g. after importing a demo snapshot) is
+harmless.
+
+Usage:
+    python scripts/backfill_message_schema.py
+    python scripts/backfill_message_schema.py --yes --batch-size 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from pymongo import MongoClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scripts.utils import confirm_execution  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.repositories.chat_repository import ChatRepository  # noqa: E402
+
+
+def run(batch_size: int) -> dict:
+    """Backfills the messages and returns the counters."""
+    client = MongoClient(settings.MONGO_URI)
+    repository = ChatRepository(client[settings.DB_NAME])
+
+    started = time.perf_counter()
+    counters = repository.backfill_normalized_schema(batch_size=batch_size)
+    counters["seconds"] = round(time.perf_counter() - started, 1)
+    return counters
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Documents per bulk write"
+    )
+    parser.add_argument(
+        "--yes", action="store_true", help="Skip the confirmation (scheduled runs)"
+    )
+    args = parser.parse_args()
+
+    if not args.yes:
+        confirm_execution("Backfill message schema", {"collection": "message_store"})
+
+    counters = run(args.batch_size)
+    print("\n✅ Message schema backfilled!")
+    for key, value in counters.items():
+        print(f"   {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Hevy workout import against a local stub Hevy server.
+
+A throwaway HTTP server serves synthetic ``/v1/workouts`` pages and the
+import writes into a scratch database (dropped afterwards). Each scenario
+reports wall time, workouts/sec and the number of Mongo commands issued,
+which should stay flat as the history grows.
+
+Usage:
+    python scripts/bench_hevy_import.py
+    python scripts/bench_hevy_import.py --workouts 1000 --existing 2000 --yes
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from pymongo import MongoClient, monitoring
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scripts.utils import confirm_execution  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.repositories.workout_repository import WorkoutRepository  # noqa: E402
+from src.services.hevy_client import HevyClient, HevyClientOptions  # noqa: E402
+from src.services.hevy_service import HevyService  # noqa: E402
+
+USER = "bench-hevy@example.com"
+FIRST_DAY = datetime(2020, 1, 1, 7, 0, tzinfo=timezone.utc)
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Counts Mongo commands sent while a scenario runs."""
+
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        self.count += 1
+
+    def succeeded(self, event):
+        return None
+
+    def failed(self, event):
+        return None
+
+
+def _workout(index: int) -> dict:
+    start = FIRST_DAY + timedelta(days=index)
+    return {
+        "id": f"bench-{index}",
+        "title": "Bench Upper" if index % 2 else "Bench Lower",
+        "start_time": start.isoformat().replace("+00:00", "Z"),
+        "end_time": (start + timedelta(minutes=55)).isoformat().replace("+00:00", "Z"),
+        "exercises": [
+            {
+                "title": title,
+                "sets": [{"reps": 8, "weight_kg": 40 + index % 30} for _ in range(3)],
+            }
+            for title in ("Squat", "Bench Press", "Barbell Row")
+        ],
+    }
+
+
+def start_stub_server(workouts: list[dict]) -> ThreadingHTTPServer:
+    """Serves ``workouts`` newest first, paginated like the Hevy API."""
+    ordered = list(reversed(workouts))
+
+    class Handler(BaseHTTPRequestHandler):
+        """Stub ``GET /v1/workouts``."""
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            """Returns one page of workouts."""
+            query = parse_qs(urlparse(self.path).query)
+            page = int(query.get("page", ["1"])[0])
+            size = int(query.get("pageSize", ["10"])[0])
+            body = json.dumps(
+                {"page": page, "workouts": ordered[(page - 1) * size : page * size]}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):  # silence per-request logging
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Runs the scenarios and returns their measurements."""
+    counter = CommandCounter()
+    client = MongoClient(settings.MONGO_URI, event_listeners=[counter])
+    client.drop_database(args.db)
+    repository = WorkoutRepository(client[args.db])
+
+    # Pre-existing history, imported from somewhere else (no external ids).
+    if args.existing:
+        history = [
+            HevyService(repository).transform_to_workout_log(_workout(-i - 1), USER)
+            for i in range(args.existing)
+        ]
+        repository.collection.insert_many([log.model_dump() for log in history])
+
+    server = start_stub_server([_workout(i) for i in range(args.workouts)])
+    # The stub has no rate limit; keep the client's out of the measurement.
+    service = HevyService(
+        repository,
+        http_client=HevyClient(HevyClientOptions(rate_per_second=1e6, burst=1000)),
+    )
+    service.BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    results = {}
+    try:
+        for label, mode in (
+            ("first import", "skip_duplicates"),
+            ("re-import (all duplicates)", "skip_duplicates"),
+            ("re-import (overwrite)", "overwrite"),
+        ):
+            counter.count = 0
+            started = time.perf_counter()
+            counts = asyncio.run(service.import_workouts(USER, "bench-key", mode=mode))
+            elapsed = time.perf_counter() - started
+            results[label] = (
+                f"{counts} in {elapsed:.2f}s "
+                f"({args.workouts / elapsed:.0f} workouts/sec, {counter.count} Mongo commands)"
+            )
+    finally:
+        server.shutdown()
+        client.drop_database(args.db)
+    return results
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--workouts", type=int, default=500, help="Workouts served by the stub")
+    parser.add_argument(
+        "--existing", type=int, default=1000, help="Logs already stored for the user"
+    )
+    parser.add_argument(
+        "--db", default=f"{settings.DB_NAME}_bench", help="Scratch database (dropped)"
+    )
+    parser.add_argument("--yes", action="store_true", help="Skip the confirmation")
+    args = parser.parse_args()
+
+    if not args.yes:
+        confirm_execution(
+            "Benchmark Hevy import",
+            {"scratch_db": args.db, "workouts": args.workouts, "existing": args.existing},
+        )
+
+    results = run(args)
+    print("\n✅ Hevy import benchmark complete!")
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ def count_and_delete_mongo(db, collection_name, query, dry_run=False):
     collection = db.database[collection_name]
 
     # SAFETY CHECK: Ensure query contains the user's email email if the collection expects it
-    if collection_name == "message_store":
+    if collection_name in ("message_store", "message_archive"):
         if "SessionId" not in query:
             print(
                 f"❌ SAFETY ERROR: Query for {collection_name} does not contain SessionId!"
@@ -122,6 +122,7 @@ def main():
         ("weight_logs", {"user_email": email}),
         ("invites", {"email": email}),
         ("message_store", {"SessionId": email}),
+        ("message_archive", {"SessionId": email}),
         ("token_blocklist", {"sub": email}),
     ]
 
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Rebuild the materialized workout statistics from the workout logs.
+
+Needed after backfills or imports that write ``workout_logs`` directly.
+Reads also rebuild a user's document when its workout count is off, so
+this job only moves that cost out of the first dashboard request.
+
+Usage:
+    python scripts/rebuild_workout_stats.py
+    python scripts/rebuild_workout_stats.py --email user@example.com
+    python scripts/rebuild_workout_stats.py --yes
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from pymongo import MongoClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scripts.utils import confirm_execution  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.repositories.workout_stats_repository import (  # noqa: E402
+    WorkoutStatsRepository,
+)
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Rebuilds the requested users and returns the counters."""
+    client = MongoClient(settings.MONGO_URI)
+    db = client[settings.DB_NAME]
+    repository = WorkoutStatsRepository(db)
+
+    emails = [args.email] if args.email else sorted(db.workout_logs.distinct("user_email"))
+    counters = {"users": 0, "workouts": 0}
+    started = time.perf_counter()
+
+    for email in emails:
+        stats = repository.rebuild(email)
+        counters["users"] += 1
+        counters["workouts"] += stats["total_workouts"]
+        if counters["users"] % 100 == 0:
+            elapsed = time.perf_counter() - started
+            print(f"  {counters['users']} users ({counters['users'] / elapsed:.1f} users/sec)")
+
+    elapsed = time.perf_counter() - started
+    counters["users_per_sec"] = round(counters["users"] / elapsed, 1) if elapsed else 0.0
+    return counters
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--email", help="Rebuild a single user")
+    parser.add_argument(
+        "--yes", action="store_true", help="Skip the confirmation (scheduled runs)"
+    )
+    args = parser.parse_args()
+
+    if not args.yes:
+        confirm_execution(
+            "Rebuild workout stats", {"email": args.email or "all users"}
+        )
+
+    counters = run(args)
+    print("\n✅ Workout stats rebuild complete!")
+    for key, value in counters.items():
+        print(f"   {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
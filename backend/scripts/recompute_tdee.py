@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Recompute Adaptive TDEE state (and coaching check-ins) for every user.
+
+Users are streamed in email order. Each chunk is loaded with a single
+aggregation (profile, weight/nutrition logs, plan and stored state), the
+TDEE pipeline runs in a process pool, and the results are written back
+with one ``bulk_write`` per collection. Progress is checkpointed after each
+chunk so an interrupted run resumes where it stopped.
+
+Usage:
+    python scripts/recompute_tdee.py
+    python scripts/recompute_tdee.py --workers 4 --chunk-size 500 --yes
+    python scripts/recompute_tdee.py --restart
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+from pymongo import MongoClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scripts.tdee_batch_lib import (  # noqa: E402
+    CHECKPOINT_COLLECTION,
+    build_chunk_pipeline,
+    build_write_operations,
+    bulk_write_tolerant,
+    checkpoint_id,
+    recompute_chunk,
+)
+from scripts.utils import confirm_execution  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.services.adaptive_tdee import AdaptiveTDEEService  # noqa: E402
+
+
+def _split(docs: list[dict], parts: int) -> list[list[dict]]:
+    size = max(1, -(-len(docs) // parts))
+    return [docs[i : i + size] for i in range(0, len(docs), size)]
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Runs the batch and returns the final counters."""
+    client = MongoClient(settings.MONGO_URI)
+    db = client[settings.DB_NAME]
+    checkpoints = db[CHECKPOINT_COLLECTION]
+    job_id = checkpoint_id(args.lookback_weeks)
+
+    checkpoint = None if args.restart else checkpoints.find_one({"_id": job_id})
+    if checkpoint and not checkpoint.get("completed"):
+        after_email = checkpoint.get("last_email")
+        counters = dict(checkpoint.get("counters") or {})
+        print(f"↩️  Resuming after {after_email}")
+    else:
+        after_email = None
+        counters = {}
+    for key in (
+        "users", "rebuilt", "fresh", "errors", "coaching", "states_written", "write_errors"
+    ):
+        counters.setdefault(key, 0)
+
+    today = date.today()
+    started = time.perf_counter()
+    processed_this_run = 0
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        while True:
+            docs = list(
+                db.users.aggregate(
+                    build_chunk_pipeline(
+                        after_email, args.chunk_size, args.lookback_weeks, today
+                    ),
+                    allowDiskUse=True,
+                )
+            )
+            if not docs:
+                break
+
+            outcomes = []
+            for part in pool.map(
+                recompute_chunk,
+                _split(docs, args.workers),
+                [args.lookback_weeks] * args.workers,
+            ):
+                outcomes.extend(part)
+
+            user_ops, state_ops = build_write_operations(outcomes, args.lookback_weeks)
+            if not args.dry_run:
+                for collection, ops in ((db.users, user_ops), (db.tdee_states, state_ops)):
+                    if not ops:
+                        continue
+                    written, write_errors = bulk_write_tolerant(collection, ops)
+                    if collection is db.tdee_states:
+                        counters["states_written"] += written
+                    counters["write_errors"] += len(write_errors)
+                    for error in write_errors:
+                        print(
+                            f"  ⚠️  {collection.name} op {error.get('index')}: "
+                            f"{error.get('errmsg')}"
+                        )
+
+            for outcome in outcomes:
+                if outcome["status"] == "error":
+                    counters["errors"] += 1
+                    print(f"  ⚠️  {outcome['email']}: {outcome['error']}")
+                else:
+                    counters[outcome["status"]] += 1
+            counters["users"] += len(docs)
+            counters["coaching"] += len(user_ops)
+            processed_this_run += len(docs)
+            after_email = docs[-1]["email"]
+
+            if not args.dry_run:
+                checkpoints.update_one(
+                    {"_id": job_id},
+                    {
+                        "$set": {
+                            "last_email": after_email,
+                            "counters": counters,
+                            "completed": False,
+                            "updated_at": datetime.now(),
+                        }
+                    },
+                    upsert=True,
+                )
+
+            elapsed = time.perf_counter() - started
+            print(
+                f"  {counters['users']} users "
+                f"({processed_this_run / elapsed:.1f} users/sec), last={after_email}"
+            )
+
+    if not args.dry_run:
+        checkpoints.update_one(
+            {"_id": job_id},
+            {"$set": {"completed": True, "updated_at": datetime.now()}},
+            upsert=True,
+        )
+
+    elapsed = time.perf_counter() - started
+    counters["users_per_sec"] = round(processed_this_run / elapsed, 1) if elapsed else 0.0
+    return counters
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--lookback-weeks",
+        type=int,
+        default=AdaptiveTDEEService.DEFAULT_LOOKBACK_WEEKS,
+    )
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--restart", action="store_true", help="Ignore the checkpoint and start over"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Compute without writing anything"
+    )
+    parser.add_argument(
+        "--yes", action="store_true", help="Skip the confirmation (scheduled runs)"
+    )
+    args = parser.parse_args()
+
+    if not args.yes:
+        confirm_execution(
+            "Recompute Adaptive TDEE",
+            {
+                "lookback_weeks": args.lookback_weeks,
+                "workers": args.workers,
+                "chunk_size": args.chunk_size,
+                "dry_run": args.dry_run,
+            },
+        )
+
+    counters = run(args)
+    print("\n✅ TDEE recompute complete!")
+    for key, value in counters.items():
+        print(f"   {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,8 +23,10 @@ SAFE_HOSTS = {"localhost", "127.0.0.1", "mongo", "qdrant", "0.0.0.0"}
 
 MONGO_COLLECTIONS = [
     ("message_store", "SessionId"),
+    ("message_archive", "SessionId"),
     ("trainer_profiles", "user_email"),
     ("workout_logs", "user_email"),
+    ("workout_stats", "user_email"),
     ("nutrition_logs", "user_email"),
     ("weight_logs", "user_email"),
     ("events", "user_email"),
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Seed the daily usage rollups from the stored prompt logs.
+
+Run once after deploying the rollups so the admin token analytics show the
+days still covered by the prompt logs. Days that already have a rollup are
+left untouched, so running it again is harmless.
+
+Usage:
+    python scripts/seed_usage_rollups.py
+    python scripts/seed_usage_rollups.py --yes
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from pymongo import MongoClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scripts.utils import confirm_execution  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.repositories.usage_rollup_repository import (  # noqa: E402
+    UsageRollupRepository,
+)
+
+
+def run() -> dict:
+    """Seeds the rollups and returns the counters."""
+    client = MongoClient(settings.MONGO_URI)
+    db = client[settings.DB_NAME]
+    repository = UsageRollupRepository(db)
+    repository.ensure_indexes()
+
+    started = time.perf_counter()
+    logs = repository.seed_from_logs(db.prompt_logs)
+    return {
+        "prompt_logs": logs,
+        "seconds": round(time.perf_counter() - started, 1),
+    }
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--yes", action="store_true", help="Skip the confirmation (scheduled runs)"
+    )
+    args = parser.parse_args()
+
+    if not args.yes:
+        confirm_execution("Seed usage rollups", {"source": "prompt_logs"})
+
+    counters = run()
+    print("\n✅ Usage rollups seeded!")
+    for key, value in counters.items():
+        print(f"   {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Helpers for recomputing Adaptive TDEE state for every user in batch."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from pydantic import ValidationError
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from src.api.models.nutrition_log import NutritionLog
+from src.api.models.plan import UserPlan
+from src.api.models.user_profile import UserProfile
+from src.api.models.weight_log import WeightLog
+from src.core.profile_cache import versioned
+from src.repositories.tdee_state_repository import TdeeStateRepository
+from src.services.adaptive_tdee import AdaptiveTDEEService
+
+# AdaptiveTDEEService falls back to the most recent logs when the lookback
+# window is empty; it asks for this many.
+RECENT_LOGS_LIMIT = 28
+
+CHECKPOINT_COLLECTION = "job_checkpoints"
+
+
+def _day_start(value: date) -> datetime:
+    return datetime(value.year, value.month, value.day)
+
+
+def build_chunk_pipeline(
+    after_email: str | None,
+    chunk_size: int,
+    lookback_weeks: int,
+    today: date,
+) -> list[dict]:
+    """
+    Aggregation over ``users`` returning the next chunk with everything the
+    TDEE pipeline reads: weight and nutrition logs of the lookback window,
+    the most recent logs for the fallback path, the plan and the stored state.
+    """
+    window_start = _day_start(today - timedelta(weeks=lookback_weeks))
+    match: dict[str, Any] = {"email": {"$exists": True}}
+    if after_email is not None:
+        match["email"] = {"$gt": after_email}
+
+    def _logs(collection: str, as_field: str, stages: list[dict]) -> dict:
+        return {
+            "$lookup": {
+                "from": collection,
+                "localField": "email",
+                "foreignField": "user_email",
+                "pipeline": [*stages, {"$project": {"_id": 0}}],
+                "as": as_field,
+            }
+        }
+
+    return [
+        {"$match": match},
+        {"$sort": {"email": 1}},
+        {"$limit": chunk_size},
+        _logs("weight_logs", "window_weights", [{"$match": {"date": {"$gte": window_start}}}]),
+        _logs(
+            "weight_logs",
+            "recent_weights",
+            [{"$sort": {"date": -1}}, {"$limit": RECENT_LOGS_LIMIT}],
+        ),
+        _logs("nutrition_logs", "window_nutrition", [{"$match": {"date": {"$gte": window_start}}}]),
+        _logs(
+            "nutrition_logs",
+            "recent_nutrition",
+            [{"$sort": {"date": -1}}, {"$limit": RECENT_LOGS_LIMIT}],
+        ),
+        _logs("plans", "plans", [{"$sort": {"updated_at": -1}}, {"$limit": 1}]),
+        _logs(
+            "tdee_states",
+            "tdee_states",
+            [{"$match": {"lookback_weeks": lookback_weeks}}],
+        ),
+    ]
+
+
+def _weight_log(doc: dict) -> WeightLog:
+    if isinstance(doc.get("date"), datetime):
+        doc = {**doc, "date": doc["date"].date()}
+    return WeightLog(**doc)
+
+
+def _log_day(value: date | datetime) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+class UserSnapshotDatabase:
+    """
+    Read-only ``MongoDatabase`` surface for one user, served from the chunk
+    aggregation. Writes made by the TDEE pipeline are recorded instead of
+    executed so the parent process can apply them with ``bulk_write``.
+    """
+
+    def __init__(self, doc: dict):
+        self.email = doc["email"]
+        self.window_weights = [_weight_log(d) for d in doc.get("window_weights", [])]
+        self.recent_weights = [_weight_log(d) for d in doc.get("recent_weights", [])]
+        self.window_nutrition = [NutritionLog(**d) for d in doc.get("window_nutrition", [])]
+        self.recent_nutrition = [NutritionLog(**d) for d in doc.get("recent_nutrition", [])]
+        plans = doc.get("plans") or []
+        try:
+            self.plan = UserPlan(**plans[0]) if plans else None
+        except ValidationError:
+            self.plan = None
+        states = doc.get("tdee_states") or []
+        self.state = states[0] if states else None
+        profile_doc = {
+            key: value
+            for key, value in doc.items()
+            if key
+            not in {
+                "window_weights",
+                "recent_weights",
+                "window_nutrition",
+                "recent_nutrition",
+                "plans",
+                "tdee_states",
+            }
+        }
+        self.profile = UserProfile(**profile_doc)
+        self.coaching_target: tuple[int, str] | None = None
+        self.saved_state: dict | None = None
+
+    def get_user_profile(self, _email: str) -> UserProfile:
+        """Returns a copy of the preloaded profile."""
+        return self.profile.model_copy()
+
+    def get_plan(self, _email: str) -> UserPlan | None:
+        """Returns the preloaded plan."""
+        return self.plan
+
+    def get_weight_logs_by_date_range(
+        self, _email: str, start_date: date, end_date: date
+    ) -> list[WeightLog]:
+        """Filters the preloaded window logs like WeightRepository does."""
+        return sorted(
+            (log for log in self.window_weights if start_date <= log.date <= end_date),
+            key=lambda log: log.date,
+        )
+
+    def get_nutrition_logs_by_date_range(
+        self, _email: str, start_date: datetime, end_date: datetime
+    ) -> list[NutritionLog]:
+        """Filters the preloaded window logs like NutritionRepository does."""
+        return sorted(
+            (
+                log
+                for log in self.window_nutrition
+                if start_date.date() <= _log_day(log.date) <= end_date.date()
+            ),
+            key=lambda log: log.date,
+        )
+
+    def get_weight_logs(self, _email: str, limit: int = 30) -> list[WeightLog]:
+        """Returns the preloaded most recent weight logs."""
+        return self.recent_weights[:limit]
+
+    def get_nutrition_logs(self, _email: str, limit: int = 30) -> list[NutritionLog]:
+        """Returns the preloaded most recent nutrition logs."""
+        return self.recent_nutrition[:limit]
+
+    def get_tdee_state(self, _email: str, _lookback_weeks: int) -> dict | None:
+        """Returns the state document read by the aggregation."""
+        return self.state
+
+    def save_tdee_state(
+        self,
+        _email: str,
+        _lookback_weeks: int,
+        state: dict,
+        expected_version: int | None = None,
+    ) -> bool:
+        """Records the rebuilt state for the bulk write."""
+        self.saved_state = {"state": state, "expected_version": expected_version}
+        return True
+
+    def update_user_coaching_target(
+        self, _email: str, target: int, check_in_date: str
+    ) -> None:
+        """Records the coaching check-in for the bulk write."""
+        self.coaching_target = (target, check_in_date)
+        self.profile.tdee_last_target = target
+        self.profile.tdee_last_check_in = check_in_date
+
+
+def recompute_user(doc: dict, lookback_weeks: int) -> dict:
+    """
+    Runs the TDEE pipeline for one aggregated user document.
+
+    Executed inside the process pool, so it only returns plain data:
+    ``status`` is ``rebuilt``, ``fresh`` (the stored state was still valid)
+    or ``error``.
+    """
+    email = doc.get("email")
+    try:
+        snapshot = UserSnapshotDatabase(doc)
+        AdaptiveTDEEService(snapshot).calculate_tdee(email, lookback_weeks)  # type: ignore[arg-type]
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        return {"email": email, "status": "error", "error": str(exc)}
+    return {
+        "email": email,
+        "status": "rebuilt" if snapshot.saved_state else "fresh",
+        "saved_state": snapshot.saved_state,
+        "coaching_target": snapshot.coaching_target,
+    }
+
+
+def recompute_chunk(docs: list[dict], lookback_weeks: int) -> list[dict]:
+    """Process-pool entry point: recomputes every user of a chunk."""
+    return [recompute_user(doc, lookback_weeks) for doc in docs]
+
+
+def build_write_operations(
+    outcomes: list[dict], lookback_weeks: int
+) -> tuple[list[UpdateOne], list[UpdateOne]]:
+    """Turns worker outcomes into ``users`` and ``tdee_states`` bulk operations."""
+    user_ops: list[UpdateOne] = []
+    state_ops: list[UpdateOne] = []
+    for outcome in outcomes:
+        if outcome.get("coaching_target"):
+            target, check_in_date = outcome["coaching_target"]
+            user_ops.append(
+                UpdateOne(
+                    {"email": outcome["email"]},
+                    # Workers cache profiles; the version bump makes them reload.
+                    versioned(
+                        {
+                            "$set": {
+                                "tdee_last_target": target,
+                                "tdee_last_check_in": check_in_date,
+                            }
+                        }
+                    ),
+                )
+            )
+        if outcome.get("saved_state"):
+            state_ops.append(
+                TdeeStateRepository.save_operation(
+                    outcome["email"],
+                    lookback_weeks,
+                    outcome["saved_state"]["state"],
+                    outcome["saved_state"]["expected_version"],
+                )
+            )
+    return user_ops, state_ops
+
+
+def bulk_write_tolerant(collection, operations: list) -> tuple[int, list[dict]]:
+    """
+    Unordered ``bulk_write`` that reports failed operations instead of raising.
+
+    Returns the number of matched or upserted documents and the driver's
+    ``writeErrors`` (e.g. duplicate keys when two runs insert the same
+    user's first state).
+    """
+    try:
+        result = collection.bulk_write(operations, ordered=False)
+    except BulkWriteError as exc:
+        details = exc.details
+        return details.get("nMatched", 0) + details.get("nUpserted", 0), details.get(
+            "writeErrors", []
+        )
+    return result.matched_count + result.upserted_count, []
+
+
+def checkpoint_id(lookback_weeks: int) -> str:
+    """Checkpoint document id for a lookback window."""
+    return f"recompute_tdee:{lookback_weeks}"
@@ -40,11 +40,16 @@ class HevyConfigRequest(BaseModel):
 
 
 class ImportRequest(BaseModel):
-    """Request model for triggering import."""
+    """
+    Request model for triggering import.
+    By default only changes since the last sync are fetched; a ``from_date``
+    or ``incremental=False`` re-imports the history instead.
+    """
 
     from_date: Optional[datetime] = None
 
     mode: str = Field("skip_duplicates", pattern="^(skip_duplicates|overwrite)$")
+    incremental: bool = True
 
 
 @router.post("/validate")
@@ -140,12 +145,17 @@ async def import_workouts(
     if not profile.hevy_api_key:
         raise HTTPException(status_code=400, detail="Hevy API key not configured")
 
-    result = await hevy_service.import_workouts(
-        user_email=user_email,
-        api_key=profile.hevy_api_key,
-        from_date=request.from_date,
-        mode=request.mode,
-    )
+    if request.from_date is not None or not request.incremental:
+        # Explicit backfill: the sync cursor stays where it is.
+        result = await hevy_service.import_workouts(
+            user_email=user_email,
+            api_key=profile.hevy_api_key,
+            from_date=request.from_date,
+            mode=request.mode,
+        )
+    else:
+        result = await hevy_service.sync_workouts(profile, mode=request.mode)
+        profile.hevy_sync_cursor = result.pop("cursor")
 
     profile.hevy_last_sync = datetime.now()
     brain.save_user_profile(profile)
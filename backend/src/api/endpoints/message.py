@@ -7,15 +7,25 @@ import inspect
 import json
 from typing import Annotated, TYPE_CHECKING
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
 from fastapi.responses import StreamingResponse
 
+from src.core.blocking import run_blocking
 from src.core.demo_access import WritableCurrentUser
 from src.services.auth import verify_token
 from src.core.deps import get_ai_trainer_brain
-from src.api.models.message import MessageRequest
+from src.api.models.message import HistoryPosition, MessageRequest
 from src.core.subscription import can_use_image_input
 from src.core.logs import logger
+from src.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
 
 if TYPE_CHECKING:
     from src.services.trainer import AITrainerBrain
@@ -25,6 +35,7 @@ router = APIRouter()
 CurrentUser = Annotated[str, Depends(verify_token)]
 SSE_STREAM_HEADER = "X-Chat-Stream-Format"
 SSE_STREAM_VERSION = "sse-v1"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 
 def _parse_sse_event(frame: str) -> tuple[str, dict] | None:
@@ -100,24 +111,53 @@ async def _adapt_sse_for_legacy_clients(response_generator):
     if raw_buffer.strip():
         yield raw_buffer
 
+def history_position(
+    offset: int = 0,
+    before: str | None = Query(
+        default=None,
+        description="X-Next-Cursor of the previous page (replaces offset)",
+    ),
+) -> HistoryPosition:
+    """Reads the chat history position from the query string."""
+    return HistoryPosition(offset=offset, before=before)
+
+
 @router.get("/history")
 def get_history(
     user_email: CurrentUser,
+    response: Response,
+    position: Annotated[HistoryPosition, Depends(history_position)],
     brain: "AITrainerBrain" = Depends(get_ai_trainer_brain),
     limit: int = 20,
-    offset: int = 0,
 ) -> list:
     """
     Returns the chat message history for the authenticated user,
     excluding internal system notifications.
+
+    The cursor for the next (older) page is returned in the X-Next-Cursor
+    header while more history remains.
     """
     logger.info(
-        "Retrieving chat history for user: %s (limit: %d, offset: %d)",
+        "Retrieving chat history for user: %s (limit: %d, offset: %d, cursor: %s)",
         user_email,
         limit,
-        offset,
+        position.offset,
+        bool(position.before),
     )
-    messages = brain.get_chat_history(user_email, limit=limit, offset=offset)
+    if position.before is None and position.offset > 0:
+        return brain.get_chat_history(user_email, limit=limit, offset=position.offset)
+
+    anchor = None
+    if position.before:
+        try:
+            (anchor,) = decode_cursor(position.before)
+        except (InvalidCursorError, ValueError) as e:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor") from e
+    messages, next_before = brain.get_chat_history_page(
+        user_email, limit=limit, before=anchor
+    )
+    if next_before is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_before)
     return messages
 
 
@@ -143,17 +183,21 @@ async def message_ai(
         preview,
     )
 
-    # Detect and save timezone from header
-    tz = request.headers.get("X-User-Timezone")
-    if tz:
+    def _preflight():
+        # Detect and save timezone from header
+        tz = request.headers.get("X-User-Timezone")
+        if tz:
+            profile = brain.get_or_create_user_profile(user_email)
+            if tz != profile.timezone:
+                logger.info("Updating timezone for %s to %s", user_email, tz)
+                brain.update_user_profile_fields(user_email, {"timezone": tz})
         profile = brain.get_or_create_user_profile(user_email)
-        if tz != profile.timezone:
-            logger.info("Updating timezone for %s to %s", user_email, tz)
-            brain.update_user_profile_fields(user_email, {"timezone": tz})
+        brain.check_message_limits(profile)
+        return profile
+
     try:
         # Pre-flight limits check to avoid StreamingResponse generator crash
-        profile = brain.get_or_create_user_profile(user_email)
-        brain.check_message_limits(profile)
+        profile = await run_blocking(_preflight)
         if message.images and not can_use_image_input(profile.subscription_plan):
             raise HTTPException(status_code=403, detail="IMAGE_NOT_ALLOWED_FOR_PLAN")
 
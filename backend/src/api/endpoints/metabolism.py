@@ -3,6 +3,7 @@ This module contains the API endpoints for metabolism-related data.
 """
 
 from fastapi import APIRouter, Depends
+from src.core.blocking import run_blocking
 from src.core.deps import get_mongo_database
 from src.services.auth import verify_token
 from src.services.database import MongoDatabase
@@ -21,5 +22,7 @@ async def get_metabolism_summary(
     Returns a summary of the user's metabolism stats (TDEE, trend, confidence).
     """
     tdee_service = AdaptiveTDEEService(db)
-    stats = tdee_service.calculate_tdee(user_email, lookback_weeks=weeks)
+    stats = await run_blocking(
+        tdee_service.calculate_tdee, user_email, lookback_weeks=weeks
+    )
     return stats
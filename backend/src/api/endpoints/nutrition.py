@@ -9,6 +9,7 @@ from bson import ObjectId
 from fastapi import APIRouter, Depends, Query, HTTPException, File, UploadFile
 from pydantic import BaseModel
 
+from src.core.blocking import run_blocking
 from src.core.demo_access import WritableCurrentUser
 from src.services.auth import verify_token
 from src.core.deps import get_mongo_database
@@ -18,8 +19,10 @@ from src.api.models.nutrition_stats import NutritionStats
 from src.services.database import MongoDatabase
 from src.api.models.import_result import ImportResult
 from src.services.myfitnesspal_import_service import import_nutrition_from_csv
-from src.services.import_utils import read_csv_file
+from src.services.import_utils import open_csv_upload
 from src.core.subscription import can_use_imports
+from src.api.models.pagination import ListPositionDep, PagedListResponse, page_fields
+from src.utils.pagination import InvalidCursorError, next_page_cursor
 
 router = APIRouter()
 
@@ -27,21 +30,17 @@ CurrentUser = Annotated[str, Depends(verify_token)]
 DatabaseDep = Annotated[MongoDatabase, Depends(get_mongo_database)]
 
 
-class NutritionListResponse(BaseModel):
+class NutritionListResponse(PagedListResponse):
     """Paginated response for nutrition list API."""
 
     logs: list[NutritionWithId]
-    total: int
-    page: int
-    page_size: int
-    total_pages: int
 
 
 @router.get("/list", response_model=NutritionListResponse)
 def list_nutrition(
     user_email: CurrentUser,
     db: DatabaseDep,
-    page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
+    position: ListPositionDep,
     page_size: int = Query(default=10, ge=1, le=50, description="Items per page"),
     days: int | None = Query(default=None, description="Filter by last N days"),
 ) -> NutritionListResponse:
@@ -49,30 +48,36 @@ def list_nutrition(
     Retrieves paginated nutrition logs for the authenticated user.
     """
     logger.info("=== Nutrition List Request ===")
-    logger.info("User: %s, Page: %d, PageSize: %d", user_email, page, page_size)
+    logger.info("User: %s, Page: %d, PageSize: %d", user_email, position.page, page_size)
 
     try:
-        raw_logs, total = db.get_nutrition_paginated(
-            user_email=user_email, page=page, page_size=page_size, days=days
-        )
-
-        logs = [NutritionWithId(**log) for log in raw_logs]
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+        if position.cursor:
+            raw_logs, has_more, total = db.get_nutrition_cursor_page(
+                user_email=user_email,
+                position=position,
+                page_size=page_size,
+                days=days,
+            )
+        else:
+            raw_logs, total = db.get_nutrition_paginated(
+                user_email=user_email, page=position.page, page_size=page_size, days=days
+            )
+            has_more = position.page * page_size < total
 
+        response = NutritionListResponse(
+            logs=[NutritionWithId(**log) for log in raw_logs],
+            **page_fields(position, page_size, total, next_page_cursor(raw_logs, has_more)),
+        )
         logger.info(
-            "Returning %d logs for user: %s (page %d/%d)",
-            len(logs),
+            "Returning %d logs for user: %s (page %d/%s)",
+            len(response.logs),
             user_email,
-            page,
-            total_pages,
-        )
-        return NutritionListResponse(
-            logs=logs,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
+            position.page,
+            response.total_pages,
         )
+        return response
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except (ValueError, TypeError, KeyError) as e:
         logger.error("Data error listing nutrition for %s: %s", user_email, e)
         raise HTTPException(status_code=400, detail="Invalid request parameters") from e
@@ -196,16 +201,19 @@ async def import_myfitnesspal(
     Import nutrition data from MyFitnessPal CSV export.
     """
     logger.info("Importing MyFitnessPal data for user: %s", user_email)
-    profile = db.get_user_profile(user_email)
+    profile = await run_blocking(db.get_user_profile, user_email)
     if not profile:
         raise HTTPException(status_code=404, detail="User profile not found")
     if not can_use_imports(getattr(profile, "subscription_plan", None)):
         raise HTTPException(status_code=403, detail="IMPORT_NOT_ALLOWED_FOR_PLAN")
 
-    csv_content = await read_csv_file(file)
+    csv_stream = open_csv_upload(file)
 
     try:
-        result = import_nutrition_from_csv(user_email, csv_content, db)
+        # Decoding, parsing and the chunked writes all run off the event loop.
+        result = await run_blocking(
+            import_nutrition_from_csv, user_email, csv_stream, db
+        )
 
         logger.info(
             "Import finished for %s. Created: %d, Updated: %d, Errors: %d",
@@ -15,11 +15,12 @@ from src.api.models.plan import (
     PlanViewModel,
     UserPlan,
 )
+from src.core.blocking import run_blocking
 from src.core.demo_access import WritableCurrentUser
 from src.core.deps import get_mongo_database
 from src.services.auth import verify_token
 from src.services.database import MongoDatabase
-from src.services.plan_hevy_sync import HevySyncError, sync_training_with_hevy_if_needed
+from src.services.plan_hevy_sync import HevySyncError, sync_training_with_hevy
 from src.services.plan_service import (
     apply_discovery_update,
     attach_review,
@@ -120,20 +121,20 @@ def create_plan_from_discovery(
 
 
 @router.patch("/section", response_model=SaveResponse)
-def update_plan_section(
+async def update_plan_section(
     user_email: WritableCurrentUser,
     db: DatabaseDep,
     payload: PlanSectionUpdateInput,
 ) -> SaveResponse:
     """Apply a typed update to one section of the active plan."""
-    current = db.get_plan(user_email)
+    current = await run_blocking(db.get_plan, user_email)
     if current is None:
         raise HTTPException(status_code=404, detail="Plan not found")
 
     try:
         updated_plan = merge_plan_section(current, payload)
         if payload.section == "training":
-            updated_plan = sync_training_with_hevy_if_needed(
+            updated_plan = await sync_training_with_hevy(
                 database=db,
                 user_email=user_email,
                 current_plan=current,
@@ -146,7 +147,7 @@ def update_plan_section(
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
-    plan_id = db.save_plan(updated_plan)
+    plan_id = await run_blocking(db.save_plan, updated_plan)
     return SaveResponse(id=plan_id)
 
 
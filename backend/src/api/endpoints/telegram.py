@@ -14,7 +14,7 @@ from src.core.config import settings
 from src.core.subscription import can_use_telegram
 from src.core.deps import (
     get_telegram_repository,
-    get_telegram_service,
+    get_telegram_update_queue,
     get_ai_trainer_brain,
 )
 from src.core.logs import logger
@@ -139,9 +139,8 @@ async def telegram_webhook(
     try:
         body = await request.json()
 
-        # Get service and process
-        service = get_telegram_service()
-        await service.handle_update(body)
+        # Persist and acknowledge; a background worker runs the bot logic
+        await get_telegram_update_queue().submit(body)
 
         return JSONResponse(content={"ok": True})
 
@@ -7,18 +7,20 @@ from typing import Annotated, Any
 
 from bson import ObjectId
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
-from pydantic import BaseModel
 
 from src.api.models.import_result import ImportResult
+from src.api.models.pagination import ListPositionDep, PagedListResponse, page_fields
 from src.api.models.weight_log import WeightLog, WeightLogInput, WeightWithId
+from src.core.blocking import run_blocking
 from src.core.demo_access import WritableCurrentUser
 from src.core.deps import get_ai_trainer_brain, get_mongo_database
 from src.core.logs import logger
 from src.services.adaptive_tdee import AdaptiveTDEEService
 from src.services.auth import verify_token
 from src.services.database import MongoDatabase
-from src.services.import_utils import read_csv_file
+from src.services.import_utils import open_csv_upload
 from src.services.zepp_life_import_service import import_zepp_life_data
+from src.utils.pagination import InvalidCursorError, next_page_cursor
 
 router = APIRouter()
 
@@ -135,29 +137,35 @@ def delete_weight_log(
     return {"message": "Weight log deleted successfully", "deleted": True}
 
 
-class WeightListResponse(BaseModel):
+class WeightListResponse(PagedListResponse):
     """Paginated response for weight list API."""
 
     logs: list[WeightWithId]
-    total: int
-    page: int
-    page_size: int
-    total_pages: int
 
 
 @router.get("", response_model=WeightListResponse)
 def get_weight_logs(
     user_email: CurrentUser,
     db: DatabaseDep,
-    page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
+    position: ListPositionDep,
     page_size: int = Query(default=30, ge=1, le=100, description="Items per page"),
 ) -> WeightListResponse:
     """
     Retrieves paginated weight logs for the user.
     """
-    raw_logs, total = db.get_weight_paginated(
-        user_email=user_email, page=page, page_size=page_size
-    )
+    if position.cursor:
+        try:
+            raw_logs, has_more, total = db.get_weight_cursor_page(
+                user_email=user_email, position=position, page_size=page_size
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+    else:
+        raw_logs, total = db.get_weight_paginated(
+            user_email=user_email, page=position.page, page_size=page_size
+        )
+        has_more = position.page * page_size < total
+    next_cursor = next_page_cursor(raw_logs, has_more)
 
     logs_out = []
     for log in raw_logs:
@@ -168,14 +176,8 @@ def get_weight_logs(
             log["_id"] = log.pop("id")
         logs_out.append(WeightWithId(**log))
 
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-
     return WeightListResponse(
-        logs=logs_out,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
+        logs=logs_out, **page_fields(position, page_size, total, next_cursor)
     )
 
 
@@ -237,10 +239,13 @@ async def import_zepp_life(
     Import weight/body composition data from Zepp Life CSV export.
     """
     logger.info("Importing Zepp Life data for user: %s", user_email)
-    csv_content = await read_csv_file(file)
+    csv_stream = open_csv_upload(file)
 
     try:
-        result = import_zepp_life_data(user_email, csv_content, db)
+        # Decoding, parsing and the chunked writes all run off the event loop.
+        result = await run_blocking(
+            import_zepp_life_data, user_email, csv_stream, db
+        )
 
         logger.info(
             "Import finished for %s. Created: %d, Updated: %d, Errors: %d",
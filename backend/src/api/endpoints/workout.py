@@ -18,7 +18,8 @@ from src.api.models.workout_log import (
     ExerciseLog,
 )
 from src.services.database import MongoDatabase
-from src.utils.pagination import calculate_total_pages
+from src.api.models.pagination import ListPositionDep, page_fields
+from src.utils.pagination import InvalidCursorError, next_page_cursor
 
 router = APIRouter()
 
@@ -138,7 +139,7 @@ def update_workout(
 def list_workouts(
     user_email: CurrentUser,
     db: DatabaseDep,
-    page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
+    position: ListPositionDep,
     page_size: int = Query(default=10, ge=1, le=50, description="Items per page"),
     workout_type: str | None = Query(
         default=None, description="Filter by workout type"
@@ -151,40 +152,50 @@ def list_workouts(
     Args:
         user_email (str): The authenticated user's email.
         db (MongoDatabase): The database dependency.
-        page (int): Page number (1-indexed).
+        position (ListPosition): Page number, or an opaque cursor; with a
+            cursor the page is ignored and the total is only counted if
+            include_total is set.
         page_size (int): Number of items per page (1-50).
 
     Returns:
         WorkoutListResponse: Paginated list of user workout logs.
     """
     logger.info("=== Workout List Request ===")
-    logger.info("User: %s, Page: %d, PageSize: %d", user_email, page, page_size)
+    logger.info("User: %s, Page: %d, PageSize: %d", user_email, position.page, page_size)
 
     try:
-        raw_workouts, total = db.get_workouts_paginated(
-            user_email=user_email,
-            page=page,
-            page_size=page_size,
-            workout_type=workout_type,
-        )
-
-        workouts = [WorkoutWithId(**w) for w in raw_workouts]
-        total_pages = calculate_total_pages(total, page_size)
+        if position.cursor:
+            raw_workouts, has_more, total = db.get_workouts_cursor_page(
+                user_email=user_email,
+                position=position,
+                page_size=page_size,
+                workout_type=workout_type,
+            )
+        else:
+            raw_workouts, total = db.get_workouts_paginated(
+                user_email=user_email,
+                page=position.page,
+                page_size=page_size,
+                workout_type=workout_type,
+            )
+            has_more = position.page * page_size < total
 
+        response = WorkoutListResponse(
+            workouts=[WorkoutWithId(**w) for w in raw_workouts],
+            **page_fields(
+                position, page_size, total, next_page_cursor(raw_workouts, has_more)
+            ),
+        )
         logger.info(
-            "Returning %d workouts for user: %s (page %d/%d)",
-            len(workouts),
+            "Returning %d workouts for user: %s (page %d/%s)",
+            len(response.workouts),
             user_email,
-            page,
-            total_pages,
-        )
-        return WorkoutListResponse(
-            workouts=workouts,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
+            position.page,
+            response.total_pages,
         )
+        return response
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         logger.error("Error listing workouts for user %s: %s", user_email, e)
         raise HTTPException(
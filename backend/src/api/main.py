@@ -32,8 +32,19 @@ from src.api.endpoints import (
     stripe,
     plan,
 )
+from src.core.blocking import shutdown_blocking_executor
 from src.core.config import settings
-from src.core.deps import get_ai_trainer_brain, get_mongo_database, get_qdrant_client
+from src.core.deps import (
+    close_async_mongo_database,
+    close_hevy_client,
+    close_telegram_update_queue,
+    flush_prompt_logs,
+    get_ai_trainer_brain,
+    get_mongo_database,
+    get_qdrant_client,
+    get_telegram_update_queue,
+    stop_token_blocklists,
+)
 from src.core.firebase import ensure_firebase_initialized
 from src.core.logs import logger, set_log_level
 from src.core.limiter import limiter, RATE_LIMITING_ENABLED
@@ -92,6 +103,7 @@ app.add_middleware(
     allow_credentials=allow_credentials_,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[message.NEXT_CURSOR_HEADER],
 )
 
 app.include_router(user.router, prefix="/user", tags=["user"])
@@ -128,6 +140,53 @@ def warmup_dependencies() -> None:
     logger.info("Dependency warmup completed in %.1fms", elapsed_ms)
 
 
+@app.on_event("startup")
+async def resume_telegram_updates() -> None:
+    """Resume Telegram updates queued before the last restart."""
+    if not settings.TELEGRAM_BOT_TOKEN:
+        return
+    try:
+        await get_telegram_update_queue().recover()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.error("Failed to resume queued Telegram updates: %s", e)
+
+
+@app.on_event("shutdown")
+async def stop_telegram_updates() -> None:
+    """Let in-flight Telegram updates finish before the executor stops."""
+    await close_telegram_update_queue()
+
+
+@app.on_event("shutdown")
+def stop_prompt_log_writer() -> None:
+    """Write the prompt logs still buffered for the background writer."""
+    flush_prompt_logs()
+
+
+@app.on_event("shutdown")
+def stop_token_blocklist_refresh() -> None:
+    """Stop polling the token blocklist."""
+    stop_token_blocklists()
+
+
+@app.on_event("shutdown")
+def stop_blocking_executor() -> None:
+    """Release the worker threads used to offload blocking calls."""
+    shutdown_blocking_executor(wait=False)
+
+
+@app.on_event("shutdown")
+async def close_hevy_connections() -> None:
+    """Close the pooled Hevy API connections."""
+    await close_hevy_client()
+
+
+@app.on_event("shutdown")
+async def close_async_database() -> None:
+    """Close the async MongoDB client used by the chat path."""
+    await close_async_mongo_database()
+
+
 @app.get("/health")
 def health_check() -> JSONResponse:
     """
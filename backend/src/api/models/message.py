@@ -39,6 +39,13 @@ class MessageImageInput(BaseModel):
         return value
 
 
+class HistoryPosition(BaseModel):
+    """Where a chat history page starts: an offset, or a cursor replacing it."""
+
+    offset: int = 0
+    before: str | None = None
+
+
 class MessageRequest(BaseModel):
     """
     Represents a request containing a user's message.
@@ -0,0 +1,59 @@
+"""
+This module contains the models shared by the paginated list endpoints.
+"""
+
+from typing import Annotated, Any
+
+from fastapi import Depends, Query
+from pydantic import BaseModel
+
+from src.utils.pagination import calculate_total_pages
+
+
+class ListPosition(BaseModel):
+    """Where a list page starts: a page number, or a cursor replacing it."""
+
+    page: int = 1
+    cursor: str | None = None
+    include_total: bool = False
+
+
+def list_position(
+    page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
+    cursor: str | None = Query(
+        default=None, description="next_cursor of the previous page (replaces page)"
+    ),
+    include_total: bool = Query(
+        default=False, description="Count the total in cursor mode"
+    ),
+) -> ListPosition:
+    """Reads the list position from the query string."""
+    return ListPosition(page=page, cursor=cursor, include_total=include_total)
+
+
+ListPositionDep = Annotated[ListPosition, Depends(list_position)]
+
+
+class PagedListResponse(BaseModel):
+    """Pagination fields of a list response; subclasses add the items."""
+
+    total: int | None
+    page: int
+    page_size: int
+    total_pages: int | None
+    next_cursor: str | None = None
+
+
+def page_fields(
+    position: ListPosition, page_size: int, total: int | None, next_cursor: str | None
+) -> dict[str, Any]:
+    """Builds the PagedListResponse fields for a page served from ``position``."""
+    return {
+        "total": total,
+        "page": position.page,
+        "page_size": page_size,
+        "total_pages": (
+            calculate_total_pages(total, page_size) if total is not None else None
+        ),
+        "next_cursor": next_cursor,
+    }
@@ -146,6 +146,10 @@ class UserProfile(UserProfileInput):
     hevy_last_sync: datetime | None = Field(
         default=None, description="Last successful sync timestamp"
     )
+    hevy_sync_cursor: datetime | None = Field(
+        default=None,
+        description="Newest Hevy workout event applied by the incremental sync",
+    )
 
     # Telegram Notifications
     telegram_notify_on_workout: bool = Field(
@@ -8,6 +8,8 @@ from typing import Annotated, Any
 from bson import ObjectId
 from pydantic import BaseModel, Field, model_validator, ConfigDict, BeforeValidator
 
+from src.api.models.pagination import PagedListResponse
+
 
 class ExerciseLog(BaseModel):
     """
@@ -107,11 +109,7 @@ class WorkoutWithId(WorkoutLog):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class WorkoutListResponse(BaseModel):
+class WorkoutListResponse(PagedListResponse):
     """Paginated response for workout list API."""
 
     workouts: list[WorkoutWithId]
-    total: int
-    page: int
-    page_size: int
-    total_pages: int
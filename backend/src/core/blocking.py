@@ -0,0 +1,69 @@
+"""
+Bounded executor for blocking work called from async code.
+
+pymongo, Qdrant and the TDEE numpy pipeline are synchronous. Async handlers
+and the chat runner hand that work to ``run_blocking`` so the event loop
+keeps serving other requests while it runs. The pool is shared by the whole
+process and sized by ``AI_TRAINER_THREADPOOL_WORKERS``; context variables of
+the caller (such as the turn cache) are visible inside the worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from src.core.config import settings
+
+T = TypeVar("T")
+
+
+class _ExecutorHolder:
+    """Lazily created executor that can be shut down and recreated."""
+
+    def __init__(self) -> None:
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> ThreadPoolExecutor:
+        """Return the executor, creating it on first use."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=max(1, int(settings.AI_TRAINER_THREADPOOL_WORKERS)),
+                        thread_name_prefix="ai-trainer-blocking",
+                    )
+        return self._executor
+
+    def shutdown(self, wait: bool) -> None:
+        """Stop the executor; the next ``get`` creates a new one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_EXECUTOR = _ExecutorHolder()
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor, creating it on first use."""
+    return _EXECUTOR.get()
+
+
+def shutdown_blocking_executor(wait: bool = True) -> None:
+    """Stop the executor; the next ``run_blocking`` call creates a new one."""
+    _EXECUTOR.shutdown(wait)
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a synchronous callable on the bounded executor and await its result."""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_blocking_executor(), call)
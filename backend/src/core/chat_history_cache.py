@@ -0,0 +1,211 @@
+"""
+Per-process cache of decoded recent chat history.
+
+Each session keeps a ring buffer of its newest public messages (already
+decoded to ``ChatHistory``) keyed by their ``message_store`` ``_id``;
+sessions are evicted LRU. Chat repositories fill it on read, append to it
+on write and serve both ``ChatHistory`` pages and Pydantic AI messages from
+it.
+
+Other workers write to the same sessions, so an entry is only trusted for
+``revalidate_seconds`` after it was last checked. Past that, the repository
+reads the ``_id``s of the session's latest writes (a covered index read)
+and hands them to ``plan_refresh``: unseen ids are fetched and merged, a
+missing newest id (deleted history) drops the entry. Entries are reloaded
+from scratch after ``max_age_seconds`` so deletions of older messages
+(scripts, admin) are picked up as well.
+
+There is no explicit invalidation: history is only deleted or rewritten by
+other processes (the admin backend, the archive and backfill scripts), which
+cannot reach this cache. The probe and ``max_age_seconds`` are the only
+coherence mechanism, so such changes show up here within that age.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Iterable
+
+from bson import ObjectId
+
+from src.api.models.chat_history import ChatHistory
+from src.core.config import settings
+
+# Writes of other workers within this window of the newest message seen can
+# carry a smaller ObjectId, so the refresh probe re-reads it.
+PROBE_OVERLAP = timedelta(seconds=2)
+
+
+@dataclass
+class _SessionHistory:
+    """Newest public messages of one session, oldest first."""
+
+    messages: list[tuple[ObjectId, ChatHistory]]
+    seen_ids: set[ObjectId]
+    newest_id: ObjectId | None
+    complete: bool
+    loaded_at: float
+    checked_at: float
+
+
+@dataclass
+class CacheStats:
+    """Lookup counters of a ChatHistoryCache."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class ChatHistoryCache:
+    """LRU of per-session ring buffers of decoded public chat messages."""
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int,
+        capacity: int,
+        revalidate_seconds: float = 2.0,
+        max_age_seconds: float = 300.0,
+    ):
+        self.max_sessions = max(1, max_sessions)
+        self.capacity = max(1, capacity)
+        self.revalidate_seconds = revalidate_seconds
+        self.max_age_seconds = max_age_seconds
+        self._sessions: OrderedDict[str, _SessionHistory] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def covers(self, count: int) -> bool:
+        """Whether windows of ``count`` newest messages can be served from here."""
+        return 0 < count <= self.capacity
+
+    def state(self, session_id: str) -> tuple[str, ObjectId | None]:
+        """
+        ``("fresh", None)`` when the entry can be served as is,
+        ``("probe", since)`` when the writes from ``since`` on must be checked,
+        ``("load", None)`` when the session must be (re)loaded.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None or now - entry.loaded_at > self.max_age_seconds:
+                self.stats.misses += 1
+                return "load", None
+            self._sessions.move_to_end(session_id)
+            if now - entry.checked_at <= self.revalidate_seconds:
+                self.stats.hits += 1
+                return "fresh", None
+            if entry.newest_id is None:
+                return "probe", None
+            return "probe", ObjectId.from_datetime(
+                entry.newest_id.generation_time - PROBE_OVERLAP
+            )
+
+    def plan_refresh(
+        self, session_id: str, recent_ids: Iterable[ObjectId]
+    ) -> list[ObjectId] | None:
+        """
+        Compares the ids returned by the probe with the entry.
+
+        Returns the unseen ids to fetch (possibly none), or None when the
+        entry was dropped and the session has to be loaded.
+        """
+        recent = set(recent_ids)
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None or (entry.newest_id is not None and entry.newest_id not in recent):
+                self._sessions.pop(session_id, None)
+                return None
+            unseen = sorted(recent - entry.seen_ids)
+            if len(unseen) > self.capacity:
+                self._sessions.pop(session_id, None)
+                return None
+            if not unseen:
+                entry.checked_at = time.monotonic()
+            return unseen
+
+    def store(self, session_id: str, newest_first: list[tuple[ObjectId, ChatHistory]],
+              raw_ids: Iterable[ObjectId], complete: bool) -> None:
+        """Stores a freshly loaded session (public messages newest first)."""
+        now = time.monotonic()
+        seen = set(raw_ids)
+        entry = _SessionHistory(
+            messages=list(reversed(newest_first[: self.capacity])),
+            seen_ids=seen,
+            newest_id=max(seen) if seen else None,
+            complete=complete,
+            loaded_at=now,
+            checked_at=now,
+        )
+        with self._lock:
+            self._sessions[session_id] = entry
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def merge(self, session_id: str, docs: list[tuple[ObjectId, ChatHistory | None]],
+              checked: bool = False) -> None:
+        """
+        Adds messages written after the entry was loaded (``None`` for raw
+        documents that are not public). ``checked`` marks the entry current,
+        which is only true after a probe, not after a local write.
+        """
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return
+            for doc_id, message in docs:
+                if doc_id in entry.seen_ids:
+                    continue
+                entry.seen_ids.add(doc_id)
+                if message is not None:
+                    entry.messages.append((doc_id, message))
+            entry.messages.sort(key=lambda item: item[0])
+            if len(entry.messages) > self.capacity:
+                del entry.messages[: len(entry.messages) - self.capacity]
+                entry.complete = False
+            if checked:
+                # A local write must not move the probe start past writes
+                # of other workers that are still unseen.
+                entry.newest_id = max(entry.seen_ids)
+                entry.checked_at = time.monotonic()
+
+    def newest(self, session_id: str, count: int) -> list[tuple[ObjectId, ChatHistory]] | None:
+        """
+        Copies of the ``count`` newest public messages, oldest first, or None
+        when the buffer holds fewer than asked and older history may exist.
+        """
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            if count > len(entry.messages) and not entry.complete:
+                return None
+            window = entry.messages[-count:] if count else []
+            # Callers normalize message text in place.
+            return [(doc_id, message.model_copy(deep=True)) for doc_id, message in window]
+
+    def clear(self) -> None:
+        """Drops every session."""
+        with self._lock:
+            self._sessions.clear()
+
+
+@functools.lru_cache(maxsize=1)
+def shared_chat_history_cache() -> ChatHistoryCache | None:
+    """The process-wide cache used by the database facades (None when disabled)."""
+    if settings.CHAT_HISTORY_CACHE_SESSIONS <= 0:
+        return None
+    return ChatHistoryCache(
+        max_sessions=settings.CHAT_HISTORY_CACHE_SESSIONS,
+        capacity=max(
+            settings.CHAT_HISTORY_CACHE_MESSAGES, settings.MAX_SHORT_TERM_MEMORY_MESSAGES
+        ),
+        revalidate_seconds=settings.CHAT_HISTORY_CACHE_REVALIDATE_SECONDS,
+        max_age_seconds=settings.CHAT_HISTORY_CACHE_MAX_AGE_SECONDS,
+    )
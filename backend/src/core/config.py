@@ -88,8 +88,20 @@ class Settings(BaseSettings):
 
     MAX_SHORT_TERM_MEMORY_MESSAGES: int = 20
     MAX_LONG_TERM_MEMORY_MESSAGES: int = Field(default=50)
+    CHAT_HISTORY_CACHE_SESSIONS: int = Field(default=1024)
+    CHAT_HISTORY_CACHE_MESSAGES: int = Field(default=60)
+    CHAT_HISTORY_CACHE_REVALIDATE_SECONDS: float = Field(default=2.0)
+    CHAT_HISTORY_CACHE_MAX_AGE_SECONDS: float = Field(default=300.0)
+    CHAT_ARCHIVE_AFTER_DAYS: int = Field(default=180)
+    CHAT_ARCHIVE_CHUNK_MESSAGES: int = Field(default=200)
+    TOKEN_BLOCKLIST_REFRESH_SECONDS: float = Field(default=1.0)
+    TOKEN_BLOCKLIST_MAX_STALENESS_SECONDS: float = Field(default=5.0)
+    PROFILE_CACHE_ENTRIES: int = Field(default=4096)
+    PROFILE_CACHE_TTL_SECONDS: float = Field(default=300.0)
+    PROFILE_CACHE_REVALIDATE_SECONDS: float = Field(default=2.0)
     LLM_STREAM_TIMEOUT_SECONDS: int = Field(default=120)
     LLM_STREAM_INACTIVITY_TIMEOUT_SECONDS: int = Field(default=45)
+    LLM_STREAM_TOKENS: bool = Field(default=True)
     LLM_AGENT_RECURSION_LIMIT: int = Field(default=20)
     AI_TRAINER_THREADPOOL_WORKERS: int = Field(default=4)
     WARMUP_AI_ON_STARTUP: bool = Field(default=False)
@@ -97,6 +109,8 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     RATE_LIMIT_LOGIN: str = "5/minute"
     MAX_PROMPT_LOGS: int = 20
+    PROMPT_LOG_FLUSH_SECONDS: float = Field(default=1.0)
+    PROMPT_LOG_BATCH_SIZE: int = Field(default=200)
 
     # ====== BETTERSTACK INTEGRATION ======
     BETTERSTACK_API_TOKEN: str = ""
@@ -154,9 +168,20 @@ class Settings(BaseSettings):
     MEM0_MAX_CONTEXT_SIZE: int = 1024
     MEM0_DATE_THRESHOLD_DAYS: int = 7
 
+    # ====== HEVY ======
+    HEVY_MAX_CONNECTIONS: int = Field(default=20)
+    HEVY_RATE_LIMIT_PER_SECOND: float = Field(default=5.0)
+    HEVY_RATE_LIMIT_BURST: int = Field(default=10)
+    HEVY_MAX_RETRIES: int = Field(default=3)
+    HEVY_PAGE_CONCURRENCY: int = Field(default=4)
+    HEVY_TEMPLATE_CACHE_SIZE: int = Field(default=256)
+    HEVY_ROUTINE_SYNC_CONCURRENCY: int = Field(default=4)
+
     # ====== TELEGRAM STUFF ======
     TELEGRAM_BOT_TOKEN: str = ""
     TELEGRAM_WEBHOOK_SECRET: str = ""
+    TELEGRAM_WORKER_CONCURRENCY: int = Field(default=4)
+    TELEGRAM_QUEUE_LEASE_SECONDS: int = Field(default=300)
 
     # ====== STRIPE ======
     STRIPE_API_KEY: str = ""
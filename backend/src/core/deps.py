@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import functools
-from typing import TYPE_CHECKING
+import weakref
+from typing import TYPE_CHECKING, Awaitable, Callable, TypeVar
 
 from src.core.config import settings
 
 if TYPE_CHECKING:
     from qdrant_client import QdrantClient  # pylint: disable=import-outside-toplevel
     from src.repositories.telegram_repository import TelegramRepository
+    from src.services.async_database import AsyncMongoDatabase
     from src.services.database import MongoDatabase
     from src.services.hevy_service import HevyService
+    from src.services.telegram_queue import TelegramUpdateQueue
     from src.services.telegram_service import TelegramBotService
     from src.services.trainer import AITrainerBrain
 
+T = TypeVar("T")
+
 
 @functools.lru_cache()
 def get_qdrant_client() -> QdrantClient:
@@ -39,6 +45,9 @@ def get_qdrant_client() -> QdrantClient:
     )
 
 
+_OPENED_MONGO_DATABASES: weakref.WeakSet[MongoDatabase] = weakref.WeakSet()
+
+
 @functools.lru_cache()
 def get_mongo_database() -> MongoDatabase:
     """
@@ -46,7 +55,68 @@ def get_mongo_database() -> MongoDatabase:
     """
     from src.services.database import MongoDatabase  # pylint: disable=import-outside-toplevel
 
-    return MongoDatabase()
+    database = MongoDatabase()
+    _OPENED_MONGO_DATABASES.add(database)
+    return database
+
+
+def flush_prompt_logs() -> None:
+    """Writes the buffered prompt logs of the databases opened so far."""
+    for database in list(_OPENED_MONGO_DATABASES):
+        database.flush_prompt_logs()
+
+
+def stop_token_blocklists() -> None:
+    """Stops the blocklist pollers of the databases opened so far."""
+    for database in list(_OPENED_MONGO_DATABASES):
+        database.stop_token_blocklist()
+
+
+_async_databases: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, AsyncMongoDatabase
+] = weakref.WeakKeyDictionary()
+
+
+def get_async_mongo_database() -> AsyncMongoDatabase:
+    """
+    Returns the async MongoDB client for the running event loop.
+
+    An AsyncMongoClient is bound to the loop it first runs on, and Telegram
+    updates run chat turns on their own loops, so one client is kept per loop.
+    """
+    from src.services.async_database import AsyncMongoDatabase  # pylint: disable=import-outside-toplevel
+
+    loop = asyncio.get_running_loop()
+    database = _async_databases.get(loop)
+    if database is None:
+        database = AsyncMongoDatabase()
+        _async_databases[loop] = database
+    return database
+
+
+async def close_async_mongo_database() -> None:
+    """Closes the async MongoDB client of the running event loop, if any."""
+    database = _async_databases.pop(asyncio.get_running_loop(), None)
+    if database is not None:
+        await database.close()
+
+
+def run_in_transient_loop(make_coro: Callable[[], Awaitable[T]]) -> T:
+    """
+    Runs a coroutine on a fresh event loop with ``asyncio.run``.
+
+    Clients opened for that loop are closed before it ends; nothing can reuse
+    them once the loop is gone.
+    """
+
+    async def run() -> T:
+        try:
+            return await make_coro()
+        finally:
+            await close_async_mongo_database()
+            await close_hevy_client()
+
+    return asyncio.run(run())
 
 
 @functools.lru_cache()
@@ -58,7 +128,11 @@ def get_ai_trainer_brain() -> AITrainerBrain:
 
     database = get_mongo_database()
     qdrant_client = get_qdrant_client()
-    return AITrainerBrain(database=database, qdrant_client=qdrant_client)
+    return AITrainerBrain(
+        database=database,
+        qdrant_client=qdrant_client,
+        async_database_factory=get_async_mongo_database,
+    )
 
 
 @functools.lru_cache()
@@ -69,7 +143,17 @@ def get_hevy_service() -> HevyService:
     from src.services.hevy_service import HevyService  # pylint: disable=import-outside-toplevel
 
     database = get_mongo_database()
-    return HevyService(workout_repository=database.workouts_repo)
+    return HevyService(
+        workout_repository=database.workouts_repo,
+        template_repository=database.hevy_templates,
+    )
+
+
+async def close_hevy_client() -> None:
+    """Closes the pooled Hevy connections of the running event loop."""
+    from src.services.hevy_client import close_shared_hevy_client  # pylint: disable=import-outside-toplevel
+
+    await close_shared_hevy_client()
 
 
 def get_telegram_repository() -> TelegramRepository:
@@ -97,3 +181,37 @@ def get_telegram_service() -> TelegramBotService:
     return TelegramBotService(
         token=settings.TELEGRAM_BOT_TOKEN, repository=repository, brain=brain
     )
+
+
+class _TelegramQueueSlot:  # pylint: disable=too-few-public-methods
+    """Holds the process-wide Telegram update queue once it is started."""
+
+    def __init__(self) -> None:
+        self.queue: TelegramUpdateQueue | None = None
+
+
+_TELEGRAM_QUEUE = _TelegramQueueSlot()
+
+
+def get_telegram_update_queue() -> TelegramUpdateQueue:
+    """
+    Returns the process-wide queue that runs Telegram updates in the background.
+    """
+    from src.services.telegram_queue import TelegramUpdateQueue  # pylint: disable=import-outside-toplevel
+
+    if _TELEGRAM_QUEUE.queue is None:
+        service = get_telegram_service()
+        _TELEGRAM_QUEUE.queue = TelegramUpdateQueue(
+            service=service,
+            repository=service.repository,
+            max_concurrency=settings.TELEGRAM_WORKER_CONCURRENCY,
+            lease_seconds=settings.TELEGRAM_QUEUE_LEASE_SECONDS,
+        )
+    return _TELEGRAM_QUEUE.queue
+
+
+async def close_telegram_update_queue() -> None:
+    """Stops the Telegram update queue, if it was started."""
+    queue, _TELEGRAM_QUEUE.queue = _TELEGRAM_QUEUE.queue, None
+    if queue is not None:
+        await queue.close()
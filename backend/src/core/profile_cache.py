@@ -0,0 +1,245 @@
+"""
+Per-process cache of validated user and trainer profiles.
+
+Profiles are read several times per request and by every request, so the
+profile repositories keep the validated models in a TTL + LRU map keyed by
+email and serve copies of them.
+
+Every write to a profile increments its ``profile_version`` field. Writes
+made through this process are applied to the cached model right away;
+writes of other workers (or the admin panel) are detected by reading only
+the version once an entry is older than ``revalidate_seconds``. Entries
+are reloaded from scratch after ``ttl_seconds``, which also covers writers
+that do not bump the version (scripts).
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from src.core.config import settings
+
+PROFILE_VERSION_FIELD = "profile_version"
+VERSION_PROJECTION = {PROFILE_VERSION_FIELD: 1}
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def versioned(update_doc: dict) -> dict:
+    """Copy of a Mongo update document that also bumps the profile version."""
+    update = {operator: dict(fields) for operator, fields in update_doc.items()}
+    update.setdefault("$inc", {})[PROFILE_VERSION_FIELD] = 1
+    return update
+
+
+def profile_loads(collection, query: dict, build: Callable[[dict], Any]) -> dict:
+    """
+    ``get_or_load``/``aget_or_load`` arguments reading the profile matched by
+    ``query`` from a sync or async collection.
+    """
+    return {
+        "load": lambda: collection.find_one(query),
+        "read_version": lambda: collection.find_one(query, VERSION_PROJECTION),
+        "build": build,
+    }
+
+
+def write_through(cache: "ProfileCache | None", key: str, update_doc: dict) -> None:
+    """Applies a write to ``cache`` when profiles are cached."""
+    if cache is not None:
+        cache.apply(key, update_doc)
+
+
+def apply_update(model: ModelT, update_doc: dict) -> ModelT | None:
+    """
+    Applies a ``$set``/``$unset``/``$inc`` update to a model as Mongo would
+    to its document; None when the result cannot be derived locally.
+    """
+    data = model.model_dump()
+    for operator, fields in update_doc.items():
+        if operator not in {"$set", "$unset", "$inc"} or any("." in key for key in fields):
+            return None
+        for key, value in fields.items():
+            if key == PROFILE_VERSION_FIELD:
+                continue
+            if operator == "$set":
+                data[key] = value
+            elif operator == "$unset":
+                # Removed fields fall back to the model defaults on load.
+                data.pop(key, None)
+            else:
+                data[key] = (data.get(key) or 0) + value
+    try:
+        return type(model)(**data)
+    except ValidationError:
+        return None
+
+
+@dataclass
+class _CachedProfile(Generic[ModelT]):
+    model: ModelT
+    version: int | None
+    loaded_at: float
+    checked_at: float
+
+
+class ProfileCache(Generic[ModelT]):
+    """TTL + LRU map of profile models keyed by email."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float = 300.0,
+        revalidate_seconds: float = 2.0,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.revalidate_seconds = revalidate_seconds
+        self._entries: OrderedDict[str, _CachedProfile[ModelT]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(
+        self,
+        key: str,
+        load: Callable[[], dict | None],
+        read_version: Callable[[], dict | None],
+        build: Callable[[dict], ModelT],
+    ) -> ModelT | None:
+        """
+        The cached profile, revalidated with ``read_version`` (a version-only
+        find) when due, or the one built from ``load`` (a full find).
+        """
+        status = self._state(key)
+        if status == "check":
+            status = "fresh" if self._confirm(key, read_version()) else "load"
+        if status == "fresh":
+            cached = self._get(key)
+            if cached is not None:
+                return cached
+        return self._store_loaded(key, load(), build)
+
+    async def aget_or_load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[dict | None]],
+        read_version: Callable[[], Awaitable[dict | None]],
+        build: Callable[[dict], ModelT],
+    ) -> ModelT | None:
+        """Async variant of ``get_or_load``."""
+        status = self._state(key)
+        if status == "check":
+            status = "fresh" if self._confirm(key, await read_version()) else "load"
+        if status == "fresh":
+            cached = self._get(key)
+            if cached is not None:
+                return cached
+        return self._store_loaded(key, await load(), build)
+
+    def apply(self, key: str, update_doc: dict) -> None:
+        """Applies a write made by this process to the cached profile."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            model = apply_update(entry.model, update_doc)
+            if model is None:
+                del self._entries[key]
+                return
+            entry.model = model
+            # Matches the stored version unless another worker wrote since
+            # the entry was checked; the next check then reloads it.
+            entry.version = (entry.version or 0) + 1
+
+    def invalidate(self, key: str) -> None:
+        """Drops one profile."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops every profile."""
+        with self._lock:
+            self._entries.clear()
+
+    def _state(self, key: str) -> str:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry.loaded_at > self.ttl_seconds:
+                self.misses += 1
+                return "load"
+            self._entries.move_to_end(key)
+            if now - entry.checked_at > self.revalidate_seconds:
+                return "check"
+            self.hits += 1
+            return "fresh"
+
+    def _confirm(self, key: str, doc: dict | None) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            if doc is None or doc.get(PROFILE_VERSION_FIELD) != entry.version:
+                del self._entries[key]
+                return False
+            entry.checked_at = time.monotonic()
+            self.hits += 1
+            return True
+
+    def _get(self, key: str) -> ModelT | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            # Callers may modify the profile they get.
+            return entry.model.model_copy(deep=True) if entry else None
+
+    def _store_loaded(
+        self, key: str, doc: dict | None, build: Callable[[dict], ModelT]
+    ) -> ModelT | None:
+        if doc is None:
+            self.invalidate(key)
+            return None
+        model = build(doc)
+        now = time.monotonic()
+        entry = _CachedProfile(
+            model=model.model_copy(deep=True),
+            version=doc.get(PROFILE_VERSION_FIELD),
+            loaded_at=now,
+            checked_at=now,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return model
+
+
+def _profile_cache() -> ProfileCache[Any] | None:
+    if settings.PROFILE_CACHE_ENTRIES <= 0:
+        return None
+    return ProfileCache(
+        max_entries=settings.PROFILE_CACHE_ENTRIES,
+        ttl_seconds=settings.PROFILE_CACHE_TTL_SECONDS,
+        revalidate_seconds=settings.PROFILE_CACHE_REVALIDATE_SECONDS,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def shared_user_profile_cache() -> ProfileCache[Any] | None:
+    """The process-wide user profile cache (None when disabled)."""
+    return _profile_cache()
+
+
+@functools.lru_cache(maxsize=1)
+def shared_trainer_profile_cache() -> ProfileCache[Any] | None:
+    """The process-wide trainer profile cache (None when disabled)."""
+    return _profile_cache()
@@ -0,0 +1,198 @@
+"""
+In-process view of the JWT blocklist.
+
+Every authenticated request checks the blocklist, so each worker keeps the
+SHA-256 hashes of the blocked tokens in memory and answers from there. A
+Bloom filter over the hashes rejects the common case (a token that was
+never blocked) without touching the set.
+
+A daemon thread polls ``token_blocklist`` for documents newer than the last
+``_id`` seen every ``refresh_seconds``. If the view is older than
+``max_staleness_seconds`` (thread not started yet, Mongo slow), the check
+refreshes inline first, so a logout on another worker is honoured within
+that window. Logouts on this worker are added right away. Entries are
+dropped once their token expires, as the TTL index does in Mongo.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from bson import ObjectId
+
+from src.core.logs import logger
+from src.repositories.token_repository import TokenRepository
+
+# Blocklist writes of other workers can carry an ObjectId slightly older
+# than the newest one seen, so polls re-read this window.
+POLL_OVERLAP = timedelta(seconds=5)
+
+
+def token_digest(token: str) -> bytes:
+    """SHA-256 of a token; only digests are kept in memory."""
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over SHA-256 digests."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = capacity = max(1, capacity)
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, digest: bytes):
+        # Double hashing on two independent halves of the digest.
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:16], "big") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, digest: bytes) -> None:
+        """Adds a digest."""
+        for position in self._positions(digest):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, digest: bytes) -> bool:
+        """False means the digest was never added."""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(digest)
+        )
+
+
+class _BlocklistPoller:
+    """Position of the last poll and the daemon thread repeating it."""
+
+    def __init__(self, refresh: Callable[[], int], interval: float):
+        self.refresh = refresh
+        self.interval = interval
+        self.last_id: ObjectId | None = None
+        self.refreshed_at: float | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def started(self) -> bool:
+        """Whether the thread was started."""
+        return self._thread is not None
+
+    def since(self) -> ObjectId | None:
+        """Lower bound of the next poll, None before the first one."""
+        if self.last_id is None:
+            return None
+        return ObjectId.from_datetime(self.last_id.generation_time - POLL_OVERLAP)
+
+    def seen(self, doc_id: ObjectId) -> None:
+        """Advances the position past ``doc_id``."""
+        if self.last_id is None or doc_id > self.last_id:
+            self.last_id = doc_id
+
+    def start(self) -> None:
+        """Starts the thread unless it already runs."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="token-blocklist-refresher", daemon=True
+            )
+        self._thread.start()
+
+    def stop(self, timeout: float) -> None:
+        """Stops the thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("Token blocklist refresh failed: %s", e)
+
+
+class TokenBlocklistCache:
+    """Blocked token digests with their expiry, kept in sync with Mongo."""
+
+    def __init__(
+        self,
+        repository: TokenRepository,
+        *,
+        refresh_seconds: float = 1.0,
+        max_staleness_seconds: float = 5.0,
+    ):
+        self.repository = repository
+        self.max_staleness_seconds = max_staleness_seconds
+        self._expires: dict[bytes, float] = {}
+        self._bloom = BloomFilter(1024)
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._poller = _BlocklistPoller(self.refresh, refresh_seconds)
+
+    def is_blocklisted(self, token: str) -> bool:
+        """Whether ``token`` was blocked (as of at most ``max_staleness_seconds`` ago)."""
+        self._ensure_fresh()
+        digest = token_digest(token)
+        with self._lock:
+            if not self._bloom.might_contain(digest):
+                return False
+            expires = self._expires.get(digest)
+        return expires is not None and expires > time.time()
+
+    def add(self, token: str, expires_at: datetime) -> None:
+        """Records a token blocked by this worker."""
+        with self._lock:
+            self._remember(token_digest(token), expires_at)
+
+    def refresh(self) -> int:
+        """Reads the blocklist entries written since the last refresh; returns how many."""
+        with self._refresh_lock:
+            docs = self.repository.blocked_since(self._poller.since())
+            now = time.time()
+            with self._lock:
+                for doc in docs:
+                    self._remember(token_digest(doc["token"]), doc["expires_at"])
+                    self._poller.seen(doc["_id"])
+                self._prune(now)
+                self._poller.refreshed_at = time.monotonic()
+            return len(docs)
+
+    def start(self) -> None:
+        """Starts the background poller."""
+        self._poller.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stops the background poller."""
+        self._poller.stop(timeout)
+
+    def _ensure_fresh(self) -> None:
+        if not self._poller.started:
+            self.start()
+        refreshed_at = self._poller.refreshed_at
+        if refreshed_at is None or time.monotonic() - refreshed_at > self.max_staleness_seconds:
+            self.refresh()
+
+    def _remember(self, digest: bytes, expires_at: datetime) -> None:
+        if expires_at.tzinfo is None:
+            # Mongo returns naive UTC datetimes.
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        self._expires[digest] = expires_at.timestamp()
+        self._bloom.add(digest)
+
+    def _prune(self, now: float) -> None:
+        expired = [digest for digest, expires in self._expires.items() if expires <= now]
+        for digest in expired:
+            del self._expires[digest]
+        # Bloom filters cannot forget: rebuild without the expired entries,
+        # or larger once the filter is past the size it was built for.
+        if expired or len(self._expires) > self._bloom.capacity:
+            self._bloom = BloomFilter(max(1024, len(self._expires) * 2))
+            for digest in self._expires:
+                self._bloom.add(digest)
@@ -0,0 +1,130 @@
+"""
+Request-scoped memoization shared by repositories and services.
+
+A chat turn (or any other unit of work) opens a scope with
+``turn_cache_scope()``. While the scope is active, reads routed through
+``turn_cached`` are computed at most once; outside a scope they always hit
+the loader, so callers keep their normal semantics. Any repository write
+calls ``invalidate_turn_cache`` so later reads in the same scope see fresh
+data.
+"""
+
+from __future__ import annotations
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Iterator, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class TurnCache:
+    """In-memory store for values derived during a single unit of work."""
+
+    def __init__(self) -> None:
+        self._values: dict[Hashable, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Return the cached value for key, computing it with loader on miss."""
+        if key in self._values:
+            self.hits += 1
+            return self._values[key]
+        self.misses += 1
+        value = loader()
+        self._values[key] = value
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        self._values.clear()
+
+
+_current_turn_cache: ContextVar[TurnCache | None] = ContextVar(
+    "turn_cache", default=None
+)
+
+
+def get_turn_cache() -> TurnCache | None:
+    """Return the active turn cache, if any."""
+    return _current_turn_cache.get()
+
+
+@contextmanager
+def turn_cache_scope() -> Iterator[TurnCache]:
+    """Activate a turn cache for the enclosed block (re-entrant)."""
+    existing = _current_turn_cache.get()
+    if existing is not None:
+        yield existing
+        return
+    cache = TurnCache()
+    token = _current_turn_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_turn_cache.reset(token)
+
+
+def turn_cached(key: Hashable, loader: Callable[[], T]) -> T:
+    """
+    Memoize loader under key for the active scope.
+
+    Every caller gets its own copy of lists, dicts and Pydantic models, so
+    sorting, filtering or editing the result in place does not corrupt the
+    cached value.
+    """
+    cache = _current_turn_cache.get()
+    if cache is None:
+        return loader()
+    return _detached(cache.get_or_load(key, loader))
+
+
+def _detached(value: T) -> T:
+    """Copy of a cached value that callers may mutate freely."""
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)  # type: ignore[return-value]
+    if isinstance(value, list):
+        return [_detached(item) for item in value]  # type: ignore[return-value]
+    if isinstance(value, dict):
+        return {k: _detached(v) for k, v in value.items()}  # type: ignore[return-value]
+    return value
+
+
+def invalidate_turn_cache() -> None:
+    """Forget everything cached in the active scope after a write."""
+    cache = _current_turn_cache.get()
+    if cache is not None:
+        cache.clear()
+
+
+def turn_memoized(method: Callable[..., T]) -> Callable[..., T]:
+    """Decorate a read method so repeated calls in one scope share a result."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            type(self).__qualname__,
+            method.__name__,
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        return turn_cached(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
+
+def invalidates_turn_cache(method: Callable[..., T]) -> Callable[..., T]:
+    """Decorate a write method so it clears the active scope once it runs."""
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        finally:
+            invalidate_turn_cache()
+
+    return wrapper
@@ -2,9 +2,68 @@
 This module contains the base repository class for all MongoDB repositories.
 """
 
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import pymongo
+from pymongo import UpdateOne
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.database import Database
 from bson import ObjectId
 from src.core.logs import logger
+from src.core.turn_cache import invalidates_turn_cache
+from src.utils.pagination import decode_cursor, keyset_filter
+
+if TYPE_CHECKING:
+    from src.repositories.tdee_state_repository import TdeeStateRepository
+
+
+@dataclass(frozen=True)
+class FindSpec:
+    """
+    One find, described once and run by either a sync repository or its
+    async counterpart, so both paths read the same documents.
+    """
+
+    query: dict
+    sort: tuple[str, int] | None = None
+    limit: int = 0
+    projection: dict | None = None
+
+    def cursor(self, collection):
+        """The find cursor on a sync or async collection."""
+        if self.projection is None:
+            cursor = collection.find(self.query)
+        else:
+            cursor = collection.find(self.query, self.projection)
+        if self.sort is not None:
+            cursor = cursor.sort(*self.sort)
+        if self.limit:
+            cursor = cursor.limit(self.limit)
+        return cursor
+
+    def find_one_kwargs(self) -> dict:
+        """Keyword arguments of the equivalent ``find_one``."""
+        kwargs: dict = {}
+        if self.projection is not None:
+            kwargs["projection"] = self.projection
+        if self.sort is not None:
+            kwargs["sort"] = [self.sort]
+        return kwargs
+
+
+def recent_user_logs(user_email: str, limit: int) -> FindSpec:
+    """A user's newest ``limit`` date-keyed logs, newest first."""
+    return FindSpec({"user_email": user_email}, sort=("date", -1), limit=limit)
+
+
+def user_logs_between(user_email: str, start, end) -> FindSpec:
+    """A user's date-keyed logs with ``start <= date <= end``, oldest first."""
+    return FindSpec(
+        {"user_email": user_email, "date": {"$gte": start, "$lte": end}},
+        sort=("date", 1),
+    )
 
 
 class BaseRepository:
@@ -16,6 +75,14 @@ class BaseRepository:
         self.collection = database[collection_name]
         self.logger = logger
 
+    def find_many(self, spec: FindSpec) -> list[dict]:
+        """Runs a find and returns the documents as a list."""
+        return list(spec.cursor(self.collection))
+
+    def find_first(self, spec: FindSpec) -> dict | None:
+        """The first document of a find, or None."""
+        return self.collection.find_one(spec.query, **spec.find_one_kwargs())
+
     def get_paginated_cursor(
         self,
         query: dict,
@@ -37,6 +104,34 @@ class BaseRepository:
         )
         return cursor, total
 
+    def get_keyset_page(
+        self,
+        query: dict,
+        page_size: int = 10,
+        cursor: str | None = None,
+        sort: tuple[str, int] | None = None,
+    ) -> tuple[list[dict], bool]:
+        """
+        Cursor pagination ordered by ``(sort field, _id)``.
+
+        Returns the page and whether more documents follow; the page starts
+        after the position encoded in ``cursor`` (from ``keyset_cursor``),
+        or at the beginning without one. Raises InvalidCursorError on a bad
+        cursor.
+        """
+        if sort is None:
+            sort = ("date", -1)
+        field, direction = sort
+
+        if cursor:
+            query = {"$and": [query, keyset_filter(decode_cursor(cursor), field, direction)]}
+        docs = list(
+            self.collection.find(query)
+            .sort([(field, direction), ("_id", direction)])
+            .limit(page_size + 1)
+        )
+        return docs[:page_size], len(docs) > page_size
+
     def upsert_document(
         self, query: dict, data: dict, log_name: str
     ) -> tuple[str, bool]:
@@ -89,3 +184,106 @@ class BaseRepository:
             data=payload,
             log_name=log_name,
         )
+
+
+class DailyLogRepository(BaseRepository, ABC):
+    """
+    Base of the one-log-per-day collections that feed the persisted TDEE
+    state (nutrition and weight logs); every write flags that state for a
+    rebuild from the log's day.
+    """
+
+    COLLECTION_NAME = ""
+    LOG_NAME = ""  # names the query index and log lines
+
+    def __init__(
+        self,
+        database: Database,
+        tdee_states: "TdeeStateRepository | None" = None,
+    ):
+        super().__init__(database, self.COLLECTION_NAME)
+        self.tdee_states = tdee_states
+        self.ensure_query_indexes()
+
+    def _mark_tdee_stale(self, user_email: str, log_date) -> None:
+        """Flags the persisted TDEE state for rebuild after a log change."""
+        if self.tdee_states is not None:
+            self.tdee_states.mark_stale(user_email, log_date)
+
+    def ensure_query_indexes(self) -> None:
+        """Ensures indexes used by frequent log reads and keyset pages."""
+        self.collection.create_index(
+            [
+                ("user_email", pymongo.ASCENDING),
+                ("date", pymongo.DESCENDING),
+                ("_id", pymongo.DESCENDING),
+            ],
+            name=f"{self.LOG_NAME}_user_date_id_idx",
+        )
+        self.logger.info("%s query indexes ensured.", self.LOG_NAME.capitalize())
+
+    @staticmethod
+    @abstractmethod
+    def _daily_upsert(log) -> tuple[dict, dict]:
+        """Returns the upsert query and data of the log's day."""
+
+    @invalidates_turn_cache
+    def save_log(self, log) -> tuple[str, bool]:
+        """
+        Saves or updates the log of a day.
+        """
+        query, data = self._daily_upsert(log)
+        result = self.upsert_document(query, data, f"{self.LOG_NAME} log (date: {log.date})")
+        self._mark_tdee_stale(log.user_email, log.date)
+        return result
+
+    @invalidates_turn_cache
+    def save_logs(self, logs: list) -> tuple[int, int]:
+        """
+        Upserts daily logs in one unordered bulk write.
+
+        Returns ``(created, updated)`` from the bulk result. A partial failure
+        raises ``BulkWriteError`` after the TDEE state was flagged.
+        """
+        if not logs:
+            return 0, 0
+        operations = [
+            UpdateOne(query, {"$set": data}, upsert=True)
+            for query, data in map(self._daily_upsert, logs)
+        ]
+        try:
+            result = self.collection.bulk_write(operations, ordered=False)
+        finally:
+            for user_email in {log.user_email for log in logs}:
+                self._mark_tdee_stale(
+                    user_email, min(log.date for log in logs if log.user_email == user_email)
+                )
+        self.logger.info(
+            "Bulk upserted %d %s logs (%d new)",
+            len(logs),
+            self.LOG_NAME,
+            result.upserted_count,
+        )
+        return result.upserted_count, result.matched_count
+
+
+class AsyncBaseRepository:
+    """
+    Async counterpart of BaseRepository on a ``pymongo.AsyncMongoClient`` database.
+
+    Async repositories expose the read/write surface used by async callers
+    (the chat path); index management stays with the sync repositories,
+    which create indexes at startup.
+    """
+
+    def __init__(self, database: AsyncDatabase, collection_name: str):
+        self.collection = database[collection_name]
+        self.logger = logger
+
+    async def find_many(self, spec: FindSpec) -> list[dict]:
+        """Runs a find and returns the documents as a list."""
+        return await spec.cursor(self.collection).to_list()
+
+    async def find_first(self, spec: FindSpec) -> dict | None:
+        """The first document of a find, or None."""
+        return await self.collection.find_one(spec.query, **spec.find_one_kwargs())
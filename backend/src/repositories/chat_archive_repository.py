@@ -0,0 +1,184 @@
+"""
+This module contains the repository for archived (cold) chat history.
+
+Messages older than the hot window are moved out of ``message_store`` into
+``message_archive``: per-session chunks of consecutive messages whose raw
+documents are stored as one zlib-compressed BSON array. The chat
+repositories fall through to the archive when a history read runs past the
+oldest hot message.
+"""
+
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import AsyncIterator, Callable, Iterator
+
+import bson
+import pymongo
+from bson import Binary, ObjectId
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.database import Database
+
+from src.repositories.base import AsyncBaseRepository, BaseRepository
+
+ARCHIVE_COLLECTION = "message_archive"
+CODEC_ZLIB = "zlib"
+
+
+def unpack_chunk(chunk: dict) -> list[dict]:
+    """Raw message documents of a chunk, oldest first."""
+    if chunk.get("codec") != CODEC_ZLIB:
+        raise ValueError(f"Unknown chat archive codec: {chunk.get('codec')}")
+    return bson.decode(zlib.decompress(chunk["data"]))["messages"]
+
+
+def _older_than(docs: list[dict], before: ObjectId | None) -> list[dict]:
+    """Newest-first documents of a chunk older than ``before``."""
+    return [
+        doc for doc in reversed(docs) if before is None or doc["_id"] < before
+    ]
+
+
+def _chunk_query(session_id: str, before: ObjectId | None) -> dict:
+    query: dict = {"SessionId": session_id}
+    if before is not None:
+        query["first_id"] = {"$lt": before}
+    return query
+
+
+class ChatArchiveRepository(BaseRepository):
+    """
+    Compressed chunks of archived chat messages.
+
+    A chunk holds the raw documents (system messages included) of one
+    session between ``first_id`` and ``last_id``. Chunks are keyed by
+    ``(SessionId, first_id)`` and written before the hot copies are
+    deleted, so an interrupted run can simply be repeated.
+    """
+
+    def __init__(self, database: Database):
+        super().__init__(database, ARCHIVE_COLLECTION)
+
+    def ensure_indexes(self) -> None:
+        """Ensures the chunk key, which also serves reads newest first."""
+        self.collection.create_index(
+            [("SessionId", pymongo.ASCENDING), ("first_id", pymongo.DESCENDING)],
+            unique=True,
+            name="archive_session_chunk_idx",
+        )
+
+    def iter_documents(
+        self, session_id: str, before: ObjectId | None = None
+    ) -> Iterator[dict]:
+        """Archived raw documents of a session older than ``before``, newest first."""
+        cursor = self.collection.find(_chunk_query(session_id, before)).sort(
+            "first_id", -1
+        )
+        for chunk in cursor:
+            yield from _older_than(unpack_chunk(chunk), before)
+
+    def archive_session(
+        self,
+        messages_collection,
+        session_id: str,
+        cutoff: ObjectId,
+        chunk_size: int = 200,
+    ) -> dict:
+        """
+        Moves the session's messages older than ``cutoff`` into chunks of
+        ``chunk_size`` documents and returns the counters.
+        """
+        counters = {"messages": 0, "chunks": 0, "raw_bytes": 0, "stored_bytes": 0}
+        batch: list[dict] = []
+        cursor = messages_collection.find(
+            {"SessionId": session_id, "_id": {"$lt": cutoff}}
+        ).sort("_id", 1)
+        for doc in cursor:
+            batch.append(doc)
+            if len(batch) >= chunk_size:
+                self._move_chunk(messages_collection, session_id, batch, counters)
+                batch = []
+        if batch:
+            self._move_chunk(messages_collection, session_id, batch, counters)
+        return counters
+
+    def _move_chunk(
+        self, messages_collection, session_id: str, docs: list[dict], counters: dict
+    ) -> None:
+        raw = bson.encode({"messages": docs})
+        data = zlib.compress(raw, 6)
+        chunk = {
+            "SessionId": session_id,
+            "first_id": docs[0]["_id"],
+            "last_id": docs[-1]["_id"],
+            "count": len(docs),
+            "codec": CODEC_ZLIB,
+            "data": Binary(data),
+            "archived_at": datetime.now(timezone.utc),
+        }
+        self.collection.replace_one(
+            {"SessionId": session_id, "first_id": chunk["first_id"]}, chunk, upsert=True
+        )
+        messages_collection.delete_many({"_id": {"$in": [doc["_id"] for doc in docs]}})
+        counters["messages"] += len(docs)
+        counters["chunks"] += 1
+        counters["raw_bytes"] += len(raw)
+        counters["stored_bytes"] += len(data)
+
+    def archive_older_than(
+        self,
+        messages_collection,
+        older_than: datetime,
+        chunk_size: int = 200,
+        progress: Callable[[str, dict], None] | None = None,
+    ) -> dict:
+        """
+        Archives every session's messages written before ``older_than``.
+
+        ``progress`` is called after each session with its id and the
+        running totals (``messages_per_second`` included). Demo sessions
+        (with published ``demo_message_id`` messages) stay hot: the admin
+        deletes their messages from ``message_store`` only.
+        """
+        cutoff = ObjectId.from_datetime(older_than)
+        totals = {"sessions": 0, "messages": 0, "chunks": 0, "raw_bytes": 0, "stored_bytes": 0}
+        started = time.perf_counter()
+        demo_sessions = set(
+            messages_collection.distinct("SessionId", {"demo_message_id": {"$exists": True}})
+        )
+        for session_id in messages_collection.distinct("SessionId", {"_id": {"$lt": cutoff}}):
+            if session_id in demo_sessions:
+                continue
+            counters = self.archive_session(messages_collection, session_id, cutoff, chunk_size)
+            totals["sessions"] += 1
+            for key, value in counters.items():
+                totals[key] += value
+            elapsed = time.perf_counter() - started
+            totals["seconds"] = round(elapsed, 1)
+            totals["messages_per_second"] = (
+                round(totals["messages"] / elapsed, 1) if elapsed else 0.0
+            )
+            if progress is not None:
+                progress(session_id, totals)
+        self.logger.info(
+            "Archived %d chat messages of %d sessions", totals["messages"], totals["sessions"]
+        )
+        return totals
+
+
+class AsyncChatArchiveRepository(AsyncBaseRepository):
+    """Async counterpart of ChatArchiveRepository for the chat path (reads only)."""
+
+    def __init__(self, database: AsyncDatabase):
+        super().__init__(database, ARCHIVE_COLLECTION)
+
+    async def iter_documents(
+        self, session_id: str, before: ObjectId | None = None
+    ) -> AsyncIterator[dict]:
+        """Archived raw documents of a session older than ``before``, newest first."""
+        cursor = self.collection.find(_chunk_query(session_id, before)).sort(
+            "first_id", -1
+        )
+        async for chunk in cursor:
+            for doc in _older_than(unpack_chunk(chunk), before):
+                yield doc
@@ -3,9 +3,12 @@ This module contains the repository for chat history management using MongoDB.
 """
 
 import json
-from datetime import datetime
+from contextlib import aclosing
+from datetime import datetime, timezone
 
 import pymongo
+from bson import ObjectId
+from pymongo import UpdateOne
 from pydantic_ai.messages import (
     ModelRequest,
     ModelResponse,
@@ -15,7 +18,67 @@ from pydantic_ai.messages import (
 
 from src.api.models.chat_history import ChatHistory
 from src.api.models.sender import Sender
-from src.repositories.base import BaseRepository
+from src.core.chat_history_cache import ChatHistoryCache
+from src.repositories.base import AsyncBaseRepository, BaseRepository, FindSpec
+from src.repositories.chat_archive_repository import (
+    AsyncChatArchiveRepository,
+    ChatArchiveRepository,
+)
+
+
+def to_pydantic_ai_messages(messages: list[ChatHistory]) -> list:
+    """Convert public chat messages into Pydantic AI model messages."""
+    result = []
+    for message in messages:
+        try:
+            timestamp = datetime.fromisoformat(message.timestamp)
+        except (ValueError, TypeError):
+            timestamp = datetime.now()
+        if message.sender == Sender.STUDENT:
+            result.append(
+                ModelRequest(
+                    parts=[UserPromptPart(content=message.text, timestamp=timestamp)],
+                    timestamp=timestamp,
+                )
+            )
+        elif message.sender == Sender.TRAINER:
+            result.append(
+                ModelResponse(
+                    parts=[TextPart(content=message.text)],
+                    timestamp=timestamp,
+                    model_name=message.trainer_type,
+                )
+            )
+    return result
+
+
+_MAX_HISTORY_BATCHES = 30
+
+# Documents written before the normalized schema have no ``is_public``
+# (None matches them) until scripts/backfill_message_schema.py ran;
+# those are still decoded and filtered here.
+_PUBLIC_FILTER = {"$in": [True, None]}
+_HISTORY_PROJECTION = {"History": 1, "sender": 1, "is_public": 1}
+
+
+def _history_batch(user_id: str, before: ObjectId | None, limit: int) -> FindSpec:
+    """Up to ``limit`` possibly public messages older than ``before``, newest first."""
+    query: dict = {"SessionId": user_id, "is_public": _PUBLIC_FILTER}
+    if before is not None:
+        query["_id"] = {"$lt": before}
+    return FindSpec(query, sort=("_id", -1), limit=limit, projection=_HISTORY_PROJECTION)
+
+
+def _recent_ids(user_id: str, since: ObjectId | None) -> FindSpec:
+    """Ids of the session's possibly public messages from ``since`` on (covered read)."""
+    query: dict = {"SessionId": user_id, "is_public": _PUBLIC_FILTER}
+    if since is not None:
+        query["_id"] = {"$gte": since}
+    return FindSpec(query, projection={"_id": 1})
+
+
+def _messages_by_id(ids: list[ObjectId]) -> FindSpec:
+    return FindSpec({"_id": {"$in": ids}}, projection=_HISTORY_PROJECTION)
 
 
 class SimpleWindowMemory:  # pylint: disable=too-few-public-methods
@@ -32,29 +95,68 @@ class SimpleWindowMemory:  # pylint: disable=too-few-public-methods
 class ChatRepository(BaseRepository):
     """
     Repository for managing public chat history in MongoDB.
+
+    With a ``history_cache``, reads of the newest messages are served from
+    the per-process cache and writes are appended to it. With an
+    ``archive``, reads that run past the oldest stored message continue in
+    the archived history.
     """
 
-    def __init__(self, database):
+    def __init__(
+        self,
+        database,
+        history_cache: ChatHistoryCache | None = None,
+        archive: ChatArchiveRepository | None = None,
+    ):
         super().__init__(database, "message_store")
         self.db = database
+        self.history_cache = history_cache
+        self.archive = archive
         self.ensure_indexes()
 
-    _HISTORY_BATCH_SIZE_FACTOR = 3
-    _MAX_HISTORY_BATCHES = 30
-
     def ensure_indexes(self) -> None:
         """Ensures indexes used by history pagination."""
         self.collection.create_index(
             [("SessionId", pymongo.ASCENDING), ("_id", pymongo.DESCENDING)],
             name="session_recent_history_idx",
         )
+        self.collection.create_index(
+            [
+                ("SessionId", pymongo.ASCENDING),
+                ("is_public", pymongo.ASCENDING),
+                ("_id", pymongo.DESCENDING),
+            ],
+            name="session_public_history_idx",
+        )
+        if self.archive is not None:
+            self.archive.ensure_indexes()
         self.logger.info("Chat history indexes ensured.")
 
-    @staticmethod
-    def _decode_public_chat_message(doc) -> ChatHistory | None:
+    @classmethod
+    def _decode_public_chat_message(cls, doc) -> ChatHistory | None:
         """
         Decodes a raw Mongo doc into ChatHistory and filters out system messages.
+
+        Normalized documents are built from their fields as stored; older
+        ones go through the legacy decoding.
         """
+        history = doc.get("History")
+        if doc.get("is_public") is False:
+            return None
+        if doc.get("is_public") is True and isinstance(history, dict):
+            return ChatHistory(
+                text=history.get("text") or "",
+                translations=history.get("translations"),
+                images=history.get("images"),
+                sender=Sender(doc["sender"]),
+                timestamp=history.get("timestamp") or datetime.min.isoformat(),
+                trainer_type=history.get("trainer_type"),
+            )
+        return cls._decode_legacy_chat_message(doc)
+
+    @staticmethod
+    def _decode_legacy_chat_message(doc) -> ChatHistory | None:
+        """Decodes the LangChain JSON and plain History formats."""
         try:
             raw_history = doc["History"]
             msg_dict = (
@@ -117,36 +219,140 @@ class ChatRepository(BaseRepository):
             offset,
         )
 
-        # Query recent records in batches from the end of the collection
-        # to avoid scanning the full conversation on every request.
-        target_public = limit + max(offset, 0)
-        batch_size = max(limit * self._HISTORY_BATCH_SIZE_FACTOR, limit)
-        public_messages_desc = []
-        oldest_seen_id = None
+        public_messages_desc = [
+            message
+            for _, message in self._newest_public_messages(
+                user_id, limit + max(offset, 0)
+            )
+        ]
+        return self._page_public_messages(public_messages_desc, limit, offset)
+
+    def get_history_page(
+        self, user_id: str, limit: int = 20, before: ObjectId | None = None
+    ) -> tuple[list[ChatHistory], ObjectId | None]:
+        """
+        Retrieves the public messages older than ``before`` (the newest when
+        omitted) and the ``_id`` to pass as ``before`` for the next page, or
+        None when the history is exhausted.
+
+        Unlike ``offset`` paging, every page starts reading at its own
+        position in the session index instead of rescanning newer messages.
+        """
+        if before is None:
+            found = self._newest_public_messages(user_id, limit)
+        else:
+            found = self._scan_public_messages(user_id, limit, before)
+        next_before = found[-1][0] if found and len(found) >= limit else None
+        return self._page_public_messages([m for _, m in found], limit, 0), next_before
+
+    def _newest_public_messages(
+        self, user_id: str, target: int
+    ) -> list[tuple[ObjectId, ChatHistory]]:
+        """Newest-first ``(_id, message)`` pairs, from the cache when it covers ``target``."""
+        if self.history_cache is not None and self.history_cache.covers(target):
+            cached = self._cached_newest(user_id, target)
+            if cached is not None:
+                cached.reverse()
+                return cached
+        return self._scan_public_messages(user_id, target)
+
+    def _cached_newest(
+        self, user_id: str, count: int
+    ) -> list[tuple[ObjectId, ChatHistory]] | None:
+        """Brings the session's cache entry up to date and reads it (oldest first)."""
+        cache = self.history_cache
+        status, since = cache.state(user_id)
+        if status == "probe":
+            recent = self.find_many(_recent_ids(user_id, since))
+            unseen = cache.plan_refresh(user_id, [doc["_id"] for doc in recent])
+            if unseen is None:
+                status = "load"
+            elif unseen:
+                docs = self.find_many(_messages_by_id(unseen))
+                cache.merge(user_id, self._decoded_pairs(docs), checked=True)
+        if status == "load":
+            raw_ids: list[ObjectId] = []
+            found = self._scan_public_messages(user_id, cache.capacity, raw_ids=raw_ids)
+            cache.store(user_id, found, raw_ids, complete=len(found) < cache.capacity)
+        return cache.newest(user_id, count)
+
+    @classmethod
+    def _decoded_pairs(cls, docs) -> list[tuple[ObjectId, ChatHistory | None]]:
+        """``(_id, message)`` for raw documents, None for non-public ones."""
+        return [(doc["_id"], cls._decode_public_chat_message(doc)) for doc in docs]
+
+    @classmethod
+    def _take_public(
+        cls,
+        docs: list[dict],
+        found: list[tuple[ObjectId, ChatHistory]],
+        target: int,
+        raw_ids: list[ObjectId] | None = None,
+    ) -> bool:
+        """
+        Appends the public messages of newest-first ``docs`` to ``found``
+        until it holds ``target``; returns whether it does.
+        """
+        for doc in docs:
+            if raw_ids is not None:
+                raw_ids.append(doc.get("_id"))
+            parsed = cls._decode_public_chat_message(doc)
+            if parsed is None:
+                continue
+            found.append((doc.get("_id"), parsed))
+            if len(found) >= target:
+                return True
+        return False
 
-        for _ in range(self._MAX_HISTORY_BATCHES):
-            query = {"SessionId": user_id}
-            if oldest_seen_id is not None:
-                query["_id"] = {"$lt": oldest_seen_id}
-            cursor = (
-                self.collection.find(query, {"History": 1})
-                .sort("_id", -1)
-                .limit(batch_size)
+    def _scan_public_messages(
+        self,
+        user_id: str,
+        target: int,
+        before: ObjectId | None = None,
+        raw_ids: list[ObjectId] | None = None,
+    ) -> list[tuple[ObjectId, ChatHistory]]:
+        """
+        Newest-first ``(_id, message)`` pairs, stopping at ``target`` public
+        messages. ``raw_ids`` collects the ids of every document read.
+
+        Mongo filters on ``is_public``, so once the history is normalized
+        the first range read on the session index returns the whole page;
+        further batches only run past documents not backfilled yet. Once
+        the stored messages are exhausted, the archive fills the rest.
+        """
+        found: list[tuple[ObjectId, ChatHistory]] = []
+        oldest_seen_id = before
+
+        for _ in range(_MAX_HISTORY_BATCHES):
+            batch_docs = self.find_many(
+                _history_batch(user_id, oldest_seen_id, target)
             )
-            batch_docs = list(cursor)
             if not batch_docs:
-                break
+                return found + self._archived_public_messages(
+                    user_id, oldest_seen_id, target - len(found)
+                )
             oldest_seen_id = batch_docs[-1].get("_id")
-            for doc in batch_docs:
-                parsed = self._decode_public_chat_message(doc)
-                if parsed is None:
-                    continue
-                public_messages_desc.append(parsed)
-                if len(public_messages_desc) >= target_public:
-                    break
-            if len(public_messages_desc) >= target_public:
+            if self._take_public(batch_docs, found, target, raw_ids):
+                return found
+
+        return found
+
+    def _archived_public_messages(
+        self, user_id: str, before: ObjectId | None, count: int
+    ) -> list[tuple[ObjectId, ChatHistory]]:
+        """Newest-first archived public messages older than ``before``."""
+        found: list[tuple[ObjectId, ChatHistory]] = []
+        if self.archive is None or count <= 0:
+            return found
+        for doc in self.archive.iter_documents(user_id, before):
+            if self._take_public([doc], found, count):
                 break
+        return found
 
+    @staticmethod
+    def _page_public_messages(
+        public_messages_desc: list[ChatHistory], limit: int, offset: int
+    ) -> list[ChatHistory]:
         # Messages are collected as newest->oldest.
         # Apply offset/limit relative to the newest end, then reverse for UI chronology.
         if offset > 0:
@@ -177,13 +383,71 @@ class ChatRepository(BaseRepository):
             trainer_type,
         )
 
-    def add_messages(
-        self,
+    @staticmethod
+    def _history_payload(message: ChatHistory) -> dict:
+        """The ``History`` field of a normalized public message."""
+        return {
+            "sender": message.sender.value,
+            "text": message.text,
+            "timestamp": message.timestamp,
+            "images": message.images,
+            "trainer_type": message.trainer_type,
+            "translations": message.translations,
+        }
+
+    @classmethod
+    def _normalized_fields(cls, doc: dict) -> dict:
+        """
+        Normalized schema fields of a message_store document: top-level
+        ``sender``, ``is_public`` and ``ts`` (write time, UTC), and the
+        ``History`` of public messages as a plain document.
+        """
+        doc_id = doc.get("_id")
+        ts = (
+            doc_id.generation_time
+            if isinstance(doc_id, ObjectId)
+            else datetime.now(timezone.utc)
+        )
+        message = cls._decode_legacy_chat_message(doc)
+        if message is None:
+            return {"sender": Sender.SYSTEM.value, "is_public": False, "ts": ts}
+        return {
+            "sender": message.sender.value,
+            "is_public": True,
+            "ts": ts,
+            "History": cls._history_payload(message),
+        }
+
+    def backfill_normalized_schema(self, batch_size: int = 1000) -> dict:
+        """
+        Adds the normalized fields to documents written before them, with
+        one unordered bulk write per ``batch_size`` documents.
+        """
+        counters = {"scanned": 0, "public": 0, "hidden": 0}
+        operations: list[UpdateOne] = []
+        for doc in self.collection.find(
+            {"is_public": {"$exists": False}}, {"History": 1}
+        ).batch_size(batch_size):
+            fields = self._normalized_fields(doc)
+            operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": fields}))
+            counters["scanned"] += 1
+            counters["public" if fields["is_public"] else "hidden"] += 1
+            if len(operations) >= batch_size:
+                self.collection.bulk_write(operations, ordered=False)
+                operations = []
+        if operations:
+            self.collection.bulk_write(operations, ordered=False)
+        self.logger.info("Normalized %d chat messages", counters["scanned"])
+        return counters
+
+    @classmethod
+    def _history_documents(
+        cls,
         chat_histories: list[ChatHistory],
         session_id: str,
-        trainer_type: str | None = None,
-    ) -> None:
-        """Persist multiple chat messages with one MongoDB round trip."""
+        trainer_type: str | None,
+    ) -> list[dict]:
+        """Builds message_store documents for add_messages."""
         now = datetime.now().isoformat()
         documents = []
         for chat_history in chat_histories:
@@ -193,22 +457,35 @@ class ChatRepository(BaseRepository):
             if chat_history.images:
                 additional_kwargs["images"] = chat_history.images
 
-            documents.append(
-                {
-                    "SessionId": session_id,
-                    "History": {
-                        "sender": chat_history.sender.value,
-                        "text": chat_history.text,
-                        "timestamp": additional_kwargs["timestamp"],
-                        "images": chat_history.images,
-                        "trainer_type": trainer_type,
-                        "translations": chat_history.translations,
-                    },
-                }
-            )
+            document = {
+                "SessionId": session_id,
+                "History": {
+                    "sender": chat_history.sender.value,
+                    "text": chat_history.text,
+                    "timestamp": additional_kwargs["timestamp"],
+                    "images": chat_history.images,
+                    "trainer_type": trainer_type,
+                    "translations": chat_history.translations,
+                },
+            }
+            document.update(cls._normalized_fields(document))
+            documents.append(document)
 
+        return documents
+
+    def add_messages(
+        self,
+        chat_histories: list[ChatHistory],
+        session_id: str,
+        trainer_type: str | None = None,
+    ) -> None:
+        """Persist multiple chat messages with one MongoDB round trip."""
+        documents = self._history_documents(chat_histories, session_id, trainer_type)
         if documents:
             self.collection.insert_many(documents, ordered=True)
+            if self.history_cache is not None:
+                # insert_many set the _ids on the documents.
+                self.history_cache.merge(session_id, self._decoded_pairs(documents))
 
     def get_window_memory(self, session_id: str, k: int = 40) -> SimpleWindowMemory:
         """Return a compatibility object containing the latest public messages."""
@@ -217,25 +494,120 @@ class ChatRepository(BaseRepository):
     def get_pydantic_ai_history(self, session_id: str, limit: int = 20) -> list:
         """Return recent public history as Pydantic AI model messages."""
         messages = self.get_history(session_id, limit=limit, offset=0)
-        result = []
-        for message in messages:
-            try:
-                timestamp = datetime.fromisoformat(message.timestamp)
-            except (ValueError, TypeError):
-                timestamp = datetime.now()
-            if message.sender == Sender.STUDENT:
-                result.append(
-                    ModelRequest(
-                        parts=[UserPromptPart(content=message.text, timestamp=timestamp)],
-                        timestamp=timestamp,
-                    )
+        return to_pydantic_ai_messages(messages)
+
+
+class AsyncChatRepository(AsyncBaseRepository):
+    """Async counterpart of ChatRepository for the chat path."""
+
+    # pylint: disable=protected-access
+
+    def __init__(
+        self,
+        database,
+        history_cache: ChatHistoryCache | None = None,
+        archive: AsyncChatArchiveRepository | None = None,
+    ):
+        super().__init__(database, "message_store")
+        self.history_cache = history_cache
+        self.archive = archive
+
+    async def get_history(
+        self, user_id: str, limit: int = 20, offset: int = 0
+    ) -> list[ChatHistory]:
+        """
+        Retrieves paginated chat history for a session, excluding system messages.
+        """
+        target_public = limit + max(offset, 0)
+        if self.history_cache is not None and self.history_cache.covers(target_public):
+            cached = await self._cached_newest(user_id, target_public)
+            if cached is not None:
+                public_messages_desc = [message for _, message in reversed(cached)]
+                return ChatRepository._page_public_messages(
+                    public_messages_desc, limit, offset
                 )
-            elif message.sender == Sender.TRAINER:
-                result.append(
-                    ModelResponse(
-                        parts=[TextPart(content=message.text)],
-                        timestamp=timestamp,
-                        model_name=message.trainer_type,
-                    )
+        found = await self._scan_public_messages(user_id, target_public)
+        return ChatRepository._page_public_messages(
+            [message for _, message in found], limit, offset
+        )
+
+    async def _cached_newest(
+        self, user_id: str, count: int
+    ) -> list[tuple[ObjectId, ChatHistory]] | None:
+        """Brings the session's cache entry up to date and reads it (oldest first)."""
+        cache = self.history_cache
+        status, since = cache.state(user_id)
+        if status == "probe":
+            recent = await self.find_many(_recent_ids(user_id, since))
+            unseen = cache.plan_refresh(user_id, [doc["_id"] for doc in recent])
+            if unseen is None:
+                status = "load"
+            elif unseen:
+                docs = await self.find_many(_messages_by_id(unseen))
+                cache.merge(user_id, ChatRepository._decoded_pairs(docs), checked=True)
+        if status == "load":
+            raw_ids: list[ObjectId] = []
+            found = await self._scan_public_messages(
+                user_id, cache.capacity, raw_ids=raw_ids
+            )
+            cache.store(user_id, found, raw_ids, complete=len(found) < cache.capacity)
+        return cache.newest(user_id, count)
+
+    async def _scan_public_messages(
+        self,
+        user_id: str,
+        target: int,
+        raw_ids: list[ObjectId] | None = None,
+    ) -> list[tuple[ObjectId, ChatHistory]]:
+        """Newest-first ``(_id, message)`` pairs, stopping at ``target`` public messages."""
+        found: list[tuple[ObjectId, ChatHistory]] = []
+        oldest_seen_id = None
+
+        for _ in range(_MAX_HISTORY_BATCHES):
+            batch_docs = await self.find_many(
+                _history_batch(user_id, oldest_seen_id, target)
+            )
+            if not batch_docs:
+                return found + await self._archived_public_messages(
+                    user_id, oldest_seen_id, target - len(found)
                 )
-        return result
+            oldest_seen_id = batch_docs[-1].get("_id")
+            if ChatRepository._take_public(batch_docs, found, target, raw_ids):
+                return found
+
+        return found
+
+    async def _archived_public_messages(
+        self, user_id: str, before: ObjectId | None, count: int
+    ) -> list[tuple[ObjectId, ChatHistory]]:
+        """Newest-first archived public messages older than ``before``."""
+        found: list[tuple[ObjectId, ChatHistory]] = []
+        if self.archive is None or count <= 0:
+            return found
+        async with aclosing(self.archive.iter_documents(user_id, before)) as docs:
+            async for doc in docs:
+                if ChatRepository._take_public([doc], found, count):
+                    break
+        return found
+
+    async def add_messages(
+        self,
+        chat_histories: list[ChatHistory],
+        session_id: str,
+        trainer_type: str | None = None,
+    ) -> None:
+        """Persist multiple chat messages with one MongoDB round trip."""
+        documents = ChatRepository._history_documents(
+            chat_histories, session_id, trainer_type
+        )
+        if documents:
+            await self.collection.insert_many(documents, ordered=True)
+            if self.history_cache is not None:
+                self.history_cache.merge(
+                    session_id, ChatRepository._decoded_pairs(documents)
+                )
+
+    async def get_pydantic_ai_history(self, session_id: str, limit: int = 20) -> list:
+        """Return recent public history as Pydantic AI model messages."""
+        messages = await self.get_history(session_id, limit=limit, offset=0)
+        return to_pydantic_ai_messages(messages)
@@ -7,10 +7,28 @@ from active queries, ensuring the AI always has current/future context.
 
 from datetime import datetime
 from bson import ObjectId
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.database import Database
 
 from src.api.models.scheduled_event import ScheduledEvent, ScheduledEventWithId
-from src.repositories.base import BaseRepository
+from src.repositories.base import AsyncBaseRepository, BaseRepository, FindSpec
+
+
+def _active_events(user_email: str) -> FindSpec:
+    """Active events without a date or dated today or later, undated first."""
+    today = datetime.now().strftime("%Y-%m-%d")
+    return FindSpec(
+        {
+            "user_email": user_email,
+            "active": True,
+            "$or": [{"date": None}, {"date": {"$gte": today}}],
+        },
+        sort=("date", 1),
+    )
+
+
+def _to_event(doc: dict) -> ScheduledEventWithId:
+    return ScheduledEventWithId(**{**doc, "_id": str(doc["_id"])})
 
 
 class EventRepository(BaseRepository):
@@ -64,24 +82,7 @@ class EventRepository(BaseRepository):
         Returns:
             List of active events with future/no dates
         """
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        query = {
-            "user_email": user_email,
-            "active": True,
-            "$or": [{"date": None}, {"date": {"$gte": today}}],
-        }
-
-        cursor = (
-            self.collection.find(query).sort(
-                "date", 1
-            )  # Sort by date ascending (None first, then future)
-        )
-
-        events = []
-        for doc in cursor:
-            doc["_id"] = str(doc["_id"])
-            events.append(ScheduledEventWithId(**doc))
+        events = [_to_event(doc) for doc in self.find_many(_active_events(user_email))]
 
         self.logger.debug(
             "Retrieved %d active events for user: %s", len(events), user_email
@@ -173,3 +174,15 @@ class EventRepository(BaseRepository):
             )
 
         return updated
+
+
+class AsyncEventRepository(AsyncBaseRepository):
+    """Async read surface of EventRepository."""
+
+    def __init__(self, database: AsyncDatabase):
+        super().__init__(database, "events")
+
+    async def get_active_events(self, user_email: str) -> list[ScheduledEventWithId]:
+        """Retrieve active events (no date or not yet past) to inject in prompt."""
+        docs = await self.find_many(_active_events(user_email))
+        return [_to_event(doc) for doc in docs]
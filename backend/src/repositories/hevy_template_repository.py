@@ -0,0 +1,38 @@
+"""Repository for the shared Hevy exercise template cache."""
+
+import hashlib
+from datetime import datetime, timezone
+
+from pymongo.database import Database
+
+from src.repositories.base import BaseRepository
+
+
+def catalog_key(api_key: str) -> str:
+    """Cache key for an API key's catalog; raw keys are never stored."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+class HevyTemplateRepository(BaseRepository):
+    """
+    One document per Hevy API key with the full exercise template catalog.
+    Shared by every worker so restarts and new workers skip the API crawl.
+    """
+
+    def __init__(self, database: Database):
+        super().__init__(database, "hevy_exercise_templates")
+
+    def get_catalog(self, key: str) -> dict | None:
+        """Returns ``{"templates": [...], "fetched_at": datetime}`` or None."""
+        return self.collection.find_one({"_id": key}, {"templates": 1, "fetched_at": 1})
+
+    def save_catalog(self, key: str, templates: list[dict]) -> datetime:
+        """Stores a freshly fetched catalog and returns its timestamp."""
+        fetched_at = datetime.now(timezone.utc)
+        self.collection.replace_one(
+            {"_id": key},
+            {"templates": templates, "fetched_at": fetched_at},
+            upsert=True,
+        )
+        self.logger.info("Stored %d Hevy exercise templates", len(templates))
+        return fetched_at
@@ -2,36 +2,64 @@
 This module contains the repository for nutrition logs.
 """
 
+import asyncio
 from datetime import datetime, timedelta, date as py_date
-from typing import Any
+from typing import Any, TYPE_CHECKING
 import pymongo
 from bson import ObjectId
 from pymongo.database import Database
 
 from src.api.models.nutrition_log import NutritionLog, NutritionWithId
+from src.api.models.pagination import ListPosition
 from src.api.models.nutrition_stats import NutritionStats, DailyMacros
-from src.repositories.base import BaseRepository
+from src.core.turn_cache import invalidates_turn_cache, turn_memoized
+from src.repositories.base import (
+    AsyncBaseRepository,
+    DailyLogRepository,
+    FindSpec,
+    recent_user_logs,
+    user_logs_between,
+)
 from src.repositories.plan_repository import PlanRepository
 from src.services.macro_resolver import resolve_macro_targets_for_plan
 
+if TYPE_CHECKING:
+    from pymongo.asynchronous.database import AsyncDatabase
+    from src.repositories.tdee_state_repository import TdeeStateRepository
 
-class NutritionRepository(BaseRepository):
+
+def _logs_between(user_email: str, start_date: datetime, end_date: datetime) -> FindSpec:
+    """Logs of the whole days from ``start_date`` to ``end_date``."""
+    return user_logs_between(
+        user_email,
+        start_date.replace(hour=0, minute=0, second=0, microsecond=0),
+        end_date.replace(hour=23, minute=59, second=59, microsecond=999999),
+    )
+
+
+def _stats_window(user_email: str, now: datetime) -> FindSpec:
+    """The last 30 days of logs read for the stats, newest first."""
+    return FindSpec(
+        {"user_email": user_email, "date": {"$gte": now - timedelta(days=30)}},
+        sort=("date", pymongo.DESCENDING),
+    )
+
+
+class NutritionRepository(DailyLogRepository):
     """
     Repository for managing nutrition logs in MongoDB.
     """
 
-    def __init__(self, database: Database):
-        super().__init__(database, "nutrition_logs")
-        self._database = database
-        self.ensure_query_indexes()
+    COLLECTION_NAME = "nutrition_logs"
+    LOG_NAME = "nutrition"
 
-    def ensure_query_indexes(self) -> None:
-        """Ensures indexes used by frequent nutrition reads."""
-        self.collection.create_index(
-            [("user_email", pymongo.ASCENDING), ("date", pymongo.DESCENDING)],
-            name="nutrition_user_date_idx",
-        )
-        self.logger.info("Nutrition query indexes ensured.")
+    def __init__(
+        self,
+        database: Database,
+        tdee_states: "TdeeStateRepository | None" = None,
+    ):
+        super().__init__(database, tdee_states)
+        self._database = database
 
     def ensure_indexes(self) -> None:
         """
@@ -44,10 +72,9 @@ class NutritionRepository(BaseRepository):
         )
         self.logger.info("Nutrition logs unique daily index ensured.")
 
-    def save_log(self, log: NutritionLog) -> tuple[str, bool]:
-        """
-        Saves or updates a nutrition log.
-        """
+    @staticmethod
+    def _daily_upsert(log: NutritionLog) -> tuple[dict, dict]:
+        """Normalizes the log to its day and returns the upsert query and data."""
         log_date = log.date
         if isinstance(log_date, py_date) and not isinstance(log_date, datetime):
             log_date = datetime.combine(log_date, datetime.min.time())
@@ -56,20 +83,17 @@ class NutritionRepository(BaseRepository):
         log.date = log_date
 
         query = {"user_email": log.user_email, "date": log_date}
-        data = log.model_dump(exclude_none=True)
-        return self.upsert_document(query, data, f"nutrition log (date: {log_date})")
+        return query, log.model_dump(exclude_none=True)
 
+    @turn_memoized
     def get_logs(self, user_email: str, limit: int = 30) -> list[NutritionLog]:
         """
         Retrieves the most recent nutrition logs for a user.
         """
-        cursor = (
-            self.collection.find({"user_email": user_email})
-            .sort("date", pymongo.DESCENDING)
-            .limit(limit)
-        )
-        return [NutritionLog(**doc) for doc in cursor]
+        docs = self.find_many(recent_user_logs(user_email, limit))
+        return [NutritionLog(**doc) for doc in docs]
 
+    @invalidates_turn_cache
     def update_log(self, log_id: str, user_email: str, log: NutritionLog) -> bool:
         """
         Updates an existing nutrition log by its ID.
@@ -82,19 +106,31 @@ class NutritionRepository(BaseRepository):
 
         data = log.model_dump()
 
-        return self.replace_user_owned_log(
+        updated = self.replace_user_owned_log(
             document_id=log_id,
             user_email=user_email,
             data=data,
             log_name="Nutrition log",
         )
+        if updated:
+            self._mark_tdee_stale(user_email, log_date)
+        return updated
 
+    @invalidates_turn_cache
     def delete_log(self, log_id: str) -> bool:
         """
         Deletes a nutrition log by its ID.
         """
-        result = self.collection.delete_one({"_id": ObjectId(log_id)})
-        deleted = result.deleted_count > 0
+        if self.tdee_states is not None:
+            existing = self.collection.find_one_and_delete(
+                {"_id": ObjectId(log_id)}, {"user_email": 1, "date": 1}
+            )
+            if existing:
+                self._mark_tdee_stale(existing["user_email"], existing["date"])
+            deleted = existing is not None
+        else:
+            result = self.collection.delete_one({"_id": ObjectId(log_id)})
+            deleted = result.deleted_count > 0
         if deleted:
             self.logger.info("Nutrition log %s deleted", log_id)
         else:
@@ -107,20 +143,15 @@ class NutritionRepository(BaseRepository):
         """
         return self.collection.find_one({"_id": ObjectId(log_id)})
 
+    @turn_memoized
     def get_logs_by_date_range(
         self, user_email: str, start_date: datetime, end_date: datetime
     ) -> list[NutritionLog]:
         """
         Retrieves nutrition logs within a specific date range.
         """
-        start = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        cursor = self.collection.find(
-            {"user_email": user_email, "date": {"$gte": start, "$lte": end}}
-        ).sort("date", pymongo.ASCENDING)
-
-        return [NutritionLog(**doc) for doc in cursor]
+        docs = self.find_many(_logs_between(user_email, start_date, end_date))
+        return [NutritionLog(**doc) for doc in docs]
 
     def get_paginated(
         self,
@@ -148,7 +179,30 @@ class NutritionRepository(BaseRepository):
 
         return logs, total
 
-    def _get_today_log(self, now: datetime, logs: list[dict]) -> NutritionWithId | None:
+    def get_cursor_page(
+        self,
+        user_email: str,
+        position: ListPosition,
+        page_size: int = 10,
+        days: int | None = None,
+    ) -> tuple[list[dict], bool, int | None]:
+        """
+        Retrieves a page of nutrition logs after ``position.cursor``, newest first.
+        Returns the logs, whether more follow and the total if requested.
+        """
+        query: dict[str, Any] = {"user_email": user_email}
+        if days:
+            start_date = datetime.now() - timedelta(days=days)
+            query["date"] = {"$gte": start_date}
+
+        docs, has_more = self.get_keyset_page(query, page_size, position.cursor)
+        for doc in docs:
+            doc["id"] = str(doc.pop("_id"))
+        total = self.collection.count_documents(query) if position.include_total else None
+        return docs, has_more, total
+
+    @staticmethod
+    def _get_today_log(now: datetime, logs: list[dict]) -> NutritionWithId | None:
         start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
         today_log_doc = next(
             (log_item for log_item in logs if log_item["date"] >= start_of_today), None
@@ -162,8 +216,9 @@ class NutritionRepository(BaseRepository):
             del doc_copy["_id"]
         return NutritionWithId(**doc_copy)
 
+    @staticmethod
     def _get_last_14_days_stats(
-        self, now: datetime, logs: list[dict]
+        now: datetime, logs: list[dict]
     ) -> list[DailyMacros]:
         stats = []
         for i in range(14):
@@ -190,7 +245,8 @@ class NutritionRepository(BaseRepository):
         stats.sort(key=lambda x: x.date)
         return stats
 
-    def _get_weekly_adherence(self, now: datetime, logs: list[dict]) -> list[bool]:
+    @staticmethod
+    def _get_weekly_adherence(now: datetime, logs: list[dict]) -> list[bool]:
         current_week_start = now - timedelta(days=now.weekday())
         current_week_start = current_week_start.replace(
             hour=0, minute=0, second=0, microsecond=0
@@ -202,8 +258,9 @@ class NutritionRepository(BaseRepository):
                 adherence[day_idx] = True
         return adherence
 
+    @staticmethod
     def _get_recent_averages(
-        self, now: datetime, logs: list[dict], days: int
+        now: datetime, logs: list[dict], days: int
     ) -> tuple[float, float]:
         start_date = (now - timedelta(days=days)).replace(
             hour=0, minute=0, second=0, microsecond=0
@@ -232,42 +289,34 @@ class NutritionRepository(BaseRepository):
             self.logger.warning("Failed to calculate Adaptive TDEE for stats: %s", e)
             return {}
 
-    def _resolve_macro_targets(
-        self, user_email: str, period_stats: dict
-    ) -> tuple[dict, str]:
-        """Resolve effective macro targets from plan or TDEE fallback."""
-        plan = PlanRepository(self._database).get_plan(user_email)
-        return resolve_macro_targets_for_plan(
+    @staticmethod
+    def stats_targets(period_stats: dict, plan) -> dict:
+        """NutritionStats target fields from a TDEE result and the user's plan."""
+        macro_dict, macro_source = resolve_macro_targets_for_plan(
             tdee_macros=period_stats.get("macro_targets"),
             plan=plan,
         )
-
-    # pylint: disable=too-many-locals
-    def get_stats(self, user_email: str, tdee_service=None) -> NutritionStats:
+        return {
+            "tdee": period_stats.get("tdee"),
+            "daily_target": period_stats.get("daily_target"),
+            "macro_targets": macro_dict,
+            "macro_source": macro_source,
+            "stability_score": period_stats.get("stability_score"),
+        }
+
+    @classmethod
+    def build_stats(
+        cls, now: datetime, logs: list[dict], total_logs: int, targets: dict
+    ) -> NutritionStats:
         """
-        Calculates and retrieves comprehensive nutrition statistics for a user.
+        Assembles NutritionStats from the last 30 days of log documents and
+        the fields from ``stats_targets``.
         """
-        now = datetime.now()
-        start_date = now - timedelta(days=30)
-
-        cursor = self.collection.find(
-            {"user_email": user_email, "date": {"$gte": start_date}}
-        ).sort("date", pymongo.DESCENDING)
-
-        logs = list(cursor)
-
-        today_log = self._get_today_log(now, logs)
-        last_14_days_stats = self._get_last_14_days_stats(now, logs)
-        weekly_adherence = self._get_weekly_adherence(now, logs)
-        avg_cal, avg_prot = self._get_recent_averages(now, logs, 7)
-        avg_cal_14, _ = self._get_recent_averages(now, logs, 14)
-
-        total_logs = self.collection.count_documents({"user_email": user_email})
-        period_stats = self._get_tdee_stats(user_email, tdee_service)
-
-        macro_dict, macro_source = self._resolve_macro_targets(
-            user_email, period_stats
-        )
+        today_log = cls._get_today_log(now, logs)
+        last_14_days_stats = cls._get_last_14_days_stats(now, logs)
+        weekly_adherence = cls._get_weekly_adherence(now, logs)
+        avg_cal, avg_prot = cls._get_recent_averages(now, logs, 7)
+        avg_cal_14, _ = cls._get_recent_averages(now, logs, 14)
 
         return NutritionStats(
             today=today_log,
@@ -278,9 +327,59 @@ class NutritionRepository(BaseRepository):
             avg_daily_calories_14_days=round(avg_cal_14, 1),
             avg_protein=round(avg_prot, 1),
             total_logs=total_logs,
-            tdee=period_stats.get("tdee"),
-            daily_target=period_stats.get("daily_target"),
-            macro_targets=macro_dict,
-            macro_source=macro_source,
-            stability_score=period_stats.get("stability_score"),
+            **targets,
+        )
+
+    def get_stats(self, user_email: str, tdee_service=None) -> NutritionStats:
+        """
+        Calculates and retrieves comprehensive nutrition statistics for a user.
+        """
+        now = datetime.now()
+        logs = self.find_many(_stats_window(user_email, now))
+
+        total_logs = self.collection.count_documents({"user_email": user_email})
+        period_stats = self._get_tdee_stats(user_email, tdee_service)
+        plan = PlanRepository(self._database).get_plan(user_email)
+
+        return self.build_stats(
+            now, logs, total_logs, self.stats_targets(period_stats, plan)
+        )
+
+
+class AsyncNutritionRepository(AsyncBaseRepository):
+    """Async read surface of NutritionRepository."""
+
+    def __init__(self, database: "AsyncDatabase"):
+        super().__init__(database, "nutrition_logs")
+
+    async def get_logs(self, user_email: str, limit: int = 30) -> list[NutritionLog]:
+        """Retrieves the most recent nutrition logs for a user."""
+        docs = await self.find_many(recent_user_logs(user_email, limit))
+        return [NutritionLog(**doc) for doc in docs]
+
+    async def get_logs_by_date_range(
+        self, user_email: str, start_date: datetime, end_date: datetime
+    ) -> list[NutritionLog]:
+        """Retrieves nutrition logs within a specific date range."""
+        docs = await self.find_many(_logs_between(user_email, start_date, end_date))
+        return [NutritionLog(**doc) for doc in docs]
+
+    async def get_stats(
+        self, user_email: str, period_stats: dict, plan
+    ) -> NutritionStats:
+        """
+        Nutrition statistics from an already computed TDEE result and plan.
+
+        The 30-day window and the total count are read concurrently.
+        """
+        now = datetime.now()
+        logs, total_logs = await asyncio.gather(
+            self.find_many(_stats_window(user_email, now)),
+            self.collection.count_documents({"user_email": user_email}),
+        )
+        return NutritionRepository.build_stats(
+            now,
+            logs,
+            total_logs,
+            NutritionRepository.stats_targets(period_stats or {}, plan),
         )
@@ -4,12 +4,42 @@ from datetime import datetime
 
 import pymongo
 from pymongo import ReturnDocument
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.database import Database
 
 from pydantic import ValidationError
 
 from src.api.models.plan import PlanDiscoveryState, UserPlan
-from src.repositories.base import BaseRepository
+from src.core.turn_cache import invalidates_turn_cache, turn_memoized
+from src.core.logs import logger
+from src.repositories.base import AsyncBaseRepository, BaseRepository, FindSpec
+
+
+def _plan_spec(user_email: str) -> FindSpec:
+    """The user's plan (the newest one if a duplicate slipped in)."""
+    return FindSpec({"user_email": user_email}, sort=("updated_at", pymongo.DESCENDING))
+
+
+def _to_plan(doc: dict | None, user_email: str) -> UserPlan | None:
+    if not doc:
+        return None
+    try:
+        return UserPlan(**doc)
+    except ValidationError as exc:
+        logger.warning("Invalid plan document for user %s: %s", user_email, exc)
+        return None
+
+
+def _to_discovery(doc: dict | None, user_email: str) -> PlanDiscoveryState | None:
+    if not doc:
+        return None
+    try:
+        return PlanDiscoveryState(**doc)
+    except ValidationError as exc:
+        logger.warning(
+            "Invalid plan discovery document for user %s: %s", user_email, exc
+        )
+        return None
 
 
 class PlanRepository(BaseRepository):
@@ -32,6 +62,7 @@ class PlanRepository(BaseRepository):
             unique=True,
         )
 
+    @invalidates_turn_cache
     def save_plan(self, plan: UserPlan) -> str:
         """Upserts singleton plan per user and returns its document id."""
         payload = plan.model_dump(mode="json", exclude={"id"})
@@ -50,6 +81,7 @@ class PlanRepository(BaseRepository):
         )
         return str(doc["_id"])
 
+    @invalidates_turn_cache
     def partial_update_plan(self, user_email: str, updates: dict) -> str:
         """Updates specific fields of the singleton plan using native MongoDB $set."""
         updates["updated_at"] = datetime.now()
@@ -66,26 +98,16 @@ class PlanRepository(BaseRepository):
         )
         return str(doc["_id"])
 
+    @turn_memoized
     def get_plan(self, user_email: str) -> UserPlan | None:
         """Returns singleton plan for user."""
-        doc = self.collection.find_one(
-            {"user_email": user_email},
-            sort=[("updated_at", pymongo.DESCENDING)],
-        )
-        if not doc:
-            return None
-        try:
-            return UserPlan(**doc)
-        except ValidationError as exc:
-            self.logger.warning(
-                "Invalid plan document for user %s: %s", user_email, exc,
-            )
-            return None
+        return _to_plan(self.find_first(_plan_spec(user_email)), user_email)
 
     def get_latest_plan(self, user_email: str) -> UserPlan | None:
         """Returns singleton plan (same document)."""
         return self.get_plan(user_email)
 
+    @invalidates_turn_cache
     def save_discovery(self, discovery: PlanDiscoveryState) -> str:
         """Upserts discovery draft per user and returns its document id."""
         payload = discovery.model_dump(mode="json", exclude={"id"})
@@ -101,21 +123,30 @@ class PlanRepository(BaseRepository):
             return ""
         return str(doc["_id"])
 
+    @turn_memoized
     def get_discovery(self, user_email: str) -> PlanDiscoveryState | None:
         """Returns the discovery draft for the user."""
         doc = self.discovery_collection.find_one({"user_email": user_email})
-        if not doc:
-            return None
-        try:
-            return PlanDiscoveryState(**doc)
-        except ValidationError as exc:
-            self.logger.warning(
-                "Invalid plan discovery document for user %s: %s",
-                user_email,
-                exc,
-            )
-            return None
+        return _to_discovery(doc, user_email)
 
+    @invalidates_turn_cache
     def clear_discovery(self, user_email: str) -> None:
         """Deletes the discovery draft once a plan becomes active."""
         self.discovery_collection.delete_one({"user_email": user_email})
+
+
+class AsyncPlanRepository(AsyncBaseRepository):
+    """Async read surface of PlanRepository."""
+
+    def __init__(self, database: AsyncDatabase):
+        super().__init__(database, "plans")
+        self.discovery_collection = database["plan_discovery_states"]
+
+    async def get_plan(self, user_email: str) -> UserPlan | None:
+        """Returns singleton plan for user."""
+        return _to_plan(await self.find_first(_plan_spec(user_email)), user_email)
+
+    async def get_discovery(self, user_email: str) -> PlanDiscoveryState | None:
+        """Returns the discovery draft for the user."""
+        doc = await self.discovery_collection.find_one({"user_email": user_email})
+        return _to_discovery(doc, user_email)
@@ -2,9 +2,12 @@
 This module contains the repository for logging LLM prompts.
 """
 
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
+import pymongo
+from pymongo import ReplaceOne, ReturnDocument
 from pymongo.database import Database
 from src.repositories.base import BaseRepository
+from src.repositories.usage_rollup_repository import UsageRollupRepository
 
 
 class PromptRepository(BaseRepository):
@@ -14,11 +17,12 @@ class PromptRepository(BaseRepository):
 
     def __init__(self, database: Database):
         super().__init__(database, "prompt_logs")
+        self._slots = database["prompt_log_slots"]
+        self.rollups = UsageRollupRepository(database)
 
-    def log_prompt(self, user_email: str, prompt_data: dict, max_logs: int = 10):
-        """
-        Logs a prompt for a specific user and ensures only the last `max_logs` are kept.
-        """
+    @staticmethod
+    def _build_log_entry(user_email: str, prompt_data: dict) -> dict:
+        """Builds the stored prompt_logs document."""
 
         # Sanitize data: convert Pydantic models or other non-serializable objects
         def sanitize(obj):
@@ -40,6 +44,9 @@ class PromptRepository(BaseRepository):
             "prompt": sanitized_prompt,
             "tokens_input": prompt_data.get("tokens_input", 0),
             "tokens_output": prompt_data.get("tokens_output", 0),
+            "cache_read_tokens": prompt_data.get("cache_read_tokens", 0),
+            "cache_write_tokens": prompt_data.get("cache_write_tokens", 0),
+            "tool_calls_count": prompt_data.get("tool_calls_count", 0),
             "duration_ms": prompt_data.get("duration_ms", 0),
             "model": prompt_data.get("model", "unknown"),
             "requested_model": prompt_data.get(
@@ -53,25 +60,67 @@ class PromptRepository(BaseRepository):
             "service_tier": prompt_data.get("service_tier"),
             "status": prompt_data.get("status", "success"),
         }
-
-        # Insert the new log
-        self.collection.insert_one(log_entry)
-
-        # Keep only the last max_logs for this user
-        # 1. Find the timestamps of the logs to keep
-        logs_to_keep = (
-            self.collection.find({"user_email": user_email})
-            .sort("timestamp", -1)
-            .limit(max_logs)
+        return log_entry
+
+    def ensure_indexes(self) -> None:
+        """Ensures the ring slot index and the per-user recency index."""
+        self.collection.create_index(
+            [("user_email", pymongo.ASCENDING), ("slot", pymongo.ASCENDING)],
+            unique=True,
+            # Logs written before the ring slots have no slot.
+            partialFilterExpression={"slot": {"$exists": True}},
+            name="prompt_log_slot_idx",
+        )
+        self.collection.create_index(
+            [("user_email", pymongo.ASCENDING), ("timestamp", pymongo.DESCENDING)],
+            name="prompt_log_user_timestamp_idx",
         )
+        self.rollups.ensure_indexes()
+        self.logger.info("Prompt log indexes ensured.")
 
-        keep_ids = [doc["_id"] for doc in logs_to_keep]
+    def write_batch(self, entries: list[tuple[str, dict]], max_logs: int = 10) -> None:
+        """
+        Stores built log entries, keeping at most ``max_logs`` per user.
 
-        # 2. Delete logs that are NOT in the keep list
-        if len(keep_ids) >= max_logs:
-            self.collection.delete_many(
-                {"user_email": user_email, "_id": {"$nin": keep_ids}}
+        Each user owns ``max_logs`` ring slots. One ``$inc`` per user reserves
+        the next slots and a single unordered bulk write overwrites them, so
+        the log never needs a sorted read or a trim. Every entry is also
+        added to the usage rollups, which outlive the trimmed log.
+        """
+        self.rollups.record(entries)
+
+        by_user: dict[str, list[dict]] = {}
+        for user_email, entry in entries:
+            by_user.setdefault(user_email, []).append(entry)
+
+        operations = []
+        for user_email, user_entries in by_user.items():
+            # Older entries of the batch would be overwritten anyway.
+            user_entries = user_entries[-max_logs:]
+            cursor = self._slots.find_one_and_update(
+                {"_id": user_email},
+                {"$inc": {"seq": len(user_entries)}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
             )
+            first_seq = cursor["seq"] - len(user_entries)
+            for offset, entry in enumerate(user_entries):
+                slot = (first_seq + offset) % max_logs
+                operations.append(
+                    ReplaceOne(
+                        {"user_email": user_email, "slot": slot},
+                        {**entry, "slot": slot},
+                        upsert=True,
+                    )
+                )
+        if operations:
+            self.collection.bulk_write(operations, ordered=False)
+
+    def log_prompt(self, user_email: str, prompt_data: dict, max_logs: int = 10):
+        """
+        Logs a prompt for a specific user and ensures only the last `max_logs` are kept.
+        """
+        self.write_batch([(user_email, self._build_log_entry(user_email, prompt_data))], max_logs)
 
     def get_user_prompts(self, user_email: str, limit: int = 10):
         """
@@ -86,32 +135,9 @@ class PromptRepository(BaseRepository):
     def get_token_summary(self, days: int = 30):
         """
         Retrieves aggregated token consumption per user over the last N days.
-        Only includes logs with tokens_input > 0 (real data).
+        Reads the daily usage rollups, not the trimmed prompt logs.
         """
-        start_date = datetime.now(timezone.utc) - timedelta(days=days)
-        pipeline = [
-            {
-                "$match": {
-                    "timestamp": {"$gte": start_date},
-                    "tokens_input": {"$gt": 0},  # Only real data
-                }
-            },
-            {
-                "$group": {
-                    "_id": "$user_email",
-                    "total_input": {"$sum": "$tokens_input"},
-                    "total_output": {"$sum": "$tokens_output"},
-                    "message_count": {"$sum": 1},
-                    "last_activity": {"$max": "$timestamp"},
-                    "requested_model": {"$last": "$requested_model"},
-                    "resolved_model": {"$last": "$resolved_model"},
-                    "resolved_provider": {"$last": "$resolved_provider"},
-                    "total_cost": {"$sum": {"$ifNull": ["$usage_cost", 0]}},
-                }
-            },
-            {"$sort": {"total_input": -1}},
-        ]
-        return list(self.collection.aggregate(pipeline))
+        return self.rollups.get_token_summary(days)
 
     def get_token_timeseries(self, days: int = 30, user_email: str | None = None):
         """
@@ -119,36 +145,4 @@ class PromptRepository(BaseRepository):
         If user_email is provided, returns data for that user only.
         Otherwise returns aggregated data for all users.
         """
-        start_date = datetime.now(timezone.utc) - timedelta(days=days)
-        match_stage = {
-            "timestamp": {"$gte": start_date},
-            "tokens_input": {"$gt": 0},  # Only real data
-        }
-        if user_email:
-            match_stage["user_email"] = user_email
-
-        pipeline = [
-            {"$match": match_stage},
-            {
-                "$group": {
-                    "_id": {
-                        "$dateToString": {
-                            "format": "%Y-%m-%d",
-                            "date": "$timestamp",
-                        }
-                    },
-                    "tokens_input": {"$sum": "$tokens_input"},
-                    "tokens_output": {"$sum": "$tokens_output"},
-                }
-            },
-            {"$sort": {"_id": 1}},  # Sort by date ascending
-            {
-                "$project": {
-                    "_id": 0,
-                    "date": "$_id",
-                    "tokens_input": 1,
-                    "tokens_output": 1,
-                }
-            },
-        ]
-        return list(self.collection.aggregate(pipeline))
+        return self.rollups.get_token_timeseries(days, user_email)
@@ -0,0 +1,114 @@
+"""
+This module contains the repository for persisted Adaptive TDEE state.
+"""
+
+from datetime import date, datetime
+import pymongo
+from pymongo import UpdateOne
+from pymongo.database import Database
+
+from src.repositories.base import BaseRepository
+
+
+class TdeeStateRepository(BaseRepository):
+    """
+    Repository for the per-user cached TDEE result.
+
+    One document per (user_email, lookback_weeks) holds the last v3 result
+    together with the pipeline values it was derived from. Weight and
+    nutrition writes flag the documents as stale so the next read recomputes
+    the whole lookback window; nothing is folded in incrementally.
+    """
+
+    def __init__(self, database: Database):
+        super().__init__(database, "tdee_states")
+        self.ensure_indexes()
+
+    def ensure_indexes(self) -> None:
+        """Ensures one state document per user and lookback window."""
+        self.collection.create_index(
+            [("user_email", pymongo.ASCENDING), ("lookback_weeks", pymongo.ASCENDING)],
+            unique=True,
+            name="tdee_state_user_lookback_idx",
+        )
+        self.logger.info("TDEE state indexes ensured.")
+
+    def get_state(self, user_email: str, lookback_weeks: int) -> dict | None:
+        """Returns the persisted state for a user and lookback window."""
+        return self.collection.find_one(
+            {"user_email": user_email, "lookback_weeks": lookback_weeks},
+            {"_id": 0},
+        )
+
+    @staticmethod
+    def _save_spec(
+        user_email: str,
+        lookback_weeks: int,
+        state: dict,
+        expected_version: int | None,
+    ) -> tuple[dict, dict, bool]:
+        """Builds the (query, update, upsert) triple used to store a state."""
+        payload = dict(state)
+        payload["stale"] = False
+        payload["updated_at"] = datetime.now()
+        query: dict = {"user_email": user_email, "lookback_weeks": lookback_weeks}
+        if expected_version is not None:
+            query["version"] = expected_version
+        update = {
+            "$set": payload,
+            "$unset": {"stale_from": ""},
+            "$setOnInsert": {"version": 0},
+        }
+        return query, update, expected_version is None
+
+    def save_state(
+        self,
+        user_email: str,
+        lookback_weeks: int,
+        state: dict,
+        expected_version: int | None = None,
+    ) -> bool:
+        """
+        Stores a freshly rebuilt state and clears the stale flag.
+
+        ``expected_version`` is the version read before the rebuild; when a
+        log write bumped it in the meantime the rebuilt state is already
+        outdated and is discarded.
+        """
+        query, update, upsert = self._save_spec(
+            user_email, lookback_weeks, state, expected_version
+        )
+        result = self.collection.update_one(query, update, upsert=upsert)
+        return bool(result.matched_count or result.upserted_id)
+
+    @classmethod
+    def save_operation(
+        cls,
+        user_email: str,
+        lookback_weeks: int,
+        state: dict,
+        expected_version: int | None = None,
+    ) -> UpdateOne:
+        """Same write as ``save_state`` as a bulk_write operation."""
+        query, update, upsert = cls._save_spec(
+            user_email, lookback_weeks, state, expected_version
+        )
+        return UpdateOne(query, update, upsert=upsert)
+
+    def mark_stale(self, user_email: str, changed_date: date | datetime) -> None:
+        """
+        Flags every state of the user as stale after a log write.
+
+        ``stale_from`` keeps the earliest changed day so operators can tell a
+        new-day append from an edit to the past.
+        """
+        if not isinstance(changed_date, datetime):
+            changed_date = datetime(changed_date.year, changed_date.month, changed_date.day)
+        self.collection.update_many(
+            {"user_email": user_email},
+            {
+                "$set": {"stale": True},
+                "$min": {"stale_from": changed_date},
+                "$inc": {"version": 1},
+            },
+        )
@@ -19,6 +19,7 @@ class TelegramRepository(BaseRepository):
         super().__init__(database, "telegram_links")
         self.codes_collection = database["telegram_codes"]
         self.processed_updates_collection = database["telegram_processed_updates"]
+        self.update_queue_collection = database["telegram_update_queue"]
         self._ensure_indexes()
 
     def _ensure_indexes(self) -> None:
@@ -37,6 +38,9 @@ class TelegramRepository(BaseRepository):
         )
         # Unique index on update_id to prevent duplicates
         self.processed_updates_collection.create_index("update_id", unique=True)
+        # Webhook updates waiting for (or being handled by) a worker
+        self.update_queue_collection.create_index("update_id", unique=True)
+        self.update_queue_collection.create_index([("status", 1), ("update_id", 1)])
 
     def create_linking_code(self, user_email: str) -> str:
         """
@@ -143,3 +147,86 @@ class TelegramRepository(BaseRepository):
         except DuplicateKeyError:
             # Most likely a duplicate key error (update_id already processed)
             return False
+
+    def enqueue_update(self, update_id: int, chat_id: int, payload: dict) -> bool:
+        """
+        Persist a webhook update for background processing.
+        Returns False if the update_id was already received.
+
+        The queue document is written before the update is recorded as
+        processed, so a failure in between leaves it queued rather than lost.
+        """
+        queued = self.update_queue_collection.update_one(
+            {"update_id": update_id},
+            {
+                "$setOnInsert": {
+                    "update_id": update_id,
+                    "chat_id": chat_id,
+                    "payload": payload,
+                    "status": "pending",
+                    "enqueued_at": datetime.now(timezone.utc),
+                }
+            },
+            upsert=True,
+        )
+        if queued.upserted_id is None:
+            # Still queued from an earlier delivery.
+            return False
+        if not self.try_record_update(update_id):
+            # Handled earlier and already removed from the queue.
+            self.update_queue_collection.delete_one(
+                {"update_id": update_id, "status": "pending"}
+            )
+            return False
+        return True
+
+    def claim_update(self, update_id: int, worker_id: str, lease_seconds: int) -> bool:
+        """
+        Atomically mark a queued update as being processed by ``worker_id``.
+        Pending updates and updates whose lease expired can be claimed.
+        """
+        now = datetime.now(timezone.utc)
+        claimed = self.update_queue_collection.find_one_and_update(
+            {
+                "update_id": update_id,
+                "$or": [
+                    {"status": "pending"},
+                    {"claimed_at": {"$lt": now - timedelta(seconds=lease_seconds)}},
+                ],
+            },
+            {"$set": {"status": "processing", "worker_id": worker_id, "claimed_at": now}},
+            projection={"_id": 1},
+        )
+        return claimed is not None
+
+    def release_update(self, update_id: int) -> None:
+        """Return a claimed update to the pending state."""
+        self.update_queue_collection.update_one(
+            {"update_id": update_id},
+            {"$set": {"status": "pending"}, "$unset": {"worker_id": "", "claimed_at": ""}},
+        )
+
+    def complete_update(self, update_id: int) -> None:
+        """Remove a handled update from the queue."""
+        self.update_queue_collection.delete_one({"update_id": update_id})
+
+    def get_queued_updates(self, lease_seconds: int, limit: int = 500) -> list[dict]:
+        """
+        Return queued updates that no live worker holds, oldest first.
+        Used on startup to resume work left behind by a restart.
+        """
+        stale = datetime.now(timezone.utc) - timedelta(seconds=lease_seconds)
+        cursor = (
+            self.update_queue_collection.find(
+                {
+                    "$or": [
+                        {"status": "pending"},
+                        {"status": "processing", "claimed_at": {"$lt": stale}},
+                    ]
+                },
+                {"_id": 0, "update_id": 1, "chat_id": 1, "payload": 1},
+            )
+            .sort("update_id", 1)
+            .limit(limit)
+        )
+        return list(cursor)
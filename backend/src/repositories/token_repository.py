@@ -2,7 +2,9 @@
 This module contains the repository for token blocklist management.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+
+from bson import ObjectId
 from pymongo.database import Database
 from src.repositories.base import BaseRepository
 
@@ -33,6 +35,18 @@ class TokenRepository(BaseRepository):
         result = self.collection.find_one({"token": token})
         return result is not None
 
+    def blocked_since(self, since: ObjectId | None = None) -> list[dict]:
+        """
+        Unexpired blocklist entries written from ``since`` on (all when None),
+        oldest first.
+        """
+        query: dict = {"expires_at": {"$gt": datetime.now(timezone.utc)}}
+        if since is not None:
+            query["_id"] = {"$gte": since}
+        return list(
+            self.collection.find(query, {"token": 1, "expires_at": 1}).sort("_id", 1)
+        )
+
     def ensure_indexes(self) -> None:
         """
         Ensures indexes used by token blocklist checks and cleanup.
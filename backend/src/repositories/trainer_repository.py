@@ -2,28 +2,43 @@
 This module contains the repository for trainer profiles.
 """
 
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.database import Database
 from src.api.models.trainer_profile import TrainerProfile
-from src.repositories.base import BaseRepository
+from src.core.profile_cache import ProfileCache, profile_loads, versioned, write_through
+from src.core.turn_cache import invalidates_turn_cache, turn_memoized
+from src.repositories.base import AsyncBaseRepository, BaseRepository
+
+
+def _to_profile(trainer_profile: dict) -> TrainerProfile:
+    return TrainerProfile(**trainer_profile)
 
 
 class TrainerRepository(BaseRepository):
     """
     Repository for managing trainer profiles in MongoDB.
+
+    Cached like UserRepository when given a ``profile_cache``.
     """
 
-    def __init__(self, database: Database):
+    def __init__(
+        self,
+        database: Database,
+        profile_cache: ProfileCache[TrainerProfile] | None = None,
+    ):
         super().__init__(database, "trainer_profiles")
+        self.profile_cache = profile_cache
 
+    @invalidates_turn_cache
     def save_profile(self, trainer_profile: TrainerProfile) -> None:
         """
         Saves or updates a trainer profile.
         """
+        update_doc = versioned({"$set": trainer_profile.model_dump(exclude_none=True)})
         result = self.collection.update_one(
-            {"user_email": trainer_profile.user_email},
-            {"$set": trainer_profile.model_dump(exclude_none=True)},
-            upsert=True,
+            {"user_email": trainer_profile.user_email}, update_doc, upsert=True
         )
+        write_through(self.profile_cache, trainer_profile.user_email, update_doc)
         if result.upserted_id:
             self.logger.info(
                 "New trainer profile created for user: %s", trainer_profile.user_email
@@ -38,13 +53,60 @@ class TrainerRepository(BaseRepository):
                 trainer_profile.user_email,
             )
 
+    @turn_memoized
     def get_profile(self, email: str) -> TrainerProfile | None:
         """
         Retrieves a trainer profile for a user by email.
         """
+        if self.profile_cache is not None:
+            profile = self.profile_cache.get_or_load(
+                email,
+                **profile_loads(self.collection, {"user_email": email}, _to_profile),
+            )
+            if profile is None:
+                self.logger.info("Trainer profile not found for email: %s", email)
+            return profile
+
         trainer_profile = self.collection.find_one({"user_email": email})
         if not trainer_profile:
             self.logger.info("Trainer profile not found for email: %s", email)
             return None
         self.logger.debug("Trainer profile retrieved for email: %s", email)
         return TrainerProfile(**trainer_profile)
+
+
+class AsyncTrainerRepository(AsyncBaseRepository):
+    """Async counterpart of TrainerRepository for the chat path."""
+
+    def __init__(
+        self,
+        database: AsyncDatabase,
+        profile_cache: ProfileCache[TrainerProfile] | None = None,
+    ):
+        super().__init__(database, "trainer_profiles")
+        self.profile_cache = profile_cache
+
+    async def save_profile(self, trainer_profile: TrainerProfile) -> None:
+        """Saves or updates a trainer profile."""
+        update_doc = versioned({"$set": trainer_profile.model_dump(exclude_none=True)})
+        await self.collection.update_one(
+            {"user_email": trainer_profile.user_email}, update_doc, upsert=True
+        )
+        write_through(self.profile_cache, trainer_profile.user_email, update_doc)
+
+    async def get_profile(self, email: str) -> TrainerProfile | None:
+        """Retrieves a trainer profile for a user by email."""
+        if self.profile_cache is not None:
+            profile = await self.profile_cache.aget_or_load(
+                email,
+                **profile_loads(self.collection, {"user_email": email}, _to_profile),
+            )
+            if profile is None:
+                self.logger.info("Trainer profile not found for email: %s", email)
+            return profile
+
+        trainer_profile = await self.collection.find_one({"user_email": email})
+        if not trainer_profile:
+            self.logger.info("Trainer profile not found for email: %s", email)
+            return None
+        return TrainerProfile(**trainer_profile)
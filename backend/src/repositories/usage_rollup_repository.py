@@ -0,0 +1,259 @@
+"""
+This module contains the repository for per-user daily LLM usage rollups.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+import pymongo
+from pymongo import UpdateOne
+from pymongo.database import Database
+
+from src.repositories.base import BaseRepository
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open.
+LATENCY_BUCKETS_MS: tuple[int, ...] = (
+    250, 500, 1000, 2000, 3000, 5000, 8000, 13000, 21000, 34000, 60000, 120000,
+)
+LATENCY_OVERFLOW = "inf"
+LATENCY_PERCENTILES: tuple[int, ...] = (50, 90, 99)
+
+# Prompt log fields the rollups are built from; older logs only carry the
+# cache and tool counters inside ``prompt``.
+_LOG_PROJECTION = {
+    "user_email": 1,
+    "timestamp": 1,
+    "tokens_input": 1,
+    "tokens_output": 1,
+    "usage_cost": 1,
+    "duration_ms": 1,
+    "requested_model": 1,
+    "resolved_model": 1,
+    "resolved_provider": 1,
+    "prompt.cache_read_tokens": 1,
+    "prompt.cache_write_tokens": 1,
+    "prompt.tool_calls_count": 1,
+}
+
+
+def latency_bucket(duration_ms: int | float | None) -> str:
+    """Histogram bucket key (upper bound in ms) for a run duration."""
+    for bound in LATENCY_BUCKETS_MS:
+        if (duration_ms or 0) <= bound:
+            return str(bound)
+    return LATENCY_OVERFLOW
+
+
+def latency_percentiles(histogram: dict[str, int]) -> dict[str, int | None]:
+    """
+    Estimates latency percentiles from a merged histogram.
+
+    Each percentile is the upper bound of the bucket where it falls; the
+    open bucket reports the last finite bound.
+    """
+    keys = [str(bound) for bound in LATENCY_BUCKETS_MS] + [LATENCY_OVERFLOW]
+    counts = [int(histogram.get(key) or 0) for key in keys]
+    total = sum(counts)
+    result: dict[str, int | None] = {}
+    for percentile in LATENCY_PERCENTILES:
+        name = f"p{percentile}_ms"
+        if not total:
+            result[name] = None
+            continue
+        rank = total * percentile / 100
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank:
+                result[name] = LATENCY_BUCKETS_MS[min(index, len(LATENCY_BUCKETS_MS) - 1)]
+                break
+    return result
+
+
+def _day_start(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return datetime(value.year, value.month, value.day)
+
+
+class UsageRollupRepository(BaseRepository):
+    """
+    One document per user and UTC day with running usage counters.
+
+    Counters are bumped with ``$inc`` when prompts are logged, so token and
+    cost analytics read O(users x days) small documents instead of the
+    prompt logs, which only keep the latest runs of each user.
+    """
+
+    def __init__(self, database: Database):
+        super().__init__(database, "usage_rollups")
+
+    def ensure_indexes(self) -> None:
+        """Ensures the (user, day) key and the day range index."""
+        self.collection.create_index(
+            [("user_email", pymongo.ASCENDING), ("date", pymongo.ASCENDING)],
+            unique=True,
+            name="usage_rollup_user_date_idx",
+        )
+        self.collection.create_index(
+            [("date", pymongo.ASCENDING)], name="usage_rollup_date_idx"
+        )
+
+    @staticmethod
+    def _increments(entry: dict) -> dict:
+        return {
+            "tokens_input": int(entry.get("tokens_input") or 0),
+            "tokens_output": int(entry.get("tokens_output") or 0),
+            "cache_read_tokens": int(entry.get("cache_read_tokens") or 0),
+            "cache_write_tokens": int(entry.get("cache_write_tokens") or 0),
+            "cost": float(entry.get("usage_cost") or 0.0),
+            "request_count": 1,
+            "tool_call_count": int(entry.get("tool_calls_count") or 0),
+            f"latency_hist.{latency_bucket(entry.get('duration_ms'))}": 1,
+        }
+
+    def record(self, entries: Iterable[tuple[str, dict]]) -> None:
+        """
+        Adds built prompt log entries to their (user, day) rollups.
+
+        Entries of the same rollup are summed first, so a batch costs one
+        unordered bulk write with one upsert per user and day.
+        """
+        rollups: dict[tuple[str, datetime], dict] = {}
+        for user_email, entry in entries:
+            timestamp = entry.get("timestamp") or datetime.now(timezone.utc)
+            key = (user_email, _day_start(timestamp))
+            rollup = rollups.setdefault(
+                key, {"inc": {}, "last_activity": timestamp, "models": {}}
+            )
+            for field, value in self._increments(entry).items():
+                rollup["inc"][field] = rollup["inc"].get(field, 0) + value
+            if timestamp >= rollup["last_activity"]:
+                rollup["last_activity"] = timestamp
+                rollup["models"] = {
+                    "requested_model": entry.get("requested_model"),
+                    "resolved_model": entry.get("resolved_model"),
+                    "resolved_provider": entry.get("resolved_provider"),
+                }
+
+        operations = [
+            UpdateOne(
+                {"user_email": user_email, "date": day},
+                {
+                    "$inc": rollup["inc"],
+                    "$max": {"last_activity": rollup["last_activity"]},
+                    "$set": rollup["models"],
+                },
+                upsert=True,
+            )
+            for (user_email, day), rollup in rollups.items()
+        ]
+        if operations:
+            self.collection.bulk_write(operations, ordered=False)
+
+    @staticmethod
+    def _since(days: int) -> datetime:
+        return _day_start(datetime.now(timezone.utc) - timedelta(days=days))
+
+    @staticmethod
+    def _histogram_sums() -> dict:
+        keys = [str(bound) for bound in LATENCY_BUCKETS_MS] + [LATENCY_OVERFLOW]
+        return {f"latency_{key}": {"$sum": f"$latency_hist.{key}"} for key in keys}
+
+    @staticmethod
+    def _with_percentiles(item: dict) -> dict:
+        histogram = {
+            key[len("latency_"):]: item.pop(key)
+            for key in list(item)
+            if key.startswith("latency_")
+        }
+        item.update(latency_percentiles(histogram))
+        return item
+
+    def get_token_summary(self, days: int = 30) -> list[dict]:
+        """Usage per user over the last N days, heaviest users first."""
+        pipeline = [
+            {"$match": {"date": {"$gte": self._since(days)}}},
+            {"$sort": {"date": 1}},
+            {
+                "$group": {
+                    "_id": "$user_email",
+                    "total_input": {"$sum": "$tokens_input"},
+                    "total_output": {"$sum": "$tokens_output"},
+                    "total_cache_read": {"$sum": "$cache_read_tokens"},
+                    "total_cache_write": {"$sum": "$cache_write_tokens"},
+                    "message_count": {"$sum": "$request_count"},
+                    "tool_call_count": {"$sum": "$tool_call_count"},
+                    "last_activity": {"$max": "$last_activity"},
+                    "requested_model": {"$last": "$requested_model"},
+                    "resolved_model": {"$last": "$resolved_model"},
+                    "resolved_provider": {"$last": "$resolved_provider"},
+                    "total_cost": {"$sum": "$cost"},
+                    **self._histogram_sums(),
+                }
+            },
+            {"$sort": {"total_input": -1}},
+        ]
+        return [self._with_percentiles(item) for item in self.collection.aggregate(pipeline)]
+
+    def get_token_timeseries(
+        self, days: int = 30, user_email: str | None = None
+    ) -> list[dict]:
+        """Daily usage for charting, for one user or summed over all users."""
+        match_stage: dict = {"date": {"$gte": self._since(days)}}
+        if user_email:
+            match_stage["user_email"] = user_email
+
+        pipeline = [
+            {"$match": match_stage},
+            {
+                "$group": {
+                    "_id": "$date",
+                    "tokens_input": {"$sum": "$tokens_input"},
+                    "tokens_output": {"$sum": "$tokens_output"},
+                    "cache_read_tokens": {"$sum": "$cache_read_tokens"},
+                    "cache_write_tokens": {"$sum": "$cache_write_tokens"},
+                    "cost": {"$sum": "$cost"},
+                    "count": {"$sum": "$request_count"},
+                    "tool_call_count": {"$sum": "$tool_call_count"},
+                    **self._histogram_sums(),
+                }
+            },
+            {"$sort": {"_id": 1}},
+        ]
+        series = []
+        for item in self.collection.aggregate(pipeline):
+            item["date"] = item.pop("_id").strftime("%Y-%m-%d")
+            series.append(self._with_percentiles(item))
+        return series
+
+    def seed_from_logs(self, logs_collection) -> int:
+        """
+        Seeds rollups for the (user, day) pairs that have none from the stored
+        prompt logs and returns how many logs were counted.
+
+        The logs only keep the latest runs of each user, so days that already
+        have a rollup are skipped rather than rebuilt from a partial view.
+        """
+        existing = {
+            (doc["user_email"], doc["date"])
+            for doc in self.collection.find({}, {"user_email": 1, "date": 1})
+        }
+        batch: list[tuple[str, dict]] = []
+        count = 0
+        for log in logs_collection.find({}, _LOG_PROJECTION):
+            user_email = log.get("user_email")
+            timestamp = log.get("timestamp")
+            if not user_email or not isinstance(timestamp, datetime):
+                continue
+            if (user_email, _day_start(timestamp)) in existing:
+                continue
+            batch.append((user_email, {**log.pop("prompt", {}), **log}))
+            count += 1
+            if len(batch) >= 1000:
+                self.record(batch)
+                batch = []
+        if batch:
+            self.record(batch)
+        self.logger.info("Seeded usage rollups from %d prompt logs", count)
+        return count
@@ -6,18 +6,79 @@ This module provides the UserRepository for managing user persistence.
 from datetime import datetime
 from typing import Any
 import pymongo
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.database import Database
 from src.api.models.user_profile import UserProfile
-from src.repositories.base import BaseRepository
+from src.core.profile_cache import ProfileCache, profile_loads, versioned, write_through
+from src.core.turn_cache import invalidates_turn_cache, turn_memoized
+from src.repositories.base import AsyncBaseRepository, BaseRepository
+
+
+def _partial_update(fields: dict) -> dict | None:
+    """Versioned update setting ``fields`` (None values are unset); None if empty."""
+    set_fields = {key: value for key, value in fields.items() if value is not None}
+    unset_fields = {key: "" for key, value in fields.items() if value is None}
+
+    update_doc: dict[str, Any] = {}
+    if set_fields:
+        update_doc["$set"] = set_fields
+    if unset_fields:
+        update_doc["$unset"] = unset_fields
+    return versioned(update_doc) if update_doc else None
+
+
+def _message_count_update(
+    existing: dict | None, new_cycle_start: datetime | None, today_str: str
+) -> dict:
+    """Builds the counter update for increment_message_counts."""
+    is_new_day = (
+        (existing and existing.get("last_message_date") != today_str)
+        if existing
+        else True
+    )
+
+    if new_cycle_start:
+        return {
+            "$inc": {"total_messages_sent": 1},
+            "$set": {
+                "current_billing_cycle_start": new_cycle_start,
+                "messages_sent_this_month": 1,
+                "last_message_date": today_str,
+                "messages_sent_today": 1,
+            },
+        }
+
+    inc_fields = {"total_messages_sent": 1, "messages_sent_this_month": 1}
+    set_fields: dict[str, Any] = {"last_message_date": today_str}
+
+    if is_new_day:
+        set_fields["messages_sent_today"] = 1
+    else:
+        inc_fields["messages_sent_today"] = 1
+
+    return {"$inc": inc_fields, "$set": set_fields}
+
+
+def _to_profile(user_data: dict) -> UserProfile:
+    return UserProfile(**user_data)
 
 
 class UserRepository(BaseRepository):
     """
     Repository for managing user profiles and authentication in MongoDB.
+
+    With a ``profile_cache``, profiles are served from the per-process cache
+    and writes through this repository are applied to it. Every write bumps
+    ``profile_version`` so other workers notice it.
     """
 
-    def __init__(self, database: Database):
+    def __init__(
+        self,
+        database: Database,
+        profile_cache: ProfileCache[UserProfile] | None = None,
+    ):
         super().__init__(database, "users")
+        self.profile_cache = profile_cache
         self.ensure_indexes()
 
     def ensure_indexes(self) -> None:
@@ -34,6 +95,7 @@ class UserRepository(BaseRepository):
         )
         self.logger.info("User indexes ensured.")
 
+    @invalidates_turn_cache
     def save_profile(self, profile: UserProfile) -> None:
         """
         Saves or updates a user profile.
@@ -50,9 +112,11 @@ class UserRepository(BaseRepository):
         if unset_fields:
             update_doc["$unset"] = unset_fields
 
+        update_doc = versioned(update_doc)
         result = self.collection.update_one(
             {"email": profile.email}, update_doc, upsert=True
         )
+        write_through(self.profile_cache, profile.email, update_doc)
         if result.upserted_id:
             self.logger.info("New user profile created for email: %s", profile.email)
         elif result.modified_count > 0:
@@ -63,32 +127,35 @@ class UserRepository(BaseRepository):
                 profile.email,
             )
 
+    @invalidates_turn_cache
     def update_profile_fields(self, email: str, fields: dict) -> bool:
         """
         Partially updates a user profile with specific fields.
         """
-        set_fields = {key: value for key, value in fields.items() if value is not None}
-        unset_fields = {key: "" for key, value in fields.items() if value is None}
-
-        update_doc: dict[str, Any] = {}
-        if set_fields:
-            update_doc["$set"] = set_fields
-        if unset_fields:
-            update_doc["$unset"] = unset_fields
-
-        if not update_doc:
+        update_doc = _partial_update(fields)
+        if update_doc is None:
             return False
 
         result = self.collection.update_one({"email": email}, update_doc)
+        write_through(self.profile_cache, email, update_doc)
         if result.modified_count > 0:
             self.logger.info("Partially updated user profile for email: %s", email)
             return True
         return False
 
+    @turn_memoized
     def get_profile(self, email: str) -> UserProfile | None:
         """
         Retrieves a user profile by email.
         """
+        if self.profile_cache is not None:
+            profile = self.profile_cache.get_or_load(
+                email, **profile_loads(self.collection, {"email": email}, _to_profile)
+            )
+            if profile is None:
+                self.logger.info("User profile not found for email: %s", email)
+            return profile
+
         user_data = self.collection.find_one({"email": email})
         if not user_data:
             self.logger.info("User profile not found for email: %s", email)
@@ -110,6 +177,7 @@ class UserRepository(BaseRepository):
             return None
         return UserProfile(**user_data)
 
+    @invalidates_turn_cache
     def increment_message_counts(
         self, email: str, new_cycle_start: datetime | None = None
     ) -> None:
@@ -140,31 +208,60 @@ class UserRepository(BaseRepository):
 
         # But for simplicity and compatibility with standard project patterns:
         existing = self.collection.find_one({"email": email}, {"last_message_date": 1})
-        is_new_day = (
-            (existing and existing.get("last_message_date") != today_str)
-            if existing
-            else True
+        update_doc = versioned(
+            _message_count_update(existing, new_cycle_start, today_str)
         )
+        self.collection.update_one({"email": email}, update_doc)
+        write_through(self.profile_cache, email, update_doc)
 
-        if new_cycle_start:
-            update_doc = {
-                "$inc": {"total_messages_sent": 1},
-                "$set": {
-                    "current_billing_cycle_start": new_cycle_start,
-                    "messages_sent_this_month": 1,
-                    "last_message_date": today_str,
-                    "messages_sent_today": 1,
-                },
-            }
-        else:
-            inc_fields = {"total_messages_sent": 1, "messages_sent_this_month": 1}
-            set_fields: dict[str, Any] = {"last_message_date": today_str}
 
-            if is_new_day:
-                set_fields["messages_sent_today"] = 1
-            else:
-                inc_fields["messages_sent_today"] = 1
+class AsyncUserRepository(AsyncBaseRepository):
+    """Async counterpart of UserRepository for the chat path."""
 
-            update_doc = {"$inc": inc_fields, "$set": set_fields}
+    def __init__(
+        self,
+        database: AsyncDatabase,
+        profile_cache: ProfileCache[UserProfile] | None = None,
+    ):
+        super().__init__(database, "users")
+        self.profile_cache = profile_cache
 
-        self.collection.update_one({"email": email}, update_doc)
+    async def get_profile(self, email: str) -> UserProfile | None:
+        """Retrieves a user profile by email."""
+        if self.profile_cache is not None:
+            profile = await self.profile_cache.aget_or_load(
+                email, **profile_loads(self.collection, {"email": email}, _to_profile)
+            )
+            if profile is None:
+                self.logger.info("User profile not found for email: %s", email)
+            return profile
+
+        user_data = await self.collection.find_one({"email": email})
+        if not user_data:
+            self.logger.info("User profile not found for email: %s", email)
+            return None
+        return UserProfile(**user_data)
+
+    async def update_profile_fields(self, email: str, fields: dict) -> bool:
+        """Partially updates a user profile with specific fields."""
+        update_doc = _partial_update(fields)
+        if update_doc is None:
+            return False
+
+        result = await self.collection.update_one({"email": email}, update_doc)
+        write_through(self.profile_cache, email, update_doc)
+        return result.modified_count > 0
+
+    async def increment_message_counts(
+        self, email: str, new_cycle_start: datetime | None = None
+    ) -> None:
+        """Atomically increments message counts for a user."""
+        today_str = datetime.now().strftime("%Y-%m-%d")
+        existing = await self.collection.find_one(
+            {"email": email}, {"last_message_date": 1}
+        )
+        update_doc = versioned(
+            _message_count_update(existing, new_cycle_start, today_str)
+        )
+        await self.collection.update_one({"email": email}, update_doc)
+        write_through(self.profile_cache, email, update_doc)
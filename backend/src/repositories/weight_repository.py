@@ -3,29 +3,57 @@ This module contains the repository for weight logs.
 """
 
 from datetime import datetime, date
+from typing import TYPE_CHECKING
 import pymongo
-from pymongo.database import Database
 
+from src.api.models.pagination import ListPosition
 from src.api.models.weight_log import WeightLog
-from src.repositories.base import BaseRepository
-
-
-class WeightRepository(BaseRepository):
+from src.core.turn_cache import invalidates_turn_cache, turn_memoized
+from src.repositories.base import (
+    AsyncBaseRepository,
+    DailyLogRepository,
+    FindSpec,
+    recent_user_logs,
+    user_logs_between,
+)
+
+if TYPE_CHECKING:
+    from pymongo.asynchronous.database import AsyncDatabase
+
+
+def _to_weight_log(doc: dict) -> WeightLog:
+    """Builds a WeightLog from a stored document (datetime dates become dates)."""
+    if isinstance(doc["date"], datetime):
+        doc["date"] = doc["date"].date()
+    doc.pop("_id", None)
+    return WeightLog(**doc)
+
+
+def _logs_between(user_email: str, start_date: date, end_date: date) -> FindSpec:
+    """Logs of the whole days from ``start_date`` to ``end_date``."""
+    return user_logs_between(
+        user_email,
+        datetime(start_date.year, start_date.month, start_date.day, 0, 0, 0),
+        datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59),
+    )
+
+
+def _to_listed_weight(doc: dict) -> dict:
+    """Shapes a stored weight log for the list endpoint."""
+    if isinstance(doc.get("date"), datetime):
+        doc["date"] = doc["date"].date()
+    if "_id" in doc:
+        doc["id"] = str(doc.pop("_id"))
+    return doc
+
+
+class WeightRepository(DailyLogRepository):
     """
     Repository for managing weight and body composition logs in MongoDB.
     """
 
-    def __init__(self, database: Database):
-        super().__init__(database, "weight_logs")
-        self.ensure_query_indexes()
-
-    def ensure_query_indexes(self) -> None:
-        """Ensures indexes used by frequent weight reads."""
-        self.collection.create_index(
-            [("user_email", pymongo.ASCENDING), ("date", pymongo.DESCENDING)],
-            name="weight_user_date_idx",
-        )
-        self.logger.info("Weight query indexes ensured.")
+    COLLECTION_NAME = "weight_logs"
+    LOG_NAME = "weight"
 
     def ensure_indexes(self) -> None:
         """
@@ -38,18 +66,18 @@ class WeightRepository(BaseRepository):
         )
         self.logger.info("Weight logs unique daily index ensured.")
 
-    def save_log(self, log: WeightLog) -> tuple[str, bool]:
-        """
-        Saves or updates a weight log.
-        """
+    @staticmethod
+    def _daily_upsert(log: WeightLog) -> tuple[dict, dict]:
+        """Returns the upsert query and data of the log's day."""
         log_datetime = datetime(log.date.year, log.date.month, log.date.day)
 
         data = log.model_dump(exclude_none=True)
         data["date"] = log_datetime
 
         query = {"user_email": log.user_email, "date": log_datetime}
-        return self.upsert_document(query, data, f"weight log (date: {log.date})")
+        return query, data
 
+    @invalidates_turn_cache
     def update_log(self, log_id: str, user_email: str, log: WeightLog) -> bool:
         """
         Updates an existing weight log by its ID.
@@ -58,13 +86,17 @@ class WeightRepository(BaseRepository):
         data = log.model_dump(exclude_none=True)
         data["date"] = log_datetime
 
-        return self.replace_user_owned_log(
+        updated = self.replace_user_owned_log(
             document_id=log_id,
             user_email=user_email,
             data=data,
             log_name="Weight log",
         )
+        if updated:
+            self._mark_tdee_stale(user_email, log.date)
+        return updated
 
+    @invalidates_turn_cache
     def delete_log(self, user_email: str, log_date: date) -> bool:
         """
         Deletes a weight log for a specific date.
@@ -77,6 +109,7 @@ class WeightRepository(BaseRepository):
 
         if result.deleted_count > 0:
             self.logger.info("Deleted weight log for %s on %s", user_email, log_date)
+            self._mark_tdee_stale(user_email, log_date)
             return True
 
         self.logger.warning(
@@ -86,48 +119,23 @@ class WeightRepository(BaseRepository):
         )
         return False
 
+    @turn_memoized
     def get_logs(self, user_email: str, limit: int = 30) -> list[WeightLog]:
         """
         Retrieves the most recent weight logs for a user.
         """
-        cursor = (
-            self.collection.find({"user_email": user_email})
-            .sort("date", pymongo.DESCENDING)
-            .limit(limit)
-        )
-
-        logs = []
-        for doc in cursor:
-            if isinstance(doc["date"], datetime):
-                doc["date"] = doc["date"].date()
-            if "_id" in doc:
-                del doc["_id"]
-            logs.append(WeightLog(**doc))
-
-        return logs
+        docs = self.find_many(recent_user_logs(user_email, limit))
+        return [_to_weight_log(doc) for doc in docs]
 
+    @turn_memoized
     def get_logs_by_date_range(
         self, user_email: str, start_date: date, end_date: date
     ) -> list[WeightLog]:
         """
         Retrieves weight logs within a specific date range.
         """
-        start = datetime(start_date.year, start_date.month, start_date.day, 0, 0, 0)
-        end = datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59)
-
-        cursor = self.collection.find(
-            {"user_email": user_email, "date": {"$gte": start, "$lte": end}}
-        ).sort("date", pymongo.ASCENDING)
-
-        logs = []
-        for doc in cursor:
-            if isinstance(doc["date"], datetime):
-                doc["date"] = doc["date"].date()
-            if "_id" in doc:
-                del doc["_id"]
-            logs.append(WeightLog(**doc))
-
-        return logs
+        docs = self.find_many(_logs_between(user_email, start_date, end_date))
+        return [_to_weight_log(doc) for doc in docs]
 
     def get_paginated(
         self,
@@ -150,12 +158,37 @@ class WeightRepository(BaseRepository):
             .limit(page_size)
         )
 
-        logs = []
-        for doc in cursor:
-            if isinstance(doc.get("date"), datetime):
-                doc["date"] = doc["date"].date()
-            if "_id" in doc:
-                doc["id"] = str(doc.pop("_id"))
-            logs.append(doc)
+        logs = [_to_listed_weight(doc) for doc in cursor]
 
         return logs, total
+
+    def get_cursor_page(
+        self, user_email: str, position: ListPosition, page_size: int = 10
+    ) -> tuple[list[dict], bool, int | None]:
+        """
+        Retrieves a page of weight logs after ``position.cursor``, newest first.
+        Returns the logs, whether more follow and the total if requested.
+        """
+        query = {"user_email": user_email}
+        docs, has_more = self.get_keyset_page(query, page_size, position.cursor)
+        total = self.collection.count_documents(query) if position.include_total else None
+        return [_to_listed_weight(doc) for doc in docs], has_more, total
+
+
+class AsyncWeightRepository(AsyncBaseRepository):
+    """Async read surface of WeightRepository."""
+
+    def __init__(self, database: "AsyncDatabase"):
+        super().__init__(database, "weight_logs")
+
+    async def get_logs(self, user_email: str, limit: int = 30) -> list[WeightLog]:
+        """Retrieves the most recent weight logs for a user."""
+        docs = await self.find_many(recent_user_logs(user_email, limit))
+        return [_to_weight_log(doc) for doc in docs]
+
+    async def get_logs_by_date_range(
+        self, user_email: str, start_date: date, end_date: date
+    ) -> list[WeightLog]:
+        """Retrieves weight logs within a specific date range."""
+        docs = await self.find_many(_logs_between(user_email, start_date, end_date))
+        return [_to_weight_log(doc) for doc in docs]
@@ -3,16 +3,32 @@ This module contains the repository for workout logs.
 """
 
 from datetime import datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 import pymongo
 from bson import ObjectId
+from pymongo import DeleteMany, InsertOne, ReplaceOne, ReturnDocument
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError
 
+from src.api.models.pagination import ListPosition
 from src.api.models.workout_log import WorkoutLog, WorkoutWithId
 from src.api.models.workout_stats import WorkoutStats, PersonalRecord, VolumeStat
-from src.repositories.base import BaseRepository
-
-datetime_type = datetime  # pylint: disable=invalid-name
+from src.core.turn_cache import invalidates_turn_cache, turn_memoized
+from src.repositories.base import AsyncBaseRepository, BaseRepository, recent_user_logs
+from src.repositories.workout_stats_repository import (
+    exercise_pr,
+    normalize_workout_datetime,
+    radar_category,
+    recent_prs,
+    stats_current_week,
+    stats_strength_radar,
+    stats_streak,
+    stats_volume_trend,
+)
+
+if TYPE_CHECKING:
+    from src.repositories.workout_stats_repository import WorkoutStatsRepository
 
 
 class WorkoutRepository(BaseRepository):
@@ -20,15 +36,31 @@ class WorkoutRepository(BaseRepository):
     Repository for managing workout logs in MongoDB.
     """
 
-    def __init__(self, database: Database):
+    def __init__(
+        self,
+        database: Database,
+        workout_stats: "WorkoutStatsRepository | None" = None,
+    ):
         super().__init__(database, "workout_logs")
+        self.workout_stats = workout_stats
         self.ensure_indexes()
 
+    def _apply_stats(
+        self, user_email: str, added: Iterable[dict] = (), removed: Iterable[dict] = ()
+    ) -> None:
+        """Folds written logs into the materialized stats, when enabled."""
+        if self.workout_stats is not None:
+            self.workout_stats.apply_changes(user_email, added=added, removed=removed)
+
     def ensure_indexes(self) -> None:
         """Ensures indexes used by workout listing and filtering."""
         self.collection.create_index(
-            [("user_email", pymongo.ASCENDING), ("date", pymongo.DESCENDING)],
-            name="workout_user_date_idx",
+            [
+                ("user_email", pymongo.ASCENDING),
+                ("date", pymongo.DESCENDING),
+                ("_id", pymongo.DESCENDING),
+            ],
+            name="workout_user_date_id_idx",
         )
         self.collection.create_index(
             [("user_email", pymongo.ASCENDING), ("workout_type", pymongo.ASCENDING)],
@@ -36,11 +68,14 @@ class WorkoutRepository(BaseRepository):
         )
         self.logger.info("Workout indexes ensured.")
 
+    @invalidates_turn_cache
     def save_log(self, workout: WorkoutLog) -> str:
         """
         Saves a workout log to the database.
         """
-        result = self.collection.insert_one(workout.model_dump())
+        doc = workout.model_dump()
+        result = self.collection.insert_one(doc)
+        self._apply_stats(workout.user_email, added=[doc])
         self.logger.info(
             "Workout log saved for user %s with %d exercises",
             workout.user_email,
@@ -48,6 +83,7 @@ class WorkoutRepository(BaseRepository):
         )
         return str(result.inserted_id)
 
+    @invalidates_turn_cache
     def update_log(self, workout_id: str, user_email: str, workout: WorkoutLog) -> bool:
         """
         Updates an existing workout log.
@@ -56,47 +92,151 @@ class WorkoutRepository(BaseRepository):
         # Ensure we don't change the user_email
         update_data["user_email"] = user_email
 
-        result = self.collection.replace_one(
-            {"_id": ObjectId(workout_id), "user_email": user_email},
-            update_data
-        )
-        updated = result.matched_count > 0
+        query = {"_id": ObjectId(workout_id), "user_email": user_email}
+        if self.workout_stats is None:
+            updated = self.collection.replace_one(query, update_data).matched_count > 0
+        else:
+            previous = self.collection.find_one_and_replace(
+                query, update_data, return_document=ReturnDocument.BEFORE
+            )
+            updated = previous is not None
+            if updated:
+                self._apply_stats(
+                    user_email,
+                    added=[{**update_data, "_id": previous["_id"]}],
+                    removed=[previous],
+                )
         if updated:
             self.logger.info("Workout log %s updated for user %s", workout_id, user_email)
         else:
             self.logger.warning("Workout log %s not found for update", workout_id)
         return updated
 
+    @turn_memoized
     def get_logs(self, user_email: str, limit: int = 50) -> list[WorkoutWithId]:
         """
         Retrieves the most recent workout logs for a user.
         """
-        cursor = (
-            self.collection.find({"user_email": user_email})
-            .sort("date", pymongo.DESCENDING)
-            .limit(limit)
-        )
-        workouts = []
-        for doc in cursor:
-            workouts.append(WorkoutWithId(**doc))
+        docs = self.find_many(recent_user_logs(user_email, limit))
+        workouts = [WorkoutWithId(**doc) for doc in docs]
 
         self.logger.debug(
             "Retrieved %d workout logs for user: %s", len(workouts), user_email
         )
         return workouts
 
+    @invalidates_turn_cache
     def delete_log(self, workout_id: str) -> bool:
         """
         Deletes a workout log by its ID.
         """
-        result = self.collection.delete_one({"_id": ObjectId(workout_id)})
-        deleted = result.deleted_count > 0
+        query = {"_id": ObjectId(workout_id)}
+        if self.workout_stats is None:
+            deleted = self.collection.delete_one(query).deleted_count > 0
+        else:
+            previous = self.collection.find_one_and_delete(query)
+            deleted = previous is not None
+            if deleted:
+                self._apply_stats(previous["user_email"], removed=[previous])
         if deleted:
             self.logger.info("Workout log %s deleted", workout_id)
         else:
             self.logger.warning("Workout log %s not found for deletion", workout_id)
         return deleted
 
+    @invalidates_turn_cache
+    def delete_user_logs(self, user_email: str, workout_ids: list) -> int:
+        """
+        Deletes several workout logs of a user and returns how many were removed.
+        """
+        if not workout_ids:
+            return 0
+        query = {"_id": {"$in": list(workout_ids)}, "user_email": user_email}
+        removed = list(self.collection.find(query)) if self.workout_stats else []
+        deleted = self.collection.delete_many(query).deleted_count
+        self._apply_stats(user_email, removed=removed)
+        return deleted
+
+    def get_import_index(self, user_email: str) -> list[dict]:
+        """
+        Returns id, external id and date of every log of a user.
+        Lets bulk imports deduplicate in memory instead of querying per workout.
+        """
+        return list(
+            self.collection.find(
+                {"user_email": user_email}, {"_id": 1, "external_id": 1, "date": 1}
+            )
+        )
+
+    @invalidates_turn_cache
+    def apply_import(
+        self,
+        user_email: str,
+        inserts: list[dict],
+        replacements: Iterable[tuple[ObjectId, dict]] = (),
+        deletions: Iterable = (),
+    ) -> set[ObjectId]:
+        """
+        Writes a batch of imported logs with a single unordered bulk_write.
+        Inserted documents must already carry their ``_id``.
+
+        Returns the ids whose write failed; only the applied writes reach the
+        materialized stats.
+        """
+        replacements = list(replacements)
+        deletions = list(deletions)
+        removed_ids = deletions + [workout_id for workout_id, _ in replacements]
+        removed = (
+            list(self.collection.find({"_id": {"$in": removed_ids}, "user_email": user_email}))
+            if self.workout_stats is not None and removed_ids
+            else []
+        )
+
+        operations: list = []
+        op_ids: list[list[ObjectId]] = []
+        if deletions:
+            operations.append(
+                DeleteMany({"_id": {"$in": deletions}, "user_email": user_email})
+            )
+            op_ids.append(deletions)
+        for workout_id, doc in replacements:
+            operations.append(ReplaceOne({"_id": workout_id, "user_email": user_email}, doc))
+            op_ids.append([workout_id])
+        for doc in inserts:
+            operations.append(InsertOne(doc))
+            op_ids.append([doc["_id"]])
+        if not operations:
+            return set()
+
+        failed: set[ObjectId] = set()
+        try:
+            self.collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            # Unordered: every operation not listed in writeErrors was applied.
+            for error in e.details.get("writeErrors", []):
+                failed.update(op_ids[error["index"]])
+            self.logger.error(
+                "Import batch for %s: %d writes failed", user_email, len(failed)
+            )
+
+        added = [
+            *(doc for doc in inserts if doc["_id"] not in failed),
+            *({**doc, "_id": wid} for wid, doc in replacements if wid not in failed),
+        ]
+        self._apply_stats(
+            user_email,
+            added=added,
+            removed=[doc for doc in removed if doc["_id"] not in failed],
+        )
+        self.logger.info(
+            "Import batch for %s: %d inserted, %d replaced, %d deleted",
+            user_email,
+            sum(doc["_id"] not in failed for doc in inserts),
+            sum(wid not in failed for wid, _ in replacements),
+            sum(wid not in failed for wid in deletions),
+        )
+        return failed
+
     def get_log_by_id(self, workout_id: str) -> dict | None:
         """
         Retrieves a single workout log by its ID.
@@ -132,6 +272,25 @@ class WorkoutRepository(BaseRepository):
         )
         return workouts, total
 
+    def get_cursor_page(
+        self,
+        user_email: str,
+        position: ListPosition,
+        page_size: int = 10,
+        workout_type: str | None = None,
+    ) -> tuple[list[dict], bool, int | None]:
+        """
+        Retrieves a page of workout logs after ``position.cursor``, newest first.
+        Returns the workouts, whether more follow and the total if requested.
+        """
+        query: dict[str, Any] = {"user_email": user_email}
+        if workout_type:
+            query["workout_type"] = workout_type
+
+        workouts, has_more = self.get_keyset_page(query, page_size, position.cursor)
+        total = self.collection.count_documents(query) if position.include_total else None
+        return workouts, has_more, total
+
     def get_types(self, user_email: str) -> list[str]:
         """
         Retrieves all unique workout types for a user.
@@ -149,7 +308,13 @@ class WorkoutRepository(BaseRepository):
     def get_stats(self, user_email: str) -> WorkoutStats:
         """
         Calculates and retrieves comprehensive workout statistics for a user.
+
+        With materialized stats enabled only the stats document and the
+        latest log are read; otherwise the whole history is scanned.
         """
+        if self.workout_stats is not None:
+            return self._get_materialized_stats(user_email)
+
         # 1. Get all workouts (projection for speed)
         cursor = self.collection.find(
             {"user_email": user_email},
@@ -166,18 +331,11 @@ class WorkoutRepository(BaseRepository):
 
         all_workouts = list(cursor)
         if not all_workouts:
-            return WorkoutStats(
-                current_streak_weeks=0,
-                weekly_frequency=[False] * 7,
-                weekly_volume=[],
-                recent_prs=[],
-                total_workouts=0,
-                last_workout=None,
-            )
+            return self._no_workout_stats()
 
         # 2. Basic Metrics
         total_workouts = len(all_workouts)
-        last_workout_doc = all_workouts[0]
+        last_workout_doc = dict(all_workouts[0])
         last_workout_doc["id"] = str(last_workout_doc.pop("_id"))
         last_workout = WorkoutWithId(**last_workout_doc)
 
@@ -200,20 +358,42 @@ class WorkoutRepository(BaseRepository):
         )
 
     @staticmethod
-    def _normalize_datetime(value: Any) -> datetime:
-        """Converts workout date payloads into a datetime."""
-        if isinstance(value, datetime_type):
-            return value.replace(tzinfo=None) if value.tzinfo else value
-        if hasattr(value, "year") and hasattr(value, "month") and hasattr(value, "day"):
-            return datetime(value.year, value.month, value.day)
-        if isinstance(value, str):
-            parsed = value.replace("Z", "+00:00")
-            try:
-                dt = datetime.fromisoformat(parsed)
-            except ValueError:
-                dt = datetime.fromisoformat(f"{parsed}T00:00:00")
-            return dt.replace(tzinfo=None) if dt.tzinfo else dt
-        raise TypeError(f"Unsupported workout date value: {value!r}")
+    def _no_workout_stats() -> WorkoutStats:
+        return WorkoutStats(
+            current_streak_weeks=0,
+            weekly_frequency=[False] * 7,
+            weekly_volume=[],
+            recent_prs=[],
+            total_workouts=0,
+            last_workout=None,
+        )
+
+    def _get_materialized_stats(self, user_email: str) -> WorkoutStats:
+        stats = self.workout_stats.get_stats(user_email)
+        if not stats["total_workouts"]:
+            return self._no_workout_stats()
+        last_workout_doc = self.collection.find_one(
+            {"user_email": user_email}, sort=[("date", pymongo.DESCENDING)]
+        )
+        last_workout = None
+        if last_workout_doc:
+            last_workout_doc["id"] = str(last_workout_doc.pop("_id"))
+            last_workout = WorkoutWithId(**last_workout_doc)
+
+        now = datetime.now()
+        freq, volume = stats_current_week(stats, now)
+        return WorkoutStats(
+            current_streak_weeks=stats_streak(stats, now),
+            weekly_frequency=freq,
+            weekly_volume=volume,
+            recent_prs=recent_prs(stats["exercise_prs"]),
+            total_workouts=stats["total_workouts"],
+            last_workout=last_workout,
+            volume_trend=stats_volume_trend(stats, now),
+            strength_radar=stats_strength_radar(stats),
+        )
+
+    _normalize_datetime = staticmethod(normalize_workout_datetime)
 
     @classmethod
     def _get_weeks_data(cls, workouts: list[dict]) -> dict[tuple[int, int], int]:
@@ -284,20 +464,7 @@ class WorkoutRepository(BaseRepository):
         stats.sort(key=lambda x: x.volume, reverse=True)
         return freq, stats
 
-    @staticmethod
-    def _get_exercise_pr(ex: dict) -> tuple[float, int] | None:
-        reps = ex.get("reps_per_set", [])
-        weights = ex.get("weights_per_set", [])
-        if not weights or all(w == 0 for w in weights):
-            return None
-
-        s_max, s_reps = -1.0, 0
-        for i, weight in enumerate(weights):
-            if weight > s_max:
-                s_max = weight
-                s_reps = reps[i] if i < len(reps) else 0
-
-        return (s_max, s_reps) if s_max >= 0 else None
+    _get_exercise_pr = staticmethod(exercise_pr)
 
     def _calculate_recent_prs(
         self, workouts: list[dict], limit: int = 3
@@ -328,19 +495,7 @@ class WorkoutRepository(BaseRepository):
                         "workout_id": w_id,
                     }
 
-        prs_list = [
-            PersonalRecord(
-                exercise_name=name,
-                weight=data["weight"],
-                reps=data["reps"],
-                date=data["date"],
-                workout_id=data["workout_id"],
-            )
-            for name, data in max_weights.items()
-        ]
-
-        prs_list.sort(key=lambda x: x.date, reverse=True)
-        return prs_list[:limit]
+        return recent_prs(max_weights, limit)
 
     def _calculate_volume_trend(self, workouts: list[dict]) -> list[float]:
         """Calculates weekly volume total for the last 8 weeks."""
@@ -362,33 +517,7 @@ class WorkoutRepository(BaseRepository):
         # Return reversed to show chronological order in chart
         return [round(v, 1) for v in reversed(weeks)]
 
-    @staticmethod
-    def _get_radar_category(name: str) -> str:
-        categories = {
-            "Push": ["Supino", "Peito", "Ombro", "Tríceps", "Militar", "Bench"],
-            "Pull": [
-                "Costas",
-                "Remada",
-                "Puxada",
-                "Bíceps",
-                "Levantamento Terra",
-                "Deadlift",
-                "Row",
-            ],
-            "Legs": [
-                "Agachamento",
-                "Leg Press",
-                "Extensora",
-                "Flexora",
-                "Pernas",
-                "Panturrilha",
-                "Squat",
-            ],
-        }
-        for k, v in categories.items():
-            if any(term.lower() in name.lower() for term in v):
-                return k
-        return "Outros"
+    _get_radar_category = staticmethod(radar_category)
 
     def _calculate_strength_radar(self, workouts: list[dict]) -> dict[str, float]:
         """Calculates current vs peak strength ratio (0-1.0) for major muscle groups."""
@@ -419,3 +548,15 @@ class WorkoutRepository(BaseRepository):
             )
 
         return result
+
+
+class AsyncWorkoutRepository(AsyncBaseRepository):
+    """Async read surface of WorkoutRepository."""
+
+    def __init__(self, database: AsyncDatabase):
+        super().__init__(database, "workout_logs")
+
+    async def get_logs(self, user_email: str, limit: int = 50) -> list[WorkoutWithId]:
+        """Retrieves the most recent workout logs for a user."""
+        docs = await self.find_many(recent_user_logs(user_email, limit))
+        return [WorkoutWithId(**doc) for doc in docs]
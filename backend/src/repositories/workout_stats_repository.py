@@ -0,0 +1,449 @@
+"""
+This module contains the repository for materialized workout statistics.
+"""
+
+import re
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+import pymongo
+from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError
+
+from src.api.models.workout_stats import PersonalRecord, VolumeStat
+from src.repositories.base import BaseRepository
+
+RADAR_CATEGORIES: dict[str, list[str]] = {
+    "Push": ["Supino", "Peito", "Ombro", "Tríceps", "Militar", "Bench"],
+    "Pull": [
+        "Costas",
+        "Remada",
+        "Puxada",
+        "Bíceps",
+        "Levantamento Terra",
+        "Deadlift",
+        "Row",
+    ],
+    "Legs": [
+        "Agachamento",
+        "Leg Press",
+        "Extensora",
+        "Flexora",
+        "Pernas",
+        "Panturrilha",
+        "Squat",
+    ],
+}
+
+# Fields of a workout log that the statistics depend on.
+STATS_PROJECTION = {"date": 1, "workout_type": 1, "exercises": 1, "user_email": 1}
+
+
+def normalize_workout_datetime(value: Any) -> datetime:
+    """Converts workout date payloads into a naive datetime."""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None) if value.tzinfo else value
+    if hasattr(value, "year") and hasattr(value, "month") and hasattr(value, "day"):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, str):
+        parsed = value.replace("Z", "+00:00")
+        try:
+            dt = datetime.fromisoformat(parsed)
+        except ValueError:
+            dt = datetime.fromisoformat(f"{parsed}T00:00:00")
+        return dt.replace(tzinfo=None) if dt.tzinfo else dt
+    raise TypeError(f"Unsupported workout date value: {value!r}")
+
+
+def exercise_pr(exercise: dict) -> tuple[float, int] | None:
+    """Returns the heaviest set of an exercise as (weight, reps)."""
+    reps = exercise.get("reps_per_set", [])
+    weights = exercise.get("weights_per_set", [])
+    if not weights or all(w == 0 for w in weights):
+        return None
+
+    s_max, s_reps = -1.0, 0
+    for i, weight in enumerate(weights):
+        if weight > s_max:
+            s_max = weight
+            s_reps = reps[i] if i < len(reps) else 0
+
+    return (s_max, s_reps) if s_max >= 0 else None
+
+
+def radar_category(name: str) -> str:
+    """Maps an exercise name to its strength radar category."""
+    for category, terms in RADAR_CATEGORIES.items():
+        if any(term.lower() in name.lower() for term in terms):
+            return category
+    return "Outros"
+
+
+def exercise_volume(exercise: dict) -> float:
+    """Returns the total load (reps x weight) of an exercise."""
+    reps = exercise.get("reps_per_set", [])
+    weights = exercise.get("weights_per_set", [])
+    return sum(r * (weights[i] if i < len(weights) else 0.0) for i, r in enumerate(reps))
+
+
+def _week_key(dt: datetime) -> str:
+    iso_year, iso_week, _ = dt.isocalendar()
+    return f"{iso_year}-W{iso_week:02d}"
+
+
+def _category_strength(workout: dict) -> dict[str, float]:
+    """
+    Returns, per radar category, the max weight of the last matching exercise
+    of a workout (what the radar treats as the "current" strength).
+    """
+    current: dict[str, float] = {}
+    for ex in workout.get("exercises", []):
+        category = radar_category(ex.get("name", ""))
+        if category == "Outros":
+            continue
+        valid = [w for w in ex.get("weights_per_set", []) if w > 0]
+        if valid:
+            current[category] = max(valid)
+    return current
+
+
+def _category_peaks(workout: dict) -> dict[str, float]:
+    peaks: dict[str, float] = {}
+    for ex in workout.get("exercises", []):
+        category = radar_category(ex.get("name", ""))
+        if category == "Outros":
+            continue
+        valid = [w for w in ex.get("weights_per_set", []) if w > 0]
+        if valid:
+            peaks[category] = max(peaks.get(category, 0), *valid)
+    return peaks
+
+
+def empty_stats(user_email: str) -> dict:
+    """Returns the materialized stats document of a user without workouts."""
+    return {
+        "user_email": user_email,
+        "total_workouts": 0,
+        "weeks": {},
+        "days": {},
+        "exercise_prs": {},
+        "strength": {},
+    }
+
+
+def add_workout(stats: dict, workout: dict) -> None:
+    """Folds one workout log into a stats document."""
+    dt = normalize_workout_datetime(workout["date"])
+    workout_id = str(workout.get("_id"))
+    stats["total_workouts"] += 1
+
+    week = _week_key(dt)
+    stats["weeks"][week] = stats["weeks"].get(week, 0) + 1
+
+    day = stats["days"].setdefault(dt.date().isoformat(), {"count": 0, "categories": {}})
+    day["count"] += 1
+    bucket = day["categories"].setdefault(
+        workout.get("workout_type") or "Outros",
+        {"workouts": 0, "exercises": 0, "volume": 0.0},
+    )
+    bucket["workouts"] += 1
+    bucket["exercises"] += len(workout.get("exercises", []))
+    bucket["volume"] += sum(exercise_volume(ex) for ex in workout.get("exercises", []))
+
+    for ex in workout.get("exercises", []):
+        name = ex.get("name")
+        pr = exercise_pr(ex) if name else None
+        if not pr:
+            continue
+        current = stats["exercise_prs"].get(name)
+        # The earliest workout reaching the max weight holds the record.
+        if (
+            current is None
+            or pr[0] > current["weight"]
+            or (pr[0] == current["weight"] and dt < current["date"])
+        ):
+            stats["exercise_prs"][name] = {
+                "weight": pr[0],
+                "reps": pr[1],
+                "date": dt,
+                "workout_id": workout_id,
+            }
+
+    peaks = _category_peaks(workout)
+    for category, weight in _category_strength(workout).items():
+        entry = stats["strength"].get(category)
+        if entry is None:
+            stats["strength"][category] = {
+                "peak": peaks[category],
+                "current": weight,
+                "current_date": dt,
+                "current_workout_id": workout_id,
+            }
+            continue
+        entry["peak"] = max(entry["peak"], peaks[category])
+        if dt >= entry["current_date"]:
+            entry.update(current=weight, current_date=dt, current_workout_id=workout_id)
+
+
+def remove_workout(stats: dict, workout: dict) -> tuple[set[str], set[str]]:
+    """
+    Removes one workout log from a stats document.
+
+    Counters and volumes are reversed in place. Maxima cannot be reversed, so
+    the exercise names and radar categories whose record came from this
+    workout are returned for a targeted recompute.
+    """
+    dt = normalize_workout_datetime(workout["date"])
+    workout_id = str(workout.get("_id"))
+    stats["total_workouts"] = max(0, stats["total_workouts"] - 1)
+
+    week = _week_key(dt)
+    if stats["weeks"].get(week, 0) <= 1:
+        stats["weeks"].pop(week, None)
+    else:
+        stats["weeks"][week] -= 1
+
+    day_key = dt.date().isoformat()
+    day = stats["days"].get(day_key)
+    if day is not None:
+        day["count"] -= 1
+        category = workout.get("workout_type") or "Outros"
+        bucket = day["categories"].get(category)
+        if bucket is not None:
+            bucket["workouts"] -= 1
+            bucket["exercises"] -= len(workout.get("exercises", []))
+            bucket["volume"] -= sum(
+                exercise_volume(ex) for ex in workout.get("exercises", [])
+            )
+            if bucket["workouts"] <= 0:
+                del day["categories"][category]
+        if day["count"] <= 0:
+            del stats["days"][day_key]
+
+    dirty_exercises = {
+        name
+        for name, record in stats["exercise_prs"].items()
+        if record["workout_id"] == workout_id
+    }
+    dirty_categories = set()
+    for category, peak in _category_peaks(workout).items():
+        entry = stats["strength"].get(category)
+        if entry is not None and (
+            peak >= entry["peak"] or entry["current_workout_id"] == workout_id
+        ):
+            dirty_categories.add(category)
+    return dirty_exercises, dirty_categories
+
+
+def stats_streak(stats: dict, now: datetime) -> int:
+    """Consecutive ISO weeks with at least 3 workouts, ending this or last week."""
+    weeks = stats["weeks"]
+
+    def met_criteria(dt: datetime) -> bool:
+        return weeks.get(_week_key(dt), 0) >= 3
+
+    check = datetime.fromisocalendar(*now.isocalendar()[:2], 1)
+    if not met_criteria(check):
+        check -= timedelta(days=7)
+    streak = 0
+    while met_criteria(check):
+        streak += 1
+        check -= timedelta(days=7)
+    return streak
+
+
+def stats_current_week(
+    stats: dict, now: datetime
+) -> tuple[list[bool], list[VolumeStat]]:
+    """Training days and volume per category of the current week."""
+    start = (now - timedelta(days=now.weekday())).date()
+    freq = [False] * 7
+    volumes: dict[str, float] = {}
+    for day_key, day in stats["days"].items():
+        day_date = datetime.fromisoformat(day_key).date()
+        if day_date < start:
+            continue
+        freq[day_date.weekday()] = True
+        for category, bucket in day["categories"].items():
+            if bucket["exercises"] <= 0:
+                continue
+            volumes[category] = volumes.get(category, 0.0) + bucket["volume"]
+    volume = [VolumeStat(category=k, volume=round(v, 1)) for k, v in volumes.items()]
+    volume.sort(key=lambda x: x.volume, reverse=True)
+    return freq, volume
+
+
+def stats_volume_trend(stats: dict, now: datetime) -> list[float]:
+    """Total volume of each of the last 8 seven-day windows, oldest first."""
+    weeks = [0.0] * 8
+    today = now.date()
+    for day_key, day in stats["days"].items():
+        age_days = (today - datetime.fromisoformat(day_key).date()).days
+        if 0 <= age_days < 56:
+            weeks[age_days // 7] += sum(b["volume"] for b in day["categories"].values())
+    return [round(v, 1) for v in reversed(weeks)]
+
+
+def recent_prs(exercise_prs: dict[str, dict], limit: int = 3) -> list[PersonalRecord]:
+    """Most recently set of the per-exercise records (weight, reps, date, workout_id)."""
+    records = [
+        PersonalRecord(
+            exercise_name=name,
+            weight=data["weight"],
+            reps=data["reps"],
+            date=data["date"],
+            workout_id=data["workout_id"],
+        )
+        for name, data in exercise_prs.items()
+    ]
+    records.sort(key=lambda x: (x.date, x.exercise_name), reverse=True)
+    return records[:limit]
+
+
+def stats_strength_radar(stats: dict) -> dict[str, float]:
+    """Current vs peak strength ratio (0-1.0) for the major muscle groups."""
+    result = {}
+    for category in RADAR_CATEGORIES:
+        entry = stats["strength"].get(category)
+        peak = entry["peak"] if entry else 0
+        result[category] = round(entry["current"] / peak, 2) if peak > 0 else 0.0
+    return result
+
+
+class WorkoutStatsRepository(BaseRepository):
+    """
+    Repository for the per-user materialized workout statistics.
+
+    One document per user keeps weekly and daily buckets, the personal
+    record of every exercise and the peak/current strength per radar
+    category. Workout writes fold the changed logs into it; maxima whose
+    holder was removed are recomputed from the logs of that exercise only.
+    Documents are replaced as a whole under a version guard, so exercise and
+    category names are stored as plain keys.
+    """
+
+    MAX_ATTEMPTS = 5
+
+    def __init__(self, database: Database):
+        super().__init__(database, "workout_stats")
+        self.workouts = database["workout_logs"]
+        self.ensure_indexes()
+
+    def ensure_indexes(self) -> None:
+        """Ensures one stats document per user."""
+        self.collection.create_index(
+            "user_email", unique=True, name="workout_stats_user_idx"
+        )
+        self.logger.info("Workout stats indexes ensured.")
+
+    def get_stats(self, user_email: str) -> dict:
+        """
+        Returns the stats document, rebuilding it when it is missing or
+        out of step with the logs (e.g. logs written by scripts).
+        """
+        stats = self.collection.find_one({"user_email": user_email}, {"_id": 0})
+        if stats is not None and stats.get("total_workouts") == self.workouts.count_documents(
+            {"user_email": user_email}
+        ):
+            return stats
+        return self.rebuild(user_email)
+
+    def rebuild(self, user_email: str) -> dict:
+        """Recomputes the stats document of a user from all workout logs."""
+        for _ in range(self.MAX_ATTEMPTS):
+            existing = self.collection.find_one(
+                {"user_email": user_email}, {"version": 1}
+            )
+            stats = empty_stats(user_email)
+            for workout in self._workouts({"user_email": user_email}):
+                add_workout(stats, workout)
+            if self._store(stats, existing.get("version", 0) if existing else None):
+                return stats
+        self.logger.warning("Workout stats rebuild for %s kept conflicting", user_email)
+        return stats
+
+    def apply_changes(
+        self,
+        user_email: str,
+        added: Iterable[dict] = (),
+        removed: Iterable[dict] = (),
+    ) -> None:
+        """
+        Folds written logs into the stats document after the write happened.
+
+        ``removed`` are the previous versions of updated or deleted logs and
+        ``added`` the new or updated logs, as stored (including ``_id``).
+        """
+        added, removed = list(added), list(removed)
+        if not added and not removed:
+            return
+        for _ in range(self.MAX_ATTEMPTS):
+            stats = self.collection.find_one({"user_email": user_email}, {"_id": 0})
+            if stats is None:
+                self.rebuild(user_email)
+                return
+            version = stats.get("version", 0)
+            dirty_exercises: set[str] = set()
+            dirty_categories: set[str] = set()
+            for workout in removed:
+                exercises, categories = remove_workout(stats, workout)
+                dirty_exercises |= exercises
+                dirty_categories |= categories
+            for workout in added:
+                add_workout(stats, workout)
+            self._recompute(stats, dirty_exercises, dirty_categories)
+            if self._store(stats, version):
+                return
+        # Lost the race repeatedly: drop the document, the next read rebuilds it.
+        self.collection.delete_one({"user_email": user_email})
+
+    def _workouts(self, query: dict):
+        return self.workouts.find(query, STATS_PROJECTION).sort(
+            "date", pymongo.ASCENDING
+        )
+
+    def _recompute(
+        self, stats: dict, exercises: set[str], categories: set[str]
+    ) -> None:
+        """Recomputes records whose holder was removed from the current logs."""
+        user_email = stats["user_email"]
+        for name in exercises:
+            partial = empty_stats(user_email)
+            for workout in self._workouts(
+                {"user_email": user_email, "exercises.name": name}
+            ):
+                add_workout(partial, workout)
+            if name in partial["exercise_prs"]:
+                stats["exercise_prs"][name] = partial["exercise_prs"][name]
+            else:
+                stats["exercise_prs"].pop(name, None)
+        for category in categories:
+            pattern = "|".join(re.escape(term) for term in RADAR_CATEGORIES[category])
+            partial = empty_stats(user_email)
+            for workout in self._workouts(
+                {
+                    "user_email": user_email,
+                    "exercises.name": {"$regex": pattern, "$options": "i"},
+                }
+            ):
+                add_workout(partial, workout)
+            if category in partial["strength"]:
+                stats["strength"][category] = partial["strength"][category]
+            else:
+                stats["strength"].pop(category, None)
+
+    def _store(self, stats: dict, expected_version: int | None) -> bool:
+        """Writes the document if nobody else changed it since it was read."""
+        stats["version"] = (expected_version or 0) + 1
+        stats["updated_at"] = datetime.now()
+        if expected_version is None:
+            try:
+                self.collection.insert_one(dict(stats))
+            except DuplicateKeyError:
+                return False
+            return True
+        result = self.collection.replace_one(
+            {"user_email": stats["user_email"], "version": expected_version},
+            stats,
+        )
+        return result.matched_count > 0
@@ -4,17 +4,21 @@ Service for calculating Adaptive TDEE based on weight and nutrition history.
 # pylint: disable=too-many-lines,too-many-locals
 
 from datetime import date, timedelta, datetime
+import hashlib
+import json
 from typing import List, TYPE_CHECKING, Any
 
 import numpy as np
 
 from src.core.logs import logger
+from src.core.turn_cache import turn_cache_scope, turn_cached
 from src.services.tdee_utils import (
     calculate_body_composition_changes,
     calculate_macro_targets,
 )
 from src.api.models.weight_log import WeightLog
 from src.api.models.nutrition_log import NutritionLog
+from src.services import tdee_engine
 from src.services.tdee_outliers import filter_outliers
 
 if TYPE_CHECKING:
@@ -77,6 +81,8 @@ class AdaptiveTDEEService:
     def __init__(self, db: "MongoDatabase"):
         """Initialize the AdaptiveTDEEService with a database connection."""
         self.db = db
+        # Intermediate v3 values from the last rebuild, persisted with the state.
+        self.last_pipeline_state: dict[str, Any] = {}
 
     def _get_optional_plan(self, user_email: str):
         """Return the user's plan when the database surface provides it."""
@@ -514,6 +520,119 @@ class AdaptiveTDEEService:
         return base_bmr * activity_factor
 
     def calculate_tdee(self, user_email: str, lookback_weeks: int = 4) -> dict:
+        """
+        Calculates the user's TDEE, computed at most once per turn cache scope.
+
+        Context loading, progress snapshots and nutrition stats all ask for the
+        same value during one chat turn; the active turn cache shares it.
+        """
+        return turn_cached(
+            ("AdaptiveTDEEService.calculate_tdee", user_email, lookback_weeks),
+            lambda: self._cached_tdee(user_email, lookback_weeks),
+        )
+
+    def _state_fingerprint(
+        self,
+        profile: "UserProfile | None",
+        plan,
+        last_target: Any = None,
+        last_check_in: Any = None,
+    ) -> str:
+        """Hashes every non-log input of the v3 pipeline (profile + plan goal)."""
+        inputs = {
+            field: getattr(profile, field, None)
+            for field in (
+                "gender",
+                "age",
+                "height",
+                "goal_type",
+                "weekly_rate",
+                "target_weight",
+                "tdee_activity_factor",
+                "tdee_start_date",
+            )
+        }
+        inputs["tdee_last_target"] = (
+            last_target
+            if last_target is not None
+            else getattr(profile, "tdee_last_target", None)
+        )
+        inputs["tdee_last_check_in"] = (
+            last_check_in
+            if last_check_in is not None
+            else getattr(profile, "tdee_last_check_in", None)
+        )
+        inputs["plan_goal"] = self._extract_plan_goal_context(plan, profile)
+        inputs["plan_calories"] = self._extract_plan_calories(plan)
+        encoded = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _cached_tdee(self, user_email: str, lookback_weeks: int) -> dict:
+        """
+        Serves the cached TDEE result when it is still valid, else recomputes it.
+
+        This is a stale-flag cache, not an incremental state: the result is
+        reused while no weight/nutrition write flagged it stale, it was
+        computed today (targets, check-ins and the lookback window are
+        day-relative) and the profile/plan inputs hash to the same
+        fingerprint. The profile and plan are read on every call to build
+        that fingerprint. Any miss reruns the full v3 pipeline over the
+        lookback window, so the cached result is identical to a fresh
+        computation.
+        """
+        with turn_cache_scope():
+            profile = self.db.get_user_profile(user_email)
+            plan = self._get_optional_plan(user_email)
+            today = date.today().isoformat()
+            fingerprint = self._state_fingerprint(profile, plan)
+
+            get_state = getattr(self.db, "get_tdee_state", None)
+            state = get_state(user_email, lookback_weeks) if callable(get_state) else None
+            if (
+                isinstance(state, dict)
+                and state.get("stale") is False
+                and state.get("computed_on") == today
+                and state.get("fingerprint") == fingerprint
+                and isinstance(state.get("result"), dict)
+            ):
+                return state["result"]
+
+            self.last_pipeline_state = {}
+            result = self._compute_tdee(user_email, lookback_weeks, profile, plan)
+
+            save_state = getattr(self.db, "save_tdee_state", None)
+            if callable(save_state):
+                checked_in_target = self.last_pipeline_state.get("checked_in_target")
+                if checked_in_target is not None:
+                    # The rebuild persisted a new coaching check-in on the profile.
+                    fingerprint = self._state_fingerprint(
+                        profile, plan, checked_in_target, today
+                    )
+                try:
+                    save_state(
+                        user_email,
+                        lookback_weeks,
+                        {
+                            **self.last_pipeline_state,
+                            "computed_on": today,
+                            "fingerprint": fingerprint,
+                            "result": result,
+                        },
+                        expected_version=(
+                            state.get("version", 0) if isinstance(state, dict) else None
+                        ),
+                    )
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    logger.warning("Failed to persist TDEE state for %s: %s", user_email, exc)
+            return result
+
+    def _compute_tdee(
+        self,
+        user_email: str,
+        lookback_weeks: int,
+        profile: "UserProfile | None",
+        plan,
+    ) -> dict:
         """
         Calculates the user's TDEE using v3 algorithm: daily observations + EMA.
 
@@ -558,8 +677,6 @@ class AdaptiveTDEEService:
         )
 
         # Step 2: Calculate formula TDEE as prior/fallback
-        profile = self.db.get_user_profile(user_email)
-        plan = self._get_optional_plan(user_email)
         plan_goal_context = self._extract_plan_goal_context(plan, profile)
         tdee_start_date_str = getattr(profile, "tdee_start_date", None)
         tdee_start_date = None
@@ -622,8 +739,10 @@ class AdaptiveTDEEService:
             )
 
         # Step 5: Interpolate weight gaps and compute daily trend (Task 2)
-        daily_weight = self.interpolate_weight_gaps(weight_logs)
-        daily_trend = self.compute_daily_trend(daily_weight)
+        daily_weight = tdee_engine.interpolate_weights(
+            weight_logs, self.MAX_INTERPOLATION_GAP
+        )
+        daily_trend = tdee_engine.daily_trend(daily_weight, self.EMA_SPAN)
 
         # Step 6: Filter complete nutrition logs (Task 1)
         complete_nutrition = [n for n in nutrition_logs if not n.partial_logged]
@@ -636,22 +755,18 @@ class AdaptiveTDEEService:
                 user_email, weight_logs, fallback_nutrition_logs
             )
 
-        # Step 7: Create nutrition_by_date dict
-        nutrition_by_date = {}
-        for log_item in complete_nutrition:
-            log_date_only = (
-                log_item.date.date()
-                if isinstance(log_item.date, datetime)
-                else log_item.date
-            )
-            nutrition_by_date[log_date_only] = log_item.calories
+        # Step 7: Align calories with the trend days
+        daily_calories = tdee_engine.calories_on_days(daily_weight, complete_nutrition)
+        last_nutrition_date = max(
+            log_item.date.date()
+            if isinstance(log_item.date, datetime)
+            else log_item.date
+            for log_item in complete_nutrition
+        )
 
         # Step 8: Calculate trend slope for energy_per_kg
-        sorted_dates = sorted(daily_trend.keys())
-        if len(sorted_dates) >= 2:
-            trend_slope = (
-                daily_trend[sorted_dates[-1]] - daily_trend[sorted_dates[0]]
-            ) / len(sorted_dates)
+        if len(daily_trend) >= 2:
+            trend_slope = (daily_trend[-1] - daily_trend[0]) / len(daily_trend)
         else:
             trend_slope = 0
 
@@ -670,21 +785,36 @@ class AdaptiveTDEEService:
         daily_target_fallback = (
             getattr(profile, "tdee_last_target", None) if profile else None
         )
-        observations = self.compute_tdee_observations(
-            daily_trend, nutrition_by_date, energy_per_kg, daily_target_fallback
+        if not isinstance(daily_target_fallback, (int, float)):
+            daily_target_fallback = None
+        observation_days, observations = tdee_engine.window_observations(
+            daily_trend, daily_calories, energy_per_kg, daily_target_fallback
         )
 
         # Step 11: Compute TDEE from observations (Task 3)
-        if observations:
-            tdee = self._compute_tdee_from_observations(
-                observations,
-                formula_tdee,
-                span=self._calculate_dynamic_span(weight_logs),
-                start_date=tdee_start_date,
-            )
+        span = self._calculate_dynamic_span(weight_logs)
+        if len(observations):
+            if tdee_start_date:
+                observations = observations[
+                    observation_days >= daily_weight.index_of(tdee_start_date)
+                ]
+            tdee = tdee_engine.smooth_observations(observations, formula_tdee, span)
         else:
             tdee = formula_tdee
 
+        self.last_pipeline_state = {
+            "last_processed_date": max(
+                daily_weight.end,
+                last_nutrition_date,
+            ).isoformat(),
+            "last_trend_kg": float(daily_trend[-1]),
+            "observation_ema": tdee,
+            "observations_count": len(observation_days),
+            "span": span,
+            "energy_per_kg": energy_per_kg,
+            "tdee_start_date": tdee_start_date_str,
+        }
+
         # Step 12: Clamp TDEE
         tdee = max(self.MIN_TDEE, min(self.MAX_TDEE, tdee))
 
@@ -709,8 +839,8 @@ class AdaptiveTDEEService:
         )
 
         # For display: use interpolated weight to calculate weekly change
-        start_weight = daily_weight.get(period_start, weight_logs[0].weight_kg)
-        end_weight = daily_weight.get(period_end, weight_logs[-1].weight_kg)
+        start_weight = float(daily_weight.values[daily_weight.index_of(period_start)])
+        end_weight = float(daily_weight.values[daily_weight.index_of(period_end)])
         total_weight_change = end_weight - start_weight
         weekly_change = (total_weight_change / days_elapsed) * 7
 
@@ -796,6 +926,7 @@ class AdaptiveTDEEService:
             self.db.update_user_coaching_target(
                 user_email, result["daily_target"], date.today().isoformat()
             )
+            self.last_pipeline_state["checked_in_target"] = result["daily_target"]
 
         return result
 
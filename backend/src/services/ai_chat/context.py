@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from src.core.blocking import run_blocking
 from src.core.config import settings
 from src.core.logs import logger
 from src.repositories.event_repository import EventRepository
 from src.services.adaptive_tdee import AdaptiveTDEEService
 from src.services.plan_service import (
     build_plan_prompt_snapshot,
-    build_progress_snapshot,
+    build_progress_snapshot_from_data,
     format_plan_snapshot,
 )
 
@@ -184,76 +188,91 @@ def _build_coaching_snapshot(
     }
 
 
-def build_runtime_context(
-    # pylint: disable=too-many-locals
-    *,
-    database,
-    user_email: str,
-    profile,
-    trainer_profile,
-    is_telegram: bool = False,
-) -> dict:
-    """Build the structured runtime context passed to the agent."""
+def _session_clock(profile) -> tuple[datetime, str]:
     timezone_name = getattr(profile, "timezone", None) or "Europe/Madrid"
     try:
-        now = datetime.now(ZoneInfo(timezone_name))
+        return datetime.now(ZoneInfo(timezone_name)), timezone_name
     except ZoneInfoNotFoundError:
-        timezone_name = "UTC"
-        now = datetime.now(timezone.utc)
+        return datetime.now(timezone.utc), "UTC"
 
-    try:
-        metabolism_data = AdaptiveTDEEService(database).calculate_tdee(user_email)
-    except Exception as exc:  # pylint: disable=broad-exception-caught
-        logger.warning("Failed to load metabolism context for %s: %s", user_email, exc)
-        metabolism_data = {}
 
-    plan = database.get_plan(user_email) if hasattr(database, "get_plan") else None
-    discovery = (
-        database.get_plan_discovery(user_email)
-        if hasattr(database, "get_plan_discovery")
-        else None
-    )
-    progress = None
-    progress_failed = False
+def _section_or_default(user_email: str, section: str, sections: dict, default):
+    value = sections.get(section)
+    if isinstance(value, Exception):
+        logger.warning("Failed to load %s context for %s: %s", section, user_email, value)
+        return default
+    return default if value is None else value
+
+
+def _plan_context(*, user_email: str, sections: dict) -> dict:
+    """Plan prompt snapshot plus the progress snapshot built from loaded sections."""
+    plan = sections["plan"]
+
+    def load_progress():
+        for name in ("workouts", "nutrition", "body"):
+            if isinstance(sections.get(name), Exception):
+                raise sections[name]
+        return build_progress_snapshot_from_data(
+            plan,
+            workouts=sections.get("workouts") or [],
+            nutrition_stats=sections["nutrition"],
+            weight_logs=sections.get("body") or [],
+        )
+
     try:
-        progress = build_progress_snapshot(plan, database) if plan else None
-        plan_snapshot = build_plan_prompt_snapshot(plan, discovery, progress)
-        plan_summary = format_plan_snapshot(plan_snapshot)
-        plan_status = getattr(plan_snapshot, "status", "NO_PLAN")
-        plan_discovery = getattr(plan_snapshot, "discovery", None)
+        progress = load_progress() if plan else None
+        plan_snapshot = build_plan_prompt_snapshot(plan, sections["discovery"], progress)
+        return {
+            "progress": progress,
+            "progress_failed": False,
+            "summary": format_plan_snapshot(plan_snapshot),
+            "status": getattr(plan_snapshot, "status", "NO_PLAN"),
+            "discovery": getattr(plan_snapshot, "discovery", None),
+        }
     except Exception as exc:  # pylint: disable=broad-exception-caught
         logger.warning("Failed to load plan context for %s: %s", user_email, exc)
-        progress_failed = True
-        plan_summary = ""
-        plan_status = "NO_PLAN"
-        plan_discovery = None
+        return {
+            "progress": None,
+            "progress_failed": True,
+            "summary": "",
+            "status": "NO_PLAN",
+            "discovery": None,
+        }
 
-    try:
-        nutrition_stats = database.get_nutrition_stats(user_email)
-    except Exception as exc:  # pylint: disable=broad-exception-caught
-        logger.warning("Failed to load nutrition context for %s: %s", user_email, exc)
-        nutrition_stats = {}
 
-    try:
-        weight_logs = database.get_weight_logs(user_email, limit=30)
-    except Exception as exc:  # pylint: disable=broad-exception-caught
-        logger.warning("Failed to load body context for %s: %s", user_email, exc)
-        weight_logs = []
+def assemble_runtime_context(
+    *,
+    user_email: str,
+    profile,
+    trainer_profile,
+    sections: dict,
+    is_telegram: bool = False,
+) -> dict:
+    """
+    Build the runtime context from loaded sections.
 
+    ``sections`` holds each load's result, or the exception it raised. Plan
+    and discovery failures are fatal; the other sections fall back to empty
+    values.
+    """
+    for required in ("plan", "discovery"):
+        if isinstance(sections[required], Exception):
+            raise sections[required]
+    metabolism_data = _section_or_default(user_email, "metabolism", sections, {})
+    plan_context = _plan_context(user_email=user_email, sections=sections)
+    nutrition_stats = _section_or_default(user_email, "nutrition", sections, {})
+    weight_logs = _section_or_default(user_email, "body", sections, [])
+    agenda = _section_or_default(user_email, "agenda", sections, [])
+
+    now, timezone_name = _session_clock(profile)
     coaching_snapshot = _build_coaching_snapshot(
-        progress=progress,
+        progress=plan_context["progress"],
         nutrition_stats=nutrition_stats,
         weight_logs=weight_logs,
         metabolism_data=metabolism_data or {},
-        progress_failed=progress_failed,
+        progress_failed=plan_context["progress_failed"],
     )
 
-    try:
-        agenda = EventRepository(database.database).get_active_events(user_email)
-    except Exception as exc:  # pylint: disable=broad-exception-caught
-        logger.warning("Failed to load agenda context for %s: %s", user_email, exc)
-        agenda = []
-
     return {
         "contract_version": settings.PROMPT_CONTEXT_CONTRACT_VERSION,
         "session": {
@@ -287,12 +306,137 @@ def build_runtime_context(
         },
         "metabolism": metabolism_data or {},
         "plan": {
-            "summary": plan_summary,
-            "status": plan_status,
-            "has_active_plan": plan_status == "ACTIVE_PLAN",
-            "discovery": plan_discovery,
+            "summary": plan_context["summary"],
+            "status": plan_context["status"],
+            "has_active_plan": plan_context["status"] == "ACTIVE_PLAN",
+            "discovery": plan_context["discovery"],
         },
         "prompt_context_v2": {
             "coaching_snapshot": coaching_snapshot,
         },
     }
+
+
+def _load_metabolism(database, user_email: str) -> dict:
+    try:
+        return AdaptiveTDEEService(database).calculate_tdee(user_email)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        logger.warning("Failed to load metabolism context for %s: %s", user_email, exc)
+        return {}
+
+
+def load_runtime_sections(
+    *,
+    database,
+    user_email: str,
+    section_timings: dict[str, int] | None = None,
+) -> dict:
+    """Load the runtime context sections one after another (sync callers)."""
+    timings = section_timings if section_timings is not None else {}
+    sections: dict = {}
+
+    def load(name: str, loader) -> None:
+        started = time.perf_counter()
+        try:
+            sections[name] = loader()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            sections[name] = exc
+        timings[name] = int((time.perf_counter() - started) * 1000)
+
+    load("metabolism", lambda: _load_metabolism(database, user_email))
+    load(
+        "plan",
+        lambda: database.get_plan(user_email) if hasattr(database, "get_plan") else None,
+    )
+    load(
+        "discovery",
+        lambda: database.get_plan_discovery(user_email)
+        if hasattr(database, "get_plan_discovery")
+        else None,
+    )
+    load("nutrition", lambda: database.get_nutrition_stats(user_email))
+    load("body", lambda: database.get_weight_logs(user_email, limit=30))
+    if sections["plan"] and not isinstance(sections["plan"], Exception):
+        # Workouts only feed the plan progress snapshot.
+        load("workouts", lambda: database.get_workout_logs(user_email, limit=30))
+    load(
+        "agenda",
+        lambda: EventRepository(database.database).get_active_events(user_email),
+    )
+    return sections
+
+
+def build_runtime_context(
+    *,
+    database,
+    user_email: str,
+    profile,
+    trainer_profile,
+    is_telegram: bool = False,
+) -> dict:
+    """Build the structured runtime context passed to the agent."""
+    return assemble_runtime_context(
+        user_email=user_email,
+        profile=profile,
+        trainer_profile=trainer_profile,
+        sections=load_runtime_sections(database=database, user_email=user_email),
+        is_telegram=is_telegram,
+    )
+
+
+LoadGraph = dict[str, tuple[tuple[str, ...], Callable[..., Awaitable[Any]]]]
+
+
+async def run_load_graph(loads: LoadGraph, section_timings: dict[str, int]) -> dict:
+    """
+    Run ``{name: (requires, load)}`` as a dependency graph.
+
+    Every load starts as soon as the loads it requires have finished and
+    receives their results as arguments, so independent loads overlap. The
+    time spent in each load (not waiting for its inputs) is written to
+    ``section_timings``. A failed load is returned as its exception and fails
+    its dependents with the same exception.
+    """
+    tasks: dict[str, asyncio.Future] = {}
+
+    async def run(name: str, requires: tuple[str, ...], load) -> Any:
+        inputs = [await tasks[dependency] for dependency in requires]
+        started = time.perf_counter()
+        try:
+            return await load(*inputs)
+        finally:
+            section_timings[name] = int((time.perf_counter() - started) * 1000)
+
+    for name, (requires, load) in loads.items():
+        tasks[name] = asyncio.ensure_future(run(name, requires, load))
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    return dict(zip(tasks, results))
+
+
+def runtime_section_loads(
+    *, async_database, tdee_database, user_email: str
+) -> LoadGraph:
+    """
+    Load graph of the runtime context sections on the async driver.
+
+    The TDEE pipeline stays synchronous (numpy plus its persisted state) and
+    runs on the blocking executor against ``tdee_database``; nutrition stats
+    reuse its result and the plan instead of reading them again.
+    """
+    return {
+        "metabolism": (
+            (),
+            lambda: run_blocking(_load_metabolism, tdee_database, user_email),
+        ),
+        "plan": ((), lambda: async_database.get_plan(user_email)),
+        "discovery": ((), lambda: async_database.get_plan_discovery(user_email)),
+        "nutrition": (
+            ("metabolism", "plan"),
+            lambda metabolism, plan: async_database.get_nutrition_stats(
+                user_email, metabolism, plan
+            ),
+        ),
+        "body": ((), lambda: async_database.get_weight_logs(user_email, limit=30)),
+        "workouts": ((), lambda: async_database.get_workout_logs(user_email, limit=30)),
+        "agenda": ((), lambda: async_database.get_active_events(user_email)),
+    }
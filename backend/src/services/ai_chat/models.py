@@ -84,6 +84,7 @@ class ChatRunLog(BaseModel):
     usage_cost: float | None = None
     duration_ms: int = 0
     context_load_ms: int = 0
+    context_section_ms: dict[str, int] = Field(default_factory=dict)
     agent_run_ms: int = 0
     time_to_first_token_ms: int | None = None
     internal_requests: int = 0
@@ -6,22 +6,31 @@ import asyncio
 import hashlib
 import time
 from datetime import datetime
-from typing import AsyncIterator, Any
+from typing import AsyncIterator, Any, Callable
 
 from fastapi import BackgroundTasks
 
 from src.api.models.chat_history import ChatHistory
 from src.api.models.sender import Sender
 from src.api.models.trainer_profile import TrainerProfile
+from src.core.blocking import run_blocking
 from src.core.config import settings
 from src.core.logs import logger
+from src.core.turn_cache import turn_cache_scope
 from src.services.ai_chat.agent import build_chat_agent
-from src.services.ai_chat.context import build_runtime_context
+from src.repositories.chat_repository import to_pydantic_ai_messages
+from src.services.ai_chat.context import (
+    assemble_runtime_context,
+    load_runtime_sections,
+    run_load_graph,
+    runtime_section_loads,
+)
 from src.services.ai_chat.deps import ChatAgentDeps
 from src.services.ai_chat.models import ChatRunLog, CoachTurnOutput, ToolResult
 from src.services.ai_chat.plan_execution import detect_plan_execution_requirement
 from src.services.ai_chat.prompts import build_user_prompt
 from src.services.ai_chat.sse import format_sse_event
+from src.services.ai_chat.streaming import stream_agent_run
 from src.services.ai_chat.tools.base import audit_entry_preview_for_log
 from src.services.ai_chat.tools.registry import select_chat_toolsets, selected_toolset_summary
 from src.services.ai_chat.validation import validate_turn_output
@@ -52,17 +61,59 @@ def _result_usage(result: Any | None):
     return usage
 
 
+def _timed_call(section_timings: dict[str, int], name: str, func, *args, **kwargs):
+    """Call ``func`` and record its duration under ``name``."""
+    started = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        section_timings[name] = int((time.perf_counter() - started) * 1000)
+
+
+def _validate_reply(raw_output, *, deps, trainer_profile, runtime_context: dict):
+    """Validate the agent output against the tool results of the turn."""
+    output = (
+        raw_output
+        if isinstance(raw_output, CoachTurnOutput)
+        else CoachTurnOutput.model_validate(raw_output)
+    )
+    tool_results = [
+        audit.result for audit in deps.tool_audit if isinstance(audit.result, ToolResult)
+    ]
+    return validate_turn_output(
+        output=output,
+        tool_results=tool_results,
+        user_locale=getattr(trainer_profile, "preferred_language", None),
+        required_tool=(runtime_context.get("plan_execution", {}) or {}).get(
+            "required_tool"
+        ),
+    )
+
+
 class ChatTurnRunner:  # pylint: disable=too-few-public-methods
     """Run one user message through a single Pydantic AI agent run."""
 
-    def __init__(self, database, qdrant_client=None, agent: Any | None = None):
+    def __init__(
+        self,
+        database,
+        qdrant_client=None,
+        agent: Any | None = None,
+        async_database_factory: Callable[[], Any] | None = None,
+    ):
         self.database = database
         self.qdrant_client = qdrant_client
+        # When set, context loading, persistence and run logging await the
+        # native async driver; tools keep using the sync ``database``.
+        self.async_database_factory = async_database_factory
+        self.stream_tokens = settings.LLM_STREAM_TOKENS
         self.agent = agent or build_chat_agent()
         self.hevy_service = None
         if hasattr(database, "workouts_repo"):
             try:
-                self.hevy_service = HevyService(workout_repository=database.workouts_repo)
+                self.hevy_service = HevyService(
+                    workout_repository=database.workouts_repo,
+                    template_repository=getattr(database, "hevy_templates", None),
+                )
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 logger.warning("Hevy service unavailable for chat tools: %s", exc)
 
@@ -79,101 +130,89 @@ class ChatTurnRunner:  # pylint: disable=too-few-public-methods
         start = time.perf_counter()
         context_ms = 0
         agent_ms = 0
-        profile = None
         trainer_profile = None
         deps = None
         selected_toolsets = []
+        section_timings: dict[str, int] = {}
+        streamed_text = ""
+        first_token_ms = None
         try:
             yield format_sse_event("status", {"stage": "preparing_context"})
             context_start = time.perf_counter()
-            profile = self.database.get_user_profile(user_email)
-            if profile is None:
-                raise ValueError("User profile not found")
-            trainer_profile = self.database.get_trainer_profile(user_email)
-            if trainer_profile is None:
-                trainer_profile = TrainerProfile(user_email=user_email, trainer_type="atlas")
-                self.database.save_trainer_profile(trainer_profile)
-
-            runtime_context = build_runtime_context(
-                database=self.database,
+            (
+                trainer_profile,
+                runtime_context,
+                deps,
+                history,
+                selected_toolsets,
+            ) = await self._load_context(
                 user_email=user_email,
-                profile=profile,
-                trainer_profile=trainer_profile,
-                is_telegram=bool((message_options or {}).get("is_telegram")),
-            )
-            public_history = []
-            if hasattr(self.database, "get_chat_history"):
-                public_history = self.database.get_chat_history(
-                    user_email, limit=settings.MAX_SHORT_TERM_MEMORY_MESSAGES, offset=0
-                )
-            plan_execution = detect_plan_execution_requirement(
                 user_input=user_input,
-                recent_history=public_history,
-                runtime_context=runtime_context,
-            )
-            if plan_execution:
-                runtime_context["plan_execution"] = plan_execution
-            deps = ChatAgentDeps(
-                user_email=user_email,
-                database=self.database,
-                qdrant_client=self.qdrant_client,
-                profile=profile,
-                trainer_profile=trainer_profile,
-                runtime_context=runtime_context,
-                hevy_service=self.hevy_service,
-            )
-            history = []
-            if hasattr(self.database, "get_pydantic_ai_history"):
-                history = self.database.get_pydantic_ai_history(
-                    user_email, limit=settings.MAX_SHORT_TERM_MEMORY_MESSAGES
-                )
-            selected_toolsets = select_chat_toolsets(
-                user_input=user_input,
-                runtime_context=runtime_context,
+                message_options=message_options,
+                section_timings=section_timings,
             )
             context_ms = int((time.perf_counter() - context_start) * 1000)
 
             yield format_sse_event("status", {"stage": "using_tools"})
             agent_start = time.perf_counter()
-            result = await asyncio.wait_for(
-                self.agent.run(
-                    build_user_prompt(user_input, runtime_context),
-                    deps=deps,
-                    message_history=history,
-                    conversation_id=user_email,
-                    metadata={"user_email": user_email},
-                    model_settings={
-                        "extra_body": {"user": _stable_openrouter_user_id(user_email)}
-                    },
-                    toolsets=selected_toolsets,
-                ),
-                timeout=float(settings.LLM_STREAM_TIMEOUT_SECONDS),
-            )
+            user_prompt = build_user_prompt(user_input, runtime_context)
+            run_kwargs = {
+                "deps": deps,
+                "message_history": history,
+                "conversation_id": user_email,
+                "metadata": {"user_email": user_email},
+                "model_settings": {
+                    "extra_body": {"user": _stable_openrouter_user_id(user_email)}
+                },
+                "toolsets": selected_toolsets,
+            }
+            if self._streams_tokens():
+                async for kind, value in stream_agent_run(
+                    self.agent,
+                    user_prompt,
+                    run_kwargs,
+                    timeout=float(settings.LLM_STREAM_TIMEOUT_SECONDS),
+                    inactivity_timeout=float(
+                        settings.LLM_STREAM_INACTIVITY_TIMEOUT_SECONDS
+                    ),
+                ):
+                    if kind == "result":
+                        result, raw_output = value
+                        continue
+                    if len(value) <= len(streamed_text) or not value.startswith(
+                        streamed_text
+                    ):
+                        continue
+                    if not streamed_text:
+                        first_token_ms = int((time.perf_counter() - start) * 1000)
+                        yield format_sse_event("status", {"stage": "writing_reply"})
+                    yield format_sse_event("delta", {"text": value[len(streamed_text):]})
+                    streamed_text = value
+            else:
+                result = await asyncio.wait_for(
+                    self.agent.run(user_prompt, **run_kwargs),
+                    timeout=float(settings.LLM_STREAM_TIMEOUT_SECONDS),
+                )
+                raw_output = result.output
             agent_ms = int((time.perf_counter() - agent_start) * 1000)
 
-            raw_output = result.output
-            output = (
-                raw_output
-                if isinstance(raw_output, CoachTurnOutput)
-                else CoachTurnOutput.model_validate(raw_output)
-            )
-            tool_results = [
-                audit.result for audit in deps.tool_audit if isinstance(audit.result, ToolResult)
-            ]
-            validated = validate_turn_output(
-                output=output,
-                tool_results=tool_results,
-                user_locale=getattr(trainer_profile, "preferred_language", None),
-                required_tool=(
-                    runtime_context.get("plan_execution", {}) or {}
-                ).get("required_tool"),
+            validated = _validate_reply(
+                raw_output,
+                deps=deps,
+                trainer_profile=trainer_profile,
+                runtime_context=runtime_context,
             )
 
-            yield format_sse_event("status", {"stage": "writing_reply"})
-            yield format_sse_event("delta", {"text": validated.public_message})
+            if not streamed_text:
+                yield format_sse_event("status", {"stage": "writing_reply"})
+                yield format_sse_event("delta", {"text": validated.public_message})
+            elif validated.public_message != streamed_text:
+                # Validation overrode text the client already shows; it must
+                # swap the streamed reply for this one.
+                yield format_sse_event("replace", {"text": validated.public_message})
             yield format_sse_event("status", {"stage": "saving"})
 
-            self._persist_success(
+            await self._persist(
                 user_email=user_email,
                 user_input=user_input,
                 final_response=validated.public_message,
@@ -193,13 +232,19 @@ class ChatTurnRunner:  # pylint: disable=too-few-public-methods
                 result=result,
                 history_messages_count=len(history),
                 selected_toolsets=selected_toolsets,
+                section_timings=section_timings,
+                first_token_ms=first_token_ms,
             )
             yield format_sse_event(
                 "done",
                 {"text": validated.public_message, "persisted": True},
             )
         except Exception as exc:  # pylint: disable=broad-exception-caught
-            logger.exception("Pydantic AI chat turn failed for %s", user_email)
+            logger.exception(
+                "Pydantic AI chat turn failed for %s (%d chars already streamed)",
+                user_email,
+                len(streamed_text),
+            )
             self._log_run(
                 user_email=user_email,
                 status="error",
@@ -212,40 +257,259 @@ class ChatTurnRunner:  # pylint: disable=too-few-public-methods
                 result=None,
                 history_messages_count=0,
                 selected_toolsets=selected_toolsets,
+                section_timings=section_timings,
+                first_token_ms=first_token_ms,
             )
             yield format_sse_event(
                 "error",
                 {"message": "Desculpe, ocorreu um erro interno. Tente novamente em instantes."},
             )
 
-    def _persist_success(
+    def _streams_tokens(self) -> bool:
+        # Agents without a streaming API (test doubles) use the single-shot run.
+        return self.stream_tokens and hasattr(self.agent, "run_stream")
+
+    async def _load_context(
+        self,
+        *,
+        user_email: str,
+        user_input: str,
+        message_options: dict | None,
+        section_timings: dict[str, int],
+    ) -> tuple[TrainerProfile, dict, ChatAgentDeps, list, list]:
+        if self.async_database_factory is None:
+            return await run_blocking(
+                self._load_turn_context,
+                user_email=user_email,
+                user_input=user_input,
+                message_options=message_options,
+                section_timings=section_timings,
+            )
+        with turn_cache_scope():
+            return await self._load_turn_context_async(
+                user_email=user_email,
+                user_input=user_input,
+                message_options=message_options,
+                section_timings=section_timings,
+            )
+
+    async def _load_turn_context_async(
+        self,
+        *,
+        user_email: str,
+        user_input: str,
+        message_options: dict | None,
+        section_timings: dict[str, int],
+    ) -> tuple[TrainerProfile, dict, ChatAgentDeps, list, list]:
+        """
+        Load the turn context on the async driver as one dependency graph.
+
+        Profile, trainer profile, chat history and every runtime context
+        section are independent reads, so they all run concurrently.
+        """
+        async_database = self.async_database_factory()
+        loads = {
+            "profile": ((), lambda: async_database.get_user_profile(user_email)),
+            "trainer_profile": (
+                (),
+                lambda: async_database.get_trainer_profile(user_email),
+            ),
+            "history": (
+                (),
+                lambda: async_database.get_chat_history(
+                    user_email, limit=settings.MAX_SHORT_TERM_MEMORY_MESSAGES, offset=0
+                ),
+            ),
+            **runtime_section_loads(
+                async_database=async_database,
+                tdee_database=self.database,
+                user_email=user_email,
+            ),
+        }
+        sections = await run_load_graph(loads, section_timings)
+        for required in ("profile", "trainer_profile", "history"):
+            if isinstance(sections[required], Exception):
+                raise sections[required]
+        profile = sections["profile"]
+        if profile is None:
+            raise ValueError("User profile not found")
+        trainer_profile = sections["trainer_profile"]
+        if trainer_profile is None:
+            trainer_profile = TrainerProfile(user_email=user_email, trainer_type="atlas")
+            await async_database.save_trainer_profile(trainer_profile)
+
+        runtime_context = assemble_runtime_context(
+            user_email=user_email,
+            profile=profile,
+            trainer_profile=trainer_profile,
+            sections=sections,
+            is_telegram=bool((message_options or {}).get("is_telegram")),
+        )
+        return self._finish_turn_context(
+            user_email=user_email,
+            user_input=user_input,
+            profile=profile,
+            trainer_profile=trainer_profile,
+            runtime_context=runtime_context,
+            public_history=sections["history"],
+        )
+
+    def _load_turn_context(
+        self,
+        *,
+        user_email: str,
+        user_input: str,
+        message_options: dict | None,
+        section_timings: dict[str, int],
+    ) -> tuple[TrainerProfile, dict, ChatAgentDeps, list, list]:
+        """Load everything the agent run needs (blocking Mongo/TDEE reads)."""
+        # One turn cache shares profile/plan/log reads and the TDEE result
+        # between the context builder, progress snapshot and nutrition stats.
+        with turn_cache_scope():
+            profile = _timed_call(
+                section_timings, "profile", self.database.get_user_profile, user_email
+            )
+            if profile is None:
+                raise ValueError("User profile not found")
+            trainer_profile = _timed_call(
+                section_timings,
+                "trainer_profile",
+                self.database.get_trainer_profile,
+                user_email,
+            )
+            if trainer_profile is None:
+                trainer_profile = TrainerProfile(user_email=user_email, trainer_type="atlas")
+                self.database.save_trainer_profile(trainer_profile)
+
+            runtime_context = assemble_runtime_context(
+                user_email=user_email,
+                profile=profile,
+                trainer_profile=trainer_profile,
+                sections=load_runtime_sections(
+                    database=self.database,
+                    user_email=user_email,
+                    section_timings=section_timings,
+                ),
+                is_telegram=bool((message_options or {}).get("is_telegram")),
+            )
+            public_history = []
+            if hasattr(self.database, "get_chat_history"):
+                public_history = _timed_call(
+                    section_timings,
+                    "history",
+                    self.database.get_chat_history,
+                    user_email,
+                    limit=settings.MAX_SHORT_TERM_MEMORY_MESSAGES,
+                    offset=0,
+                )
+            return self._finish_turn_context(
+                user_email=user_email,
+                user_input=user_input,
+                profile=profile,
+                trainer_profile=trainer_profile,
+                runtime_context=runtime_context,
+                public_history=public_history,
+            )
+
+    def _finish_turn_context(
         # pylint: disable=too-many-arguments
         self,
         *,
         user_email: str,
         user_input: str,
+        profile,
+        trainer_profile: TrainerProfile,
+        runtime_context: dict,
+        public_history: list,
+    ) -> tuple[TrainerProfile, dict, ChatAgentDeps, list, list]:
+        # The agent history is the same window as the public history, so it
+        # is converted instead of read a second time.
+        history = to_pydantic_ai_messages(public_history)
+        plan_execution = detect_plan_execution_requirement(
+            user_input=user_input,
+            recent_history=public_history,
+            runtime_context=runtime_context,
+        )
+        if plan_execution:
+            runtime_context["plan_execution"] = plan_execution
+        deps = ChatAgentDeps(
+            user_email=user_email,
+            database=self.database,
+            qdrant_client=self.qdrant_client,
+            profile=profile,
+            trainer_profile=trainer_profile,
+            runtime_context=runtime_context,
+            hevy_service=self.hevy_service,
+        )
+        selected_toolsets = select_chat_toolsets(
+            user_input=user_input,
+            runtime_context=runtime_context,
+        )
+        return trainer_profile, runtime_context, deps, history, selected_toolsets
+
+    async def _persist(self, **kwargs) -> None:
+        if self.async_database_factory is None:
+            await run_blocking(self._persist_success, **kwargs)
+            return
+        async_database = self.async_database_factory()
+        user_email = kwargs.pop("user_email")
+        background_tasks = kwargs.pop("background_tasks")
+        messages = self._turn_messages(**kwargs)
+
+        async def persist() -> None:
+            await async_database.add_many_to_history(
+                messages, user_email, kwargs["trainer_type"]
+            )
+            await async_database.increment_user_message_counts(user_email)
+
+        if background_tasks:
+            background_tasks.add_task(persist)
+        else:
+            await persist()
+
+    @staticmethod
+    def _turn_messages(
+        *,
+        user_input: str,
         final_response: str,
         trainer_type: str,
         image_payloads: list[dict[str, str]] | None,
-        background_tasks: BackgroundTasks | None,
-    ) -> None:
-        def persist() -> None:
-            now = datetime.now().isoformat()
-            user_message = ChatHistory(
+    ) -> list[ChatHistory]:
+        now = datetime.now().isoformat()
+        return [
+            ChatHistory(
                 sender=Sender.STUDENT,
                 text=user_input,
                 timestamp=now,
                 images=image_payloads,
-            )
-            ai_message = ChatHistory(
+            ),
+            ChatHistory(
                 sender=Sender.TRAINER,
                 text=final_response,
                 timestamp=now,
                 trainer_type=trainer_type,
+            ),
+        ]
+
+    def _persist_success(
+        # pylint: disable=too-many-arguments
+        self,
+        *,
+        user_email: str,
+        user_input: str,
+        final_response: str,
+        trainer_type: str,
+        image_payloads: list[dict[str, str]] | None,
+        background_tasks: BackgroundTasks | None,
+    ) -> None:
+        def persist() -> None:
+            messages = self._turn_messages(
+                user_input=user_input,
+                final_response=final_response,
+                trainer_type=trainer_type,
+                image_payloads=image_payloads,
             )
-            self.database.add_many_to_history(
-                [user_message, ai_message], user_email, trainer_type
-            )
+            self.database.add_many_to_history(messages, user_email, trainer_type)
             self.database.increment_user_message_counts(user_email)
 
         if background_tasks:
@@ -253,11 +517,18 @@ class ChatTurnRunner:  # pylint: disable=too-few-public-methods
         else:
             persist()
 
-    def _log_run(
+    def _log_run(self, *, user_email: str, **kwargs) -> None:
+        # log_prompt only buffers the entry; a writer thread does the I/O.
+        log = self._build_run_log(**kwargs)
+        try:
+            self.database.log_prompt(user_email, log.model_dump())
+        except Exception as log_exc:  # pylint: disable=broad-exception-caught
+            logger.warning("Failed to log Pydantic AI run: %s", log_exc)
+
+    @staticmethod
+    def _build_run_log(
         # pylint: disable=too-many-arguments,too-many-locals
-        self,
         *,
-        user_email: str,
         status: str,
         error_type: str | None,
         start: float,
@@ -268,7 +539,9 @@ class ChatTurnRunner:  # pylint: disable=too-few-public-methods
         result: Any | None,
         history_messages_count: int,
         selected_toolsets: list,
-    ) -> None:
+        section_timings: dict[str, int] | None = None,
+        first_token_ms: int | None = None,
+    ) -> ChatRunLog:
         usage = _result_usage(result)
         input_tokens = _usage_value(usage, "input_tokens")
         output_tokens = _usage_value(usage, "output_tokens")
@@ -278,7 +551,7 @@ class ChatTurnRunner:  # pylint: disable=too-few-public-methods
         audit = deps.tool_audit if deps is not None else []
         audit_for_log = [audit_entry_preview_for_log(entry) for entry in audit]
         toolset_ids, available_tool_names = selected_toolset_summary(selected_toolsets)
-        log = ChatRunLog(
+        return ChatRunLog(
             status=status,
             error_type=error_type,
             requested_model=settings.OPENROUTER_CHAT_MODEL,
@@ -290,6 +563,8 @@ class ChatTurnRunner:  # pylint: disable=too-few-public-methods
             duration_ms=int((time.perf_counter() - start) * 1000),
             context_load_ms=context_ms,
             agent_run_ms=agent_ms,
+            time_to_first_token_ms=first_token_ms,
+            context_section_ms=dict(section_timings or {}),
             internal_requests=requests,
             tool_calls_count=len(audit),
             selected_toolsets=toolset_ids,
@@ -300,7 +575,3 @@ class ChatTurnRunner:  # pylint: disable=too-few-public-methods
             message_chars=message_chars,
             history_messages_count=history_messages_count,
         )
-        try:
-            self.database.log_prompt(user_email, log.model_dump())
-        except Exception as log_exc:  # pylint: disable=broad-exception-caught
-            logger.warning("Failed to log Pydantic AI run: %s", log_exc)
@@ -0,0 +1,102 @@
+"""Token streaming for one Pydantic AI agent run."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator
+
+from pydantic_core import from_json
+
+# Partial responses are grouped for this long before the reply text is
+# re-parsed, which keeps SSE frames to a handful per second.
+STREAM_DEBOUNCE_SECONDS = 0.1
+
+
+def partial_public_message(response) -> str | None:
+    """
+    Return the ``public_message`` streamed so far from a partial model response.
+
+    The structured output arrives as the arguments of the output tool call,
+    a JSON document that is still being written; it is parsed leniently so
+    the unfinished string value is returned as well.
+    """
+    for part in getattr(response, "parts", None) or []:
+        args = getattr(part, "args", None)
+        if isinstance(args, str) and args:
+            try:
+                args = from_json(args, allow_partial="trailing-strings")
+            except ValueError:
+                continue
+        if isinstance(args, dict) and isinstance(args.get("public_message"), str):
+            return args["public_message"]
+    return None
+
+
+async def stream_agent_run(
+    agent,
+    user_prompt: str,
+    run_kwargs: dict[str, Any],
+    *,
+    timeout: float,
+    inactivity_timeout: float,
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Run ``agent.run_stream`` and yield its progress.
+
+    Yields ``("text", public_message_so_far)`` while the final output is
+    written, then ``("result", (run_result, output))`` once the run
+    completed. The run happens in its own task so the overall ``timeout``
+    (and, after the first token, ``inactivity_timeout``) can cancel it
+    cleanly; closing the iterator cancels the run too.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    updates: asyncio.Queue[str] = asyncio.Queue()
+
+    async def produce() -> tuple[Any, Any]:
+        async with agent.run_stream(user_prompt, **run_kwargs) as result:
+            async for response in result.stream_response(
+                debounce_by=STREAM_DEBOUNCE_SECONDS
+            ):
+                text = partial_public_message(response)
+                if text:
+                    updates.put_nowait(text)
+            output = await result.get_output()
+        return result, output
+
+    producer = asyncio.ensure_future(produce())
+    getter: asyncio.Future | None = None
+    first_token_seen = False
+    try:
+        while True:
+            getter = asyncio.ensure_future(updates.get())
+            wait = deadline - loop.time()
+            if first_token_seen:
+                wait = min(wait, inactivity_timeout)
+            done, _ = await asyncio.wait(
+                {getter, producer},
+                timeout=max(wait, 0),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if getter in done:
+                text = getter.result()
+                # Only the latest text matters; skip updates already superseded.
+                while not updates.empty():
+                    text = updates.get_nowait()
+                first_token_seen = True
+                yield "text", text
+                continue
+            if producer in done:
+                getter.cancel()
+                text = None
+                while not updates.empty():
+                    text = updates.get_nowait()
+                if text:
+                    yield "text", text
+                yield "result", producer.result()
+                return
+            raise TimeoutError("Agent stream timed out")
+    finally:
+        if getter is not None:
+            getter.cancel()
+        producer.cancel()
@@ -19,6 +19,7 @@ from src.api.models.plan import (
     PlanReviewInput,
     PlanSectionUpdateInput,
 )
+from src.core.blocking import run_blocking
 from src.services.adaptive_tdee import AdaptiveTDEEService
 from src.services.ai_chat.deps import ChatAgentDeps
 from src.services.ai_chat.models import ToolResult
@@ -60,7 +61,7 @@ from src.services.nutrition_tools import (
     create_save_nutrition_tool,
     create_sync_nutrition_text_tool,
 )
-from src.services.plan_hevy_sync import HevySyncError, sync_training_with_hevy_if_needed
+from src.services.plan_hevy_sync import HevySyncError, sync_training_with_hevy
 from src.services.plan_service import (
     apply_discovery_update,
     attach_review,
@@ -816,7 +817,7 @@ def _validation_error_result(tool_name: str, action: str | StrEnum, message: str
     )
 
 
-def plan_ops(ctx: RunContext[ChatAgentDeps], request: PlanOpsRequest) -> ToolResult:
+async def plan_ops(ctx: RunContext[ChatAgentDeps], request: PlanOpsRequest) -> ToolResult:
     """Execute plan lifecycle operations through one clear domain tool.
 
     Use when the user asks about plan status, wants to create a first plan,
@@ -827,6 +828,21 @@ def plan_ops(ctx: RunContext[ChatAgentDeps], request: PlanOpsRequest) -> ToolRes
     Args:
         request: Plan action plus the typed payload required by that action.
     """
+    if request.action == PlanOpsAction.UPDATE_SECTION:
+        try:
+            payload = _validate_action_payload(
+                PlanSectionUpdateInput,
+                request.payload,
+                request.action,
+            )
+        except ModelRetry as exc:
+            return _validation_error_result("plan_ops", request.action, str(exc))
+        return await update_plan_section(ctx, payload)
+    # The remaining actions only touch Mongo; keep them off the event loop.
+    return await run_blocking(_run_plan_op, ctx, request)
+
+
+def _run_plan_op(ctx: RunContext[ChatAgentDeps], request: PlanOpsRequest) -> ToolResult:
     if request.action == PlanOpsAction.GET_STATUS:
         return get_plan_status(ctx)
     if request.action == PlanOpsAction.GET_PLAN:
@@ -851,16 +867,6 @@ def plan_ops(ctx: RunContext[ChatAgentDeps], request: PlanOpsRequest) -> ToolRes
         except ModelRetry as exc:
             return _validation_error_result("plan_ops", request.action, str(exc))
         return create_plan_from_discovery(ctx, payload)
-    if request.action == PlanOpsAction.UPDATE_SECTION:
-        try:
-            payload = _validate_action_payload(
-                PlanSectionUpdateInput,
-                request.payload,
-                request.action,
-            )
-        except ModelRetry as exc:
-            return _validation_error_result("plan_ops", request.action, str(exc))
-        return update_plan_section(ctx, payload)
     if request.action == PlanOpsAction.RECORD_REVIEW:
         try:
             payload = _validate_action_payload(PlanReviewInput, request.payload, request.action)
@@ -1366,7 +1372,7 @@ def create_plan_from_discovery(
     return run_tool(ctx, "create_plan_from_discovery", {"payload": payload.model_dump()}, op)
 
 
-def update_plan_section(
+async def update_plan_section(
     ctx: RunContext[ChatAgentDeps], payload: PlanSectionUpdateInput
 ) -> ToolResult:
     """
@@ -1377,9 +1383,9 @@ def update_plan_section(
     saved=true and material_change=true.
     """
 
-    def op() -> ToolResult:
+    async def op() -> ToolResult:
         db = ctx.deps.database
-        current = db.get_plan(ctx.deps.user_email)
+        current = await run_blocking(db.get_plan, ctx.deps.user_email)
         if current is None:
             return ToolResult(
                 tool_name="update_plan_section",
@@ -1391,13 +1397,13 @@ def update_plan_section(
         try:
             updated = merge_plan_section(current, payload)
             if payload.section == "training":
-                updated = sync_training_with_hevy_if_needed(
+                updated = await sync_training_with_hevy(
                     database=db,
                     user_email=ctx.deps.user_email,
                     current_plan=current,
                     updated_plan=updated,
                 )
-            plan_id = db.save_plan(updated)
+            plan_id = await run_blocking(db.save_plan, updated)
         except HevySyncError as exc:
             return ToolResult(
                 tool_name="update_plan_section",
@@ -1418,7 +1424,7 @@ def update_plan_section(
             payload={"plan_id": plan_id},
         )
 
-    return run_tool(ctx, "update_plan_section", {"payload": payload.model_dump()}, op)
+    return await run_async_tool(ctx, "update_plan_section", {"payload": payload.model_dump()}, op)
 
 
 def record_plan_review(
@@ -0,0 +1,165 @@
+"""
+Async database facade on ``pymongo.AsyncMongoClient``.
+
+Mirrors the chat-path subset of MongoDatabase with the same method names, so
+async callers await the driver directly instead of borrowing a thread from
+the blocking executor. Index creation and every other operation stay with
+MongoDatabase.
+"""
+
+from datetime import date, datetime
+
+from pymongo import AsyncMongoClient
+
+from src.api.models.chat_history import ChatHistory
+from src.api.models.nutrition_log import NutritionLog
+from src.api.models.nutrition_stats import NutritionStats
+from src.api.models.plan import PlanDiscoveryState, UserPlan
+from src.api.models.scheduled_event import ScheduledEventWithId
+from src.api.models.trainer_profile import TrainerProfile
+from src.api.models.user_profile import UserProfile
+from src.api.models.weight_log import WeightLog
+from src.api.models.workout_log import WorkoutWithId
+from src.core.chat_history_cache import shared_chat_history_cache
+from src.core.config import settings
+from src.core.profile_cache import (
+    shared_trainer_profile_cache,
+    shared_user_profile_cache,
+)
+from src.core.logs import logger
+from src.repositories.chat_archive_repository import AsyncChatArchiveRepository
+from src.repositories.chat_repository import AsyncChatRepository
+from src.repositories.event_repository import AsyncEventRepository
+from src.repositories.nutrition_repository import AsyncNutritionRepository
+from src.repositories.plan_repository import AsyncPlanRepository
+from src.repositories.trainer_repository import AsyncTrainerRepository
+from src.repositories.user_repository import AsyncUserRepository
+from src.repositories.weight_repository import AsyncWeightRepository
+from src.repositories.workout_repository import AsyncWorkoutRepository
+
+
+# pylint: disable=too-many-instance-attributes
+class AsyncMongoDatabase:
+    """
+    Async counterpart of MongoDatabase for the chat path.
+    """
+
+    def __init__(self, client: AsyncMongoClient | None = None):
+        self.client = client or AsyncMongoClient(settings.MONGO_URI)
+        self.database = self.client[settings.DB_NAME]
+
+        self.users = AsyncUserRepository(
+            self.database, profile_cache=shared_user_profile_cache()
+        )
+        self.trainers = AsyncTrainerRepository(
+            self.database, profile_cache=shared_trainer_profile_cache()
+        )
+        self.chat = AsyncChatRepository(
+            self.database,
+            history_cache=shared_chat_history_cache(),
+            archive=AsyncChatArchiveRepository(self.database),
+        )
+        self.workouts_repo = AsyncWorkoutRepository(self.database)
+        self.nutrition = AsyncNutritionRepository(self.database)
+        self.weight = AsyncWeightRepository(self.database)
+        self.plans = AsyncPlanRepository(self.database)
+        self.events = AsyncEventRepository(self.database)
+
+    async def close(self) -> None:
+        """Closes the MongoDB connection."""
+        await self.client.close()
+        logger.info("Async MongoDB connection closed.")
+
+    async def get_user_profile(self, email: str) -> UserProfile | None:
+        """Retrieves user profile."""
+        return await self.users.get_profile(email)
+
+    async def update_user_profile_fields(self, email: str, fields: dict) -> bool:
+        """Updates specific fields in user profile."""
+        return await self.users.update_profile_fields(email, fields)
+
+    async def increment_user_message_counts(
+        self, email: str, new_cycle_start: datetime | None = None
+    ) -> None:
+        """Atomically increments message counts for a user."""
+        await self.users.increment_message_counts(email, new_cycle_start)
+
+    async def save_trainer_profile(self, trainer_profile: TrainerProfile) -> None:
+        """Saves trainer profile."""
+        await self.trainers.save_profile(trainer_profile)
+
+    async def get_trainer_profile(self, email: str) -> TrainerProfile | None:
+        """Retrieves trainer profile."""
+        return await self.trainers.get_profile(email)
+
+    async def get_chat_history(
+        self, user_id: str, limit: int = 20, offset: int = 0
+    ) -> list[ChatHistory]:
+        """Retrieves chat history."""
+        return await self.chat.get_history(user_id, limit, offset)
+
+    async def add_many_to_history(
+        self,
+        chat_histories: list[ChatHistory],
+        session_id: str,
+        trainer_type: str | None = None,
+    ) -> None:
+        """Adds multiple messages to chat history in one database operation."""
+        await self.chat.add_messages(chat_histories, session_id, trainer_type)
+
+    async def get_pydantic_ai_history(self, session_id: str, limit: int = 20) -> list:
+        """Returns recent public messages as Pydantic AI message history."""
+        return await self.chat.get_pydantic_ai_history(session_id, limit)
+
+    async def get_workout_logs(
+        self, user_email: str, limit: int = 50
+    ) -> list[WorkoutWithId]:
+        """Delegates to workout repository."""
+        return await self.workouts_repo.get_logs(user_email, limit)
+
+    async def get_nutrition_logs(
+        self, user_email: str, limit: int = 30
+    ) -> list[NutritionLog]:
+        """Delegates to nutrition repository."""
+        return await self.nutrition.get_logs(user_email, limit)
+
+    async def get_nutrition_logs_by_date_range(
+        self, user_email: str, start_date: datetime, end_date: datetime
+    ) -> list[NutritionLog]:
+        """Delegates to nutrition repository."""
+        return await self.nutrition.get_logs_by_date_range(
+            user_email, start_date, end_date
+        )
+
+    async def get_nutrition_stats(
+        self, user_email: str, period_stats: dict, plan: UserPlan | None
+    ) -> NutritionStats:
+        """
+        Delegates to nutrition repository.
+
+        Unlike the sync version, the TDEE result and plan are passed in so a
+        caller that already loaded them does not read them twice.
+        """
+        return await self.nutrition.get_stats(user_email, period_stats, plan)
+
+    async def get_weight_logs(self, user_email: str, limit: int = 30) -> list[WeightLog]:
+        """Delegates to weight repository."""
+        return await self.weight.get_logs(user_email, limit)
+
+    async def get_weight_logs_by_date_range(
+        self, user_email: str, start_date: date, end_date: date
+    ) -> list[WeightLog]:
+        """Delegates to weight repository."""
+        return await self.weight.get_logs_by_date_range(user_email, start_date, end_date)
+
+    async def get_plan(self, user_email: str) -> UserPlan | None:
+        """Delegates to plan repository."""
+        return await self.plans.get_plan(user_email)
+
+    async def get_plan_discovery(self, user_email: str) -> PlanDiscoveryState | None:
+        """Delegates to plan repository."""
+        return await self.plans.get_discovery(user_email)
+
+    async def get_active_events(self, user_email: str) -> list[ScheduledEventWithId]:
+        """Delegates to event repository."""
+        return await self.events.get_active_events(user_email)
@@ -4,14 +4,23 @@ This module contains the database logic for the application.
 
 from datetime import datetime, date
 import pymongo
+from bson import ObjectId
 
 from src.core.config import settings
 from src.api.models.trainer_profile import TrainerProfile
 from src.api.models.user_profile import UserProfile
 from src.api.models.chat_history import ChatHistory
+from src.api.models.pagination import ListPosition
 from src.api.models.weight_log import WeightLog
 from src.api.models.workout_log import WorkoutLog, WorkoutWithId
+from src.core.chat_history_cache import shared_chat_history_cache
 from src.core.logs import logger
+from src.core.profile_cache import (
+    shared_trainer_profile_cache,
+    shared_user_profile_cache,
+)
+from src.core.token_blocklist_cache import TokenBlocklistCache
+from src.core.turn_cache import turn_memoized
 from src.api.models.workout_stats import WorkoutStats
 from src.api.models.nutrition_log import NutritionLog
 from src.api.models.nutrition_stats import NutritionStats
@@ -19,14 +28,19 @@ from src.api.models.nutrition_stats import NutritionStats
 from src.repositories.user_repository import UserRepository
 from src.repositories.trainer_repository import TrainerRepository
 from src.repositories.token_repository import TokenRepository
+from src.repositories.chat_archive_repository import ChatArchiveRepository
 from src.repositories.chat_repository import ChatRepository
 from src.repositories.workout_repository import WorkoutRepository
+from src.repositories.hevy_template_repository import HevyTemplateRepository
+from src.repositories.workout_stats_repository import WorkoutStatsRepository
 from src.repositories.nutrition_repository import NutritionRepository
 from src.repositories.weight_repository import WeightRepository
 from src.repositories.invite_repository import InviteRepository
 from src.repositories.prompt_repository import PromptRepository
+from src.services.prompt_log_writer import PromptLogWriter, PromptLogWriterOptions
 from src.repositories.telegram_repository import TelegramRepository
 from src.repositories.plan_repository import PlanRepository
+from src.repositories.tdee_state_repository import TdeeStateRepository
 from src.services.adaptive_tdee import AdaptiveTDEEService
 
 # pylint: disable=too-many-instance-attributes
@@ -43,16 +57,45 @@ class MongoDatabase:
             self.database = self.client[settings.DB_NAME]
 
             # Initialize Repositories
-            self.users = UserRepository(self.database)
-            self.trainers = TrainerRepository(self.database)
+            self.users = UserRepository(
+                self.database, profile_cache=shared_user_profile_cache()
+            )
+            self.trainers = TrainerRepository(
+                self.database, profile_cache=shared_trainer_profile_cache()
+            )
             self.tokens = TokenRepository(self.database)
             self.tokens.ensure_indexes()
-            self.chat = ChatRepository(self.database)
-            self.workouts_repo = WorkoutRepository(self.database)
-            self.nutrition = NutritionRepository(self.database)
-            self.weight = WeightRepository(self.database)
+            self.token_blocklist = TokenBlocklistCache(
+                self.tokens,
+                refresh_seconds=settings.TOKEN_BLOCKLIST_REFRESH_SECONDS,
+                max_staleness_seconds=settings.TOKEN_BLOCKLIST_MAX_STALENESS_SECONDS,
+            )
+            self.chat = ChatRepository(
+                self.database,
+                history_cache=shared_chat_history_cache(),
+                archive=ChatArchiveRepository(self.database),
+            )
+            self.workout_stats = WorkoutStatsRepository(self.database)
+            self.workouts_repo = WorkoutRepository(
+                self.database, workout_stats=self.workout_stats
+            )
+            self.hevy_templates = HevyTemplateRepository(self.database)
+            self.tdee_states = TdeeStateRepository(self.database)
+            self.nutrition = NutritionRepository(
+                self.database, tdee_states=self.tdee_states
+            )
+            self.weight = WeightRepository(self.database, tdee_states=self.tdee_states)
             self.invites = InviteRepository(self.database)
             self.prompts = PromptRepository(self.database)
+            self.prompts.ensure_indexes()
+            self.prompt_log_writer = PromptLogWriter(
+                self.prompts,
+                PromptLogWriterOptions(
+                    max_logs=settings.MAX_PROMPT_LOGS,
+                    flush_interval=settings.PROMPT_LOG_FLUSH_SECONDS,
+                    batch_size=settings.PROMPT_LOG_BATCH_SIZE,
+                ),
+            )
             self.telegram = TelegramRepository(self.database)
             self.plans = PlanRepository(self.database)
 
@@ -63,8 +106,10 @@ class MongoDatabase:
 
     def close(self):
         """
-        Closes the MongoDB connection.
+        Stops the blocklist poller and closes the MongoDB connection.
         """
+        if hasattr(self, "token_blocklist"):
+            self.token_blocklist.stop()
         if hasattr(self, "client"):
             self.client.close()
             logger.info("MongoDB connection closed.")
@@ -118,12 +163,13 @@ class MongoDatabase:
         return self.trainers.get_profile(email)
 
     def add_token_to_blocklist(self, token: str, expires_at: datetime) -> None:
-        """Adds JWT token to blocklist."""
-        return self.tokens.add_to_blocklist(token, expires_at)
+        """Adds JWT token to blocklist (and to this worker's blocklist view)."""
+        self.tokens.add_to_blocklist(token, expires_at)
+        self.token_blocklist.add(token, expires_at)
 
     def is_token_blocklisted(self, token: str) -> bool:
-        """Checks if token is blocklisted."""
-        return self.tokens.is_blocklisted(token)
+        """Checks if token is blocklisted, from the in-process blocklist view."""
+        return self.token_blocklist.is_blocklisted(token)
 
     def ensure_blocklist_indexes(self) -> None:
         """Ensures TTL indexes for token blocklist."""
@@ -135,6 +181,12 @@ class MongoDatabase:
         """Retrieves chat history."""
         return self.chat.get_history(user_id, limit, offset)
 
+    def get_chat_history_page(
+        self, user_id: str, limit: int = 20, before: ObjectId | None = None
+    ) -> tuple[list[ChatHistory], ObjectId | None]:
+        """Delegates to chat repository."""
+        return self.chat.get_history_page(user_id, limit, before)
+
     def add_to_history(
         self,
         chat_history: ChatHistory,
@@ -156,10 +208,17 @@ class MongoDatabase:
     def log_prompt(self, user_email: str, prompt_data: dict):
         """
         Logs an LLM prompt for debugging purposes.
+        Buffered: the write happens on the prompt log writer thread.
         """
-        return self.prompts.log_prompt(
-            user_email, prompt_data, settings.MAX_PROMPT_LOGS
-        )
+        self.prompt_log_writer.submit(user_email, prompt_data)
+
+    def flush_prompt_logs(self) -> None:
+        """Writes buffered prompt logs and stops the writer thread."""
+        self.prompt_log_writer.close()
+
+    def stop_token_blocklist(self) -> None:
+        """Stops the thread polling the token blocklist."""
+        self.token_blocklist.stop()
 
     def get_window_memory(
         self,
@@ -200,6 +259,18 @@ class MongoDatabase:
             user_email, page, page_size, workout_type
         )
 
+    def get_workouts_cursor_page(
+        self,
+        user_email: str,
+        position: ListPosition,
+        page_size: int = 10,
+        workout_type: str | None = None,
+    ) -> tuple[list[dict], bool, int | None]:
+        """Delegates to workout repository."""
+        return self.workouts_repo.get_cursor_page(
+            user_email, position, page_size, workout_type
+        )
+
     def get_workout_stats(self, user_email: str) -> WorkoutStats:
         """Delegates to workout repository."""
         return self.workouts_repo.get_stats(user_email)
@@ -229,6 +300,10 @@ class MongoDatabase:
         """Delegates to nutrition repository."""
         return self.nutrition.save_log(log)
 
+    def save_nutrition_logs(self, logs: list[NutritionLog]) -> tuple[int, int]:
+        """Delegates to nutrition repository."""
+        return self.nutrition.save_logs(logs)
+
     def update_nutrition_log(
         self, log_id: str, user_email: str, log: NutritionLog
     ) -> bool:
@@ -257,6 +332,17 @@ class MongoDatabase:
         """Delegates to nutrition repository."""
         return self.nutrition.get_paginated(user_email, page, page_size, days)
 
+    def get_nutrition_cursor_page(
+        self,
+        user_email: str,
+        position: ListPosition,
+        page_size: int = 10,
+        days: int | None = None,
+    ) -> tuple[list[dict], bool, int | None]:
+        """Delegates to nutrition repository."""
+        return self.nutrition.get_cursor_page(user_email, position, page_size, days)
+
+    @turn_memoized
     def get_nutrition_stats(self, user_email: str) -> NutritionStats:
         """Delegates to nutrition repository."""
         try:
@@ -282,6 +368,10 @@ class MongoDatabase:
         """Delegates to weight repository."""
         return self.weight.save_log(log)
 
+    def save_weight_logs(self, logs: list[WeightLog]) -> tuple[int, int]:
+        """Delegates to weight repository."""
+        return self.weight.save_logs(logs)
+
     def delete_weight_log(self, user_email: str, log_date: date) -> bool:
         """Delegates to weight repository."""
         return self.weight.delete_log(user_email, log_date)
@@ -290,6 +380,23 @@ class MongoDatabase:
         """Delegates to weight repository."""
         return self.weight.get_logs(user_email, limit)
 
+    # ====== TDEE STATE REPOSITORY DELEGATION ======
+    def get_tdee_state(self, user_email: str, lookback_weeks: int) -> dict | None:
+        """Delegates to TDEE state repository."""
+        return self.tdee_states.get_state(user_email, lookback_weeks)
+
+    def save_tdee_state(
+        self,
+        user_email: str,
+        lookback_weeks: int,
+        state: dict,
+        expected_version: int | None = None,
+    ) -> bool:
+        """Delegates to TDEE state repository."""
+        return self.tdee_states.save_state(
+            user_email, lookback_weeks, state, expected_version
+        )
+
     # ====== PLAN REPOSITORY DELEGATION ======
     def save_plan(self, plan):
         """Delegates to plan repository."""
@@ -333,3 +440,9 @@ class MongoDatabase:
     ) -> tuple[list[dict], int]:
         """Delegates to weight repository."""
         return self.weight.get_paginated(user_email, page, page_size)
+
+    def get_weight_cursor_page(
+        self, user_email: str, position: ListPosition, page_size: int = 10
+    ) -> tuple[list[dict], bool, int | None]:
+        """Delegates to weight repository."""
+        return self.weight.get_cursor_page(user_email, position, page_size)
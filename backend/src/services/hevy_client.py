@@ -0,0 +1,201 @@
+"""
+Shared HTTP client for the Hevy API.
+
+Every Hevy call used to open its own ``httpx.AsyncClient`` and pay the TCP
+and TLS handshake again. ``HevyClient`` keeps one pooled keep-alive HTTP/2
+client per event loop, spaces requests per API key with a token bucket
+(Hevy rate limits per key) and retries 429 and 5xx answers with backoff.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import random
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, TypeVar
+
+import httpx
+from cachetools import LRUCache
+
+from src.core.config import settings
+from src.core.logs import logger
+
+T = TypeVar("T")
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+
+class TokenBucket:
+    """
+    Reservation-based token bucket.
+
+    Each caller reserves a token immediately and sleeps until it is due, so
+    the bookkeeping needs no loop-bound lock and works from any event loop.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes one token and returns how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Waits for a token."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _setting(name: str) -> Callable[[], Any]:
+    return lambda: getattr(settings, name)
+
+
+@dataclass(frozen=True)
+class HevyClientOptions:
+    """Pool, rate limit and retry settings of a ``HevyClient``."""
+
+    http2: bool = True
+    max_connections: int = field(default_factory=_setting("HEVY_MAX_CONNECTIONS"))
+    rate_per_second: float = field(default_factory=_setting("HEVY_RATE_LIMIT_PER_SECOND"))
+    burst: int = field(default_factory=_setting("HEVY_RATE_LIMIT_BURST"))
+    max_retries: int = field(default_factory=_setting("HEVY_MAX_RETRIES"))
+    backoff_seconds: float = 0.5
+
+
+class HevyClient:
+    """Pooled, rate-limited HTTP client shared by every ``HevyService``."""
+
+    def __init__(
+        self,
+        options: HevyClientOptions | None = None,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.options = options or HevyClientOptions()
+        self.transport = transport
+        self._buckets: LRUCache[str, TokenBucket] = LRUCache(maxsize=4096)
+        self._buckets_lock = threading.Lock()
+        # An httpx.AsyncClient is bound to the loop it first runs on, and
+        # sync callers drive Hevy from their own loops, so one per loop.
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+
+    def _client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self.options.http2,
+                transport=self.transport,
+                limits=httpx.Limits(
+                    max_connections=self.options.max_connections,
+                    max_keepalive_connections=self.options.max_connections,
+                    keepalive_expiry=60.0,
+                ),
+            )
+            self._clients[loop] = client
+        return client
+
+    def _bucket(self, api_key: str) -> TokenBucket:
+        with self._buckets_lock:
+            bucket = self._buckets.get(api_key)
+            if bucket is None:
+                bucket = TokenBucket(self.options.rate_per_second, self.options.burst)
+                self._buckets[api_key] = bucket
+            return bucket
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), 30.0)
+            except ValueError:
+                pass
+        return self.options.backoff_seconds * (2**attempt) * (1 + random.random() / 2)
+
+    async def request(
+        self, method: str, url: str, api_key: str, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Sends a request, rate limited per API key. ``kwargs`` (``params``,
+        ``json``, ``timeout``; 20 seconds by default) go to httpx.
+
+        429 is retried for every method (the request was not processed);
+        5xx and connection errors only for idempotent ones. The last response
+        is returned once retries run out, so callers keep handling status codes.
+        """
+        method = method.upper()
+        kwargs.setdefault("timeout", 20.0)
+        bucket = self._bucket(api_key)
+        attempt = 0
+        while True:
+            await bucket.acquire()
+            try:
+                response = await self._client().request(
+                    method, url, headers={"api-key": api_key}, **kwargs
+                )
+            except httpx.TransportError as e:
+                if method not in IDEMPOTENT_METHODS or attempt >= self.options.max_retries:
+                    raise
+                logger.warning("Hevy %s %s failed (%s), retrying", method, url, e)
+                response = None
+            else:
+                retryable = response.status_code == 429 or (
+                    response.status_code in RETRY_STATUSES and method in IDEMPOTENT_METHODS
+                )
+                if not retryable or attempt >= self.options.max_retries:
+                    return response
+                logger.warning(
+                    "Hevy %s %s returned %d, retrying", method, url, response.status_code
+                )
+            await asyncio.sleep(self._retry_delay(attempt, response))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        """Closes the pooled client of the running loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+async def gather_pages(
+    fetch_page: Callable[[int], Awaitable[T]], pages: range, concurrency: int
+) -> list[T]:
+    """Fetches ``pages`` concurrently, at most ``concurrency`` at a time, in order."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def bounded(page: int) -> T:
+        async with semaphore:
+            return await fetch_page(page)
+
+    return list(await asyncio.gather(*(bounded(page) for page in pages)))
+
+
+@functools.lru_cache()
+def get_shared_hevy_client() -> HevyClient:
+    """Returns the process-wide Hevy client."""
+    return HevyClient()
+
+
+async def close_shared_hevy_client() -> None:
+    """Closes the process-wide Hevy client's connections on the running loop."""
+    # Creating the client here is harmless: it opens no connection until used.
+    await get_shared_hevy_client().aclose()
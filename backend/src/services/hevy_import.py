@@ -0,0 +1,406 @@
+"""
+Import and incremental sync of a user's Hevy workouts.
+
+The user's existing logs are loaded once and every duplicate decision is
+taken in memory by an ``_ImportPlan``; writes go to Mongo in bulk batches,
+run on the blocking executor so the event loop keeps serving requests.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Optional
+
+from bson import ObjectId
+
+from src.core.blocking import run_blocking
+from src.core.logs import logger
+
+if TYPE_CHECKING:
+    from src.repositories.workout_repository import WorkoutRepository
+    from src.services.hevy_service import HevyService
+
+# pylint: disable=broad-exception-caught,too-many-return-statements
+
+
+class HevyWorkoutImport:
+    """One import or sync run of a user's Hevy workouts."""
+
+    def __init__(self, service: HevyService, user_email: str, api_key: str, mode: str):
+        self.service = service
+        self.user_email = user_email
+        self.api_key = api_key
+        self.mode = mode  # 'skip_duplicates' or 'overwrite'
+        self.counts: dict[str, int] = {}
+        self.plan = _ImportPlan([])
+
+    async def _start(self, *outcomes: str) -> None:
+        self.counts = dict.fromkeys((*outcomes, "skipped", "failed"), 0)
+        self.plan = _ImportPlan(
+            await run_blocking(
+                self.service.workout_repository.get_import_index, self.user_email
+            )
+        )
+
+    async def import_all(self, from_date: Optional[datetime] = None) -> dict:
+        """Imports every Hevy workout, or those from ``from_date`` on."""
+        if from_date and from_date.tzinfo is None:
+            from_date = from_date.replace(tzinfo=timezone.utc)
+        logger.info(
+            "Starting Hevy import for %s, mode=%s, from=%s",
+            self.user_email,
+            self.mode,
+            from_date,
+        )
+        await self._start("imported")
+
+        # Hevy API pagination
+        page = 1
+        page_size = 10
+        while page <= 100:
+            workouts_batch = await self.service.fetch_workouts(self.api_key, page, page_size)
+            if not workouts_batch:
+                break
+
+            for hevy_workout in workouts_batch:
+                self._count(self._plan_workout(hevy_workout, from_date=from_date))
+            if self.plan.pending >= self.service.IMPORT_BATCH_SIZE:
+                await self._flush()
+
+            if len(workouts_batch) < page_size:
+                break
+            page += 1
+        else:
+            logger.warning("Hit page limit safeguard")
+
+        await self._flush()
+        return self.counts
+
+    async def sync_since(self, since: datetime) -> dict:
+        """
+        Applies the workouts created, updated or deleted in Hevy after the
+        ``since`` high-water mark, reading event pages (newest first) only
+        until an event older than the mark shows up.
+
+        Returns the counts plus ``cursor``, the high-water mark to persist for
+        the next run. The mark does not move when Hevy could not be read or
+        any workout failed, so the next run picks those events up again.
+        """
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        logger.info("Starting incremental Hevy sync for %s since %s", self.user_email, since)
+        await self._start("imported", "updated", "deleted")
+
+        high_water = since
+        handled: set[str] = set()
+        complete = False
+        page = 1
+        while page <= 100:
+            data = await self.service.fetch_workout_events(self.api_key, since, page)
+            if data is None:
+                break
+            events = data.get("events") or []
+            crossed = False
+            for event in events:
+                at = _event_time(event)
+                if at is not None and at <= since:
+                    crossed = True
+                    break
+                if at is not None:
+                    high_water = max(high_water, at)
+                self._apply_event(event, handled)
+
+            if self.plan.pending >= self.service.IMPORT_BATCH_SIZE:
+                await self._flush()
+
+            if crossed or not events or page >= data.get("page_count", page):
+                complete = True
+                break
+            page += 1
+
+        await self._flush()
+        if not complete:
+            logger.warning("Incremental Hevy sync for %s stopped early", self.user_email)
+            high_water = since
+        elif self.counts["failed"]:
+            logger.warning(
+                "Incremental Hevy sync for %s had %d failures; cursor kept",
+                self.user_email,
+                self.counts["failed"],
+            )
+            high_water = since
+        return {**self.counts, "cursor": high_water}
+
+    def _apply_event(self, event: dict, handled: set[str]) -> None:
+        deleted = event.get("type") == "deleted"
+        workout = event.get("workout") or {}
+        workout_id = event.get("id") if deleted else workout.get("id")
+        # Newest first: only the latest event of a workout counts.
+        if not workout_id or workout_id in handled:
+            return
+        handled.add(workout_id)
+
+        if deleted:
+            removed = self.plan.find_external_ids(workout_id)
+            if removed:
+                self.plan.delete(removed)
+                self._count("deleted")
+            return
+        self._count(self._plan_workout(workout, update_existing=True))
+
+    def _count(self, outcome: Optional[str]) -> None:
+        if outcome is not None:
+            self.counts[outcome] += 1
+            self.plan.record(outcome)
+
+    def _plan_workout(
+        self,
+        hevy_workout: dict,
+        from_date: Optional[datetime] = None,
+        update_existing: bool = False,
+    ) -> Optional[str]:
+        """
+        Takes the import decision for one Hevy workout.
+        Returns the counter it falls under, or None when it is out of range.
+        """
+        try:
+            # Check date filter
+            start_time_str = hevy_workout["start_time"].replace("Z", "+00:00")
+            workout_date = datetime.fromisoformat(start_time_str)
+
+            if from_date and workout_date < from_date:
+                return None
+
+            # Transform
+            workout_log = self.service.transform_to_workout_log(hevy_workout, self.user_email)
+            if not workout_log:
+                return "failed"
+
+            # Check for existence
+            # 1. Try by external_id
+            exists = self.plan.find_external_id(hevy_workout.get("id"))
+
+            if exists is None:
+                # 2. Daily deduplication
+                day_start = workout_date.replace(hour=0, minute=0, second=0, microsecond=0)
+                existing_on_day = self.plan.find_between(
+                    day_start, day_start + timedelta(days=1)
+                )
+
+                if existing_on_day:
+                    if self.mode == "skip_duplicates":
+                        logger.debug(
+                            "Workout on day %s already exists, skipping", day_start.date()
+                        )
+                        return "skipped"
+                    if self.mode == "overwrite":
+                        self.plan.delete(existing_on_day)
+                        logger.info(
+                            "Overwriting %d existing workouts on %s",
+                            len(existing_on_day),
+                            day_start.date(),
+                        )
+                self.plan.insert(workout_log.model_dump())
+                return "imported"
+
+            if update_existing:
+                # Edited in Hevy since the last sync.
+                self.plan.replace(exists, workout_log.model_dump())
+                return "updated"
+            if self.mode == "skip_duplicates":
+                logger.debug(
+                    "Workout with external_id %s already exists, skipping",
+                    hevy_workout.get("id"),
+                )
+                return "skipped"
+            # Same Hevy workout: rewrite it in place.
+            self.plan.replace(exists, workout_log.model_dump())
+            logger.info("Overwriting workout with external_id %s", hevy_workout.get("id"))
+            return "imported"
+
+        except Exception as e:
+            logger.error("Error importing specific workout: %s", e)
+            return "failed"
+
+    async def _flush(self) -> None:
+        """Writes the pending batch; workouts whose writes failed count as failed."""
+        try:
+            lost = await run_blocking(
+                self.plan.flush, self.service.workout_repository, self.user_email
+            )
+        except Exception as e:
+            logger.error("Error writing Hevy import batch for %s: %s", self.user_email, e)
+            lost = self.plan.discard()
+        for outcome, count in lost.items():
+            self.counts[outcome] -= count
+            self.counts["failed"] += count
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Naive UTC datetime, the form pymongo returns stored dates in."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _event_time(event: dict) -> Optional[datetime]:
+    """When a Hevy workout event happened (update or deletion time)."""
+    if event.get("type") == "deleted":
+        value = event.get("deleted_at")
+    else:
+        value = (event.get("workout") or {}).get("updated_at")
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class _BatchLog:
+    """What the unflushed batch of an _ImportPlan changed."""
+
+    # Index entry of each changed log as stored (None: not stored yet).
+    stored: dict[ObjectId, Optional[tuple[Optional[str], datetime]]] = field(
+        default_factory=dict
+    )
+    outcomes: list[tuple[str, set[ObjectId]]] = field(default_factory=list)
+    touched: set[ObjectId] = field(default_factory=set)
+
+
+class _ImportPlan:
+    """
+    In-memory view of a user's workout logs during an import.
+
+    Answers the duplicate checks the import used to send to Mongo one workout
+    at a time, and collects the resulting writes. Writes decided in this run
+    are visible to later checks, exactly as if they had been saved already;
+    writes that end up failing are taken back out of the view.
+    """
+
+    def __init__(self, existing: list[dict]):
+        self._logs: dict[ObjectId, tuple[Optional[str], datetime]] = {}
+        self._by_external_id: dict[str, set[ObjectId]] = defaultdict(set)
+        self._by_day: dict[date, set[ObjectId]] = defaultdict(set)
+        self.inserts: dict[ObjectId, dict] = {}
+        self.replacements: dict[ObjectId, dict] = {}
+        self.deletions: set[ObjectId] = set()
+        self._batch = _BatchLog()
+        for doc in existing:
+            if doc.get("date") is not None:
+                self._index(doc["_id"], doc.get("external_id"), doc["date"])
+
+    @property
+    def pending(self) -> int:
+        """Number of writes not flushed yet."""
+        return len(self.inserts) + len(self.replacements) + len(self.deletions)
+
+    def _index(self, workout_id: ObjectId, external_id: Optional[str], when: datetime):
+        when = _as_utc(when)
+        self._logs[workout_id] = (external_id, when)
+        if external_id:
+            self._by_external_id[external_id].add(workout_id)
+        self._by_day[when.date()].add(workout_id)
+
+    def _unindex(self, workout_id: ObjectId) -> None:
+        external_id, when = self._logs.pop(workout_id)
+        if external_id:
+            self._by_external_id[external_id].discard(workout_id)
+        self._by_day[when.date()].discard(workout_id)
+
+    def _track(self, workout_id: ObjectId) -> None:
+        self._batch.stored.setdefault(workout_id, self._logs.get(workout_id))
+        self._batch.touched.add(workout_id)
+
+    def record(self, outcome: str) -> None:
+        """Ties the changes queued since the last call to the ``outcome`` counter."""
+        if self._batch.touched:
+            self._batch.outcomes.append((outcome, self._batch.touched))
+            self._batch.touched = set()
+
+    def find_external_id(self, external_id: Optional[str]) -> Optional[ObjectId]:
+        """Id of a log imported from this Hevy workout, if any."""
+        matches = self._by_external_id.get(external_id) if external_id else None
+        return min(matches) if matches else None
+
+    def find_external_ids(self, external_id: str) -> list[ObjectId]:
+        """Ids of every log imported from this Hevy workout."""
+        return sorted(self._by_external_id.get(external_id, ()))
+
+    def find_between(self, start: datetime, end: datetime) -> list[ObjectId]:
+        """Ids of the logs dated in ``[start, end)``."""
+        start, end = _as_utc(start), _as_utc(end)
+        found = []
+        day = start.date()
+        while day <= (end - timedelta(microseconds=1)).date():
+            found.extend(
+                workout_id
+                for workout_id in self._by_day.get(day, ())
+                if start <= self._logs[workout_id][1] < end
+            )
+            day += timedelta(days=1)
+        return found
+
+    def insert(self, doc: dict) -> None:
+        """Queues a new log."""
+        doc["_id"] = ObjectId()
+        self._track(doc["_id"])
+        self.inserts[doc["_id"]] = doc
+        self._index(doc["_id"], doc.get("external_id"), doc["date"])
+
+    def replace(self, workout_id: ObjectId, doc: dict) -> None:
+        """Queues a rewrite of an existing log, keeping its id."""
+        self._track(workout_id)
+        self._unindex(workout_id)
+        if workout_id in self.inserts:
+            self.inserts[workout_id] = {**doc, "_id": workout_id}
+        else:
+            self.replacements[workout_id] = doc
+        self._index(workout_id, doc.get("external_id"), doc["date"])
+
+    def delete(self, workout_ids: list[ObjectId]) -> None:
+        """Queues the removal of logs; unflushed inserts are simply dropped."""
+        for workout_id in workout_ids:
+            self._track(workout_id)
+            self._unindex(workout_id)
+            if self.inserts.pop(workout_id, None) is None:
+                self.replacements.pop(workout_id, None)
+                self.deletions.add(workout_id)
+
+    def flush(self, repository: WorkoutRepository, user_email: str) -> dict[str, int]:
+        """
+        Writes the queued changes in one bulk batch.
+        Returns, per counter, how many recorded outcomes had a write fail.
+        """
+        failed: set[ObjectId] = set()
+        if self.pending:
+            failed = repository.apply_import(
+                user_email,
+                list(self.inserts.values()),
+                list(self.replacements.items()),
+                list(self.deletions),
+            )
+        return self._settle(failed)
+
+    def discard(self) -> dict[str, int]:
+        """Forgets the queued changes, as if every write of the batch had failed."""
+        return self._settle(set(self._batch.stored))
+
+    def _settle(self, failed: set[ObjectId]) -> dict[str, int]:
+        for workout_id in failed:
+            # The stored log is unchanged: index it as it was.
+            if workout_id in self._logs:
+                self._unindex(workout_id)
+            stored = self._batch.stored.get(workout_id)
+            if stored is not None:
+                self._index(workout_id, *stored)
+        lost: dict[str, int] = defaultdict(int)
+        for outcome, workout_ids in self._batch.outcomes:
+            if workout_ids & failed:
+                lost[outcome] += 1
+        self.inserts.clear()
+        self.replacements.clear()
+        self.deletions.clear()
+        self._batch = _BatchLog()
+        return dict(lost)
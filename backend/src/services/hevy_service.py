@@ -2,10 +2,15 @@
 Service to interact with Hevy API.
 """
 
-from datetime import datetime, timezone, timedelta
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
 from typing import Optional
 import json
 import httpx
+from cachetools import LRUCache
+from src.api.models.user_profile import UserProfile
 from src.api.models.workout_log import WorkoutLog, ExerciseLog
 from src.api.models.routine import (
     HevyRoutine,
@@ -13,7 +18,13 @@ from src.api.models.routine import (
     HevyExerciseTemplate,
     ExerciseTemplateListResponse,
 )
+from src.repositories.hevy_template_repository import HevyTemplateRepository, catalog_key
 from src.repositories.workout_repository import WorkoutRepository
+from src.services.hevy_client import HevyClient, gather_pages, get_shared_hevy_client
+from src.services.hevy_import import HevyWorkoutImport
+from src.services.hevy_templates import HevyTemplateCatalog
+from src.core.blocking import run_blocking
+from src.core.config import settings
 from src.core.logs import logger
 
 # pylint: disable=too-many-locals,broad-exception-caught,no-else-continue,too-many-nested-blocks,too-many-branches,too-many-statements,too-many-return-statements,import-outside-toplevel
@@ -26,53 +37,62 @@ class HevyService:
 
     BASE_URL = "https://api.hevyapp.com/v1"
 
-    # Simple in-memory cache for exercise templates
-    _exercises_cache: dict[
-        str, tuple[float, list[HevyExerciseTemplate]]
-    ] = {}  # key: api_key, value: (timestamp, templates)
+    # Exercise template catalogs: bounded in-process LRU in front of the
+    # shared Mongo copy. key: catalog_key(api_key), value: (timestamp, catalog)
+    _template_catalogs: LRUCache = LRUCache(maxsize=settings.HEVY_TEMPLATE_CACHE_SIZE)
+    _template_catalogs_lock = threading.Lock()
+    _catalog_refreshes: dict[str, asyncio.Task] = {}
     CACHE_DURATION = 3600 * 24  # 24 hours
     _routines_cache: dict[
         str, tuple[float, list[HevyRoutine]]
     ] = {}  # key: api_key, value: (timestamp, routines)
     ROUTINES_CACHE_DURATION = 15  # seconds
+    IMPORT_BATCH_SIZE = 500  # pending writes before an import flushes to Mongo
 
-    def __init__(self, workout_repository: WorkoutRepository):
+    def __init__(
+        self,
+        workout_repository: WorkoutRepository,
+        http_client: Optional[HevyClient] = None,
+        template_repository: Optional[HevyTemplateRepository] = None,
+    ):
         self.workout_repository = workout_repository
+        self.template_repository = template_repository
+        self.http = http_client or get_shared_hevy_client()
 
     async def validate_api_key(self, api_key: str) -> bool:
         """
         Validates the Hevy API key by making a lightweight request.
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.BASE_URL}/workouts/count",
-                    headers={"api-key": api_key},
-                    timeout=10.0,
-                )
-                return response.status_code == 200
-            except httpx.RequestError as e:
-                logger.error("Hevy API validation failed: %s", e)
-                return False
+        try:
+            response = await self.http.request(
+                "GET",
+                f"{self.BASE_URL}/workouts/count",
+                api_key,
+                timeout=10.0,
+            )
+            return response.status_code == 200
+        except httpx.RequestError as e:
+            logger.error("Hevy API validation failed: %s", e)
+            return False
 
     async def get_workout_count(self, api_key: str) -> int:
         """
         Returns the total number of workouts available.
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.BASE_URL}/workouts/count",
-                    headers={"api-key": api_key},
-                    timeout=10.0,
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("workout_count", 0)
-                return 0
-            except Exception as e:
-                logger.error("Failed to get workout count: %s", e)
-                return 0
+        try:
+            response = await self.http.request(
+                "GET",
+                f"{self.BASE_URL}/workouts/count",
+                api_key,
+                timeout=10.0,
+            )
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("workout_count", 0)
+            return 0
+        except Exception as e:
+            logger.error("Failed to get workout count: %s", e)
+            return 0
 
     async def fetch_workouts(
         self, api_key: str, page: int = 1, page_size: int = 10
@@ -80,21 +100,51 @@ class HevyService:
         """
         Fetches a page of workouts from Hevy API.
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.BASE_URL}/workouts",
-                    headers={"api-key": api_key},
-                    params={"page": page, "pageSize": page_size},
-                    timeout=20.0,
-                )
-                if response.status_code == 200:
-                    return response.json().get("workouts", [])
-                logger.warning("Hevy API returned %s", response.status_code)
-                return []
-            except Exception as e:
-                logger.error("Failed to fetch workouts page %d: %s", page, e)
-                return []
+        try:
+            response = await self.http.request(
+                "GET",
+                f"{self.BASE_URL}/workouts",
+                api_key,
+                params={"page": page, "pageSize": page_size},
+                timeout=20.0,
+            )
+            if response.status_code == 200:
+                return response.json().get("workouts", [])
+            logger.warning("Hevy API returned %s", response.status_code)
+            return []
+        except Exception as e:
+            logger.error("Failed to fetch workouts page %d: %s", page, e)
+            return []
+
+    async def fetch_workout_events(
+        self, api_key: str, since: datetime, page: int = 1, page_size: int = 10
+    ) -> Optional[dict]:
+        """
+        Fetches a page of workout events (updated or deleted) since a date,
+        newest first. None when the page could not be read.
+        """
+        try:
+            response = await self.http.request(
+                "GET",
+                f"{self.BASE_URL}/workouts/events",
+                api_key,
+                params={
+                    "page": page,
+                    "pageSize": page_size,
+                    "since": since.isoformat().replace("+00:00", "Z"),
+                },
+                timeout=20.0,
+            )
+            if response.status_code == 200:
+                return response.json()
+            if response.status_code == 404 and page > 1:
+                # Hevy answers past the last page with 404.
+                return {"page": page, "page_count": page - 1, "events": []}
+            logger.warning("Hevy API events returned %s", response.status_code)
+            return None
+        except Exception as e:
+            logger.error("Failed to fetch workout events page %d: %s", page, e)
+            return None
 
     async def fetch_workout_by_id(
         self, api_key: str, workout_id: str
@@ -102,41 +152,41 @@ class HevyService:
         """
         Fetches a single workout by ID from Hevy API.
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                logger.debug(
-                    "[Hevy] Fetching workout %s with key ****%s",
-                    workout_id,
-                    api_key[-4:],
-                )
-                response = await client.get(
-                    f"{self.BASE_URL}/workouts/{workout_id}",
-                    headers={"api-key": api_key},
-                    timeout=10.0,
-                )
-                logger.debug("[Hevy] Response status: %s", response.status_code)
-
-                if response.status_code == 200:
-                    # Hevy API returns the workout object directly
-                    data = response.json()
-                    logger.debug("[Hevy] Response JSON keys: %s", list(data.keys()))
-                    logger.debug("[Hevy] Returning workout directly from response")
-                    return data
-
-                # Log detailed error for debugging
-                logger.error(
-                    "[Hevy] Workout fetch failed for %s. Status: %s, Body: %s",
-                    workout_id,
-                    response.status_code,
-                    response.text,
-                )
-                return None
-            except Exception as e:
-                logger.error("[Hevy] Exception fetching workout %s: %s", workout_id, e)
-                import traceback
+        try:
+            logger.debug(
+                "[Hevy] Fetching workout %s with key ****%s",
+                workout_id,
+                api_key[-4:],
+            )
+            response = await self.http.request(
+                "GET",
+                f"{self.BASE_URL}/workouts/{workout_id}",
+                api_key,
+                timeout=10.0,
+            )
+            logger.debug("[Hevy] Response status: %s", response.status_code)
+
+            if response.status_code == 200:
+                # Hevy API returns the workout object directly
+                data = response.json()
+                logger.debug("[Hevy] Response JSON keys: %s", list(data.keys()))
+                logger.debug("[Hevy] Returning workout directly from response")
+                return data
+
+            # Log detailed error for debugging
+            logger.error(
+                "[Hevy] Workout fetch failed for %s. Status: %s, Body: %s",
+                workout_id,
+                response.status_code,
+                response.text,
+            )
+            return None
+        except Exception as e:
+            logger.error("[Hevy] Exception fetching workout %s: %s", workout_id, e)
+            import traceback
 
-                logger.error(traceback.format_exc())
-                return None
+            logger.error(traceback.format_exc())
+            return None
 
     def transform_to_workout_log(
         self, hevy_workout: dict, user_email: str
@@ -239,131 +289,33 @@ class HevyService:
         mode: str = "skip_duplicates",  # 'skip_duplicates' or 'overwrite'
     ) -> dict:
         """
-        Orchestrates the import process.
+        Imports every Hevy workout (from ``from_date``, if given).
+        See ``HevyWorkoutImport.import_all``.
         """
-        imported_count = 0
-        skipped_count = 0
-        failed_count = 0
-
-        # Hevy API pagination
-        page = 1
-        page_size = 10
-        has_more = True
-
-        if from_date and from_date.tzinfo is None:
-            from_date = from_date.replace(tzinfo=timezone.utc)
+        return await HevyWorkoutImport(self, user_email, api_key, mode).import_all(from_date)
 
-        logger.info(
-            "Starting Hevy import for %s, mode=%s, from=%s", user_email, mode, from_date
-        )
-
-        while has_more:
-            workouts_batch = await self.fetch_workouts(api_key, page, page_size)
-            if not workouts_batch:
-                break
-
-            for hevy_workout in workouts_batch:
-                try:
-                    # Check date filter
-                    start_time_str = hevy_workout["start_time"].replace("Z", "+00:00")
-                    workout_date = datetime.fromisoformat(start_time_str)
-
-                    if from_date and workout_date < from_date:
-                        continue
-
-                    # Transform
-                    workout_log = self.transform_to_workout_log(
-                        hevy_workout, user_email
-                    )
-                    if not workout_log:
-                        failed_count += 1
-                        continue
-
-                    # Check for existence
-                    # 1. Try by external_id
-                    exists = self.workout_repository.collection.find_one(
-                        {
-                            "user_email": user_email,
-                            "external_id": hevy_workout.get("id"),
-                        }
-                    )
+    async def sync_workouts(
+        self,
+        profile: UserProfile,
+        mode: str = "skip_duplicates",
+        from_date: Optional[datetime] = None,
+    ) -> dict:
+        """
+        Incremental import of the workouts created, updated or deleted in
+        Hevy after the profile's ``hevy_sync_cursor``. Without a cursor it
+        falls back to a full ``import_workouts`` (from ``from_date``, if given).
 
-                    if not exists:
-                        # 2. Daily deduplication
-                        day_start = workout_date.replace(
-                            hour=0, minute=0, second=0, microsecond=0
-                        )
-                        day_end = day_start + timedelta(days=1)
-
-                        existing_on_day = list(
-                            self.workout_repository.collection.find(
-                                {
-                                    "user_email": user_email,
-                                    "date": {"$gte": day_start, "$lt": day_end},
-                                }
-                            )
-                        )
-
-                        if existing_on_day:
-                            if mode == "skip_duplicates":
-                                logger.debug(
-                                    "Workout on day %s already exists, skipping",
-                                    day_start.date(),
-                                )
-                                skipped_count += 1
-                                continue
-                            elif mode == "overwrite":
-                                for doc in existing_on_day:
-                                    self.workout_repository.collection.delete_one(
-                                        {"_id": doc["_id"]}
-                                    )
-                                logger.info(
-                                    "Overwriting %d existing workouts on %s",
-                                    len(existing_on_day),
-                                    day_start.date(),
-                                )
-
-                    elif exists:
-                        if mode == "skip_duplicates":
-                            logger.debug(
-                                "Workout with external_id %s already exists, skipping",
-                                hevy_workout.get("id"),
-                            )
-                            skipped_count += 1
-                            continue
-                        elif mode == "overwrite":
-                            self.workout_repository.collection.delete_one(
-                                {"_id": exists["_id"]}
-                            )
-                            logger.info(
-                                "Overwriting workout with external_id %s",
-                                hevy_workout.get("id"),
-                            )
-
-                    # Save
-                    self.workout_repository.save_log(workout_log)
-                    imported_count += 1
-
-                except Exception as e:
-                    logger.error("Error importing specific workout: %s", e)
-                    failed_count += 1
-
-            # Pagination check
-            if len(workouts_batch) < page_size:
-                has_more = False
-            else:
-                page += 1
-
-            # Safegaurd loop
-            if page > 100:
-                logger.warning("Hit page limit safeguard")
-                break
-
-        return {
-            "imported": imported_count,
-            "skipped": skipped_count,
-            "failed": failed_count,
-        }
+        Returns the counts plus ``cursor``, the high-water mark to persist for
+        the next run.
+        """
+        if profile.hevy_sync_cursor is None:
+            started_at = datetime.now(timezone.utc)
+            result = await self.import_workouts(
+                profile.email, profile.hevy_api_key, from_date, mode
+            )
+            return {**result, "updated": 0, "deleted": 0, "cursor": started_at}
+        run = HevyWorkoutImport(self, profile.email, profile.hevy_api_key, mode)
+        return await run.sync_since(profile.hevy_sync_cursor)
 
     async def get_routines(
         self, api_key: str, page: int = 1, page_size: int = 10
@@ -375,35 +327,33 @@ class HevyService:
         logger.info(
             "Fetching routines from Hevy (page=%d, page_size=%d)", page, page_size
         )
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.BASE_URL}/routines",
-                    headers={"api-key": api_key},
-                    params={"page": page, "pageSize": page_size},
-                    timeout=20.0,
+        try:
+            response = await self.http.request(
+                "GET",
+                f"{self.BASE_URL}/routines",
+                api_key,
+                params={"page": page, "pageSize": page_size},
+                timeout=20.0,
+            )
+            if response.status_code == 200:
+                data = response.json()
+                logger.info(
+                    "Hevy API returned %d routines", len(data.get("routines", []))
                 )
-                if response.status_code == 200:
-                    data = response.json()
-                    logger.info(
-                        "Hevy API returned %d routines", len(data.get("routines", []))
-                    )
-                    return RoutineListResponse(**data)
+                return RoutineListResponse(**data)
 
-                logger.error(
-                    "Hevy API routines error: %d - Body: %s",
-                    response.status_code,
-                    response.text,
-                )
-                return None
-            except Exception as e:
-                logger.error("Failed to fetch routines: %s", e)
-                return None
+            logger.error(
+                "Hevy API routines error: %d - Body: %s",
+                response.status_code,
+                response.text,
+            )
+            return None
+        except Exception as e:
+            logger.error("Failed to fetch routines: %s", e)
+            return None
 
     async def get_all_routines(self, api_key: str, max_pages: int = 100) -> list[HevyRoutine]:
         """Fetch all visible routines from Hevy across paginated responses."""
-        import time
-
         now = time.time()
         cached = self._routines_cache.get(api_key)
         if cached:
@@ -413,19 +363,22 @@ class HevyService:
                 return routines
 
         all_routines: list[HevyRoutine] = []
-        page = 1
-
-        while page <= max_pages:
-            response = await self.get_routines(api_key, page=page, page_size=10)
-            if not response or not response.routines:
-                break
-            all_routines.extend(response.routines)
-            if page >= response.page_count:
-                break
-            page += 1
-
-        if page > max_pages:
-            logger.warning("get_all_routines hit safeguard page limit: %d", max_pages)
+        first = await self.get_routines(api_key, page=1, page_size=10)
+        if first and first.routines:
+            all_routines.extend(first.routines)
+            last_page = min(first.page_count, max_pages)
+            if first.page_count > max_pages:
+                logger.warning("get_all_routines hit safeguard page limit: %d", max_pages)
+            # page_count is known now: fetch the rest concurrently.
+            pages = await gather_pages(
+                lambda page: self.get_routines(api_key, page=page, page_size=10),
+                range(2, last_page + 1),
+                settings.HEVY_PAGE_CONCURRENCY,
+            )
+            for response in pages:
+                if not response or not response.routines:
+                    break
+                all_routines.extend(response.routines)
 
         self._routines_cache[api_key] = (now, all_routines)
         return all_routines
@@ -436,31 +389,31 @@ class HevyService:
         """
         Fetches a specific routine by ID.
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.BASE_URL}/routines/{routine_id}",
-                    headers={"api-key": api_key},
-                    timeout=10.0,
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    routine_data = data.get("routine")
-                    if isinstance(routine_data, list) and routine_data:
-                        routine_data = routine_data[0]
-
-                    if isinstance(routine_data, dict):
-                        return HevyRoutine(**routine_data)
-
-                logger.error(
-                    "Hevy API get routine error: %d - Body: %s",
-                    response.status_code,
-                    response.text,
-                )
-                return None
-            except Exception:
-                logger.error("Failed to fetch routine %s", routine_id)
-                return None
+        try:
+            response = await self.http.request(
+                "GET",
+                f"{self.BASE_URL}/routines/{routine_id}",
+                api_key,
+                timeout=10.0,
+            )
+            if response.status_code == 200:
+                data = response.json()
+                routine_data = data.get("routine")
+                if isinstance(routine_data, list) and routine_data:
+                    routine_data = routine_data[0]
+
+                if isinstance(routine_data, dict):
+                    return HevyRoutine(**routine_data)
+
+            logger.error(
+                "Hevy API get routine error: %d - Body: %s",
+                response.status_code,
+                response.text,
+            )
+            return None
+        except Exception:
+            logger.error("Failed to fetch routine %s", routine_id)
+            return None
 
     @staticmethod
     def _prepare_routine_payload(routine_data: dict, for_update: bool = False) -> dict:
@@ -549,87 +502,87 @@ class HevyService:
         """
         Creates a new routine in Hevy.
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                logger.info("[create_routine] Creating routine: %s", routine.title)
+        try:
+            logger.info("[create_routine] Creating routine: %s", routine.title)
 
-                routine_data = routine.model_dump(
-                    exclude={"id", "created_at", "updated_at"},
-                    exclude_none=True,
-                )
+            routine_data = routine.model_dump(
+                exclude={"id", "created_at", "updated_at"},
+                exclude_none=True,
+            )
 
-                logger.debug(
-                    "[create_routine] Routine data before cleanup - exercises: %d",
-                    len(routine_data.get("exercises", [])),
-                )
+            logger.debug(
+                "[create_routine] Routine data before cleanup - exercises: %d",
+                len(routine_data.get("exercises", [])),
+            )
 
-                # Ensure folder_id is included (can be null)
-                routine_data["folder_id"] = routine.folder_id
+            # Ensure folder_id is included (can be null)
+            routine_data["folder_id"] = routine.folder_id
 
-                # Clean payload: remove index, title, etc.
-                logger.debug("[create_routine] Cleaning payload for POST request")
-                routine_data = self._prepare_routine_payload(
-                    routine_data, for_update=False
-                )
+            # Clean payload: remove index, title, etc.
+            logger.debug("[create_routine] Cleaning payload for POST request")
+            routine_data = self._prepare_routine_payload(
+                routine_data, for_update=False
+            )
 
-                payload = {"routine": routine_data}
+            payload = {"routine": routine_data}
 
-                logger.debug(
-                    "[create_routine] Payload after cleanup - exercises: %d",
-                    len(payload["routine"].get("exercises", [])),
-                )
+            logger.debug(
+                "[create_routine] Payload after cleanup - exercises: %d",
+                len(payload["routine"].get("exercises", [])),
+            )
 
-                logger.info(
-                    "[create_routine] Sending payload:\n%s",
-                    json.dumps(payload, indent=2, default=str),
-                )
+            logger.info(
+                "[create_routine] Sending payload:\n%s",
+                json.dumps(payload, indent=2, default=str),
+            )
 
-                response = await client.post(
-                    f"{self.BASE_URL}/routines",
-                    headers={"api-key": api_key},
-                    json=payload,
-                    timeout=20.0,
-                )
+            response = await self.http.request(
+                "POST",
+                f"{self.BASE_URL}/routines",
+                api_key,
+                json=payload,
+                timeout=20.0,
+            )
 
-                logger.info(
-                    "[create_routine] Response status: %s", response.status_code
-                )
+            logger.info(
+                "[create_routine] Response status: %s", response.status_code
+            )
 
-                if response.status_code in [200, 201]:
-                    response_json = response.json()
-                    routine_resp = response_json.get("routine")
+            if response.status_code in [200, 201]:
+                response_json = response.json()
+                routine_resp = response_json.get("routine")
 
-                    if isinstance(routine_resp, list):
-                        if routine_resp:
-                            routine_resp = routine_resp[0]
-                        else:
-                            return None, "API returned empty list"
+                if isinstance(routine_resp, list):
+                    if routine_resp:
+                        routine_resp = routine_resp[0]
+                    else:
+                        return None, "API returned empty list"
 
-                    if isinstance(routine_resp, dict):
-                        return HevyRoutine(**routine_resp), None
+                if isinstance(routine_resp, dict):
+                    return HevyRoutine(**routine_resp), None
 
-                    return None, f"Unexpected response format: {type(routine_resp)}"
+                return None, f"Unexpected response format: {type(routine_resp)}"
 
-                error_body = response.text
-                logger.error(
-                    "[create_routine] Error: %s - Body: %s",
-                    response.status_code,
-                    error_body,
-                )
+            error_body = response.text
+            logger.error(
+                "[create_routine] Error: %s - Body: %s",
+                response.status_code,
+                error_body,
+            )
 
-                try:
-                    error_json = response.json()
-                    if "routine-limit-exceeded" in str(error_json):
-                        return None, "LIMIT_EXCEEDED"
-                    error_msg = error_json.get("error", error_body)
-                    return None, f"API Error ({response.status_code}): {error_msg}"
-                except Exception:
-                    pass
+            try:
+                error_json = response.json()
+                if "routine-limit-exceeded" in str(error_json):
+                    return None, "LIMIT_EXCEEDED"
+                error_msg = error_json.get("error", error_body)
+                return None, f"API Error ({response.status_code}): {error_msg}"
+            except Exception:
+                pass
 
-                return None, f"API Error ({response.status_code}): {error_body}"
-            except Exception as e:
-                logger.error("Failed to create routine: %s", e, exc_info=True)
-                return None, str(e)
+            return None, f"API Error ({response.status_code}): {error_body}"
+        except Exception as e:
+            logger.error("Failed to create routine: %s", e, exc_info=True)
+            return None, str(e)
 
     async def update_routine(
         self, api_key: str, routine_id: str, routine: HevyRoutine
@@ -637,77 +590,77 @@ class HevyService:
         """
         Updates an existing routine in Hevy.
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                logger.info(
-                    "[update_routine] Updating routine ID: %s (title: %s)",
-                    routine_id,
-                    routine.title,
-                )
+        try:
+            logger.info(
+                "[update_routine] Updating routine ID: %s (title: %s)",
+                routine_id,
+                routine.title,
+            )
 
-                routine_data = routine.model_dump(
-                    exclude={"id", "created_at", "updated_at"},
-                    exclude_none=True,
-                )
+            routine_data = routine.model_dump(
+                exclude={"id", "created_at", "updated_at"},
+                exclude_none=True,
+            )
 
-                logger.debug(
-                    "[update_routine] Routine data before cleanup - exercises: %d",
-                    len(routine_data.get("exercises", [])),
-                )
+            logger.debug(
+                "[update_routine] Routine data before cleanup - exercises: %d",
+                len(routine_data.get("exercises", [])),
+            )
 
-                # Clean payload: remove index, title, folder_id, etc. for PUT
-                logger.debug(
-                    "[update_routine] Cleaning payload for PUT request (for_update=True)"
-                )
-                routine_data = self._prepare_routine_payload(
-                    routine_data, for_update=True
-                )
+            # Clean payload: remove index, title, folder_id, etc. for PUT
+            logger.debug(
+                "[update_routine] Cleaning payload for PUT request (for_update=True)"
+            )
+            routine_data = self._prepare_routine_payload(
+                routine_data, for_update=True
+            )
 
-                payload = {"routine": routine_data}
+            payload = {"routine": routine_data}
 
-                logger.debug(
-                    "[update_routine] Payload after cleanup - exercises: %d",
-                    len(payload["routine"].get("exercises", [])),
-                )
+            logger.debug(
+                "[update_routine] Payload after cleanup - exercises: %d",
+                len(payload["routine"].get("exercises", [])),
+            )
 
-                logger.info(
-                    "[update_routine] Sending payload for routine %s (exercises=%d)",
-                    routine_id,
-                    len(payload["routine"].get("exercises", [])),
-                )
+            logger.info(
+                "[update_routine] Sending payload for routine %s (exercises=%d)",
+                routine_id,
+                len(payload["routine"].get("exercises", [])),
+            )
 
-                response = await client.put(
-                    f"{self.BASE_URL}/routines/{routine_id}",
-                    headers={"api-key": api_key},
-                    json=payload,
-                    timeout=20.0,
-                )
+            response = await self.http.request(
+                "PUT",
+                f"{self.BASE_URL}/routines/{routine_id}",
+                api_key,
+                json=payload,
+                timeout=20.0,
+            )
 
-                logger.info("[update_routine] Status: %d", response.status_code)
+            logger.info("[update_routine] Status: %d", response.status_code)
 
-                if response.status_code == 200:
-                    data = response.json()
-                    routine_data = data.get("routine")
-                    if isinstance(routine_data, list) and routine_data:
-                        routine_data = routine_data[0]
+            if response.status_code == 200:
+                data = response.json()
+                routine_data = data.get("routine")
+                if isinstance(routine_data, list) and routine_data:
+                    routine_data = routine_data[0]
 
-                    if isinstance(routine_data, dict):
-                        self._routines_cache.pop(api_key, None)
-                        return HevyRoutine(**routine_data)
+                if isinstance(routine_data, dict):
+                    self._routines_cache.pop(api_key, None)
+                    return HevyRoutine(**routine_data)
 
-                # Detailed error logging
-                error_body = response.text
-                logger.error(
-                    "Hevy routine update failed: %d - Body: %s",
-                    response.status_code,
-                    error_body,
-                )
-                return None
-            except Exception as e:
-                logger.error(
-                    "Failed to update routine %s: %s", routine_id, e, exc_info=True
-                )
-                return None
+            # Detailed error logging
+            error_body = response.text
+            logger.error(
+                "Hevy routine update failed: %d - Body: %s",
+                response.status_code,
+                error_body,
+            )
+            return None
+        except Exception as e:
+            logger.error(
+                "Failed to update routine %s: %s", routine_id, e, exc_info=True
+            )
+            return None
 
     async def get_exercise_templates(
         self, api_key: str, page: int = 1, page_size: int = 20
@@ -715,68 +668,129 @@ class HevyService:
         """
         Fetches a paginated list of exercise templates from Hevy.
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.BASE_URL}/exercise_templates",
-                    headers={"api-key": api_key},
-                    params={"page": page, "pageSize": page_size},
-                    timeout=20.0,
-                )
-                if response.status_code == 200:
-                    return ExerciseTemplateListResponse(**response.json())
-                logger.warning(
-                    "Hevy API exercise templates returned %d", response.status_code
-                )
-                return None
-            except Exception as e:
-                logger.error("Failed to fetch exercise templates: %s", e)
-                return None
+        try:
+            response = await self.http.request(
+                "GET",
+                f"{self.BASE_URL}/exercise_templates",
+                api_key,
+                params={"page": page, "pageSize": page_size},
+                timeout=20.0,
+            )
+            if response.status_code == 200:
+                return ExerciseTemplateListResponse(**response.json())
+            logger.warning(
+                "Hevy API exercise templates returned %d", response.status_code
+            )
+            return None
+        except Exception as e:
+            logger.error("Failed to fetch exercise templates: %s", e)
+            return None
 
     async def get_all_exercise_templates(
         self, api_key: str
     ) -> list[HevyExerciseTemplate]:
         """
-        Fetches ALL exercise templates by iterating through all pages.
+        Returns ALL exercise templates of the account (cached, see get_exercise_catalog).
+        """
+        return (await self.get_exercise_catalog(api_key)).templates
+
+    async def get_exercise_catalog(self, api_key: str) -> HevyTemplateCatalog:
         """
-        import time
+        Returns the indexed exercise template catalog of an account.
 
+        Served from the in-process LRU, then from the copy shared by all
+        workers in Mongo; a stale copy is returned right away while a
+        background task refreshes it. Only a missing catalog is fetched inline.
+        """
+        key = catalog_key(api_key)
         now = time.time()
+        with self._template_catalogs_lock:
+            cached = self._template_catalogs.get(key)
+        if cached and now - cached[0] < self.CACHE_DURATION:
+            logger.debug("Returning %d exercise templates from memory cache", len(cached[1]))
+            return cached[1]
+
+        stored = None
+        if self.template_repository is not None:
+            try:
+                stored = await run_blocking(self.template_repository.get_catalog, key)
+            except Exception as e:
+                logger.warning("Failed to read shared Hevy template cache: %s", e)
+
+        if stored and stored.get("templates"):
+            fetched_at = stored["fetched_at"].replace(tzinfo=timezone.utc).timestamp()
+            catalog = HevyTemplateCatalog(
+                HevyExerciseTemplate(**template) for template in stored["templates"]
+            )
+            self._remember_catalog(key, fetched_at, catalog)
+            if now - fetched_at >= self.CACHE_DURATION:
+                self._schedule_catalog_refresh(api_key, key)
+            return catalog
 
-        # Check cache
-        if api_key in self._exercises_cache:
-            ts, templates = self._exercises_cache[api_key]
-            if now - ts < self.CACHE_DURATION:
-                logger.debug(
-                    "Returning %d exercise templates from memory cache", len(templates)
+        if cached:
+            self._schedule_catalog_refresh(api_key, key)
+            return cached[1]
+
+        logger.info("Fetching exercise templates from Hevy API (cache miss)")
+        return await self._refresh_catalog(api_key, key) or HevyTemplateCatalog([])
+
+    def _remember_catalog(
+        self, key: str, fetched_at: float, catalog: HevyTemplateCatalog
+    ) -> None:
+        with self._template_catalogs_lock:
+            self._template_catalogs[key] = (fetched_at, catalog)
+
+    def _schedule_catalog_refresh(self, api_key: str, key: str) -> None:
+        if key in self._catalog_refreshes:
+            return
+        task = asyncio.create_task(self._refresh_catalog(api_key, key))
+        self._catalog_refreshes[key] = task
+        task.add_done_callback(lambda _task: self._catalog_refreshes.pop(key, None))
+
+    async def _refresh_catalog(
+        self, api_key: str, key: str
+    ) -> Optional[HevyTemplateCatalog]:
+        """Crawls the catalog from Hevy and stores it; None when the crawl fails."""
+        templates = await self._fetch_all_exercise_templates(api_key)
+        if not templates:
+            return None
+        catalog = HevyTemplateCatalog(templates)
+        fetched_at = time.time()
+        if self.template_repository is not None:
+            try:
+                stored_at = await run_blocking(
+                    self.template_repository.save_catalog,
+                    key,
+                    [template.model_dump() for template in templates],
                 )
-                return templates
+                fetched_at = stored_at.timestamp()
+            except Exception as e:
+                logger.warning("Failed to store shared Hevy template cache: %s", e)
+        self._remember_catalog(key, fetched_at, catalog)
+        return catalog
 
+    async def _fetch_all_exercise_templates(
+        self, api_key: str
+    ) -> list[HevyExerciseTemplate]:
+        """Fetches every exercise template page from Hevy."""
         all_templates = []
-        page = 1
         page_size = 100
 
-        logger.info("Fetching exercise templates from Hevy API (cache miss or expired)")
         try:
-            while True:
-                resp = await self.get_exercise_templates(api_key, page, page_size)
-                if not resp or not resp.exercise_templates:
-                    break
-
-                all_templates.extend(resp.exercise_templates)
-                if page >= resp.page_count:
-                    break
-                page += 1
-
-            # Save to cache if successful
-            if all_templates:
-                self._exercises_cache[api_key] = (now, all_templates)
-
+            first = await self.get_exercise_templates(api_key, 1, page_size)
+            if first and first.exercise_templates:
+                all_templates.extend(first.exercise_templates)
+                # page_count is known now: fetch the rest concurrently.
+                pages = await gather_pages(
+                    lambda page: self.get_exercise_templates(api_key, page, page_size),
+                    range(2, first.page_count + 1),
+                    settings.HEVY_PAGE_CONCURRENCY,
+                )
+                for resp in pages:
+                    if not resp or not resp.exercise_templates:
+                        break
+                    all_templates.extend(resp.exercise_templates)
             return all_templates
         except Exception as e:
             logger.error("Error in get_all_exercise_templates: %s", e)
-            # Try to return expired cache if we have it
-            if api_key in self._exercises_cache:
-                _, templates = self._exercises_cache[api_key]
-                return templates
             return []
@@ -0,0 +1,107 @@
+"""
+Indexed view of a Hevy exercise template catalog.
+
+Resolution by id, normalized title or alias is a dict lookup; word search
+goes through a token index instead of scanning every template.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Any, Iterable
+
+_PARENTHETICAL = re.compile(r"\s*\([^)]*\)")
+
+
+def normalize_exercise_name(value: str | None) -> str:
+    """Lowercase with hyphens as spaces, the matching rule of the exercise search."""
+    return " ".join((value or "").lower().replace("-", " ").split())
+
+
+def _strip_accents(value: str) -> str:
+    return "".join(
+        char
+        for char in unicodedata.normalize("NFKD", value)
+        if not unicodedata.combining(char)
+    )
+
+
+def exercise_aliases(title: str | None) -> set[str]:
+    """Looser spellings a template should also resolve from."""
+    name = normalize_exercise_name(title)
+    base = normalize_exercise_name(_PARENTHETICAL.sub("", title or ""))
+    aliases = {_strip_accents(name), base, _strip_accents(base)}
+    aliases.discard(name)
+    aliases.discard("")
+    return aliases
+
+
+class HevyTemplateCatalog:
+    """Exercise templates of one Hevy account with lookup indexes."""
+
+    def __init__(self, templates: Iterable[Any]):
+        self.templates = list(templates)
+        self._by_id: dict[str, Any] = {}
+        self._by_name: dict[str, list[int]] = {}
+        self._by_alias: dict[str, int] = {}
+        self._by_token: dict[str, set[int]] = {}
+        self._by_muscle: dict[str, set[int]] = {}
+        for position, template in enumerate(self.templates):
+            self._by_id.setdefault(template.id, template)
+            name = normalize_exercise_name(template.title)
+            self._by_name.setdefault(name, []).append(position)
+            for alias in exercise_aliases(template.title):
+                self._by_alias.setdefault(alias, position)
+            for token in name.split():
+                self._by_token.setdefault(token, set()).add(position)
+            muscle = (template.primary_muscle_group or "").lower()
+            self._by_muscle.setdefault(muscle, set()).add(position)
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+    def get(self, template_id: str) -> Any | None:
+        """Template with this id, if any."""
+        return self._by_id.get(template_id)
+
+    def resolve(self, name: str | None) -> Any | None:
+        """Template whose title or alias matches ``name`` exactly."""
+        normalized = normalize_exercise_name(name)
+        positions = self._by_name.get(normalized)
+        if positions:
+            return self.templates[positions[0]]
+        for key in (normalized, _strip_accents(normalized)):
+            position = self._by_alias.get(key)
+            if position is not None:
+                return self.templates[position]
+        return None
+
+    def search(self, query: str) -> list[Any]:
+        """
+        Exact title matches first, then titles containing every word of the
+        query, in catalog order; falls back to the primary muscle group.
+        """
+        query = normalize_exercise_name(query)
+        exact = self._by_name.get(query, [])
+        matching: set[int] | None = None
+        for part in query.split():
+            # A space-free word is inside a title only if it is inside one token.
+            containing = set().union(
+                *(positions for token, positions in self._by_token.items() if part in token)
+            )
+            matching = containing if matching is None else matching & containing
+            if not matching:
+                break
+        if matching is None:
+            matching = set(range(len(self.templates)))
+
+        exact_set = set(exact)
+        positions = exact + sorted(matching - exact_set)
+        if not positions:
+            positions = sorted(
+                set().union(
+                    *(found for muscle, found in self._by_muscle.items() if query in muscle)
+                )
+            )
+        return [self.templates[position] for position in positions]
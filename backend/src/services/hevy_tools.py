@@ -121,39 +121,15 @@ def create_search_hevy_exercises_tool(hevy_service, database, user_email: str):
         if not profile or not profile.hevy_enabled or not profile.hevy_api_key:
             return "Integração desativada."
 
-        # Fetch ALL exercise templates to avoid missing data from first page only
-        all_templates = await hevy_service.get_all_exercise_templates(
-            profile.hevy_api_key
-        )
+        # Full catalog (cached and indexed) to avoid missing data from first page only
+        catalog = await hevy_service.get_exercise_catalog(profile.hevy_api_key)
 
-        if not all_templates:
+        if not catalog.templates:
             return "Nenhum exercício encontrado no catálogo do Hevy."
 
-        # logic: exact match first, then all words match
+        # logic: exact match first, then all words match, then muscle group
         query = query.lower().replace("-", " ")  # Basic normalization
-        parts = query.split()
-
-        exact_matches = [
-            ex for ex in all_templates if query == ex.title.lower().replace("-", " ")
-        ]
-        all_words_matches = [
-            ex
-            for ex in all_templates
-            if all(p in ex.title.lower().replace("-", " ") for p in parts)
-        ]
-
-        # Merge and remove duplicates (preserving order)
-        matches = exact_matches + [
-            m for m in all_words_matches if m not in exact_matches
-        ]
-
-        if not matches:
-            # Last resort: partial muscle match
-            matches = [
-                ex
-                for ex in all_templates
-                if query in (ex.primary_muscle_group or "").lower()
-            ]
+        matches = catalog.search(query)
 
         if not matches:
             return f"Nenhum exercício encontrado para '{query}'. Tente usar o nome em inglês ou termos parciais (Ex: 'Leg Press' em vez de 'Prensa')."
@@ -451,7 +427,7 @@ def create_replace_hevy_exercise_tool(hevy_service, database, user_email: str):
         Args:
             routine_title: Título da rotina (ex: "Pull", "Legs").
             old_exercise_name_or_id: Nome (fuzzy match) ou ID do exercício antigo a ser removido.
-            new_exercise_id: ID do novo exercício (template ID) que entrará no lugar.
+            new_exercise_id: ID do novo exercício (template ID) que entrará no lugar; o nome exato do catálogo também é aceito.
         """
         profile = database.get_user_profile(user_email)
         if not profile or not profile.hevy_enabled or not profile.hevy_api_key:
@@ -465,6 +441,17 @@ def create_replace_hevy_exercise_tool(hevy_service, database, user_email: str):
         )
 
         try:
+            # 0. Resolve the new template: an ID, or a title/alias from the catalog
+            catalog = await hevy_service.get_exercise_catalog(profile.hevy_api_key)
+            new_template = catalog.get(new_exercise_id) or catalog.resolve(new_exercise_id)
+            if new_template is not None:
+                new_exercise_id = new_template.id
+            elif len(catalog):
+                return (
+                    f"Exercício '{new_exercise_id}' não existe no catálogo do Hevy. "
+                    "Use `search_hevy_exercises` para obter o ID correto."
+                )
+
             # 1. Buscar a rotina
             all_routines = await _get_all_routines(hevy_service, profile.hevy_api_key)
             target_routine = _match_routine(all_routines, routine_title)
@@ -831,13 +818,14 @@ def create_set_routine_rest_and_ranges_tool(hevy_service, database, user_email:
 
 def create_trigger_hevy_import_tool(hevy_service, database, user_email: str):
     @tool
-    async def trigger_hevy_import(days_back: int = 7) -> str:
+    async def trigger_hevy_import(days_back: int | None = None) -> str:
         """
         Dispara a importação de treinos do Hevy para o sistema.
         Use esta ferramenta APENAS se a integração com o Hevy estiver ATIVA e o aluno pedir para sincronizar ou importar os treinos.
+        Por padrão sincroniza só o que mudou no Hevy desde a última sincronização (novos, editados e excluídos).
 
         Args:
-            days_back: Quantidade de dias para trás que os treinos devem ser buscados (padrão é 7).
+            days_back: Só se o aluno pedir explicitamente: reimporta os treinos dos últimos N dias.
         """
         profile = database.get_user_profile(user_email)
         if not profile or not profile.hevy_enabled or not profile.hevy_api_key:
@@ -846,23 +834,38 @@ def create_trigger_hevy_import_tool(hevy_service, database, user_email: str):
         try:
             from datetime import datetime, timezone, timedelta  # pylint: disable=import-outside-toplevel
 
-            from_date = datetime.now(timezone.utc) - timedelta(days=days_back)
-
             logger.info(
-                "[trigger_hevy_import] Starting import for user %s, %d days back",
+                "[trigger_hevy_import] Starting import for user %s, days_back=%s",
                 user_email,
                 days_back,
             )
 
-            result = await hevy_service.import_workouts(
-                user_email=user_email, api_key=profile.hevy_api_key, from_date=from_date
-            )
+            if days_back is not None:
+                result = await hevy_service.import_workouts(
+                    user_email=user_email,
+                    api_key=profile.hevy_api_key,
+                    from_date=datetime.now(timezone.utc) - timedelta(days=days_back),
+                )
+                fields = {"hevy_last_sync": datetime.now()}
+            else:
+                # First sync without a cursor covers the last week, as before.
+                result = await hevy_service.sync_workouts(
+                    profile, from_date=datetime.now(timezone.utc) - timedelta(days=7)
+                )
+                fields = {
+                    "hevy_last_sync": datetime.now(),
+                    "hevy_sync_cursor": result["cursor"],
+                }
+            database.update_user_profile_fields(user_email, fields)
 
             imported = result.get("imported", 0)
             skipped = result.get("skipped", 0)
             failed = result.get("failed", 0)
 
-            return f"A importação do Hevy foi concluída com sucesso! Detalhes:\n- {imported} novos treinos importados\n- {skipped} treinos ignorados (já existiam)\n- {failed} importações falharam."
+            message = f"A importação do Hevy foi concluída com sucesso! Detalhes:\n- {imported} novos treinos importados\n- {skipped} treinos ignorados (já existiam)\n- {failed} importações falharam."
+            if result.get("updated") or result.get("deleted"):
+                message += f"\n- {result.get('updated', 0)} treinos atualizados\n- {result.get('deleted', 0)} treinos removidos (excluídos no Hevy)"
+            return message
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error("[trigger_hevy_import] Error: %s", e, exc_info=True)
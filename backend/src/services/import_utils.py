@@ -1,23 +1,146 @@
 """
 Shared utilities for data import.
+
+Uploads are decoded and parsed as a stream: rows are folded into one
+aggregate per day as they arrive and the resulting logs are upserted in
+chunks. The file, its rows and the pending logs are never held whole; only
+the per-day aggregates (a few numbers each) and the day keys are kept for
+the whole import, so a day that shows up again can be merged and counted
+once.
 """
 
+import csv
+import io
+from typing import IO, Any, Callable, Iterable, Iterator, TypeVar
+
 from fastapi import UploadFile, HTTPException
+from pymongo.errors import BulkWriteError
+
+from src.api.models.import_result import ImportResult
 from src.core.logs import logger
 
+T = TypeVar("T")
 
-async def read_csv_file(file: UploadFile) -> str:
+BULK_CHUNK_SIZE = 500
+
+
+def open_csv_upload(file: UploadFile) -> IO[str]:
     """
-    Validates and reads a CSV file from an UploadFile.
+    Validates a CSV upload and returns a text stream decoding it as it is read.
+
+    The stream reads the spooled upload synchronously; consume it off the
+    event loop (``run_blocking``).
     """
     if not file.filename or not file.filename.endswith(".csv"):
         raise HTTPException(status_code=400, detail="O arquivo deve ser um CSV.")
 
     try:
-        content = await file.read()
-        return content.decode("utf-8")
+        file.file.seek(0)
+        return io.TextIOWrapper(file.file, encoding="utf-8", newline="")
     except Exception as e:
         logger.error("Error reading uploaded CSV file: %s", e)
         raise HTTPException(
             status_code=400, detail="Falha ao ler o arquivo CSV."
         ) from e
+
+
+def csv_dict_reader(source: str | IO[str]) -> csv.DictReader:
+    """DictReader over CSV text or a text stream."""
+    if isinstance(source, str):
+        # Handle both \n and \r\n line endings
+        source = io.StringIO(source, newline=None)
+    return csv.DictReader(source)
+
+
+def group_by_day(
+    rows: Iterable[tuple[str, Any]], merge: Callable[[T | None, Any], T]
+) -> Iterator[tuple[str, T]]:
+    """
+    Folds ``(day, row)`` pairs into one aggregate per day while streaming.
+
+    Exports list the rows of a day together, so a day is yielded as soon as
+    the next one starts. If a day shows up again later its rows are merged
+    into the earlier aggregate, which is yielded again so the last write
+    carries the whole day. Every finished aggregate is kept for that, so
+    memory grows with the number of days in the export (not with its rows).
+    """
+    finished: dict[str, T] = {}
+    current_day: str | None = None
+    current: T | None = None
+    for day, row in rows:
+        if day != current_day:
+            if current_day is not None:
+                finished[current_day] = current
+                yield current_day, current
+            current_day, current = day, finished.get(day)
+        current = merge(current, row)
+    if current_day is not None:
+        yield current_day, current
+
+
+def write_daily_logs(
+    days: Iterable[tuple[str, Any]],
+    to_log: Callable[[str, Any], Any],
+    save_logs: Callable[[list], tuple[int, int]],
+    error_prefix: str,
+    chunk_size: int | None = None,
+) -> ImportResult:
+    """
+    Converts streamed daily aggregates to logs and bulk upserts them in chunks.
+
+    ``save_logs`` returns ``(created, updated)``; a ``BulkWriteError`` is
+    reported per failed day from its details, any other failure fails the
+    whole chunk. At most ``chunk_size`` logs are pending at a time; the keys
+    of the days already written are kept to count rewritten days once.
+    """
+    chunk_size = chunk_size or BULK_CHUNK_SIZE
+    created = 0
+    updated = 0
+    error_messages: list[str] = []
+    seen: set[str] = set()
+    pending: dict[str, Any] = {}
+
+    def flush() -> None:
+        nonlocal created, updated
+        chunk_days = list(pending)
+        logs = list(pending.values())
+        pending.clear()
+        try:
+            chunk_created, chunk_updated = save_logs(logs)
+        except BulkWriteError as e:
+            chunk_created = e.details.get("nUpserted", 0)
+            chunk_updated = e.details.get("nMatched", 0)
+            for error in e.details.get("writeErrors", []):
+                error_messages.append(
+                    f"{error_prefix} {chunk_days[error['index']]}: {error.get('errmsg')}"
+                )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Failed to save %d imported logs: %s", len(logs), e)
+            chunk_created = chunk_updated = 0
+            error_messages.extend(f"{error_prefix} {day}: {str(e)}" for day in chunk_days)
+        created += chunk_created
+        updated += chunk_updated
+
+    for day, aggregate in days:
+        if day in seen and day not in pending:
+            # Rewritten with later rows: the earlier write was already counted.
+            updated -= 1
+        seen.add(day)
+        try:
+            pending[day] = to_log(day, aggregate)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            pending.pop(day, None)
+            error_messages.append(f"{error_prefix} {day}: {str(e)}")
+            continue
+        if len(pending) >= chunk_size:
+            flush()
+    if pending:
+        flush()
+
+    return ImportResult(
+        created=created,
+        updated=max(updated, 0),
+        errors=len(error_messages),
+        total_days=len(seen),
+        error_messages=error_messages,
+    )
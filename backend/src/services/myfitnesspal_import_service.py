@@ -3,15 +3,14 @@ This module provides services for importing nutrition data from MyFitnessPal CSV
 """
 
 import csv
-import io
-import logging
 from datetime import datetime
-from typing import Optional
+from typing import IO, Iterator, Optional
 from dataclasses import dataclass, field
 
 from src.api.models.nutrition_log import NutritionLog
 from src.api.models.import_result import ImportResult
 from src.services.database import MongoDatabase
+from src.services.import_utils import csv_dict_reader, group_by_day, write_daily_logs
 
 
 # CSV Column Mapping (Portuguese MyFitnessPal headers → internal names)
@@ -89,21 +88,59 @@ class DailyNutrition:
         )
 
 
-def parse_csv_content(file_content: str) -> dict[str, DailyNutrition]:
+def _meal_rows(reader: csv.DictReader) -> Iterator[tuple[str, tuple[datetime, dict]]]:
+    """Yields ``(date, (day, normalized row))`` for every dated CSV row."""
+    for row in reader:
+        # Normalize column names
+        normalized = {}
+        for orig_col, internal_name in COLUMN_MAPPING.items():
+            if orig_col in row:
+                normalized[internal_name] = row[orig_col]
+
+        date_str = (normalized.get("date") or "").strip()
+        if not date_str:
+            continue
+
+        # Parse date
+        try:
+            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+        except ValueError:
+            # Try explicit skip of malformed dates silently to avoid log spam
+            continue
+
+        yield date_str, (date_obj, normalized)
+
+
+def _add_meal(
+    daily: Optional[DailyNutrition], meal: tuple[datetime, dict]
+) -> DailyNutrition:
+    date_obj, normalized = meal
+    if daily is None:
+        daily = DailyNutrition(date=date_obj)
+    try:
+        daily.add_meal(normalized.get("meal", "Refeição"), normalized)
+    except (ValueError, TypeError):
+        # Skip rows with data type errors
+        pass
+    return daily
+
+
+def iter_daily_nutrition(
+    source: str | IO[str],
+) -> Iterator[tuple[str, DailyNutrition]]:
     """
-    Parse MyFitnessPal CSV content and aggregate by date.
+    Stream MyFitnessPal CSV rows aggregated per day.
 
     Args:
-        file_content: Raw CSV string content.
+        source: Raw CSV string content or a text stream over it.
 
     Returns:
-        Dictionary mapping date strings to DailyNutrition objects.
-    """
-    daily_data: dict[str, DailyNutrition] = {}
+        Iterator of ``(date string, DailyNutrition)``; see ``group_by_day``.
 
-    # Handle both \n and \r\n line endings
-    f = io.StringIO(file_content, newline=None)
-    reader = csv.DictReader(f)
+    Raises:
+        ValueError: If required columns are missing (checked eagerly).
+    """
+    reader = csv_dict_reader(source)
 
     # Validate required columns
     headers = reader.fieldnames or []
@@ -115,90 +152,48 @@ def parse_csv_content(file_content: str) -> dict[str, DailyNutrition]:
         )
         raise ValueError(error_msg)
 
-    for _, row in enumerate(reader, start=2):  # Start at 2 (header is 1)
-        try:
-            # Normalize column names
-            normalized = {}
-            for orig_col, internal_name in COLUMN_MAPPING.items():
-                if orig_col in row:
-                    normalized[internal_name] = row[orig_col]
-
-            date_str = normalized.get("date", "").strip()
-            if not date_str:
-                continue
-
-            # Parse date
-            try:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            except ValueError:
-                # Try explicit skip of malformed dates silently to avoid log spam
-                continue
-
-            # Get or create daily aggregation
-            if date_str not in daily_data:
-                daily_data[date_str] = DailyNutrition(date=date_obj)
-
-            meal_name = normalized.get("meal", "Refeição")
-            daily_data[date_str].add_meal(meal_name, normalized)
-
-        except (ValueError, TypeError):
-            # Skip rows with data type errors
-            continue
+    return group_by_day(_meal_rows(reader), _add_meal)
 
-    return daily_data
+
+def parse_csv_content(file_content: str) -> dict[str, DailyNutrition]:
+    """
+    Parse MyFitnessPal CSV content and aggregate by date.
+
+    Args:
+        file_content: Raw CSV string content.
+
+    Returns:
+        Dictionary mapping date strings to DailyNutrition objects.
+    """
+    return dict(iter_daily_nutrition(file_content))
 
 
 def import_nutrition_from_csv(
-    user_email: str, csv_content: str, db: MongoDatabase
+    user_email: str, csv_content: str | IO[str], db: MongoDatabase
 ) -> ImportResult:
     """
     Import nutrition data from MyFitnessPal CSV content.
 
+    Days are upserted in chunks while the CSV is still being read.
+
     Args:
         user_email: User's email address.
-        csv_content: Raw CSV string content.
+        csv_content: Raw CSV string content or a text stream over it.
         db: Database instance.
 
     Returns:
         ImportResult object with counts.
     """
     try:
-        daily_data = parse_csv_content(csv_content)
+        daily_data = iter_daily_nutrition(csv_content)
+        return write_daily_logs(
+            daily_data,
+            lambda _date_str, daily: daily.to_nutrition_log(user_email),
+            db.save_nutrition_logs,
+            error_prefix="Erro em",
+        )
     except ValueError as e:
         # Re-raise validation errors
         raise e
     except Exception as e:
         raise ValueError(f"Erro ao processar CSV: {str(e)}") from e
-
-    if not daily_data:
-        return ImportResult(created=0, updated=0, errors=0, total_days=0)
-
-    created = 0
-    updated = 0
-    errors = 0
-    error_messages = []
-
-    sorted_dates = sorted(daily_data.keys())
-
-    for date_str in sorted_dates:
-        daily = daily_data[date_str]
-        log = daily.to_nutrition_log(user_email)
-
-        try:
-            _, is_new = db.save_nutrition_log(log)
-            if is_new:
-                created += 1
-            else:
-                updated += 1
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            logging.error("Failed to save nutrition log for %s: %s", date_str, e)
-            errors += 1
-            error_messages.append(f"Erro em {date_str}: {str(e)}")
-
-    return ImportResult(
-        created=created,
-        updated=updated,
-        errors=errors,
-        total_days=len(daily_data),
-        error_messages=error_messages,
-    )
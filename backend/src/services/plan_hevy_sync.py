@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from src.api.models.plan import (
@@ -17,7 +19,11 @@ from src.api.models.routine import (
     HevyRoutineExercise,
     HevySet,
 )
+from src.core.blocking import run_blocking
+from src.core.config import settings
+from src.core.deps import run_in_transient_loop
 from src.services.hevy_service import HevyService
+from src.services.hevy_templates import HevyTemplateCatalog
 
 
 class HevySyncError(ValueError):
@@ -46,38 +52,59 @@ def _exercise_note(exercise: TrainingExercise) -> str | None:
     return " | ".join(parts)
 
 
+def _matches_current_exercise(
+    exercise: TrainingExercise, current_exercises: list, index: int
+) -> bool:
+    if index >= len(current_exercises):
+        return False
+    current_title = _normalize_name(getattr(current_exercises[index], "title", None))
+    return current_title == _normalize_name(exercise.name)
+
+
+def _needs_catalog(routine: TrainingRoutine, current_exercises: list) -> bool:
+    return any(
+        not exercise.external_exercise_template_id
+        and not _matches_current_exercise(exercise, current_exercises, index)
+        for index, exercise in enumerate(routine.exercises)
+    )
+
+
 def _resolve_exercise_template_id(
     exercise: TrainingExercise,
     current_exercises: list,
     index: int,
+    catalog: HevyTemplateCatalog | None = None,
 ) -> str:
     if exercise.external_exercise_template_id:
         return exercise.external_exercise_template_id
 
+    if _matches_current_exercise(exercise, current_exercises, index):
+        return current_exercises[index].exercise_template_id
+
+    template = catalog.resolve(exercise.name) if catalog is not None else None
+    if template is not None:
+        return template.id
+
     if index >= len(current_exercises):
         raise HevySyncError(
             "Rotina vinculada ao Hevy exige external_exercise_template_id "
             f"para o exercicio '{exercise.name}'."
         )
-
-    current_exercise = current_exercises[index]
-    current_title = _normalize_name(getattr(current_exercise, "title", None))
-    exercise_name = _normalize_name(exercise.name)
-    if current_title != exercise_name:
-        raise HevySyncError(
-            "Nao foi possivel mapear os exercicios da rotina vinculada ao Hevy. "
-            "Inclua external_exercise_template_id ou mantenha o mesmo exercicio na mesma ordem."
-        )
-
-    return current_exercise.exercise_template_id
+    raise HevySyncError(
+        "Nao foi possivel mapear os exercicios da rotina vinculada ao Hevy. "
+        "Inclua external_exercise_template_id ou mantenha o mesmo exercicio na mesma ordem."
+    )
 
 
 def _build_hevy_exercise(
     exercise: TrainingExercise,
     current_exercises: list,
     index: int,
+    catalog: HevyTemplateCatalog | None = None,
 ) -> tuple[HevyRoutineExercise, str]:
-    template_id = _resolve_exercise_template_id(exercise, current_exercises, index)
+    template_id = _resolve_exercise_template_id(
+        exercise, current_exercises, index, catalog
+    )
     hevy_sets = [
         HevySet(
             type="normal",
@@ -102,6 +129,7 @@ def _build_hevy_exercise(
 def _build_hevy_routine_payload(
     routine: TrainingRoutine,
     current_hevy_routine: HevyRoutine,
+    catalog: HevyTemplateCatalog | None = None,
 ) -> tuple[HevyRoutine, list[TrainingExercise]]:
     current_exercises = list(current_hevy_routine.exercises)
     synced_exercises: list[HevyRoutineExercise] = []
@@ -109,7 +137,7 @@ def _build_hevy_routine_payload(
 
     for index, exercise in enumerate(routine.exercises):
         synced_exercise, template_id = _build_hevy_exercise(
-            exercise, current_exercises, index
+            exercise, current_exercises, index, catalog
         )
         synced_exercises.append(synced_exercise)
         enriched_plan_exercises.append(
@@ -144,9 +172,15 @@ async def _sync_one_bound_routine(
             f"'{binding.external_routine_id}' no Hevy."
         )
 
+    # Exercises without a template id or a positional match resolve by name.
+    catalog = None
+    if _needs_catalog(routine, list(current_hevy_routine.exercises)):
+        catalog = await hevy_service.get_exercise_catalog(api_key)
+
     hevy_payload, enriched_exercises = _build_hevy_routine_payload(
         routine,
         current_hevy_routine,
+        catalog,
     )
     synced_hevy_routine = await hevy_service.update_routine(
         api_key,
@@ -185,13 +219,69 @@ async def _sync_one_bound_routine(
     )
 
 
-async def _sync_training_with_hevy_async(
+async def _sync_bound_routine(
+    hevy_service: HevyService,
+    api_key: str,
+    routine: TrainingRoutine,
+    semaphore: asyncio.Semaphore,
+) -> TrainingRoutine:
+    # Bindings of one routine build on each other and stay sequential.
+    async with semaphore:
+        synced_routine = routine
+        for binding in _get_hevy_bindings(routine):
+            synced_routine = await _sync_one_bound_routine(
+                hevy_service=hevy_service,
+                api_key=api_key,
+                routine=synced_routine,
+                binding=binding,
+            )
+        return synced_routine
+
+
+async def _sync_bound_routines(
+    hevy_service: HevyService, api_key: str, routines: list[TrainingRoutine]
+) -> list[TrainingRoutine]:
+    """Pushes the bound routines concurrently; returns the list with them synced."""
+    semaphore = asyncio.Semaphore(max(1, settings.HEVY_ROUTINE_SYNC_CONCURRENCY))
+    bound_positions = [
+        position for position, routine in enumerate(routines) if _has_hevy_binding(routine)
+    ]
+    results = await asyncio.gather(
+        *(
+            _sync_bound_routine(hevy_service, api_key, routines[position], semaphore)
+            for position in bound_positions
+        ),
+        return_exceptions=True,
+    )
+
+    synced_routines = list(routines)
+    failures: list[str] = []
+    for position, result in zip(bound_positions, results):
+        if isinstance(result, HevySyncError):
+            failures.append(str(result))
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            synced_routines[position] = result
+    if failures:
+        raise HevySyncError(" ".join(failures))
+    return synced_routines
+
+
+async def sync_training_with_hevy(
     database,
     user_email: str,
     current_plan: UserPlan,
     updated_plan: UserPlan,
 ) -> UserPlan:
-    profile = database.get_user_profile(user_email)
+    """
+    Synchronize bound training routines with Hevy before saving the active plan.
+
+    Bound routines are pushed concurrently (at most
+    ``HEVY_ROUTINE_SYNC_CONCURRENCY`` at a time). The plan is only returned when
+    every routine synced; otherwise one ``HevySyncError`` lists each failure.
+    """
+    profile = await run_blocking(database.get_user_profile, user_email)
     if not profile or not profile.hevy_enabled or not profile.hevy_api_key:
         return updated_plan
 
@@ -212,26 +302,13 @@ async def _sync_training_with_hevy_async(
     if not any(_has_hevy_binding(routine) for routine in updated_plan.training.routines):
         return updated_plan
 
-    hevy_service = HevyService(workout_repository=database.workouts_repo)
-    synced_routines: list[TrainingRoutine] = []
-
-    for routine in updated_plan.training.routines:
-        bindings = _get_hevy_bindings(routine)
-        if not bindings:
-            synced_routines.append(routine)
-            continue
-
-        synced_routine = routine
-        for binding in bindings:
-            synced_routine = await _sync_one_bound_routine(
-                hevy_service=hevy_service,
-                api_key=profile.hevy_api_key,
-                routine=synced_routine,
-                binding=binding,
-            )
-
-        synced_routines.append(synced_routine)
-
+    hevy_service = HevyService(
+        workout_repository=database.workouts_repo,
+        template_repository=getattr(database, "hevy_templates", None),
+    )
+    synced_routines = await _sync_bound_routines(
+        hevy_service, profile.hevy_api_key, updated_plan.training.routines
+    )
     updated_training = updated_plan.training.model_copy(
         update={"routines": synced_routines}
     )
@@ -244,23 +321,24 @@ def sync_training_with_hevy_if_needed(
     current_plan: UserPlan,
     updated_plan: UserPlan,
 ) -> UserPlan:
-    """Synchronize bound training routines with Hevy before saving the active plan."""
-
-    async def runner() -> UserPlan:
-        return await _sync_training_with_hevy_async(
-            database=database,
-            user_email=user_email,
-            current_plan=current_plan,
-            updated_plan=updated_plan,
-        )
-
+    """
+    Blocking variant of ``sync_training_with_hevy`` for synchronous callers.
+
+    Async code must await ``sync_training_with_hevy`` instead. When called on a
+    thread whose event loop is running, the sync runs on a helper thread with
+    its own loop rather than nesting loops. Clients opened for that loop are
+    closed with it.
+    """
+    sync = functools.partial(
+        sync_training_with_hevy,
+        database=database,
+        user_email=user_email,
+        current_plan=current_plan,
+        updated_plan=updated_plan,
+    )
     try:
-        return asyncio.run(runner())
+        asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import nest_asyncio  # type: ignore # pylint: disable=import-error,import-outside-toplevel
-
-            nest_asyncio.apply()
-            return loop.run_until_complete(runner())
-        return loop.run_until_complete(runner())
+        return run_in_transient_loop(sync)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_in_transient_loop, sync).result()
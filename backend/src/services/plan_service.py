@@ -388,10 +388,22 @@ def _build_weekly_schedule(plan: UserPlan) -> list[WeeklyScheduleView]:
 
 def build_progress_snapshot(plan: UserPlan, database) -> PlanProgressSnapshot:
     """Compute a pragmatic progress snapshot from the data already stored."""
-    workouts = database.get_workout_logs(plan.user_email, limit=30)
-    nutrition_stats = database.get_nutrition_stats(plan.user_email)
-    weight_logs = database.get_weight_logs(plan.user_email, limit=30)
+    return build_progress_snapshot_from_data(
+        plan,
+        workouts=database.get_workout_logs(plan.user_email, limit=30),
+        nutrition_stats=database.get_nutrition_stats(plan.user_email),
+        weight_logs=database.get_weight_logs(plan.user_email, limit=30),
+    )
+
 
+def build_progress_snapshot_from_data(
+    plan: UserPlan,
+    *,
+    workouts: list,
+    nutrition_stats,
+    weight_logs: list,
+) -> PlanProgressSnapshot:
+    """Same as build_progress_snapshot, for callers that already loaded the data."""
     if workouts:
         training_metric = ProgressMetric(
             status="on_track" if len(workouts) >= 1 else "insufficient_data",
@@ -0,0 +1,123 @@
+"""
+Buffered background writer for LLM prompt logs.
+
+Chat turns hand their run log to ``submit``, which only appends to an
+in-memory buffer. A daemon thread flushes the buffer to Mongo in batches
+every ``flush_interval`` seconds (or as soon as ``batch_size`` entries are
+waiting), so logging never adds Mongo latency to a turn. Prompt logs are
+debugging data: if Mongo is down the buffer is capped at ``max_pending``
+entries and the oldest are dropped.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from src.core.logs import logger
+from src.repositories.prompt_repository import PromptRepository
+
+
+@dataclass(frozen=True)
+class PromptLogWriterOptions:
+    """Retention, batching and buffering settings of a ``PromptLogWriter``."""
+
+    max_logs: int
+    flush_interval: float = 1.0
+    batch_size: int = 200
+    max_pending: int = 10_000
+
+
+class _PendingLogs:
+    """Bounded buffer of log entries; the oldest are dropped when it is full."""
+
+    def __init__(self, max_pending: int):
+        self.entries: deque[tuple[str, dict]] = deque(maxlen=max(1, max_pending))
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def append(self, item: tuple[str, dict]) -> None:
+        """Buffers an entry, counting the one it pushes out."""
+        if len(self.entries) == self.entries.maxlen:
+            self.dropped += 1
+        self.entries.append(item)
+
+    def take(self, count: int) -> list[tuple[str, dict]]:
+        """Removes and returns up to ``count`` of the oldest entries."""
+        return [self.entries.popleft() for _ in range(min(count, len(self.entries)))]
+
+
+class PromptLogWriter:
+    """Batches prompt log writes on a background thread."""
+
+    def __init__(self, repository: PromptRepository, options: PromptLogWriterOptions):
+        self.repository = repository
+        self.options = options
+        self._pending = _PendingLogs(options.max_pending)
+        self._wakeup = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    @property
+    def dropped(self) -> int:
+        """Entries dropped because the buffer was full."""
+        return self._pending.dropped
+
+    def submit(self, user_email: str, prompt_data: dict) -> None:
+        """Queues a prompt log; the entry (and its timestamp) is built now."""
+        entry = PromptRepository._build_log_entry(  # pylint: disable=protected-access
+            user_email, prompt_data
+        )
+        with self._wakeup:
+            self._pending.append((user_email, entry))
+            if self._closed:
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="prompt-log-writer", daemon=True
+                )
+                self._thread.start()
+            if len(self._pending) >= self.options.batch_size:
+                self._wakeup.notify()
+
+    def flush(self) -> None:
+        """Writes everything buffered so far on the calling thread."""
+        while True:
+            with self._wakeup:
+                batch = self._pending.take(self.options.batch_size)
+            if not batch:
+                return
+            self._write(batch)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stops the background thread after a final flush."""
+        with self._wakeup:
+            self._closed = True
+            self._wakeup.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self.flush()
+
+    def _write(self, batch: list[tuple[str, dict]]) -> None:
+        with self._write_lock:
+            try:
+                self.repository.write_batch(batch, self.options.max_logs)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("Failed to write %d prompt logs: %s", len(batch), e)
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                if not self._closed and len(self._pending) < self.options.batch_size:
+                    self._wakeup.wait(self.options.flush_interval)
+                closed = self._closed
+            self.flush()
+            if closed:
+                if self.dropped:
+                    logger.warning("Dropped %d prompt logs while Mongo lagged", self.dropped)
+                return
@@ -0,0 +1,227 @@
+"""
+Array-backed engine for the Adaptive TDEE trend and observation pipeline.
+
+The v3 pipeline works on one value per calendar day. Here every series is a
+dense float64 array indexed by day offset from ``DailySeries.start`` and
+missing days are NaN, so interpolation, the EMA filters and the rolling
+7-day calorie windows run as vector operations instead of per-day loops over
+``date``-keyed dicts. Results match the dict-based reference methods on
+``AdaptiveTDEEService`` within floating point tolerance.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Iterable
+
+import numpy as np
+
+from src.api.models.nutrition_log import NutritionLog
+from src.api.models.weight_log import WeightLog
+
+OBSERVATION_WINDOW_DAYS = 7
+MIN_KNOWN_WINDOW_DAYS = 4
+MIN_TREND_DAYS = 8
+MIN_OBSERVATION_KCAL = 500
+MAX_OBSERVATION_KCAL = 5000
+
+# The closed-form EMA divides by decay**k inside a block; capping that factor
+# keeps the rounding error of each block around 1e-12 relative.
+_MAX_EMA_BLOCK_GROWTH = 1e4
+
+
+@dataclass(frozen=True)
+class DailySeries:
+    """Dense per-day values starting at ``start`` (NaN marks a missing day)."""
+
+    start: date
+    values: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def end(self) -> date:
+        """Last calendar day covered by the series."""
+        return self.start + timedelta(days=len(self.values) - 1)
+
+    def index_of(self, day: date) -> int:
+        """Day offset of ``day`` relative to the series start."""
+        return (day - self.start).days
+
+    def dates(self) -> list[date]:
+        """Calendar days covered by the series, in order."""
+        return [self.start + timedelta(days=i) for i in range(len(self.values))]
+
+
+def _as_date(value: date | datetime) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _last_weight_per_day(weight_logs: list[WeightLog]) -> tuple[np.ndarray, np.ndarray]:
+    """Day ordinals and weights in date order, keeping the last log of each day."""
+    sorted_logs = sorted(weight_logs, key=lambda log: log.date)
+    ordinals = np.fromiter(
+        (log.date.toordinal() for log in sorted_logs), dtype=np.int64
+    )
+    weights = np.fromiter((log.weight_kg for log in sorted_logs), dtype=np.float64)
+
+    keep = np.append(ordinals[1:] != ordinals[:-1], True)
+    return ordinals[keep], weights[keep]
+
+
+def interpolate_weights(
+    weight_logs: list[WeightLog], max_gap_days: int
+) -> DailySeries | None:
+    """
+    Fills every day between the first and last weigh-in.
+
+    Gaps up to ``max_gap_days`` are interpolated linearly; longer gaps carry
+    the previous weight forward. When a day has several logs the last one in
+    date order wins, like ``AdaptiveTDEEService.interpolate_weight_gaps``.
+    """
+    if not weight_logs:
+        return None
+
+    ordinals, weights = _last_weight_per_day(weight_logs)
+    days = np.arange(ordinals[0], ordinals[-1] + 1)
+    prev_idx = np.searchsorted(ordinals, days, side="right") - 1
+    next_idx = np.minimum(prev_idx + 1, len(ordinals) - 1)
+
+    prev_weight = weights[prev_idx]
+    gap = ordinals[next_idx] - ordinals[prev_idx]
+    offset = days - ordinals[prev_idx]
+    interpolate = (offset > 0) & (gap <= max_gap_days)
+
+    safe_gap = np.where(gap > 0, gap, 1)
+    daily_change = (weights[next_idx] - prev_weight) / safe_gap
+    values = np.where(interpolate, prev_weight + daily_change * offset, prev_weight)
+
+    return DailySeries(date.fromordinal(int(ordinals[0])), values)
+
+
+def ema_filter(values: np.ndarray, alpha: float, initial: float) -> np.ndarray:
+    """
+    Runs ``y[n] = alpha * x[n] + (1 - alpha) * y[n-1]`` with ``y[-1] = initial``.
+
+    The recursion is solved in closed form per block:
+    ``y[j] = d**(j+1) * (y_prev + alpha * cumsum(x[k] / d**(k+1)))`` where
+    ``d = 1 - alpha``, so each block is a handful of vector operations.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.empty_like(values)
+    if values.size == 0:
+        return out
+
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[:] = values
+        return out
+
+    block = int(np.log(_MAX_EMA_BLOCK_GROWTH) / -np.log(decay)) if decay < 1 else 1
+    block = max(1, min(block, len(values)))
+    powers = decay ** np.arange(1, block + 1)
+
+    previous = float(initial)
+    for start in range(0, len(values), block):
+        chunk = values[start : start + block]
+        scale = powers[: len(chunk)]
+        smoothed = scale * (previous + alpha * np.cumsum(chunk / scale))
+        out[start : start + len(chunk)] = smoothed
+        previous = float(smoothed[-1])
+    return out
+
+
+def daily_trend(weights: DailySeries, span: int) -> np.ndarray:
+    """EMA trend of a dense weight series, seeded with the first weight."""
+    if len(weights) == 0:
+        return np.empty(0)
+    return ema_filter(weights.values, 2 / (span + 1), weights.values[0])
+
+
+def calories_on_days(
+    series: DailySeries, nutrition_logs: Iterable[NutritionLog]
+) -> np.ndarray:
+    """Calories aligned to the days of ``series`` (NaN where nothing was logged)."""
+    calories = np.full(len(series), np.nan)
+    for log in nutrition_logs:
+        idx = series.index_of(_as_date(log.date))
+        if 0 <= idx < len(series):
+            calories[idx] = log.calories
+    return calories
+
+
+def _window_sums(
+    calories: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Logged calories and logged day count of each ``[start, end]`` window."""
+    known = ~np.isnan(calories)
+    kcal_sums = np.concatenate(([0.0], np.cumsum(np.where(known, calories, 0.0))))
+    day_counts = np.concatenate(([0], np.cumsum(known)))
+    return (
+        kcal_sums[ends + 1] - kcal_sums[starts],
+        day_counts[ends + 1] - day_counts[starts],
+    )
+
+
+def _window_average(
+    window_kcal: np.ndarray,
+    window_days: np.ndarray,
+    daily_target_fallback: float | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Average daily calories of each window and whether it was imputed."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        actual_avg = window_kcal / window_days
+    if not daily_target_fallback:
+        return actual_avg, np.zeros(len(window_kcal), dtype=bool)
+
+    imputing = (window_days > 0) & (window_days < OBSERVATION_WINDOW_DAYS)
+    imputed = actual_avg * 0.7 + daily_target_fallback * 0.3
+    with np.errstate(invalid="ignore"):
+        imputed_avg = (
+            window_kcal + (OBSERVATION_WINDOW_DAYS - window_days) * imputed
+        ) / OBSERVATION_WINDOW_DAYS
+    return np.where(imputing, imputed_avg, actual_avg), imputing
+
+
+def window_observations(
+    trend: np.ndarray,
+    calories: np.ndarray,
+    energy_per_kg: float,
+    daily_target_fallback: float | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized ``compute_tdee_observations`` over rolling 7-day windows.
+
+    Returns the day offsets that produced a valid observation and the
+    observed TDEE for each. Windows with 1-6 logged days are imputed from
+    ``0.7 * actual_avg + 0.3 * fallback`` when a fallback target exists;
+    otherwise at least 4 logged days are required.
+    """
+    empty = (np.empty(0, dtype=np.int64), np.empty(0))
+    n = len(trend)
+    if n < MIN_TREND_DAYS or not np.any(~np.isnan(calories)):
+        return empty
+
+    ends = np.arange(OBSERVATION_WINDOW_DAYS - 1, n)
+    starts = ends - (OBSERVATION_WINDOW_DAYS - 1)
+    window_kcal, window_days = _window_sums(calories, starts, ends)
+    avg_calories, imputing = _window_average(
+        window_kcal, window_days, daily_target_fallback
+    )
+
+    daily_trend_change = (trend[ends] - trend[starts]) / OBSERVATION_WINDOW_DAYS
+    with np.errstate(invalid="ignore"):
+        observed = avg_calories - daily_trend_change * energy_per_kg
+        valid = (imputing | (window_days >= MIN_KNOWN_WINDOW_DAYS)) & (
+            (observed >= MIN_OBSERVATION_KCAL) & (observed <= MAX_OBSERVATION_KCAL)
+        )
+    return ends[valid], observed[valid]
+
+
+def smooth_observations(
+    observed: np.ndarray, prior_tdee: float, span: int
+) -> float:
+    """Final value of the observation EMA anchored on ``prior_tdee``."""
+    if observed.size == 0:
+        return prior_tdee
+    return float(ema_filter(observed, 2 / (span + 1), prior_tdee)[-1])
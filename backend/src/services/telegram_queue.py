@@ -0,0 +1,147 @@
+"""
+Background processing of Telegram webhook updates.
+
+The webhook only persists the update and returns; an in-process worker pool
+runs the bot logic afterwards. Updates of one chat are handled strictly in
+arrival order, while different chats run concurrently up to
+``TELEGRAM_WORKER_CONCURRENCY`` so a burst of Telegram messages cannot take
+over the event loop and the LLM capacity needed by app users.
+
+Queued updates live in Mongo until handled, so updates accepted right before
+a restart are picked up again by ``recover`` on the next startup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections import deque
+from typing import Any
+
+from src.core.blocking import run_blocking
+from src.core.logs import logger
+from src.repositories.telegram_repository import TelegramRepository
+
+_CHAT_UPDATE_KEYS = ("message", "edited_message", "channel_post", "edited_channel_post")
+
+
+def update_chat_id(update_data: dict) -> int | None:
+    """Return the chat an update belongs to, without a full Update parse."""
+    for key in _CHAT_UPDATE_KEYS:
+        chat = (update_data.get(key) or {}).get("chat") or {}
+        if chat.get("id") is not None:
+            return int(chat["id"])
+    return None
+
+
+class TelegramUpdateQueue:
+    """Per-chat ordered, concurrency-capped worker pool for Telegram updates."""
+
+    def __init__(
+        self,
+        service: Any,
+        repository: TelegramRepository,
+        max_concurrency: int,
+        lease_seconds: int,
+    ):
+        self.service = service
+        self.repository = repository
+        self.lease_seconds = lease_seconds
+        self.worker_id = uuid.uuid4().hex
+        self._slots = asyncio.Semaphore(max(1, max_concurrency))
+        self._chats: dict[int, deque[dict]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, update_data: dict) -> bool:
+        """
+        Persist an incoming update and schedule it.
+        Returns False for duplicates (Telegram retries) and updates without a chat.
+        """
+        update_id = update_data.get("update_id")
+        chat_id = update_chat_id(update_data)
+        if update_id is None or chat_id is None:
+            return False
+        accepted = await run_blocking(
+            self.repository.enqueue_update, update_id, chat_id, update_data
+        )
+        if not accepted:
+            logger.info("Ignoring duplicate Telegram update: %s", update_id)
+            return False
+        self._schedule({"update_id": update_id, "chat_id": chat_id, "payload": update_data})
+        return True
+
+    async def recover(self) -> int:
+        """Schedule updates left in the queue by a previous process."""
+        queued = await run_blocking(self.repository.get_queued_updates, self.lease_seconds)
+        for item in queued:
+            self._schedule(item)
+        if queued:
+            logger.info("Resuming %d queued Telegram updates", len(queued))
+        return len(queued)
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """
+        Wait briefly for in-flight updates, then cancel the rest.
+        Cancelled updates stay queued and are resumed on the next startup.
+        """
+        tasks = list(self._tasks)
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def _schedule(self, item: dict) -> None:
+        chat_id = item["chat_id"]
+        backlog = self._chats.get(chat_id)
+        if backlog is not None:
+            # A worker is already draining this chat; it picks the update up in order.
+            backlog.append(item)
+            return
+        self._chats[chat_id] = deque([item])
+        task = asyncio.create_task(self._drain(chat_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _drain(self, chat_id: int) -> None:
+        backlog = self._chats[chat_id]
+        while backlog:
+            item = backlog[0]
+            try:
+                await self._process(item)
+            except asyncio.CancelledError:
+                # Shutdown: the rest of the backlog stays queued in Mongo.
+                del self._chats[chat_id]
+                raise
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # Queue bookkeeping failed; the update stays queued in Mongo
+                # and is resumed by ``recover`` on the next startup.
+                logger.error(
+                    "Telegram update %s could not be handled: %s", item["update_id"], exc
+                )
+            backlog.popleft()
+        del self._chats[chat_id]
+
+    async def _process(self, item: dict) -> None:
+        update_id = item["update_id"]
+        async with self._slots:
+            claimed = await run_blocking(
+                self.repository.claim_update,
+                update_id,
+                self.worker_id,
+                self.lease_seconds,
+            )
+            if not claimed:
+                # Another worker resumed it after a restart.
+                return
+            try:
+                await self.service.process_update(item["payload"])
+            except asyncio.CancelledError:
+                # Shutdown: hand the update back so the next startup resumes it.
+                await run_blocking(self.repository.release_update, update_id)
+                raise
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # Not retried: the turn may already have written or replied.
+                logger.error("Telegram update %s failed: %s", update_id, exc)
+            await run_blocking(self.repository.complete_update, update_id)
@@ -7,6 +7,7 @@ from telegram import Update, Bot
 from telegram.constants import ParseMode
 from telegram.error import TelegramError
 
+from src.core.blocking import run_blocking
 from src.core.logs import logger
 from src.core.subscription import can_use_image_input
 from src.repositories.telegram_repository import TelegramRepository
@@ -24,16 +25,14 @@ class TelegramBotService:
         self.repository = repository
         self.brain = brain
 
-    async def handle_update(self, update_data: dict) -> None:
-        """Process incoming Telegram update."""
+    async def process_update(self, update_data: dict) -> None:
+        """
+        Process an update already deduplicated by the webhook queue.
+        """
         # pylint: disable=no-member
-        update = Update.de_json(update_data, self.bot)
-
-        # 0. Check for duplicate update_id (Telegram retries)
-        if not self.repository.try_record_update(update.update_id):
-            logger.info("Ignoring duplicate Telegram update: %s", update.update_id)
-            return
+        await self._dispatch(Update.de_json(update_data, self.bot))
 
+    async def _dispatch(self, update: Update) -> None:
         if not update.message or not update.effective_chat:
             return
 
@@ -82,7 +81,9 @@ class TelegramBotService:
             return
 
         code = parts[1].strip().upper()
-        user_email = self.repository.validate_and_consume_code(code, chat_id, username)
+        user_email = await run_blocking(
+            self.repository.validate_and_consume_code, code, chat_id, username
+        )
 
         if user_email:
             await self.bot.send_message(
@@ -100,9 +101,9 @@ class TelegramBotService:
 
     async def _handle_desvincular(self, chat_id: int) -> None:
         """Handle /desvincular command."""
-        link = self.repository.get_link_by_chat_id(chat_id)
+        link = await run_blocking(self.repository.get_link_by_chat_id, chat_id)
         if link:
-            self.repository.delete_link(link.user_email)
+            await run_blocking(self.repository.delete_link, link.user_email)
             await self.bot.send_message(
                 chat_id=chat_id,
                 text="✅ Conta desvinculada. Use /vincular para conectar novamente.",
@@ -114,7 +115,7 @@ class TelegramBotService:
 
     async def _handle_message(self, chat_id: int, text: str, photo=None) -> None:
         """Handle regular message - forward to AI."""
-        link = self.repository.get_link_by_chat_id(chat_id)
+        link = await run_blocking(self.repository.get_link_by_chat_id, chat_id)
 
         if not link:
             await self.bot.send_message(
@@ -125,7 +126,7 @@ class TelegramBotService:
 
         image_payloads = None
         if photo:
-            profile = self.brain.get_user_profile(link.user_email)
+            profile = await run_blocking(self.brain.get_user_profile, link.user_email)
             if not can_use_image_input(getattr(profile, "subscription_plan", None)):
                 await self.bot.send_message(
                     chat_id=chat_id,
@@ -154,8 +155,7 @@ class TelegramBotService:
         )
 
         try:
-            # Call AI (synchronous version)
-            response = self.brain.send_message_sync(
+            response = await self.brain.send_message_async(
                 user_email=link.user_email,
                 user_input=text,
                 is_telegram=True,
@@ -3,19 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import re
 import unicodedata
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from bson import ObjectId
 from fastapi import BackgroundTasks, HTTPException
 
 from src.api.models.chat_history import ChatHistory
 from src.api.models.sender import Sender
 from src.api.models.trainer_profile import TrainerProfile
 from src.api.models.user_profile import UserProfile
+from src.core.blocking import run_blocking
 from src.core.config import settings
+from src.core.deps import run_in_transient_loop
 from src.core.logs import logger
 from src.core.subscription import SUBSCRIPTION_PLANS, SubscriptionPlan
 from src.services.ai_chat.runner import ChatTurnRunner
@@ -45,6 +49,7 @@ class AITrainerBrain:  # pylint: disable=too-many-public-methods
         database: MongoDatabase,
         llm_client=None,  # kept for dependency-construction compatibility
         qdrant_client=None,
+        async_database_factory=None,
     ):
         _ = llm_client
         self._database = database
@@ -52,6 +57,7 @@ class AITrainerBrain:  # pylint: disable=too-many-public-methods
         self._runner = ChatTurnRunner(
             database=database,
             qdrant_client=qdrant_client,
+            async_database_factory=async_database_factory,
         )
 
     @property
@@ -185,6 +191,18 @@ class AITrainerBrain:  # pylint: disable=too-many-public-methods
     ) -> list[ChatHistory]:
         """Return public chat history with legacy wrappers removed."""
         messages = self._database.get_chat_history(session_id, limit, offset)
+        return self._normalize_public_history(messages)
+
+    def get_chat_history_page(
+        self, session_id: str, limit: int = 20, before: ObjectId | None = None
+    ) -> tuple[list[ChatHistory], ObjectId | None]:
+        """Return a page of public chat history older than ``before`` and the next anchor."""
+        messages, next_before = self._database.get_chat_history_page(
+            session_id, limit, before
+        )
+        return self._normalize_public_history(messages), next_before
+
+    def _normalize_public_history(self, messages: list[ChatHistory]) -> list[ChatHistory]:
         for message in messages:
             if message.sender == Sender.TRAINER:
                 message.text = self.normalize_public_chat_text(message.text)
@@ -320,6 +338,27 @@ class AITrainerBrain:  # pylint: disable=too-many-public-methods
         ):
             yield chunk
 
+    async def send_message_async(
+        self,
+        user_email: str,
+        user_input: str,
+        is_telegram: bool = False,
+        image_payloads: list[dict[str, str]] | None = None,
+    ) -> str:
+        """Run one chat turn and return the final reply text (used by Telegram)."""
+        response = ""
+        async for chunk in self.send_message_ai(
+            user_email=user_email,
+            user_input=user_input,
+            background_tasks=None,
+            message_options={
+                "is_telegram": is_telegram,
+                "image_payloads": image_payloads,
+            },
+        ):
+            response = _apply_sse_frame(response, chunk)
+        return response
+
     def send_message_sync(
         self,
         user_email: str,
@@ -327,26 +366,17 @@ class AITrainerBrain:  # pylint: disable=too-many-public-methods
         is_telegram: bool = False,
         image_payloads: list[dict[str, str]] | None = None,
     ) -> str:
-        """Synchronous wrapper used by Telegram."""
-
-        async def collect_response() -> str:
-            response_parts: list[str] = []
-            async for chunk in self.send_message_ai(
-                user_email=user_email,
-                user_input=user_input,
-                background_tasks=None,
-                message_options={
-                    "is_telegram": is_telegram,
-                    "image_payloads": image_payloads,
-                },
-            ):
-                parsed = _parse_sse_delta_or_done(chunk)
-                if parsed:
-                    response_parts.append(parsed)
-            return "".join(response_parts)
+        """Synchronous wrapper for callers without an event loop."""
+        collect_response = functools.partial(
+            self.send_message_async,
+            user_email=user_email,
+            user_input=user_input,
+            is_telegram=is_telegram,
+            image_payloads=image_payloads,
+        )
 
         try:
-            return asyncio.run(collect_response())
+            return run_in_transient_loop(collect_response)
         except RuntimeError:
             loop = asyncio.get_event_loop()
             if loop.is_running():
@@ -357,7 +387,7 @@ class AITrainerBrain:  # pylint: disable=too-many-public-methods
 
     async def analyze_workout_async(self, user_email: str, workout_summary: str) -> str:
         """Generate a chat-based workout analysis."""
-        response_parts: list[str] = []
+        response = ""
         async for chunk in self.send_message_ai(
             user_email=user_email,
             user_input=(
@@ -367,10 +397,7 @@ class AITrainerBrain:  # pylint: disable=too-many-public-methods
             background_tasks=None,
             message_options={"is_telegram": False},
         ):
-            parsed = _parse_sse_delta_or_done(chunk)
-            if parsed:
-                response_parts.append(parsed)
-        response = "".join(response_parts)
+            response = _apply_sse_frame(response, chunk)
         self._database.log_prompt(
             user_email,
             {
@@ -412,7 +439,8 @@ class AITrainerBrain:  # pylint: disable=too-many-public-methods
         """Return paginated memories from Qdrant."""
         if self._qdrant_client is None:
             return [], 0
-        return paginate_memories(
+        return await run_blocking(
+            paginate_memories,
             user_id,
             page,
             page_size,
@@ -429,7 +457,8 @@ class AITrainerBrain:  # pylint: disable=too-many-public-methods
         """Add a memory to Qdrant."""
         if self._qdrant_client is None:
             raise HTTPException(status_code=500, detail="Qdrant not initialized")
-        return service_add_memory(
+        return await run_blocking(
+            service_add_memory,
             user_id=user_id,
             memory_data={"text": text, "translations": translations},
             qdrant_client=self._qdrant_client,
@@ -437,10 +466,15 @@ class AITrainerBrain:  # pylint: disable=too-many-public-methods
         )
 
 
-def _parse_sse_delta_or_done(chunk: str) -> str:
-    """Extract visible text from one SSE frame."""
+def _apply_sse_frame(response: str, chunk: str) -> str:
+    """
+    Return the reply text after one SSE frame.
+
+    Deltas extend the text; ``replace`` and ``done`` carry the full final
+    reply and win over what was streamed; ``error`` discards partial text.
+    """
     if not isinstance(chunk, str) or not chunk.startswith("event:"):
-        return chunk if isinstance(chunk, str) else ""
+        return response + chunk if isinstance(chunk, str) else response
     event_name = ""
     data = ""
     for line in chunk.splitlines():
@@ -448,10 +482,15 @@ def _parse_sse_delta_or_done(chunk: str) -> str:
             event_name = line.split(":", 1)[1].strip()
         elif line.startswith("data:"):
             data = line.split(":", 1)[1].strip()
-    if event_name != "delta" or not data:
+    if event_name == "error":
         return ""
+    if event_name not in {"delta", "replace", "done"} or not data:
+        return response
     try:
         payload = json.loads(data)
     except ValueError:
-        return ""
-    return str(payload.get("text") or "")
+        return response
+    text = str(payload.get("text") or "")
+    if event_name == "delta":
+        return response + text
+    return text or response
@@ -2,14 +2,13 @@
 This module provides services for importing weight data from Zepp Life CSV exports.
 """
 
-import csv
-import io
 import logging
 from datetime import datetime
-from typing import Dict, Any, cast
+from typing import IO, Dict, Any, Iterator, cast
 from src.api.models.weight_log import WeightLog
 from src.api.models.import_result import ImportResult
 from src.services.database import MongoDatabase
+from src.services.import_utils import csv_dict_reader, group_by_day, write_daily_logs
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +26,8 @@ COLUMN_MAPPING = {
 }
 
 
-def _process_csv_row(
-    row: Dict[str, str], daily_data: Dict[str, Dict[str, float | int]]
-) -> None:
-    """Helper function to process a single CSV row."""
+def _parse_csv_row(row: Dict[str, str]) -> tuple[str, Dict[str, float | int]] | None:
+    """Helper function to parse a single CSV row into ``(date, data)``."""
     date_str = None
     data: Dict[str, float | int] = {}
 
@@ -52,14 +49,18 @@ def _process_csv_row(
                     continue
 
     if not date_str or "weight_kg" not in data:
-        return
+        return None
+    return date_str, data
 
+
+def _prefer_entry(
+    existing: Dict[str, float | int] | None, data: Dict[str, float | int]
+) -> Dict[str, float | int]:
     # Logic: If we already have data for this day, should we overwrite?
     # Yes, assume latest in file (or latest time) is most accurate/final.
     # However, if current row has missing composition data (nulls),
     # but existing data HAS composition, keep existing composition.
-
-    existing = daily_data.get(date_str, {})
+    existing = existing or {}
 
     # Check if current row has composition data (using body_fat_pct as proxy)
     has_comp = "body_fat_pct" in data
@@ -67,97 +68,91 @@ def _process_csv_row(
 
     if has_comp or not existing_has_comp:
         # Overwrite if we have better data, or if we just want to update weight
-        daily_data[date_str] = data
+        return data
+    return existing
 
 
-def parse_zepp_life_csv(file_content: str) -> Dict[str, Dict[str, float | int]]:
+def _weighings(reader) -> Iterator[tuple[str, Dict[str, float | int]]]:
+    for row_num, row in enumerate(reader, start=2):
+        try:
+            parsed = _parse_csv_row(row)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Error processing row %d: %s", row_num, e)
+            continue
+        if parsed is not None:
+            yield parsed
+
+
+def iter_daily_weights(
+    source: str | IO[str],
+) -> Iterator[tuple[str, Dict[str, float | int]]]:
     """
-    Parse Zepp Life CSV content and aggregate by date.
+    Stream Zepp Life CSV rows aggregated per day.
     Keeps the last entry for each day, prioritizing entries with body composition data.
 
     Args:
-        file_content: Raw CSV string content.
+        source: Raw CSV string content or a text stream over it.
 
     Returns:
-        Dict mapping date string (YYYY-MM-DD) to log data dict.
+        Iterator of ``(date string, log data dict)``; see ``group_by_day``.
     """
-    daily_data: Dict[str, Dict[str, float | int]] = {}
-
-    # Handle both \n and \r\n line endings
-    f = io.StringIO(file_content, newline=None)
+    reader = csv_dict_reader(source)
 
     # Strip potential BOM or whitespace from fieldnames if present
-    reader = csv.DictReader(f)
     if reader.fieldnames:
         reader.fieldnames = [
             name.strip().lstrip("\ufeff") for name in reader.fieldnames
         ]
 
-    for row_num, row in enumerate(reader, start=2):
-        try:
-            _process_csv_row(row, daily_data)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            logger.warning("Error processing row %d: %s", row_num, e)
-            continue
+    return group_by_day(_weighings(reader), _prefer_entry)
+
+
+def parse_zepp_life_csv(file_content: str) -> Dict[str, Dict[str, float | int]]:
+    """
+    Parse Zepp Life CSV content and aggregate by date.
+    Keeps the last entry for each day, prioritizing entries with body composition data.
+
+    Args:
+        file_content: Raw CSV string content.
+
+    Returns:
+        Dict mapping date string (YYYY-MM-DD) to log data dict.
+    """
+    return dict(iter_daily_weights(file_content))
+
 
-    return daily_data
+def _to_weight_log(user_email: str, date_str: str, data: Dict[str, float | int]) -> WeightLog:
+    return WeightLog(
+        user_email=user_email,
+        date=datetime.strptime(date_str, "%Y-%m-%d").date(),
+        source="zepp_life_import",
+        **cast(Dict[str, Any], data),
+    )
 
 
 def import_zepp_life_data(
-    user_email: str, csv_content: str, db: MongoDatabase
+    user_email: str, csv_content: str | IO[str], db: MongoDatabase
 ) -> ImportResult:
     # pylint: disable=duplicate-code
     """
     Import weight/body composition data from Zepp Life CSV content.
 
+    Days are upserted in chunks while the CSV is still being read.
+
     Args:
         user_email: User's email address.
-        csv_content: Raw CSV string content.
+        csv_content: Raw CSV string content or a text stream over it.
         db: Database instance.
 
     Returns:
         ImportResult object with counts.
     """
     try:
-        daily_data = parse_zepp_life_csv(csv_content)
+        return write_daily_logs(
+            iter_daily_weights(csv_content),
+            lambda date_str, data: _to_weight_log(user_email, date_str, data),
+            db.save_weight_logs,
+            error_prefix="Error on",
+        )
     except Exception as e:
         raise ValueError(f"Error parsing CSV: {str(e)}") from e
-
-    if not daily_data:
-        return ImportResult(created=0, updated=0, errors=0, total_days=0)
-
-    created = 0
-    updated = 0
-    errors = 0
-    error_messages = []
-
-    for date_str in sorted(daily_data.keys()):
-        data = daily_data[date_str]
-
-        try:
-            log_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-
-            log = WeightLog(
-                user_email=user_email,
-                date=log_date,
-                source="zepp_life_import",
-                **cast(Dict[str, Any], data),
-            )
-
-            _, is_new = db.save_weight_log(log)
-            if is_new:
-                created += 1
-            else:
-                updated += 1
-
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            errors += 1
-            error_messages.append(f"Error on {date_str}: {str(e)}")
-
-    return ImportResult(
-        created=created,
-        updated=updated,
-        errors=errors,
-        total_days=len(daily_data),
-        error_messages=error_messages,
-    )
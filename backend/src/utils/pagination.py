@@ -1,8 +1,86 @@
 """
 Pagination utilities.
+
+List endpoints accept either a page number (``skip``/``limit``, kept for
+compatibility) or an opaque cursor. A cursor encodes the sort key and
+``_id`` of the last item served, so the next page is an index range read
+that costs the same however deep it is.
 """
 
+import base64
+from datetime import date, datetime
+from typing import Any
+
+import bson
+from bson import ObjectId
+from bson.errors import BSONError
+
+
+class InvalidCursorError(ValueError):
+    """Raised for a pagination cursor that was not issued by this API."""
+
 
 def calculate_total_pages(total: int, page_size: int) -> int:
     """Calculates total pages for pagination."""
     return (total + page_size - 1) // page_size if total > 0 else 0
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encodes keyset values (datetimes and ObjectIds included) as a URL-safe token."""
+    raw = bson.encode({"k": list(values)})
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decodes a token from ``encode_cursor``; raises InvalidCursorError when malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = bson.decode(raw)["k"]
+    except (BSONError, KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+    if not isinstance(values, list):
+        raise InvalidCursorError("Invalid pagination cursor")
+    return values
+
+
+def keyset_cursor(doc: dict, sort_field: str | None = "date") -> str:
+    """
+    Cursor continuing after ``doc``.
+
+    Accepts raw documents and the serialized ones the list endpoints build
+    (``id`` as a string, dates converted to ``date``).
+    """
+    doc_id = doc.get("_id", doc.get("id"))
+    if isinstance(doc_id, str) and ObjectId.is_valid(doc_id):
+        doc_id = ObjectId(doc_id)
+    if sort_field is None:
+        return encode_cursor(doc_id)
+    value = doc.get(sort_field)
+    if isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    return encode_cursor(value, doc_id)
+
+
+def next_page_cursor(
+    items: list[dict], has_more: bool, sort_field: str | None = "date"
+) -> str | None:
+    """Cursor for the page after ``items``, or None on the last page."""
+    return keyset_cursor(items[-1], sort_field) if has_more and items else None
+
+
+def keyset_filter(
+    after: list[Any], sort_field: str | None = "date", direction: int = -1
+) -> dict:
+    """Query matching the documents after a decoded cursor in sort order."""
+    op = "$lt" if direction < 0 else "$gt"
+    if sort_field is None and len(after) == 1:
+        return {"_id": {op: after[0]}}
+    if sort_field is None or len(after) != 2:
+        raise InvalidCursorError("Invalid pagination cursor")
+    value, doc_id = after
+    return {
+        "$or": [
+            {sort_field: {op: value}},
+            {sort_field: value, "_id": {op: doc_id}},
+        ]
+    }
@@ -1,3 +1,4 @@
+import asyncio
 import warnings
 import pytest
 import unittest
@@ -14,6 +15,11 @@ warnings.filterwarnings("ignore", message=".*migrating_memory.*")
 warnings.filterwarnings("ignore", message=".*_UnionGenericAlias.*")
 
 from src.core import deps  # noqa: E402
+from src.core.chat_history_cache import shared_chat_history_cache  # noqa: E402
+from src.core.profile_cache import (  # noqa: E402
+    shared_trainer_profile_cache,
+    shared_user_profile_cache,
+)
 
 @pytest.fixture(scope="session", autouse=True)
 def cleanup_resources():
@@ -32,11 +38,63 @@ def mock_dependencies():
     """
     with unittest.mock.patch("src.core.deps.get_mongo_database") as mock_db, \
          unittest.mock.patch("src.core.deps.get_qdrant_client") as mock_qdrant, \
-         unittest.mock.patch("pymongo.MongoClient") as mock_mongo:
+         unittest.mock.patch("pymongo.MongoClient") as mock_mongo, \
+         unittest.mock.patch("src.core.deps.get_async_mongo_database") as mock_async_db:
 
         # Configure mocks to provide safe mocks that don't connect.
         mock_db.return_value = unittest.mock.MagicMock()
+        mock_async_db.return_value = unittest.mock.MagicMock()
         mock_qdrant.return_value = unittest.mock.MagicMock()
         mock_mongo.return_value = unittest.mock.MagicMock()
         
         yield
+
+    # Facades built in a test share the process-wide caches.
+    for cache in (
+        shared_chat_history_cache(),
+        shared_user_profile_cache(),
+        shared_trainer_profile_cache(),
+    ):
+        if cache is not None:
+            cache.clear()
+
+
+class EventLoopBlockingMonitor:
+    """
+    Measures how late a periodic tick fires while the enclosed code runs.
+
+    Any synchronous call executed on the event loop delays the tick, so
+    ``max_lag_ms`` is the longest stretch the loop was blocked.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.max_lag_ms = 0.0
+        self._task = None
+
+    async def _tick(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag_ms = (loop.time() - expected) * 1000
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._tick())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *_exc):
+        await asyncio.sleep(self.interval * 2)
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+@pytest.fixture
+def loop_blocking_monitor():
+    """Factory for an async context manager that reports event-loop blocking."""
+    return EventLoopBlockingMonitor
@@ -156,6 +156,9 @@ class StatefulMessageDb:
     def get_chat_history(self, user_id: str, limit: int = 20, offset: int = 0):
         return self.chat.get_history(user_id, limit, offset)
 
+    def get_chat_history_page(self, user_id: str, limit: int = 20, before=None):
+        return self.chat.get_history_page(user_id, limit, before)
+
     def add_many_to_history(
         self,
         chat_histories: list[ChatHistory],
@@ -204,6 +207,9 @@ class StatefulMessageBrain:
     def get_chat_history(self, user_email: str, limit: int = 20, offset: int = 0):
         return self.database.get_chat_history(user_email, limit, offset)
 
+    def get_chat_history_page(self, user_email: str, limit: int = 20, before=None):
+        return self.database.get_chat_history_page(user_email, limit, before)
+
     async def send_message_ai(
         self,
         user_email: str,
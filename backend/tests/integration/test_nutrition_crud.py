@@ -30,6 +30,12 @@ class FakeReplaceResult:
         self.matched_count = matched_count
 
 
+class FakeBulkWriteResult:
+    def __init__(self, upserted_count: int, matched_count: int) -> None:
+        self.upserted_count = upserted_count
+        self.matched_count = matched_count
+
+
 class FakeDeleteResult:
     def __init__(self, deleted_count: int) -> None:
         self.deleted_count = deleted_count
@@ -140,6 +146,16 @@ class FakeCollection:
     def count_documents(self, query: dict) -> int:
         return len([doc for doc in self.docs if self._matches(doc, query)])
 
+    def bulk_write(self, operations: list, ordered: bool = True) -> FakeBulkWriteResult:
+        upserted = matched = 0
+        for operation in operations:
+            result = self.update_one(operation._filter, operation._doc, upsert=operation._upsert)
+            if result.upserted_id is not None:
+                upserted += 1
+            else:
+                matched += 1
+        return FakeBulkWriteResult(upserted, matched)
+
 
 class FakeDatabase:
     def __init__(self) -> None:
@@ -160,6 +176,9 @@ class StatefulNutritionDb:
     def save_nutrition_log(self, log):
         return self.nutrition.save_log(log)
 
+    def save_nutrition_logs(self, logs):
+        return self.nutrition.save_logs(logs)
+
     def update_nutrition_log(self, log_id: str, user_email: str, log):
         return self.nutrition.update_log(log_id, user_email, log)
 
@@ -1,6 +1,6 @@
 from copy import deepcopy
 from datetime import date, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from bson import ObjectId
 from fastapi.testclient import TestClient
@@ -636,8 +636,8 @@ def test_patch_plan_training_preserves_review_reason_and_updates_advanced_fields
 
     try:
         with patch(
-            "src.api.endpoints.plan.sync_training_with_hevy_if_needed",
-            side_effect=lambda **kwargs: kwargs["updated_plan"],
+            "src.api.endpoints.plan.sync_training_with_hevy",
+            new=AsyncMock(side_effect=lambda **kwargs: kwargs["updated_plan"]),
         ):
             response = client.patch("/plan/section", json=payload)
         assert response.status_code == 200
@@ -1154,8 +1154,8 @@ def test_plan_training_section_stateful_preserves_review_reason_and_advanced_fie
         }
 
         with patch(
-            "src.api.endpoints.plan.sync_training_with_hevy_if_needed",
-            side_effect=lambda **kwargs: kwargs["updated_plan"],
+            "src.api.endpoints.plan.sync_training_with_hevy",
+            new=AsyncMock(side_effect=lambda **kwargs: kwargs["updated_plan"]),
         ):
             response = client.patch("/plan/section", json=payload)
 
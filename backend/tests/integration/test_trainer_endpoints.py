@@ -40,7 +40,7 @@ class FakeCollection:
                 original = deepcopy(doc)
                 for key, value in update.get("$set", {}).items():
                     doc[key] = deepcopy(value)
-                for key in update.get("$inc", {}).items():
+                for key, value in update.get("$inc", {}).items():
                     doc[key] = doc.get(key, 0) + value
                 for key in update.get("$unset", {}):
                     doc.pop(key, None)
@@ -50,7 +50,12 @@ class FakeCollection:
 
         if upsert:
             inserted_id = ObjectId()
-            new_doc = {"_id": inserted_id, **deepcopy(query), **deepcopy(update.get("$set", {}))}
+            new_doc = {
+                "_id": inserted_id,
+                **deepcopy(query),
+                **deepcopy(update.get("$set", {})),
+                **deepcopy(update.get("$inc", {})),
+            }
             self.docs.append(new_doc)
             return FakeUpdateResult(upserted_id=inserted_id, modified_count=0)
 
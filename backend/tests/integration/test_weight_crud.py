@@ -29,6 +29,12 @@ class FakeReplaceResult:
         self.matched_count = matched_count
 
 
+class FakeBulkWriteResult:
+    def __init__(self, upserted_count: int, matched_count: int) -> None:
+        self.upserted_count = upserted_count
+        self.matched_count = matched_count
+
+
 class FakeDeleteResult:
     def __init__(self, deleted_count: int) -> None:
         self.deleted_count = deleted_count
@@ -127,6 +133,16 @@ class FakeCollection:
     def count_documents(self, query: dict) -> int:
         return len([doc for doc in self.docs if self._matches(doc, query)])
 
+    def bulk_write(self, operations: list, ordered: bool = True) -> FakeBulkWriteResult:
+        upserted = matched = 0
+        for operation in operations:
+            result = self.update_one(operation._filter, operation._doc, upsert=operation._upsert)
+            if result.upserted_id is not None:
+                upserted += 1
+            else:
+                matched += 1
+        return FakeBulkWriteResult(upserted, matched)
+
 
 class FakeDatabase:
     def __init__(self) -> None:
@@ -145,6 +161,9 @@ class StatefulWeightDb:
     def save_weight_log(self, log: WeightLog):
         return self.weight.save_log(log)
 
+    def save_weight_logs(self, logs):
+        return self.weight.save_logs(logs)
+
     def get_weight_paginated(self, user_email: str, page: int = 1, page_size: int = 10):
         return self.weight.get_paginated(user_email, page, page_size)
 
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock
 
@@ -37,8 +39,13 @@ from src.services.plan_service import (
     merge_plan_section,
     missing_discovery_fields,
 )
-from src.api.models.routine import HevyRoutine, HevyRoutineExercise
-from src.services.plan_hevy_sync import HevySyncError, sync_training_with_hevy_if_needed
+from src.api.models.routine import HevyExerciseTemplate, HevyRoutine, HevyRoutineExercise
+from src.services.hevy_templates import HevyTemplateCatalog
+from src.services.plan_hevy_sync import (
+    HevySyncError,
+    sync_training_with_hevy,
+    sync_training_with_hevy_if_needed,
+)
 
 
 def make_create_input() -> PlanCreateInput:
@@ -455,6 +462,71 @@ def test_sync_training_with_hevy_updates_bound_routine_and_enriches_exercise_ids
     )
 
 
+def test_sync_training_with_hevy_resolves_new_exercises_from_template_catalog(monkeypatch):
+    current_plan = build_plan_from_create_input("user@test.com", make_create_input())
+    bound_routine = current_plan.training.routines[0].model_copy(
+        update={
+            "external_bindings": [
+                ExternalRoutineBinding(provider="hevy", external_routine_id="hevy_routine_1")
+            ]
+        }
+    )
+    current_plan = current_plan.model_copy(
+        update={
+            "training": current_plan.training.model_copy(update={"routines": [bound_routine]})
+        }
+    )
+    first = bound_routine.exercises[0]
+    added = first.model_copy(update={"name": "Leg Press", "external_exercise_template_id": None})
+    updated_plan = current_plan.model_copy(
+        update={
+            "training": current_plan.training.model_copy(
+                update={
+                    "routines": [bound_routine.model_copy(update={"exercises": [first, added]})]
+                }
+            )
+        }
+    )
+
+    database = MagicMock()
+    database.get_user_profile.return_value = MagicMock(hevy_enabled=True, hevy_api_key="key")
+    current_hevy_routine = HevyRoutine(
+        id="hevy_routine_1",
+        title="Upper A",
+        exercises=[
+            HevyRoutineExercise(
+                exercise_template_id="tpl_supino", title=first.name, sets=[]
+            )
+        ],
+    )
+    hevy_service = MagicMock()
+    hevy_service.get_routine_by_id = AsyncMock(return_value=current_hevy_routine)
+    hevy_service.update_routine = AsyncMock(return_value=current_hevy_routine)
+    hevy_service.get_exercise_catalog = AsyncMock(
+        return_value=HevyTemplateCatalog(
+            [HevyExerciseTemplate(id="tpl_leg_press", title="Leg Press (Machine)", type="weight_reps")]
+        )
+    )
+    monkeypatch.setattr(
+        "src.services.plan_hevy_sync.HevyService",
+        MagicMock(return_value=hevy_service),
+    )
+
+    synced_plan = sync_training_with_hevy_if_needed(
+        database=database,
+        user_email="user@test.com",
+        current_plan=current_plan,
+        updated_plan=updated_plan,
+    )
+
+    template_ids = [
+        exercise.external_exercise_template_id
+        for exercise in synced_plan.training.routines[0].exercises
+    ]
+    assert template_ids == ["tpl_supino", "tpl_leg_press"]
+    hevy_service.get_exercise_catalog.assert_awaited_once_with("key")
+
+
 def test_sync_training_with_hevy_raises_when_bound_routine_removed():
     current_plan = build_plan_from_create_input("user@test.com", make_create_input())
     base_routine = current_plan.training.routines[0]
@@ -497,3 +569,122 @@ def test_sync_training_with_hevy_raises_when_bound_routine_removed():
             current_plan=current_plan,
             updated_plan=updated_plan,
         )
+
+
+def _plan_with_bound_routines(count: int):
+    plan = build_plan_from_create_input("user@test.com", make_create_input())
+    base_routine = plan.training.routines[0]
+    routines = [
+        base_routine.model_copy(
+            update={
+                "id": f"routine_{index}",
+                "name": f"Rotina {index}",
+                "external_bindings": [
+                    ExternalRoutineBinding(provider="hevy", external_routine_id=f"hevy_{index}")
+                ],
+            }
+        )
+        for index in range(count)
+    ]
+    return plan.model_copy(
+        update={"training": plan.training.model_copy(update={"routines": routines})}
+    )
+
+
+def _delayed_hevy_service(delay: float, failing: set[str] = frozenset()):
+    in_flight = {"now": 0, "max": 0}
+
+    async def get_routine_by_id(_api_key, routine_id):
+        return HevyRoutine(id=routine_id, title=routine_id, exercises=[])
+
+    async def update_routine(_api_key, routine_id, _payload):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(delay)
+        in_flight["now"] -= 1
+        if routine_id in failing:
+            return None
+        return HevyRoutine(id=routine_id, title=f"Synced {routine_id}", exercises=[])
+
+    hevy_service = MagicMock()
+    hevy_service.get_routine_by_id = AsyncMock(side_effect=get_routine_by_id)
+    hevy_service.update_routine = AsyncMock(side_effect=update_routine)
+    hevy_service.get_exercise_catalog = AsyncMock(
+        return_value=HevyTemplateCatalog(
+            [HevyExerciseTemplate(id="tpl_supino", title="Supino Reto", type="weight_reps")]
+        )
+    )
+    return hevy_service, in_flight
+
+
+@pytest.mark.asyncio
+async def test_sync_training_with_hevy_pushes_bound_routines_concurrently(monkeypatch):
+    plan = _plan_with_bound_routines(6)
+    database = MagicMock()
+    database.get_user_profile.return_value = MagicMock(hevy_enabled=True, hevy_api_key="key")
+    hevy_service, in_flight = _delayed_hevy_service(delay=0.05)
+    monkeypatch.setattr(
+        "src.services.plan_hevy_sync.HevyService", MagicMock(return_value=hevy_service)
+    )
+    monkeypatch.setattr(
+        "src.services.plan_hevy_sync.settings", MagicMock(HEVY_ROUTINE_SYNC_CONCURRENCY=3)
+    )
+
+    started = time.perf_counter()
+    synced_plan = await sync_training_with_hevy(
+        database=database,
+        user_email="user@test.com",
+        current_plan=plan,
+        updated_plan=plan,
+    )
+    elapsed = time.perf_counter() - started
+
+    assert [routine.name for routine in synced_plan.training.routines] == [
+        f"Synced hevy_{index}" for index in range(6)
+    ]
+    assert in_flight["max"] == 3
+    assert elapsed < 6 * 0.05
+
+
+@pytest.mark.asyncio
+async def test_sync_training_with_hevy_reports_every_failed_routine(monkeypatch):
+    plan = _plan_with_bound_routines(4)
+    database = MagicMock()
+    database.get_user_profile.return_value = MagicMock(hevy_enabled=True, hevy_api_key="key")
+    hevy_service, _ = _delayed_hevy_service(delay=0, failing={"hevy_1", "hevy_3"})
+    monkeypatch.setattr(
+        "src.services.plan_hevy_sync.HevyService", MagicMock(return_value=hevy_service)
+    )
+
+    with pytest.raises(HevySyncError) as exc_info:
+        await sync_training_with_hevy(
+            database=database,
+            user_email="user@test.com",
+            current_plan=plan,
+            updated_plan=plan,
+        )
+
+    assert "'Rotina 1'" in str(exc_info.value)
+    assert "'Rotina 3'" in str(exc_info.value)
+    assert "'Rotina 0'" not in str(exc_info.value)
+    assert hevy_service.update_routine.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_sync_training_with_hevy_if_needed_runs_inside_a_running_loop(monkeypatch):
+    plan = _plan_with_bound_routines(1)
+    database = MagicMock()
+    database.get_user_profile.return_value = MagicMock(hevy_enabled=True, hevy_api_key="key")
+    hevy_service, _ = _delayed_hevy_service(delay=0)
+    monkeypatch.setattr(
+        "src.services.plan_hevy_sync.HevyService", MagicMock(return_value=hevy_service)
+    )
+
+    synced_plan = sync_training_with_hevy_if_needed(
+        database=database,
+        user_email="user@test.com",
+        current_plan=plan,
+        updated_plan=plan,
+    )
+
+    assert synced_plan.training.routines[0].name == "Synced hevy_0"
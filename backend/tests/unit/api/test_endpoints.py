@@ -351,7 +351,7 @@ class TestEndpoints(unittest.TestCase):
         # Arrange
         app.dependency_overrides[verify_token] = lambda: "test@test.com"
         mock_brain = MagicMock()
-        mock_brain.get_chat_history.return_value = []
+        mock_brain.get_chat_history_page.return_value = ([], None)
         app.dependency_overrides[get_ai_trainer_brain] = lambda: mock_brain
 
         # Act
@@ -371,14 +371,17 @@ class TestEndpoints(unittest.TestCase):
         # Arrange
         app.dependency_overrides[verify_token] = lambda: "test@test.com"
         mock_brain = MagicMock()
-        mock_brain.get_chat_history.return_value = [
-            ChatHistory(
-                text="Hello", sender=Sender.STUDENT, timestamp="2023-01-01T12:00:00"
-            ),
-            ChatHistory(
-                text="Hi there!", sender=Sender.TRAINER, timestamp="2023-01-01T12:00:01"
-            ),
-        ]
+        mock_brain.get_chat_history_page.return_value = (
+            [
+                ChatHistory(
+                    text="Hello", sender=Sender.STUDENT, timestamp="2023-01-01T12:00:00"
+                ),
+                ChatHistory(
+                    text="Hi there!", sender=Sender.TRAINER, timestamp="2023-01-01T12:00:01"
+                ),
+            ],
+            None,
+        )
         app.dependency_overrides[get_ai_trainer_brain] = lambda: mock_brain
 
         # Act
@@ -1,7 +1,7 @@
 """Tests for Hevy integration endpoints."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, AsyncMock
 from fastapi.testclient import TestClient
 from src.api.main import app
@@ -359,6 +359,56 @@ class TestHevyImport:
         mock_brain.save_user_profile.assert_called_once_with(profile)
         app.dependency_overrides = {}
 
+    def test_import_without_from_date_syncs_incrementally_and_stores_cursor(
+        self, client, mock_hevy_service, mock_brain
+    ):
+        """Default import only fetches Hevy changes since the stored cursor."""
+        app.dependency_overrides[verify_token] = lambda: "test@test.com"
+
+        previous_cursor = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        new_cursor = datetime(2024, 3, 4, 8, tzinfo=timezone.utc)
+        profile = MagicMock()
+        profile.subscription_plan = "Pro"
+        profile.hevy_api_key = "valid_key_123"
+        profile.hevy_sync_cursor = previous_cursor
+        mock_brain.get_user_profile.return_value = profile
+
+        mock_hevy_service.sync_workouts = AsyncMock(
+            return_value={
+                "imported": 1,
+                "updated": 2,
+                "deleted": 1,
+                "skipped": 0,
+                "failed": 0,
+                "cursor": new_cursor,
+            }
+        )
+
+        app.dependency_overrides[get_ai_trainer_brain] = lambda: mock_brain
+        app.dependency_overrides[get_hevy_service] = lambda: mock_hevy_service
+
+        response = client.post(
+            "/integrations/hevy/import",
+            json={"mode": "skip_duplicates"},
+            headers={"Authorization": "Bearer token"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "imported": 1,
+            "updated": 2,
+            "deleted": 1,
+            "skipped": 0,
+            "failed": 0,
+        }
+        mock_hevy_service.sync_workouts.assert_awaited_once_with(
+            profile, mode="skip_duplicates"
+        )
+        mock_hevy_service.import_workouts.assert_not_called()
+        assert profile.hevy_sync_cursor == new_cursor
+        mock_brain.save_user_profile.assert_called_once_with(profile)
+        app.dependency_overrides = {}
+
     def test_import_workouts_forbidden_for_basic_plan(
         self, client, mock_hevy_service, mock_brain
     ):
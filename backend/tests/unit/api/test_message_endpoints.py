@@ -8,13 +8,15 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
-from fastapi import HTTPException
+from bson import ObjectId
+from fastapi import HTTPException, Response
 
-from src.api.endpoints.message import get_history, message_ai
+from src.api.endpoints.message import NEXT_CURSOR_HEADER, get_history, message_ai
 from src.api.models.chat_history import ChatHistory
-from src.api.models.message import MessageRequest
+from src.api.models.message import HistoryPosition, MessageRequest
 from src.api.models.sender import Sender
 from src.api.models.user_profile import UserProfile
+from src.utils.pagination import decode_cursor, encode_cursor
 
 
 @pytest.fixture
@@ -35,33 +37,76 @@ def sample_chat_messages():
 
 def test_get_history_success(sample_chat_messages):
     mock_brain = MagicMock()
-    mock_brain.get_chat_history.return_value = sample_chat_messages
+    anchor = ObjectId()
+    mock_brain.get_chat_history_page.return_value = (sample_chat_messages, anchor)
+    response = Response()
 
     result = get_history(
         user_email="test@example.com",
+        response=response,
         brain=mock_brain,
         limit=20,
-        offset=0,
+        position=HistoryPosition(offset=0, before=None),
     )
 
     assert result == sample_chat_messages
-    mock_brain.get_chat_history.assert_called_once_with(
-        "test@example.com", limit=20, offset=0
+    mock_brain.get_chat_history_page.assert_called_once_with(
+        "test@example.com", limit=20, before=None
     )
+    assert decode_cursor(response.headers[NEXT_CURSOR_HEADER]) == [anchor]
 
 
 def test_get_history_empty():
     mock_brain = MagicMock()
-    mock_brain.get_chat_history.return_value = []
+    mock_brain.get_chat_history_page.return_value = ([], None)
+    response = Response()
 
     result = get_history(
         user_email="newuser@example.com",
+        response=response,
         brain=mock_brain,
         limit=20,
-        offset=0,
+        position=HistoryPosition(offset=0, before=None),
     )
 
     assert result == []
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_get_history_cursor_and_legacy_offset():
+    mock_brain = MagicMock()
+    anchor = ObjectId()
+    mock_brain.get_chat_history_page.return_value = ([], None)
+    mock_brain.get_chat_history.return_value = []
+
+    get_history(
+        user_email="a@example.com",
+        response=Response(),
+        brain=mock_brain,
+        limit=5,
+        position=HistoryPosition(offset=0, before=encode_cursor(anchor)),
+    )
+    get_history(
+        user_email="a@example.com",
+        response=Response(),
+        brain=mock_brain,
+        limit=5,
+        position=HistoryPosition(offset=10, before=None),
+    )
+
+    mock_brain.get_chat_history_page.assert_called_once_with(
+        "a@example.com", limit=5, before=anchor
+    )
+    mock_brain.get_chat_history.assert_called_once_with("a@example.com", limit=5, offset=10)
+    with pytest.raises(HTTPException) as exc:
+        get_history(
+            user_email="a@example.com",
+            response=Response(),
+            brain=mock_brain,
+            limit=5,
+            position=HistoryPosition(offset=0, before="not-a-cursor"),
+        )
+    assert exc.value.status_code == 400
 
 
 def test_get_history_route_does_not_require_brain_query_param():
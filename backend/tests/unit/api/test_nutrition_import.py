@@ -19,10 +19,16 @@ def test_import_endpoint_success():
     mock_db.get_user_profile.return_value = MagicMock(is_demo=False, subscription_plan="Pro")
     app.dependency_overrides[get_mongo_database] = lambda: mock_db
 
-    with patch("src.api.endpoints.nutrition.import_nutrition_from_csv") as mock_import:
-        mock_import.return_value = ImportResult(
-            created=5, updated=2, errors=0, total_days=7
-        )
+    received = {}
+
+    def fake_import(email, csv_stream, _db):
+        received["email"] = email
+        received["content"] = csv_stream.read()
+        return ImportResult(created=5, updated=2, errors=0, total_days=7)
+
+    with patch(
+        "src.api.endpoints.nutrition.import_nutrition_from_csv", side_effect=fake_import
+    ) as mock_import:
 
         csv_content = b"Data,Calorias\n2024-01-01,100"
         files = {"file": ("test.csv", csv_content, "text/csv")}
@@ -42,9 +48,8 @@ def test_import_endpoint_success():
         assert data["total_days"] == 7
 
         mock_import.assert_called_once()
-        args = mock_import.call_args[0]
-        assert args[0] == "test@example.com"
-        assert args[1] == "Data,Calorias\n2024-01-01,100"
+        assert received["email"] == "test@example.com"
+        assert received["content"] == "Data,Calorias\n2024-01-01,100"
 
     app.dependency_overrides = {}
 
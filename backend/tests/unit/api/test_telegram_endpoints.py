@@ -4,7 +4,7 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, AsyncMock
 from src.api.main import app
-from src.core.deps import get_telegram_repository, get_telegram_service, get_ai_trainer_brain
+from src.core.deps import get_telegram_repository, get_ai_trainer_brain
 from src.services.auth import verify_token
 from src.api.models.telegram_link import TelegramLink
 
@@ -28,13 +28,6 @@ def mock_telegram_repo():
     return repo
 
 
-@pytest.fixture
-def mock_telegram_service():
-    service = AsyncMock()
-    service.handle_update = AsyncMock()
-    return service
-
-
 @pytest.fixture
 def mock_brain():
     """Mock AI trainer brain to avoid Qdrant connection."""
@@ -192,9 +185,13 @@ def test_e2e_link_hidden_when_test_auth_disabled(mock_telegram_repo, mock_brain,
     assert response.status_code == 404
     mock_telegram_repo.create_or_replace_link.assert_not_called()
 
-def test_webhook_valid_request(mock_telegram_service):
-    """Test webhook with valid request."""
-    app.dependency_overrides[get_telegram_service] = lambda: mock_telegram_service
+def test_webhook_valid_request(monkeypatch):
+    """Test webhook hands the update to the background queue."""
+    queue = Mock()
+    queue.submit = AsyncMock(return_value=True)
+    monkeypatch.setattr(
+        "src.api.endpoints.telegram.get_telegram_update_queue", lambda: queue
+    )
 
     response = client.post(
         "/telegram/webhook", json={"update_id": 1, "message": {"text": "test"}}
@@ -202,3 +199,6 @@ def test_webhook_valid_request(mock_telegram_service):
 
     assert response.status_code == 200
     assert response.json()["ok"] is True
+    queue.submit.assert_awaited_once_with(
+        {"update_id": 1, "message": {"text": "test"}}
+    )
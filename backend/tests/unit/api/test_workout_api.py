@@ -10,6 +10,7 @@ from datetime import datetime
 from src.api.main import app
 from src.services.auth import verify_token
 from src.core.deps import get_mongo_database
+from src.utils.pagination import InvalidCursorError
 
 class TestWorkoutApi(unittest.TestCase):
     def setUp(self):
@@ -47,6 +48,42 @@ class TestWorkoutApi(unittest.TestCase):
         self.assertEqual(data["total"], 1)
         self.assertEqual(data["workouts"][0]["workout_type"], "Push")
 
+    def test_list_workouts_cursor_mode(self):
+        """A cursor switches to keyset paging and the page links to the next one."""
+        app.dependency_overrides[verify_token] = lambda: "test@test.com"
+        mock_db = MagicMock()
+        workout = {
+            "_id": "65a000000000000000000001",
+            "user_email": "test@test.com",
+            "date": datetime(2024, 1, 1),
+            "workout_type": "Push",
+            "exercises": [],
+        }
+        mock_db.get_workouts_paginated.return_value = ([workout], 3)
+        mock_db.get_workouts_cursor_page.return_value = ([workout], False, None)
+        app.dependency_overrides[get_mongo_database] = lambda: mock_db
+
+        first = self.client.get(
+            "/workout/list?page=1&page_size=1", headers={"Authorization": "Bearer token"}
+        ).json()
+        self.assertIsNotNone(first["next_cursor"])
+
+        response = self.client.get(
+            f"/workout/list?page_size=1&cursor={first['next_cursor']}",
+            headers={"Authorization": "Bearer token"},
+        )
+        data = response.json()
+        self.assertIsNone(data["total"])
+        self.assertIsNone(data["next_cursor"])
+        position = mock_db.get_workouts_cursor_page.call_args.kwargs["position"]
+        self.assertEqual(position.cursor, first["next_cursor"])
+
+        mock_db.get_workouts_cursor_page.side_effect = InvalidCursorError("Invalid pagination cursor")
+        bad = self.client.get(
+            "/workout/list?cursor=garbage", headers={"Authorization": "Bearer token"}
+        )
+        self.assertEqual(bad.status_code, 400)
+
     def test_get_types_success(self):
         """Test retrieval of workout types."""
         app.dependency_overrides[verify_token] = lambda: "test@test.com"
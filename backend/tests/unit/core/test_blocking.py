@@ -0,0 +1,51 @@
+"""Tests for the bounded executor used to offload blocking calls."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.api.endpoints.metabolism import get_metabolism_summary
+from src.core import blocking
+from src.core.turn_cache import get_turn_cache, turn_cache_scope
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor():
+    blocking.shutdown_blocking_executor()
+    yield
+    blocking.shutdown_blocking_executor()
+
+
+def test_executor_is_sized_from_settings():
+    with patch("src.core.blocking.settings") as mock_settings:
+        mock_settings.AI_TRAINER_THREADPOOL_WORKERS = 3
+        executor = blocking.get_blocking_executor()
+
+    assert executor._max_workers == 3  # pylint: disable=protected-access
+    assert blocking.get_blocking_executor() is executor
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_keeps_caller_context():
+    with turn_cache_scope() as cache:
+        seen = await blocking.run_blocking(get_turn_cache)
+
+    assert seen is cache
+
+
+@pytest.mark.asyncio
+async def test_metabolism_summary_does_not_block_the_loop(loop_blocking_monitor):
+    def slow_tdee(*_args, **_kwargs):
+        time.sleep(0.15)
+        return {"tdee": 2400}
+
+    with patch("src.api.endpoints.metabolism.AdaptiveTDEEService") as service_cls:
+        service_cls.return_value.calculate_tdee.side_effect = slow_tdee
+        async with loop_blocking_monitor() as monitor:
+            result = await get_metabolism_summary(
+                weeks=3, user_email="a@b.com", db=MagicMock()
+            )
+
+    assert result == {"tdee": 2400}
+    assert monitor.max_lag_ms < 75
@@ -0,0 +1,99 @@
+"""Tests for the per-process chat history cache."""
+
+from unittest.mock import patch
+
+from bson import ObjectId
+
+from src.api.models.chat_history import ChatHistory
+from src.api.models.sender import Sender
+from src.core.chat_history_cache import ChatHistoryCache
+
+
+def _message(text: str) -> ChatHistory:
+    return ChatHistory(text=text, sender=Sender.STUDENT, timestamp="2026-01-01T00:00:00")
+
+
+def _loaded(cache: ChatHistoryCache, count: int, complete: bool = True) -> list[ObjectId]:
+    ids = sorted(ObjectId() for _ in range(count))
+    newest_first = [(doc_id, _message(f"m{i}")) for i, doc_id in enumerate(ids)][::-1]
+    cache.store("s", newest_first, ids, complete=complete)
+    return ids
+
+
+def test_newest_returns_oldest_first_copies():
+    cache = ChatHistoryCache(max_sessions=4, capacity=10)
+    _loaded(cache, 3)
+
+    window = cache.newest("s", 2)
+    assert [m.text for _, m in window] == ["m1", "m2"]
+
+    window[0][1].text = "changed"
+    assert cache.newest("s", 2)[0][1].text == "m1"
+
+
+def test_newest_refuses_windows_beyond_an_incomplete_buffer():
+    cache = ChatHistoryCache(max_sessions=4, capacity=3)
+    _loaded(cache, 3, complete=False)
+
+    assert cache.newest("s", 3) is not None
+    assert cache.newest("s", 4) is None
+    assert not cache.covers(4)
+
+
+def test_merge_appends_and_trims_to_capacity():
+    cache = ChatHistoryCache(max_sessions=4, capacity=3)
+    _loaded(cache, 3)
+    new_id = ObjectId()
+
+    cache.merge("s", [(new_id, _message("new")), (ObjectId(), None)])
+
+    assert [m.text for _, m in cache.newest("s", 3)] == ["m1", "m2", "new"]
+    # The oldest message was dropped, so a longer window needs Mongo.
+    assert cache.newest("s", 4) is None
+
+
+def test_sessions_are_evicted_lru():
+    cache = ChatHistoryCache(max_sessions=2, capacity=5)
+    for session in ("a", "b"):
+        cache.store(session, [], [], complete=True)
+    cache.state("a")
+    cache.store("c", [], [], complete=True)
+
+    assert cache.newest("a", 1) == []
+    assert cache.newest("b", 1) is None
+
+
+def test_state_probes_after_revalidate_window_and_reloads_after_max_age():
+    cache = ChatHistoryCache(max_sessions=2, capacity=5, revalidate_seconds=2, max_age_seconds=60)
+    with patch("src.core.chat_history_cache.time.monotonic", return_value=100.0):
+        ids = _loaded(cache, 2)
+    with patch("src.core.chat_history_cache.time.monotonic", return_value=101.0):
+        assert cache.state("s") == ("fresh", None)
+    with patch("src.core.chat_history_cache.time.monotonic", return_value=105.0):
+        status, since = cache.state("s")
+        assert status == "probe"
+        assert since <= ids[-1]
+    with patch("src.core.chat_history_cache.time.monotonic", return_value=200.0):
+        assert cache.state("s") == ("load", None)
+
+
+def test_plan_refresh_returns_unseen_ids_and_drops_rewritten_sessions():
+    cache = ChatHistoryCache(max_sessions=2, capacity=5)
+    ids = _loaded(cache, 2)
+    other = ObjectId()
+
+    assert cache.plan_refresh("s", [ids[-1], other]) == [other]
+    # The newest message seen is gone: the history was deleted.
+    assert cache.plan_refresh("s", [other]) is None
+    assert cache.newest("s", 1) is None
+
+
+def test_local_write_does_not_advance_the_probe_start():
+    cache = ChatHistoryCache(max_sessions=2, capacity=5, revalidate_seconds=0)
+    ids = _loaded(cache, 1)
+
+    cache.merge("s", [(ObjectId(), _message("local"))])
+
+    status, since = cache.state("s")
+    assert status == "probe"
+    assert since <= ids[0]
@@ -2,11 +2,14 @@
 Tests for dependency injection functions in src/core/deps.py
 """
 
-from unittest.mock import patch, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, patch, MagicMock
+from src.core import deps
 from src.core.deps import (
     get_qdrant_client,
     get_mongo_database,
     get_ai_trainer_brain,
+    run_in_transient_loop,
 )
 
 
@@ -93,3 +96,42 @@ def test_get_ai_trainer_brain():
         call_kwargs = mock_brain.call_args[1]
         assert "database" in call_kwargs
         assert "qdrant_client" in call_kwargs
+
+
+def test_run_in_transient_loop_closes_the_loop_clients():
+    """The clients opened for a transient loop are closed with it."""
+    database = MagicMock(close=AsyncMock())
+
+    async def turn():
+        deps._async_databases[asyncio.get_running_loop()] = database  # pylint: disable=protected-access
+        return "reply"
+
+    with patch("src.core.deps.close_hevy_client", AsyncMock()) as close_hevy:
+        assert run_in_transient_loop(turn) == "reply"
+    database.close.assert_awaited_once()
+    close_hevy.assert_awaited_once()
+    assert not deps._async_databases  # pylint: disable=protected-access
+
+
+def test_flush_prompt_logs_only_touches_opened_databases():
+    """Flushing before the database was opened does not open it."""
+    get_mongo_database.cache_clear()
+
+    with patch("src.services.database.MongoDatabase") as mock_mongo:
+        deps.flush_prompt_logs()
+        mock_mongo.assert_not_called()
+
+        database = get_mongo_database()
+        deps.flush_prompt_logs()
+
+    database.flush_prompt_logs.assert_called_once()
+
+
+def test_stop_token_blocklists_stops_opened_databases():
+    get_mongo_database.cache_clear()
+
+    with patch("src.services.database.MongoDatabase"):
+        database = get_mongo_database()
+        deps.stop_token_blocklists()
+
+    database.stop_token_blocklist.assert_called_once()
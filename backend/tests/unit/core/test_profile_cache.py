@@ -0,0 +1,181 @@
+"""Tests for the per-process profile cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.api.models.user_profile import UserProfile
+from src.core.profile_cache import ProfileCache, apply_update, versioned
+
+
+def _doc(email: str = "u@test.com", version: int | None = 1, **fields) -> dict:
+    doc = {
+        "email": email,
+        "gender": "Masculino",
+        "age": 30,
+        "weight": 80.0,
+        "height": 180,
+        "goal_type": "maintain",
+        "weekly_rate": 0.5,
+        **fields,
+    }
+    if version is not None:
+        doc["profile_version"] = version
+    return doc
+
+
+def _get(cache: ProfileCache, doc: dict | None, version_doc: dict | None = None):
+    load = MagicMock(return_value=doc)
+    read_version = MagicMock(return_value=version_doc)
+    profile = cache.get_or_load(
+        "u@test.com", load, read_version, lambda d: UserProfile(**d)
+    )
+    return profile, load, read_version
+
+
+def test_versioned_adds_increment_without_touching_the_original():
+    update = {"$set": {"age": 31}, "$inc": {"total_messages_sent": 1}}
+
+    assert versioned(update) == {
+        "$set": {"age": 31},
+        "$inc": {"total_messages_sent": 1, "profile_version": 1},
+    }
+    assert update == {"$set": {"age": 31}, "$inc": {"total_messages_sent": 1}}
+
+
+def test_apply_update_sets_unsets_and_increments():
+    profile = UserProfile(**_doc(notes="old", total_messages_sent=4))
+
+    updated = apply_update(
+        profile,
+        versioned({
+            "$set": {"age": 31},
+            "$unset": {"notes": ""},
+            "$inc": {"total_messages_sent": 1},
+        }),
+    )
+
+    assert updated.age == 31
+    assert updated.notes is None
+    assert updated.total_messages_sent == 5
+
+
+def test_apply_update_gives_up_on_what_it_cannot_derive():
+    profile = UserProfile(**_doc())
+
+    assert apply_update(profile, {"$set": {"a.b": 1}}) is None
+    assert apply_update(profile, {"$push": {"tags": "x"}}) is None
+    assert apply_update(profile, {"$set": {"age": "not a number"}}) is None
+
+
+def test_fresh_entry_is_served_without_reads():
+    cache = ProfileCache(max_entries=4)
+    _get(cache, _doc())
+
+    profile, load, read_version = _get(cache, _doc(age=99))
+
+    assert profile.age == 30
+    load.assert_not_called()
+    read_version.assert_not_called()
+
+
+def test_served_profiles_are_copies():
+    cache = ProfileCache(max_entries=4)
+    first, _, _ = _get(cache, _doc())
+    first.age = 50
+
+    profile, _, _ = _get(cache, None)
+
+    assert profile.age == 30
+
+
+def test_revalidation_keeps_entry_when_version_matches():
+    cache = ProfileCache(max_entries=4, revalidate_seconds=2)
+    with patch("src.core.profile_cache.time.monotonic", return_value=100.0):
+        _get(cache, _doc())
+    with patch("src.core.profile_cache.time.monotonic", return_value=103.0):
+        profile, load, read_version = _get(cache, _doc(age=99), {"profile_version": 1})
+
+    assert profile.age == 30
+    read_version.assert_called_once()
+    load.assert_not_called()
+
+
+def test_revalidation_reloads_when_another_worker_wrote():
+    cache = ProfileCache(max_entries=4, revalidate_seconds=2)
+    with patch("src.core.profile_cache.time.monotonic", return_value=100.0):
+        _get(cache, _doc())
+    with patch("src.core.profile_cache.time.monotonic", return_value=103.0):
+        profile, load, _ = _get(cache, _doc(version=2, age=99), {"profile_version": 2})
+
+    assert profile.age == 99
+    load.assert_called_once()
+
+
+def test_entries_expire_after_ttl():
+    cache = ProfileCache(max_entries=4, ttl_seconds=10, revalidate_seconds=60)
+    with patch("src.core.profile_cache.time.monotonic", return_value=100.0):
+        _get(cache, _doc())
+    with patch("src.core.profile_cache.time.monotonic", return_value=111.0):
+        profile, load, read_version = _get(cache, _doc(age=99))
+
+    assert profile.age == 99
+    load.assert_called_once()
+    read_version.assert_not_called()
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ProfileCache(max_entries=2)
+    for email in ("a@test.com", "b@test.com", "c@test.com"):
+        cache.get_or_load(
+            email, lambda e=email: _doc(e), MagicMock(), lambda d: UserProfile(**d)
+        )
+
+    load = MagicMock(return_value=_doc("a@test.com"))
+    cache.get_or_load("a@test.com", load, MagicMock(), lambda d: UserProfile(**d))
+
+    load.assert_called_once()
+
+
+def test_apply_writes_through_and_tracks_the_version():
+    cache = ProfileCache(max_entries=4, revalidate_seconds=2)
+    with patch("src.core.profile_cache.time.monotonic", return_value=100.0):
+        _get(cache, _doc())
+        cache.apply("u@test.com", versioned({"$set": {"age": 31}}))
+    with patch("src.core.profile_cache.time.monotonic", return_value=103.0):
+        profile, load, _ = _get(cache, None, {"profile_version": 2})
+
+    assert profile.age == 31
+    load.assert_not_called()
+
+
+def test_apply_drops_entries_it_cannot_update():
+    cache = ProfileCache(max_entries=4)
+    _get(cache, _doc())
+
+    cache.apply("u@test.com", {"$push": {"tags": "x"}})
+    profile, load, _ = _get(cache, _doc(age=99))
+
+    assert profile.age == 99
+    load.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_get_or_load_caches_the_profile():
+    cache = ProfileCache(max_entries=4)
+    loads = []
+
+    async def load():
+        loads.append(1)
+        return _doc()
+
+    async def read_version():
+        return {"profile_version": 1}
+
+    for _ in range(2):
+        profile = await cache.aget_or_load(
+            "u@test.com", load, read_version, lambda d: UserProfile(**d)
+        )
+
+    assert profile.age == 30
+    assert len(loads) == 1
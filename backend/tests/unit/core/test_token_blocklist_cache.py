@@ -0,0 +1,109 @@
+"""Tests for the in-process token blocklist view."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+from src.core.token_blocklist_cache import BloomFilter, TokenBlocklistCache, token_digest
+
+
+def _entry(token: str, hours: float = 1) -> dict:
+    return {
+        "_id": ObjectId(),
+        "token": token,
+        "expires_at": datetime.now(timezone.utc) + timedelta(hours=hours),
+    }
+
+
+@pytest.fixture
+def repository():
+    repo = MagicMock()
+    repo.blocked_since.return_value = []
+    return repo
+
+
+@pytest.fixture
+def cache(repository):
+    blocklist = TokenBlocklistCache(repository, refresh_seconds=60, max_staleness_seconds=5)
+    # Checks below drive the refreshes; keep the poller out of the way.
+    blocklist.start = MagicMock()
+    return blocklist
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(100)
+    digests = [token_digest(f"token-{i}") for i in range(100)]
+    for digest in digests:
+        bloom.add(digest)
+
+    assert all(bloom.might_contain(digest) for digest in digests)
+    misses = sum(bloom.might_contain(token_digest(f"other-{i}")) for i in range(1000))
+    assert misses < 50
+
+
+def test_checks_within_staleness_window_do_not_query_mongo(cache, repository):
+    repository.blocked_since.return_value = [_entry("blocked")]
+
+    assert cache.is_blocklisted("blocked") is True
+    assert cache.is_blocklisted("fresh") is False
+    assert cache.is_blocklisted("blocked") is True
+
+    repository.blocked_since.assert_called_once_with(None)
+
+
+def test_stale_view_refreshes_incrementally(cache, repository):
+    first = _entry("a")
+    repository.blocked_since.return_value = [first]
+    cache.is_blocklisted("a")
+
+    repository.blocked_since.return_value = [_entry("b")]
+    with patch("src.core.token_blocklist_cache.time.monotonic", return_value=10**9):
+        assert cache.is_blocklisted("b") is True
+
+    since = repository.blocked_since.call_args.args[0]
+    assert since is not None and since <= first["_id"]
+    assert cache.is_blocklisted("a") is True
+
+
+def test_local_logout_is_honoured_immediately(cache, repository):
+    cache.is_blocklisted("warm-up")
+
+    cache.add("mine", datetime.now(timezone.utc) + timedelta(hours=2))
+
+    assert cache.is_blocklisted("mine") is True
+    assert repository.blocked_since.call_count == 1
+
+
+def test_expired_entries_are_dropped(cache, repository):
+    repository.blocked_since.return_value = [_entry("old", hours=-1), _entry("live")]
+
+    assert cache.is_blocklisted("old") is False
+    assert cache.is_blocklisted("live") is True
+    assert token_digest("old") not in cache._expires  # pylint: disable=protected-access
+
+
+def test_naive_mongo_datetimes_are_read_as_utc(cache, repository):
+    entry = _entry("naive")
+    entry["expires_at"] = entry["expires_at"].replace(tzinfo=None)
+    repository.blocked_since.return_value = [entry]
+
+    assert cache.is_blocklisted("naive") is True
+
+
+def test_refresh_errors_surface_when_view_is_stale(cache, repository):
+    repository.blocked_since.side_effect = RuntimeError("mongo down")
+
+    with pytest.raises(RuntimeError):
+        cache.is_blocklisted("token")
+
+
+def test_stop_ends_the_poller_thread(repository):
+    blocklist = TokenBlocklistCache(repository, refresh_seconds=0.01)
+    blocklist.start()
+
+    blocklist.stop(timeout=1)
+
+    thread = blocklist._poller._thread  # pylint: disable=protected-access
+    assert thread is not None and not thread.is_alive()
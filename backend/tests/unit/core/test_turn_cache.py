@@ -0,0 +1,114 @@
+"""Tests for the request-scoped turn cache."""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+from src.api.models.weight_log import WeightLog
+from src.core.turn_cache import (
+    get_turn_cache,
+    invalidate_turn_cache,
+    turn_cache_scope,
+    turn_cached,
+)
+from src.repositories.user_repository import UserRepository
+from src.services.adaptive_tdee import AdaptiveTDEEService
+
+
+def test_turn_cached_without_scope_always_calls_loader():
+    loader = MagicMock(return_value=1)
+
+    turn_cached("key", loader)
+    turn_cached("key", loader)
+
+    assert loader.call_count == 2
+    assert get_turn_cache() is None
+
+
+def test_turn_cached_memoizes_within_scope_and_resets_after():
+    loader = MagicMock(return_value=42)
+
+    with turn_cache_scope() as cache:
+        assert turn_cached("key", loader) == 42
+        assert turn_cached("key", loader) == 42
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    assert loader.call_count == 1
+    assert get_turn_cache() is None
+
+
+def test_turn_cache_scope_is_reentrant():
+    with turn_cache_scope() as outer:
+        with turn_cache_scope() as inner:
+            assert inner is outer
+        assert get_turn_cache() is outer
+
+
+def test_turn_cached_returns_list_copies():
+    with turn_cache_scope():
+        first = turn_cached("logs", lambda: [3, 1, 2])
+        first.sort()
+        second = turn_cached("logs", lambda: [])
+
+    assert second == [3, 1, 2]
+
+
+def test_turn_cached_returns_model_copies():
+    with turn_cache_scope():
+        first = turn_cached(
+            "logs",
+            lambda: [WeightLog(user_email="u@x.com", date=date(2024, 1, 1), weight_kg=80.0)],
+        )
+        first[0].weight_kg = 70.0
+        second = turn_cached("logs", lambda: [])
+
+    assert second[0].weight_kg == 80.0
+
+
+def test_invalidate_turn_cache_forces_reload():
+    loader = MagicMock(side_effect=[1, 2])
+
+    with turn_cache_scope():
+        assert turn_cached("key", loader) == 1
+        invalidate_turn_cache()
+        assert turn_cached("key", loader) == 2
+
+
+def test_repository_reads_share_one_query_and_writes_invalidate():
+    database = MagicMock()
+    collection = database.__getitem__.return_value
+    collection.find_one.return_value = {
+        "email": "a@b.com",
+        "gender": "Masculino",
+        "age": 30,
+        "weight": 80,
+        "height": 175,
+        "goal_type": "maintain",
+    }
+    collection.update_one.return_value = MagicMock(upserted_id=None, modified_count=1)
+    repository = UserRepository(database)
+
+    with turn_cache_scope():
+        repository.get_profile("a@b.com")
+        UserRepository(database).get_profile("a@b.com")
+        assert collection.find_one.call_count == 1
+
+        repository.update_profile_fields("a@b.com", {"age": 30})
+        repository.get_profile("a@b.com")
+
+    assert collection.find_one.call_count == 2
+
+
+def test_calculate_tdee_runs_once_per_scope():
+    database = MagicMock()
+    database.get_weight_logs_by_date_range.return_value = []
+    database.get_nutrition_logs_by_date_range.return_value = []
+    database.get_user_profile.return_value = None
+    database.get_plan.return_value = None
+
+    with turn_cache_scope():
+        first = AdaptiveTDEEService(database).calculate_tdee("a@b.com")
+        second = AdaptiveTDEEService(database).calculate_tdee("a@b.com")
+
+    assert first == second
+    assert database.get_weight_logs_by_date_range.call_count == 1
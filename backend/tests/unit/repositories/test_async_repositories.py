@@ -0,0 +1,187 @@
+"""Tests for the async repositories used by the chat path."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api.models.chat_history import ChatHistory
+from src.api.models.sender import Sender
+from src.repositories.chat_repository import AsyncChatRepository
+from src.repositories.nutrition_repository import (
+    AsyncNutritionRepository,
+    NutritionRepository,
+)
+from src.repositories.user_repository import AsyncUserRepository
+from src.repositories.weight_repository import AsyncWeightRepository
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    for key, condition in query.items():
+        value = doc.get(key)
+        if isinstance(condition, dict):
+            if "$lt" in condition and not value < condition["$lt"]:
+                return False
+            if "$gte" in condition and not value >= condition["$gte"]:
+                return False
+            if "$lte" in condition and not value <= condition["$lte"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeAsyncCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, key, direction):
+        self.docs = sorted(self.docs, key=lambda d: d[key], reverse=direction == -1)
+        return self
+
+    def limit(self, limit):
+        self.docs = self.docs[:limit]
+        return self
+
+    async def to_list(self, length=None):
+        return [dict(doc) for doc in self.docs]
+
+
+class FakeAsyncCollection:
+    def __init__(self, docs=None):
+        self.docs = list(docs or [])
+        self.updates = []
+
+    def find(self, query, _projection=None):
+        return FakeAsyncCursor([d for d in self.docs if _matches(d, query)])
+
+    async def find_one(self, query, _projection=None, **_kwargs):
+        return next((dict(d) for d in self.docs if _matches(d, query)), None)
+
+    async def count_documents(self, query):
+        return len([d for d in self.docs if _matches(d, query)])
+
+    async def insert_many(self, documents, ordered=True):
+        self.docs.extend(documents)
+
+    async def update_one(self, query, update, upsert=False):
+        self.updates.append((query, update))
+
+
+class FakeAsyncDatabase(dict):
+    def __missing__(self, name):
+        self[name] = FakeAsyncCollection()
+        return self[name]
+
+
+@pytest.mark.asyncio
+async def test_chat_history_skips_system_messages_and_pages_from_newest():
+    database = FakeAsyncDatabase()
+    database["message_store"] = FakeAsyncCollection(
+        [
+            {
+                "_id": i,
+                "SessionId": "u@test.com",
+                "History": json.dumps(
+                    {
+                        "type": "system" if i % 4 == 0 else "human",
+                        "data": {"content": f"m{i}"},
+                    }
+                ),
+            }
+            for i in range(1, 21)
+        ]
+    )
+    repo = AsyncChatRepository(database)
+
+    history = await repo.get_history("u@test.com", limit=3, offset=2)
+    model_messages = await repo.get_pydantic_ai_history("u@test.com", limit=3)
+
+    assert [m.text for m in history] == ["m14", "m15", "m17"]
+    assert len(model_messages) == 3
+
+
+@pytest.mark.asyncio
+async def test_chat_add_messages_uses_sync_document_shape():
+    database = FakeAsyncDatabase()
+    repo = AsyncChatRepository(database)
+
+    await repo.add_messages(
+        [ChatHistory(sender=Sender.STUDENT, text="oi", timestamp="")],
+        "u@test.com",
+        "atlas",
+    )
+
+    [doc] = database["message_store"].docs
+    assert doc["SessionId"] == "u@test.com"
+    assert doc["History"]["sender"] == Sender.STUDENT.value
+    assert doc["History"]["trainer_type"] == "atlas"
+
+
+@pytest.mark.asyncio
+async def test_nutrition_stats_match_sync_builder():
+    now = datetime.now()
+    docs = [
+        {
+            "user_email": "u@test.com",
+            "date": (now - timedelta(days=i)).replace(hour=12),
+            "calories": 2000 + i * 10,
+            "protein_grams": 150,
+            "carbs_grams": 200,
+            "fat_grams": 60,
+        }
+        for i in range(0, 40, 2)
+    ]
+    database = FakeAsyncDatabase()
+    database["nutrition_logs"] = FakeAsyncCollection(docs)
+    period_stats = {"tdee": 2500, "daily_target": 2100}
+
+    stats = await AsyncNutritionRepository(database).get_stats(
+        "u@test.com", period_stats, None
+    )
+    window = sorted(
+        (d for d in docs if d["date"] >= now - timedelta(days=30)),
+        key=lambda d: d["date"],
+        reverse=True,
+    )
+    expected = NutritionRepository.build_stats(
+        now, window, len(docs), NutritionRepository.stats_targets(period_stats, None)
+    )
+
+    assert stats.total_logs == 20
+    assert stats.avg_daily_calories == expected.avg_daily_calories
+    assert stats.last_14_days == expected.last_14_days
+    assert stats.daily_target == 2100
+
+
+@pytest.mark.asyncio
+async def test_weight_logs_convert_dates():
+    database = FakeAsyncDatabase()
+    database["weight_logs"] = FakeAsyncCollection(
+        [
+            {"_id": 1, "user_email": "u@test.com", "date": datetime(2026, 1, 2), "weight_kg": 80},
+            {"_id": 2, "user_email": "u@test.com", "date": datetime(2026, 1, 3), "weight_kg": 79.5},
+        ]
+    )
+
+    logs = await AsyncWeightRepository(database).get_logs("u@test.com")
+
+    assert [log.date.isoformat() for log in logs] == ["2026-01-03", "2026-01-02"]
+
+
+@pytest.mark.asyncio
+async def test_increment_message_counts_resets_daily_count_on_new_day():
+    database = FakeAsyncDatabase()
+    database["users"] = FakeAsyncCollection(
+        [{"email": "u@test.com", "last_message_date": "2000-01-01"}]
+    )
+
+    await AsyncUserRepository(database).increment_message_counts("u@test.com")
+
+    [(_, update)] = database["users"].updates
+    assert update["$set"]["messages_sent_today"] == 1
+    assert update["$inc"] == {
+        "total_messages_sent": 1,
+        "messages_sent_this_month": 1,
+        "profile_version": 1,
+    }
@@ -136,6 +136,20 @@ class FakeCollection:
     def count_documents(self, query: dict) -> int:
         return len([doc for doc in self.docs if self._matches(doc, query)])
 
+    def find_one_and_update(self, query: dict, update: dict, upsert: bool = False, **_kwargs):
+        doc = next((doc for doc in self.docs if self._matches(doc, query)), None)
+        if doc is None and upsert:
+            doc = deepcopy(query)
+            self.docs.append(doc)
+        for key, value in update.get("$inc", {}).items():
+            doc[key] = doc.get(key, 0) + value
+        return deepcopy(doc)
+
+    def bulk_write(self, operations: list, ordered: bool = True) -> None:
+        for operation in operations:
+            self.docs = [doc for doc in self.docs if not self._matches(doc, operation._filter)]
+            self.docs.append({"_id": ObjectId(), **deepcopy(operation._doc)})
+
 
 class FakeDatabase:
     def __init__(self) -> None:
@@ -221,6 +235,7 @@ def test_prompt_repository_roundtrip_logs_trims_and_sanitizes_prompt_payload():
     assert prompts[0]["prompt"]["model"] == {"name": "m3", "val": 3}
     assert prompts[1]["prompt"]["model"] == {"name": "m2", "val": 2}
     assert all(doc["user_email"] == "prompt@test.com" for doc in prompts)
+    assert sorted(doc["slot"] for doc in prompts) == [0, 1]
 
 
 def test_token_repository_roundtrip_adds_and_updates_blocklist_entries():
@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock
-from src.repositories.base import BaseRepository
+from src.repositories.base import BaseRepository, DailyLogRepository
 
 
 @pytest.fixture
@@ -30,6 +30,16 @@ class TestBaseRepositoryInitialization:
         assert repo.collection is not None
         mock_db.__getitem__.assert_called_once_with("users")
 
+    def test_daily_log_repository_requires_daily_upsert(self, mock_db):
+        """A daily log repository without _daily_upsert cannot be created."""
+
+        class IncompleteLogRepository(DailyLogRepository):
+            COLLECTION_NAME = "incomplete_logs"
+            LOG_NAME = "incomplete"
+
+        with pytest.raises(TypeError):
+            IncompleteLogRepository(mock_db)
+
     def test_init_with_different_collection_names(self, mock_db):
         """Test initialization with different collection names."""
         for collection_name in ["users", "chat_history", "workouts", "weights"]:
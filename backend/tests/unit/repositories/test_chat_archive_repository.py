@@ -0,0 +1,186 @@
+"""Tests for chat history archival and the read fall-through."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from src.repositories.chat_archive_repository import (
+    AsyncChatArchiveRepository,
+    ChatArchiveRepository,
+    unpack_chunk,
+)
+from src.repositories.chat_repository import ChatRepository
+
+
+class _Cursor(list):
+    def sort(self, field, direction):
+        return _Cursor(sorted(self, key=lambda d: d[field], reverse=direction < 0))
+
+    def limit(self, amount):
+        return _Cursor(self[:amount] if amount else self)
+
+
+class _Collection:
+    """In-memory stand-in for the few collection methods archival uses."""
+
+    def __init__(self, docs=None):
+        self.docs: list[dict] = list(docs or [])
+
+    def create_index(self, *_args, **_kwargs):
+        return None
+
+    @staticmethod
+    def _matches(doc, query):
+        for field, cond in query.items():
+            value = doc.get(field)
+            if isinstance(cond, dict):
+                if "$lt" in cond and not (value is not None and value < cond["$lt"]):
+                    return False
+                if "$in" in cond and value not in cond["$in"]:
+                    return False
+                if "$exists" in cond and (field in doc) != cond["$exists"]:
+                    return False
+            elif value != cond:
+                return False
+        return True
+
+    def find(self, query, _projection=None):
+        return _Cursor(dict(d) for d in self.docs if self._matches(d, query))
+
+    def distinct(self, field, query):
+        return sorted({d[field] for d in self.docs if self._matches(d, query)})
+
+    def replace_one(self, query, replacement, upsert=False):
+        self.docs = [d for d in self.docs if not self._matches(d, query)]
+        self.docs.append(dict(replacement))
+
+    def delete_many(self, query):
+        self.docs = [d for d in self.docs if not self._matches(d, query)]
+
+
+def _message(session: str, sender: str, text: str, days_ago: int) -> dict:
+    when = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return {
+        "_id": ObjectId.from_datetime(when),
+        "SessionId": session,
+        "History": json.dumps({"type": sender, "data": {"content": text}}),
+    }
+
+
+@pytest.fixture
+def stores():
+    hot = _Collection(
+        [
+            _message("s", "human", "old question", 400),
+            _message("s", "system", "tool output", 399),
+            _message("s", "ai", "old answer", 398),
+            _message("s", "human", "recent question", 2),
+            _message("s", "ai", "recent answer", 1),
+            _message("other", "human", "hi", 300),
+        ]
+    )
+    archive_db = MagicMock()
+    archive_db.__getitem__.return_value = _Collection()
+    return hot, ChatArchiveRepository(archive_db)
+
+
+def test_archive_moves_old_messages_into_compressed_chunks(stores):
+    hot, archive = stores
+    progress = MagicMock()
+
+    totals = archive.archive_older_than(
+        hot, datetime.now(timezone.utc) - timedelta(days=180), chunk_size=2, progress=progress
+    )
+
+    assert totals["sessions"] == 2
+    assert totals["messages"] == 4
+    assert totals["chunks"] == 3
+    assert totals["stored_bytes"] > 0 and "messages_per_second" in totals
+    assert progress.call_count == 2
+    assert [d["SessionId"] for d in hot.docs] == ["s", "s"]
+    chunks = sorted(
+        (c for c in archive.collection.docs if c["SessionId"] == "s"),
+        key=lambda c: c["first_id"],
+    )
+    assert [c["count"] for c in chunks] == [2, 1]
+    # Raw documents are kept as written, system messages included.
+    assert [d["_id"] for d in unpack_chunk(chunks[0])] == [chunks[0]["first_id"], chunks[0]["last_id"]]
+
+
+def test_demo_sessions_are_not_archived(stores):
+    hot, archive = stores
+    demo = dict(_message("demo@test.com", "ai", "demo answer", 301), demo_message_id="m1")
+    hot.docs.append(demo)
+
+    totals = archive.archive_older_than(hot, datetime.now(timezone.utc) - timedelta(days=180))
+
+    assert totals["sessions"] == 2
+    assert demo in hot.docs
+    assert all(c["SessionId"] != "demo@test.com" for c in archive.collection.docs)
+
+
+def test_archive_run_is_repeatable(stores):
+    hot, archive = stores
+    cutoff = ObjectId.from_datetime(datetime.now(timezone.utc) - timedelta(days=180))
+
+    archive.archive_session(hot, "s", cutoff, chunk_size=10)
+    again = archive.archive_session(hot, "s", cutoff, chunk_size=10)
+
+    assert again["messages"] == 0
+    assert len([c for c in archive.collection.docs if c["SessionId"] == "s"]) == 1
+
+
+def test_history_falls_through_to_the_archive(stores):
+    hot, archive = stores
+    archive.archive_older_than(hot, datetime.now(timezone.utc) - timedelta(days=180), chunk_size=2)
+    db = MagicMock()
+    db.__getitem__.return_value = hot
+    repo = ChatRepository(db, archive=archive)
+
+    newest = repo.get_history("s", limit=2)
+    older = repo.get_history("s", limit=2, offset=2)
+    page, next_before = repo.get_history_page("s", limit=1, before=ObjectId())
+
+    assert [m.text for m in newest] == ["recent question", "recent answer"]
+    assert [m.text for m in older] == ["old question", "old answer"]
+    assert [m.text for m in page] == ["recent answer"]
+    messages, _ = repo.get_history_page("s", limit=5, before=next_before)
+    assert [m.text for m in messages] == ["old question", "old answer", "recent question"]
+
+
+@pytest.mark.asyncio
+async def test_async_archive_reads_documents_older_than_anchor(stores):
+    hot, archive = stores
+    archive.archive_session(hot, "s", ObjectId(), chunk_size=2)
+    chunks = archive.collection.docs
+
+    class _AsyncCursor:
+        def __init__(self, items):
+            self._items = iter(items)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                return next(self._items)
+            except StopIteration as exc:
+                raise StopAsyncIteration from exc
+
+    async_db = MagicMock()
+    async_archive = AsyncChatArchiveRepository(async_db)
+    async_archive.collection.find.return_value.sort.side_effect = (
+        lambda field, direction: _AsyncCursor(
+            sorted(chunks, key=lambda c: c[field], reverse=direction < 0)
+        )
+    )
+    anchor = sorted(d["_id"] for c in chunks for d in unpack_chunk(c))[-1]
+
+    docs = [doc async for doc in async_archive.iter_documents("s", before=anchor)]
+
+    assert len(docs) == 4
+    assert all(doc["_id"] < anchor for doc in docs)
+    assert docs == sorted(docs, key=lambda d: d["_id"], reverse=True)
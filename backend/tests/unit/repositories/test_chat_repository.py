@@ -7,6 +7,7 @@ from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
+from bson import ObjectId
 from pydantic_ai.messages import ModelRequest, ModelResponse
 
 from src.api.models.chat_history import ChatHistory
@@ -179,3 +180,68 @@ def test_get_pydantic_ai_history_converts_public_messages(chat_repo):
 
     assert isinstance(history[0], ModelRequest)
     assert isinstance(history[1], ModelResponse)
+
+
+def test_add_messages_writes_normalized_fields(chat_repo):
+    """New documents carry the fields the public history index filters on."""
+    now = datetime.now().isoformat()
+    messages = [
+        ChatHistory(text="Oi", sender=Sender.STUDENT, timestamp=now),
+        ChatHistory(text="✅ Tool executed", sender=Sender.STUDENT, timestamp=now),
+    ]
+
+    chat_repo.add_messages(messages, "session_123")
+
+    documents = chat_repo.collection.insert_many.call_args.args[0]
+    assert [(d["sender"], d["is_public"]) for d in documents] == [
+        ("Student", True),
+        ("System", False),
+    ]
+    assert all(isinstance(d["ts"], datetime) for d in documents)
+
+
+def test_get_history_builds_normalized_documents_without_legacy_decoding(chat_repo):
+    """Normalized documents are read as stored, without JSON decoding."""
+    _find_once(
+        chat_repo,
+        [
+            {
+                "_id": 1,
+                "sender": "Trainer",
+                "is_public": True,
+                "History": {"text": "Pronto", "timestamp": "2026-01-01T10:00:00"},
+            },
+        ],
+    )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            ChatRepository,
+            "_decode_legacy_chat_message",
+            staticmethod(lambda doc: pytest.fail("legacy decoding")),
+        )
+        result = chat_repo.get_history("user@test.com", limit=20)
+
+    assert [(m.sender, m.text) for m in result] == [(Sender.TRAINER, "Pronto")]
+
+
+def test_backfill_normalized_schema_bulk_updates_legacy_documents(chat_repo):
+    """The backfill sets the normalized fields with unordered bulk writes."""
+    legacy = [
+        {"_id": ObjectId(), "History": json.dumps({"type": "human", "data": {"content": "Oi"}})},
+        {"_id": ObjectId(), "History": json.dumps({"type": "system", "data": {"content": "tool"}})},
+        {"_id": ObjectId(), "History": {"sender": "Trainer", "text": "Ok", "timestamp": "t"}},
+    ]
+    chat_repo.collection.find.return_value.batch_size.return_value = legacy
+
+    counters = chat_repo.backfill_normalized_schema(batch_size=2)
+
+    assert counters == {"scanned": 3, "public": 2, "hidden": 1}
+    assert chat_repo.collection.find.call_args.args[0] == {"is_public": {"$exists": False}}
+    batches = [call.args[0] for call in chat_repo.collection.bulk_write.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 1]
+    first = batches[0][0]._doc["$set"]
+    assert first["sender"] == "Student" and first["is_public"] is True
+    assert first["History"]["text"] == "Oi"
+    assert first["ts"] == legacy[0]["_id"].generation_time
+    assert batches[0][1]._doc["$set"]["is_public"] is False
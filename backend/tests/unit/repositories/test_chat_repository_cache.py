@@ -0,0 +1,157 @@
+"""ChatRepository reads and writes through the chat history cache."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from src.api.models.chat_history import ChatHistory
+from src.api.models.sender import Sender
+from src.core.chat_history_cache import ChatHistoryCache
+from src.repositories.chat_repository import AsyncChatRepository, ChatRepository
+
+
+def _history(sender: str, text: str) -> str:
+    return json.dumps(
+        {"type": sender, "data": {"content": text, "additional_kwargs": {"timestamp": "2026-01-01T00:00:00"}}}
+    )
+
+
+class _Cursor(list):
+    def sort(self, field, direction):
+        return _Cursor(sorted(self, key=lambda d: d[field], reverse=direction < 0))
+
+    def limit(self, amount):
+        return _Cursor(self[:amount] if amount else self)
+
+
+class _Collection:
+    """Just enough of a message_store collection for the chat queries."""
+
+    def __init__(self):
+        self.docs: list[dict] = []
+        self.finds: list[dict] = []
+
+    def create_index(self, *_args, **_kwargs):
+        return None
+
+    def _matches(self, doc, query):
+        for field, cond in query.items():
+            value = doc.get(field)
+            if isinstance(cond, dict):
+                if "$lt" in cond and not value < cond["$lt"]:
+                    return False
+                if "$gte" in cond and not value >= cond["$gte"]:
+                    return False
+                if "$in" in cond and value not in cond["$in"]:
+                    return False
+            elif value != cond:
+                return False
+        return True
+
+    def find(self, query, _projection=None):
+        self.finds.append(query)
+        return _Cursor(dict(d) for d in self.docs if self._matches(d, query))
+
+    def insert_many(self, documents, ordered=True):
+        for document in documents:
+            document.setdefault("_id", ObjectId())
+            self.docs.append(dict(document))
+
+    def add(self, sender: str, text: str) -> ObjectId:
+        doc_id = ObjectId()
+        self.docs.append({"_id": doc_id, "SessionId": "s", "History": _history(sender, text)})
+        return doc_id
+
+
+@pytest.fixture
+def collection():
+    coll = _Collection()
+    for i in range(4):
+        coll.add("human", f"q{i}")
+        coll.add("ai", f"a{i}")
+    coll.add("system", "hidden")
+    return coll
+
+
+def _repository(collection, **cache_kwargs):
+    db = MagicMock()
+    db.__getitem__.return_value = collection
+    cache = ChatHistoryCache(max_sessions=8, capacity=6, **cache_kwargs)
+    return ChatRepository(db, history_cache=cache), cache
+
+
+def test_repeated_reads_are_served_from_cache(collection):
+    repo, cache = _repository(collection, revalidate_seconds=60)
+
+    first = repo.get_history("s", limit=4)
+    reads = len(collection.finds)
+    second = repo.get_history("s", limit=4, offset=1)
+
+    assert [m.text for m in first] == ["q2", "a2", "q3", "a3"]
+    assert [m.text for m in second] == ["a1", "q2", "a2", "q3"]
+    assert len(collection.finds) == reads
+    assert cache.stats.hits == 1
+
+
+def test_windows_beyond_capacity_fall_back_to_mongo(collection):
+    repo, _ = _repository(collection, revalidate_seconds=60)
+
+    result = repo.get_history("s", limit=5, offset=3)
+
+    assert [m.text for m in result] == ["q0", "a0", "q1", "a1", "q2"]
+
+
+def test_add_messages_writes_through(collection):
+    repo, _ = _repository(collection, revalidate_seconds=60)
+    repo.get_history("s", limit=2)
+    reads = len(collection.finds)
+
+    repo.add_messages([ChatHistory(text="new", sender=Sender.STUDENT, timestamp="")], "s")
+    messages, _ = repo.get_history_page("s", limit=2)
+
+    assert [m.text for m in messages] == ["a3", "new"]
+    assert len(collection.finds) == reads
+
+
+def test_probe_picks_up_writes_of_other_workers(collection):
+    repo, _ = _repository(collection, revalidate_seconds=0)
+    repo.get_history("s", limit=2)
+
+    collection.add("ai", "elsewhere")
+    collection.finds.clear()
+    result = repo.get_history("s", limit=2)
+
+    assert [m.text for m in result] == ["a3", "elsewhere"]
+    # One covered id probe plus one fetch of the unseen message.
+    assert [set(query) for query in collection.finds] == [{"SessionId", "is_public", "_id"}, {"_id"}]
+
+
+def test_deleted_history_is_reloaded(collection):
+    repo, _ = _repository(collection, revalidate_seconds=0)
+    repo.get_history("s", limit=2)
+
+    collection.docs.clear()
+
+    assert not repo.get_history("s", limit=2)
+
+
+@pytest.mark.asyncio
+async def test_async_repository_shares_the_cache(collection):
+    _, cache = _repository(collection, revalidate_seconds=60)
+    repo = AsyncChatRepository(MagicMock(), history_cache=cache)
+    repo.find_many = MagicMock()
+
+    async def find_many(spec):
+        return list(spec.cursor(collection))
+
+    repo.find_many.side_effect = find_many
+
+    first = await repo.get_pydantic_ai_history("s", limit=2)
+    reads = len(collection.finds)
+    second = await repo.get_pydantic_ai_history("s", limit=2)
+
+    assert len(first) == len(second) == 2
+    assert second[-1].parts[0].content == "a3"
+    assert len(collection.finds) == reads
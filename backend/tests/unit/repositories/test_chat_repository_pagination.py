@@ -48,6 +48,29 @@ def test_get_history_uses_desc_cursor_window(chat_repository):
     mock_find_cursor.limit.assert_called()
     first_call = chat_repository.collection.find.call_args_list[0]
     second_call = chat_repository.collection.find.call_args_list[1]
-    assert first_call.args[0] == {"SessionId": "abc"}
-    assert first_call.args[1] == {"History": 1}
-    assert second_call.args[0] == {"SessionId": "abc", "_id": {"$lt": 30}}
+    public = {"$in": [True, None]}
+    assert first_call.args[0] == {"SessionId": "abc", "is_public": public}
+    assert first_call.args[1] == {"History": 1, "sender": 1, "is_public": 1}
+    assert second_call.args[0] == {"SessionId": "abc", "is_public": public, "_id": {"$lt": 30}}
+
+
+def test_get_history_page_starts_at_cursor_and_returns_next_anchor(chat_repository):
+    """Cursor pages read from their own position instead of rescanning newer messages."""
+    human = '{"type":"human","data":{"content":"m%d","additional_kwargs":{"timestamp":"2026-01-01T00:00:00"}}}'
+    docs = [{"_id": 50 - i, "History": human % (50 - i)} for i in range(6)]
+    mock_find_cursor = MagicMock()
+    mock_find_cursor.sort.return_value = mock_find_cursor
+    mock_find_cursor.limit.return_value = docs
+    chat_repository.collection.find.return_value = mock_find_cursor
+
+    messages, next_before = chat_repository.get_history_page("abc", limit=3, before=51)
+
+    assert chat_repository.collection.find.call_args.args[0] == {
+        "SessionId": "abc",
+        "is_public": {"$in": [True, None]},
+        "_id": {"$lt": 51},
+    }
+    # Oldest first for the UI; the next page continues below the oldest served.
+    assert [m.text for m in messages] == ["m48", "m49", "m50"]
+    assert next_before == 48
+    assert chat_repository.collection.find.call_count == 1
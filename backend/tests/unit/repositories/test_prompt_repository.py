@@ -6,15 +6,15 @@ class TestPromptRepository(unittest.TestCase):
     def setUp(self):
         self.mock_db = MagicMock()
         self.mock_collection = MagicMock()
-        self.mock_db.__getitem__.return_value = self.mock_collection
+        self.mock_rollups = MagicMock()
+        self.mock_db.__getitem__.side_effect = lambda name: (
+            self.mock_rollups if name == "usage_rollups" else self.mock_collection
+        )
         self.repo = PromptRepository(self.mock_db)
 
-    def test_log_prompt_inserts_and_trims_with_pydantic(self):
-        # Setup mock for find().sort().limit()
-        mock_cursor = MagicMock()
-        self.mock_collection.find.return_value = mock_cursor
-        mock_cursor.sort.return_value = mock_cursor
-        mock_cursor.limit.return_value = []
+    def test_log_prompt_writes_ring_slot_with_pydantic(self):
+        # Slot counter after reserving one slot
+        self.mock_collection.find_one_and_update.return_value = {"seq": 3}
 
         # Create a dummy Pydantic-like object (or use a real one if simple)
         from pydantic import BaseModel
@@ -27,10 +27,47 @@ class TestPromptRepository(unittest.TestCase):
         # Call log_prompt
         self.repo.log_prompt("test@user.com", data, max_logs=2)
 
-        # Verify insert - should have converted to dict
-        self.mock_collection.insert_one.assert_called_once()
-        inserted_doc = self.mock_collection.insert_one.call_args[0][0]
-        self.assertEqual(inserted_doc["prompt"]["model"], {"name": "test", "val": 123})
+        # One upsert into slot (3 - 1) % 2, no sorted read or trim
+        self.mock_collection.find.assert_not_called()
+        self.mock_collection.delete_many.assert_not_called()
+        operations = self.mock_collection.bulk_write.call_args[0][0]
+        self.assertEqual(len(operations), 1)
+        self.assertEqual(operations[0]._filter, {"user_email": "test@user.com", "slot": 0})
+        self.assertTrue(operations[0]._upsert)
+        # Should have converted to dict
+        self.assertEqual(operations[0]._doc["prompt"]["model"], {"name": "test", "val": 123})
+
+    def test_write_batch_reserves_slots_once_per_user(self):
+        from datetime import datetime, timezone
+        now = datetime(2026, 4, 3, 12, tzinfo=timezone.utc)
+        self.mock_collection.find_one_and_update.side_effect = [{"seq": 5}, {"seq": 1}]
+        entries = [
+            ("a@user.com", {"n": 1, "timestamp": now}),
+            ("b@user.com", {"n": 2, "timestamp": now}),
+            ("a@user.com", {"n": 3, "timestamp": now}),
+            ("a@user.com", {"n": 4, "timestamp": now}),
+        ]
+
+        self.repo.write_batch(entries, max_logs=2)
+
+        increments = [
+            call.args[1]["$inc"]["seq"]
+            for call in self.mock_collection.find_one_and_update.call_args_list
+        ]
+        # Only the newest max_logs entries of a user are written
+        self.assertEqual(increments, [2, 1])
+        self.mock_collection.bulk_write.assert_called_once()
+        operations = self.mock_collection.bulk_write.call_args[0][0]
+        self.assertEqual(
+            [(op._filter["user_email"], op._filter["slot"], op._doc["n"]) for op in operations],
+            [("a@user.com", 1, 3), ("a@user.com", 0, 4), ("b@user.com", 0, 2)],
+        )
+        # Trimmed entries still count towards the usage rollups
+        rollup_ops = self.mock_rollups.bulk_write.call_args[0][0]
+        self.assertEqual(
+            sorted((op._filter["user_email"], op._doc["$inc"]["request_count"]) for op in rollup_ops),
+            [("a@user.com", 3), ("b@user.com", 1)],
+        )
 
     def test_get_user_prompts(self):
         mock_cursor = MagicMock()
@@ -0,0 +1,69 @@
+"""Tests for the persisted TDEE state repository."""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.api.models.weight_log import WeightLog
+from src.repositories.tdee_state_repository import TdeeStateRepository
+from src.repositories.weight_repository import WeightRepository
+
+
+@pytest.fixture
+def mock_db():
+    db_mock = MagicMock()
+    db_mock.__getitem__.return_value = MagicMock()
+    return db_mock
+
+
+@pytest.fixture
+def state_repo(mock_db):
+    return TdeeStateRepository(mock_db)
+
+
+def test_save_state_upserts_when_no_version_was_read(state_repo, mock_db):
+    collection = mock_db.__getitem__.return_value
+    collection.update_one.return_value = MagicMock(matched_count=0, upserted_id="x")
+
+    assert state_repo.save_state("a@b.com", 4, {"result": {"tdee": 2000}})
+
+    query, update = collection.update_one.call_args[0]
+    assert query == {"user_email": "a@b.com", "lookback_weeks": 4}
+    assert update["$set"]["stale"] is False
+    assert update["$setOnInsert"] == {"version": 0}
+    assert collection.update_one.call_args[1]["upsert"] is True
+
+
+def test_save_state_is_discarded_when_version_moved(state_repo, mock_db):
+    collection = mock_db.__getitem__.return_value
+    collection.update_one.return_value = MagicMock(matched_count=0, upserted_id=None)
+
+    assert not state_repo.save_state("a@b.com", 4, {}, expected_version=2)
+
+    query = collection.update_one.call_args[0][0]
+    assert query["version"] == 2
+    assert collection.update_one.call_args[1]["upsert"] is False
+
+
+def test_mark_stale_bumps_version_and_tracks_earliest_day(state_repo, mock_db):
+    collection = mock_db.__getitem__.return_value
+
+    state_repo.mark_stale("a@b.com", date(2026, 3, 4))
+
+    query, update = collection.update_many.call_args[0]
+    assert query == {"user_email": "a@b.com"}
+    assert update["$set"] == {"stale": True}
+    assert update["$min"] == {"stale_from": datetime(2026, 3, 4)}
+    assert update["$inc"] == {"version": 1}
+
+
+def test_weight_save_marks_tdee_state_stale(mock_db):
+    collection = mock_db.__getitem__.return_value
+    collection.update_one.return_value = MagicMock(upserted_id="new")
+    tdee_states = MagicMock()
+    repo = WeightRepository(mock_db, tdee_states=tdee_states)
+
+    repo.save_log(WeightLog(user_email="a@b.com", date=date(2026, 3, 4), weight_kg=80))
+
+    tdee_states.mark_stale.assert_called_once_with("a@b.com", date(2026, 3, 4))
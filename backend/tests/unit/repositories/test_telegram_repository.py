@@ -83,3 +83,41 @@ class TestIdempotency:
 
         result = telegram_repo.try_record_update(123)
         assert result is False
+
+
+class TestUpdateQueue:
+    """Test the persisted webhook update queue."""
+
+    def test_enqueue_update_skips_updates_still_queued(self, telegram_repo, mock_db):
+        queue = mock_db["telegram_update_queue"]
+        queue.update_one.return_value.upserted_id = None
+
+        assert telegram_repo.enqueue_update(10, 555, {"update_id": 10}) is False
+        mock_db["telegram_processed_updates"].insert_one.assert_not_called()
+
+    def test_enqueue_update_drops_updates_already_processed(self, telegram_repo, mock_db):
+        mock_db["telegram_processed_updates"].insert_one.side_effect = [
+            MagicMock(),
+            DuplicateKeyError("Duplicate key"),
+        ]
+
+        assert telegram_repo.enqueue_update(10, 555, {"update_id": 10}) is True
+        assert telegram_repo.enqueue_update(10, 555, {"update_id": 10}) is False
+        mock_db["telegram_update_queue"].delete_one.assert_called_once_with(
+            {"update_id": 10, "status": "pending"}
+        )
+
+    def test_enqueue_update_queues_before_recording(self, telegram_repo, mock_db):
+        mock_db["telegram_update_queue"].update_one.side_effect = RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            telegram_repo.enqueue_update(10, 555, {"update_id": 10})
+        mock_db["telegram_processed_updates"].insert_one.assert_not_called()
+
+    def test_claim_update_requires_pending_or_expired_lease(self, telegram_repo, mock_db):
+        mock_db["telegram_update_queue"].find_one_and_update.return_value = None
+
+        assert telegram_repo.claim_update(10, "worker", 300) is False
+        query = mock_db["telegram_update_queue"].find_one_and_update.call_args.args[0]
+        assert query["update_id"] == 10
+        assert {"status": "pending"} in query["$or"]
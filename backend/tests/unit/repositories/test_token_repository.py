@@ -3,6 +3,7 @@
 import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import MagicMock
+from bson import ObjectId
 from src.repositories.token_repository import TokenRepository
 
 
@@ -221,3 +222,27 @@ class TestTokenRepositoryEdgeCases:
             token_repo.is_blocklisted("token")
 
         assert "DB Error" in str(exc_info.value)
+
+
+class TestBlockedSince:
+    """Incremental reads used by the in-process blocklist view."""
+
+    def test_blocked_since_reads_unexpired_entries_in_id_order(self, token_repo, mock_db):
+        collection = mock_db.__getitem__.return_value
+        collection.find.return_value.sort.return_value = [{"_id": 1}]
+
+        result = token_repo.blocked_since()
+
+        assert result == [{"_id": 1}]
+        query = collection.find.call_args.args[0]
+        assert set(query) == {"expires_at"}
+        collection.find.return_value.sort.assert_called_once_with("_id", 1)
+
+    def test_blocked_since_starts_at_given_id(self, token_repo, mock_db):
+        collection = mock_db.__getitem__.return_value
+        collection.find.return_value.sort.return_value = []
+        since = ObjectId()
+
+        token_repo.blocked_since(since)
+
+        assert collection.find.call_args.args[0]["_id"] == {"$gte": since}
@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock
+from src.core.profile_cache import ProfileCache
 from src.repositories.trainer_repository import TrainerRepository
 from src.api.models.trainer_profile import TrainerProfile
 
@@ -438,3 +439,22 @@ class TestTrainerRepositoryIntegration:
         result = trainer_repo.get_profile("user@example.com")
 
         assert result.trainer_type == "sofia"
+
+
+class TestTrainerRepositoryProfileCache:
+    """Test the per-process profile cache wiring."""
+
+    def test_save_profile_writes_through_to_cache(self, mock_db, sample_trainer_profile):
+        """A saved trainer should be served without another read."""
+        repo = TrainerRepository(mock_db, profile_cache=ProfileCache(max_entries=8))
+        collection = mock_db.__getitem__.return_value
+        collection.find_one.return_value = {**sample_trainer_profile.model_dump(), "profile_version": 3}
+        repo.get_profile("user@example.com")
+
+        repo.save_profile(TrainerProfile(user_email="user@example.com", trainer_type="luna"))
+        profile = repo.get_profile("user@example.com")
+
+        assert profile.trainer_type == "luna"
+        collection.find_one.assert_called_once_with({"user_email": "user@example.com"})
+        update_doc = collection.update_one.call_args[0][1]
+        assert update_doc["$inc"] == {"profile_version": 1}
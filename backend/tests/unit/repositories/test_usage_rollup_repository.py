@@ -0,0 +1,94 @@
+"""Tests for the per-user daily usage rollups."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from src.repositories.usage_rollup_repository import (
+    UsageRollupRepository,
+    latency_bucket,
+    latency_percentiles,
+)
+
+
+def _repository():
+    collection = MagicMock()
+    database = MagicMock()
+    database.__getitem__.return_value = collection
+    return UsageRollupRepository(database), collection
+
+
+def test_record_sums_entries_per_user_and_day():
+    repository, collection = _repository()
+    day = datetime(2026, 4, 3, 9, tzinfo=timezone.utc)
+    entries = [
+        ("a@x.com", {"timestamp": day, "tokens_input": 100, "tokens_output": 10,
+                     "cache_read_tokens": 50, "usage_cost": 0.01, "tool_calls_count": 2,
+                     "duration_ms": 900, "resolved_model": "old"}),
+        ("a@x.com", {"timestamp": day.replace(hour=11), "tokens_input": 40, "usage_cost": None,
+                     "duration_ms": 4000, "resolved_model": "new"}),
+        ("a@x.com", {"timestamp": day.replace(day=4), "tokens_input": 7, "duration_ms": 100}),
+    ]
+
+    repository.record(entries)
+
+    operations = collection.bulk_write.call_args[0][0]
+    assert collection.bulk_write.call_args.kwargs == {"ordered": False}
+    assert [op._filter["date"] for op in operations] == [
+        datetime(2026, 4, 3), datetime(2026, 4, 4)
+    ]
+    first = operations[0]._doc
+    assert first["$inc"] == {
+        "tokens_input": 140,
+        "tokens_output": 10,
+        "cache_read_tokens": 50,
+        "cache_write_tokens": 0,
+        "cost": 0.01,
+        "request_count": 2,
+        "tool_call_count": 2,
+        "latency_hist.1000": 1,
+        "latency_hist.5000": 1,
+    }
+    assert first["$max"] == {"last_activity": day.replace(hour=11)}
+    assert first["$set"]["resolved_model"] == "new"
+    assert all(op._upsert for op in operations)
+
+
+def test_latency_percentiles_from_histogram():
+    assert latency_bucket(0) == "250"
+    assert latency_bucket(250) == "250"
+    assert latency_bucket(10**7) == "inf"
+    histogram = {"250": 50, "2000": 40, "inf": 10}
+    assert latency_percentiles(histogram) == {"p50_ms": 250, "p90_ms": 2000, "p99_ms": 120000}
+    assert latency_percentiles({}) == {"p50_ms": None, "p90_ms": None, "p99_ms": None}
+
+
+def test_summary_reads_rollups_and_adds_percentiles():
+    repository, collection = _repository()
+    collection.aggregate.return_value = [
+        {"_id": "a@x.com", "total_input": 10, "latency_500": 3, "latency_inf": 0}
+    ]
+
+    summary = repository.get_token_summary(days=7)
+
+    assert summary == [
+        {"_id": "a@x.com", "total_input": 10, "p50_ms": 500, "p90_ms": 500, "p99_ms": 500}
+    ]
+    match = collection.aggregate.call_args[0][0][0]["$match"]
+    assert match["date"]["$gte"].tzinfo is None
+
+
+def test_seed_skips_days_that_already_have_rollups():
+    repository, collection = _repository()
+    collection.find.return_value = [{"user_email": "a@x.com", "date": datetime(2026, 4, 3)}]
+    logs = MagicMock()
+    logs.find.return_value = [
+        {"user_email": "a@x.com", "timestamp": datetime(2026, 4, 3, 8), "tokens_input": 1},
+        {"user_email": "a@x.com", "timestamp": datetime(2026, 4, 2, 8), "tokens_input": 2,
+         "prompt": {"tool_calls_count": 3}},
+    ]
+
+    assert repository.seed_from_logs(logs) == 1
+
+    operations = collection.bulk_write.call_args[0][0]
+    assert [op._filter["date"] for op in operations] == [datetime(2026, 4, 2)]
+    assert operations[0]._doc["$inc"]["tool_call_count"] == 3
@@ -4,6 +4,7 @@
 from unittest.mock import MagicMock
 
 import pytest
+from src.core.profile_cache import ProfileCache
 from src.repositories.user_repository import UserRepository
 from src.api.models.user_profile import UserProfile
 
@@ -216,7 +217,7 @@ class TestUserRepositoryUpdateProfileFields:
         assert result is True
         mock_db.__getitem__.return_value.update_one.assert_called_once_with(
             {"email": "test@example.com"},
-            {"$set": {"weight": 85.0, "age": 31}}
+            {"$set": {"weight": 85.0, "age": 31}, "$inc": {"profile_version": 1}}
         )
 
     def test_update_profile_fields_no_changes(self, user_repo, mock_db):
@@ -279,6 +280,7 @@ class TestUserRepositoryUpdateProfileFields:
             {
                 "$set": {"notes": "kept"},
                 "$unset": {"display_name": "", "photo_base64": ""},
+                "$inc": {"profile_version": 1},
             },
         )
         call_args = mock_db.__getitem__.return_value.update_one.call_args
@@ -345,3 +347,40 @@ class TestUserRepositoryIndexes:
         _ = UserRepository(mock_db)
         collection = mock_db.__getitem__.return_value
         assert collection.create_index.call_count == 2
+
+
+class TestUserRepositoryProfileCache:
+    """Test the per-process profile cache wiring."""
+
+    @pytest.fixture
+    def cached_repo(self, mock_db):
+        """UserRepository with its own profile cache."""
+        return UserRepository(mock_db, profile_cache=ProfileCache(max_entries=8))
+
+    def test_get_profile_is_served_from_cache(self, cached_repo, mock_db, sample_user_profile):
+        """A second read within the revalidation window should not hit Mongo."""
+        collection = mock_db.__getitem__.return_value
+        collection.find_one.return_value = {**sample_user_profile.model_dump(), "profile_version": 1}
+
+        first = cached_repo.get_profile("test@example.com")
+        second = cached_repo.get_profile("test@example.com")
+
+        assert first == second
+        collection.find_one.assert_called_once_with({"email": "test@example.com"})
+
+    def test_writes_update_the_cached_profile(self, cached_repo, mock_db, sample_user_profile):
+        """Partial updates and message counters should be visible without a reload."""
+        collection = mock_db.__getitem__.return_value
+        collection.find_one.return_value = {**sample_user_profile.model_dump(), "profile_version": 1}
+        collection.update_one.return_value.modified_count = 1
+        cached_repo.get_profile("test@example.com")
+
+        cached_repo.update_profile_fields("test@example.com", {"weight": 82.0})
+        collection.find_one.return_value = {"last_message_date": None}
+        cached_repo.increment_message_counts("test@example.com")
+        profile = cached_repo.get_profile("test@example.com")
+
+        assert profile.weight == 82.0
+        assert profile.total_messages_sent == sample_user_profile.total_messages_sent + 1
+        assert profile.messages_sent_today == 1
+        assert collection.find_one.call_count == 2
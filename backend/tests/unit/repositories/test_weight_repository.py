@@ -164,6 +164,38 @@ class TestWeightRepositorySaveLog:
         assert isinstance(update_data["date"], datetime)
 
 
+class TestWeightRepositorySaveLogs:
+    """Test save_logs bulk upsert."""
+
+    def test_save_logs_counts_from_bulk_result(self, mock_db):
+        """One unordered bulk write; counts come from the bulk result."""
+        tdee_states = MagicMock()
+        repo = WeightRepository(mock_db, tdee_states=tdee_states)
+        collection = mock_db.__getitem__.return_value
+        collection.bulk_write.return_value = MagicMock(upserted_count=2, matched_count=1)
+        logs = [
+            WeightLog(user_email="user@example.com", date=date(2024, 1, day), weight_kg=80.0)
+            for day in (3, 1, 2)
+        ]
+
+        created, updated = repo.save_logs(logs)
+
+        assert (created, updated) == (2, 1)
+        operations = collection.bulk_write.call_args[0][0]
+        assert collection.bulk_write.call_args[1] == {"ordered": False}
+        assert [op._filter["date"] for op in operations] == [
+            datetime(2024, 1, 3), datetime(2024, 1, 1), datetime(2024, 1, 2)
+        ]
+        assert all(op._upsert for op in operations)
+        collection.find_one.assert_not_called()
+        tdee_states.mark_stale.assert_called_once_with("user@example.com", date(2024, 1, 1))
+
+    def test_save_logs_empty(self, weight_repo, mock_db):
+        """Nothing to write issues no command."""
+        assert weight_repo.save_logs([]) == (0, 0)
+        mock_db.__getitem__.return_value.bulk_write.assert_not_called()
+
+
 class TestWeightRepositoryDeleteLog:
     """Test delete_log method."""
 
@@ -0,0 +1,218 @@
+"""Tests for the materialized workout statistics."""
+
+import random
+import re
+from copy import deepcopy
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from src.api.models.workout_log import ExerciseLog, WorkoutLog
+from src.repositories.workout_repository import WorkoutRepository
+from src.repositories.workout_stats_repository import WorkoutStatsRepository
+
+USER = "stats@test.com"
+
+
+def _value_matches(doc: dict, key: str, condition) -> bool:
+    if key == "exercises.name":
+        values = [ex.get("name", "") for ex in doc.get("exercises", [])]
+    else:
+        values = [doc.get(key)]
+    if isinstance(condition, dict):
+        if "$in" in condition:
+            return any(value in condition["$in"] for value in values)
+        if "$regex" in condition:
+            pattern = re.compile(condition["$regex"], re.IGNORECASE)
+            return any(value and pattern.search(value) for value in values)
+        raise NotImplementedError(condition)
+    return condition in values
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, field, direction):
+        self.docs.sort(key=lambda doc: doc[field], reverse=direction < 0)
+        return self
+
+    def __iter__(self):
+        return iter(deepcopy(self.docs))
+
+
+class FakeCollection:
+    def __init__(self, unique_key=None):
+        self.docs = []
+        self.unique_key = unique_key
+
+    def create_index(self, *_args, **_kwargs):
+        return None
+
+    def _find(self, query):
+        return [
+            doc
+            for doc in self.docs
+            if all(_value_matches(doc, key, value) for key, value in query.items())
+        ]
+
+    def find(self, query, _projection=None):
+        return FakeCursor(list(self._find(query)))
+
+    def find_one(self, query, _projection=None, sort=None):
+        docs = self._find(query)
+        if sort:
+            docs = sorted(docs, key=lambda doc: doc[sort[0][0]], reverse=sort[0][1] < 0)
+        return deepcopy(docs[0]) if docs else None
+
+    def count_documents(self, query):
+        return len(self._find(query))
+
+    def insert_one(self, doc):
+        key = self.unique_key
+        if key and any(existing[key] == doc[key] for existing in self.docs):
+            raise DuplicateKeyError("duplicate")
+        doc.setdefault("_id", ObjectId())
+        self.docs.append(deepcopy(doc))
+        return type("Result", (), {"inserted_id": doc["_id"]})
+
+    def replace_one(self, query, replacement):
+        previous = self.find_one_and_replace(query, replacement)
+        return type("Result", (), {"matched_count": int(previous is not None)})
+
+    def find_one_and_replace(self, query, replacement, return_document=None):
+        for index, doc in enumerate(self.docs):
+            if doc in self._find(query):
+                self.docs[index] = {"_id": doc["_id"], **deepcopy(replacement)}
+                assert return_document in (None, ReturnDocument.BEFORE)
+                return deepcopy(doc)
+        return None
+
+    def find_one_and_delete(self, query):
+        for doc in self._find(query):
+            self.docs.remove(doc)
+            return deepcopy(doc)
+        return None
+
+    def delete_one(self, query):
+        return self.find_one_and_delete(query)
+
+    def delete_many(self, query):
+        matched = self._find(query)
+        self.docs = [doc for doc in self.docs if doc not in matched]
+        return type("Result", (), {"deleted_count": len(matched)})
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection("user_email" if name == "workout_stats" else None)
+        return self[name]
+
+
+def _workout(day: datetime, rng: random.Random) -> WorkoutLog:
+    names = ["Supino Reto", "Agachamento Livre", "Remada Curvada", "Rosca", "Bench Press"]
+    exercises = [
+        ExerciseLog(
+            name=name,
+            sets=2,
+            reps_per_set=[rng.randint(3, 12), rng.randint(3, 12)],
+            weights_per_set=[rng.choice([0, 20, 40, 60, 80]), rng.choice([20, 40, 60, 80, 100])],
+        )
+        for name in rng.sample(names, rng.randint(0, 3))
+    ]
+    return WorkoutLog(
+        user_email=USER,
+        date=day,
+        workout_type=rng.choice(["Upper", "Lower", None]),
+        exercises=exercises,
+    )
+
+
+def _comparable(stats):
+    data = stats.model_dump()
+    data["weekly_volume"] = sorted((v["category"], v["volume"]) for v in data["weekly_volume"])
+    return data
+
+
+def test_incremental_stats_match_full_history_scan():
+    rng = random.Random(7)
+    database = FakeDatabase()
+    stats_repo = WorkoutStatsRepository(database)
+    materialized = WorkoutRepository(database, workout_stats=stats_repo)
+    full_scan = WorkoutRepository(database)
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    free_days = [today - timedelta(days=offset) for offset in range(120)]
+    rng.shuffle(free_days)
+    ids: dict[str, datetime] = {}
+
+    materialized.get_stats(USER)  # creates the (empty) stats document
+    for _ in range(150):
+        action = rng.random()
+        if action < 0.55 or not ids:
+            day = free_days.pop()
+            ids[materialized.save_log(_workout(day, rng))] = day
+        elif action < 0.8:
+            workout_id = rng.choice(list(ids))
+            day = ids[workout_id] if rng.random() < 0.5 else free_days.pop()
+            assert materialized.update_log(workout_id, USER, _workout(day, rng))
+            free_days.append(ids[workout_id]) if day != ids[workout_id] else None
+            ids[workout_id] = day
+        else:
+            workout_id = rng.choice(list(ids))
+            assert materialized.delete_log(workout_id)
+            free_days.append(ids.pop(workout_id))
+
+        assert _comparable(materialized.get_stats(USER)) == _comparable(
+            full_scan.get_stats(USER)
+        )
+
+    assert stats_repo.collection.docs[0]["version"] > 100
+
+
+def test_stats_document_is_rebuilt_after_out_of_band_writes():
+    database = FakeDatabase()
+    stats_repo = WorkoutStatsRepository(database)
+    repo = WorkoutRepository(database, workout_stats=stats_repo)
+    repo.save_log(_workout(datetime.now() - timedelta(days=1), random.Random(1)))
+
+    # A script inserting logs directly bypasses the incremental update.
+    database["workout_logs"].insert_one(
+        _workout(datetime.now() - timedelta(days=2), random.Random(2)).model_dump()
+    )
+
+    assert repo.get_stats(USER).total_workouts == 2
+    assert stats_repo.collection.docs[0]["total_workouts"] == 2
+
+
+def test_deleting_the_record_holder_recomputes_that_exercise_only():
+    database = FakeDatabase()
+    stats_repo = WorkoutStatsRepository(database)
+    repo = WorkoutRepository(database, workout_stats=stats_repo)
+    base = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def log(days_ago, weight):
+        return repo.save_log(
+            WorkoutLog(
+                user_email=USER,
+                date=base - timedelta(days=days_ago),
+                workout_type="Lower",
+                exercises=[
+                    ExerciseLog(
+                        name="Squat", sets=1, reps_per_set=[5], weights_per_set=[weight]
+                    )
+                ],
+            )
+        )
+
+    log(10, 100)
+    record_id = log(5, 120)
+    log(1, 110)
+    assert repo.get_stats(USER).recent_prs[0].weight == 120
+
+    repo.delete_user_logs(USER, [ObjectId(record_id)])
+
+    stats = repo.get_stats(USER)
+    assert stats.recent_prs[0].weight == 110
+    assert stats.strength_radar["Legs"] == 1.0
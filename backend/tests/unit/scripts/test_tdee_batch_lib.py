@@ -0,0 +1,143 @@
+"""Tests for the batch TDEE recompute helpers."""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+
+from pymongo.errors import BulkWriteError
+
+from scripts.tdee_batch_lib import (
+    UserSnapshotDatabase,
+    build_chunk_pipeline,
+    build_write_operations,
+    bulk_write_tolerant,
+    recompute_chunk,
+)
+from src.services.adaptive_tdee import AdaptiveTDEEService
+
+USER = "batch@test.com"
+
+
+def _user_doc(days: int = 28) -> dict:
+    today = date.today()
+    weights, nutrition = [], []
+    for i in range(days):
+        day = today - timedelta(days=days - 1 - i)
+        stored = datetime(day.year, day.month, day.day)
+        if i % 3 != 1:
+            weights.append(
+                {"user_email": USER, "date": stored, "weight_kg": round(84 - 0.05 * i, 2)}
+            )
+        if i % 5 != 2:
+            nutrition.append(
+                {
+                    "user_email": USER,
+                    "date": stored,
+                    "calories": 2000 + (i % 4) * 75,
+                    "protein_grams": 150,
+                    "carbs_grams": 200,
+                    "fat_grams": 70,
+                }
+            )
+    return {
+        "_id": "mongo-id",
+        "email": USER,
+        "gender": "Feminino",
+        "age": 31,
+        "weight": 84,
+        "height": 168,
+        "goal_type": "lose",
+        "weekly_rate": 0.5,
+        "window_weights": weights,
+        "recent_weights": list(reversed(weights)),
+        "window_nutrition": nutrition,
+        "recent_nutrition": list(reversed(nutrition)),
+        "plans": [],
+        "tdee_states": [],
+    }
+
+
+def test_recompute_matches_live_service_and_records_writes():
+    doc = _user_doc()
+    golden = AdaptiveTDEEService(UserSnapshotDatabase(_user_doc())).calculate_tdee(USER)
+
+    [outcome] = recompute_chunk([doc], 4)
+
+    assert outcome["status"] == "rebuilt"
+    assert outcome["saved_state"]["state"]["result"] == golden
+    assert outcome["saved_state"]["expected_version"] is None
+
+
+def test_valid_stored_state_is_not_recomputed():
+    [first] = recompute_chunk([_user_doc()], 4)
+    doc = _user_doc()
+    doc["tdee_states"] = [
+        {**first["saved_state"]["state"], "stale": False, "version": 3}
+    ]
+    if first["coaching_target"]:
+        doc["tdee_last_target"], doc["tdee_last_check_in"] = first["coaching_target"]
+
+    [second] = recompute_chunk([doc], 4)
+
+    assert second["status"] == "fresh"
+    assert second["saved_state"] is None
+
+
+def test_invalid_profile_is_reported_not_raised():
+    doc = _user_doc()
+    doc["age"] = "not-a-number"
+
+    [outcome] = recompute_chunk([doc], 4)
+
+    assert outcome["status"] == "error"
+
+
+def test_write_operations_keep_version_guard():
+    outcomes = [
+        {
+            "email": USER,
+            "status": "rebuilt",
+            "coaching_target": (1800, "2026-01-05"),
+            "saved_state": {"state": {"result": {}}, "expected_version": 2},
+        }
+    ]
+
+    user_ops, state_ops = build_write_operations(outcomes, 4)
+
+    assert user_ops[0]._doc == {
+        "$set": {"tdee_last_target": 1800, "tdee_last_check_in": "2026-01-05"},
+        "$inc": {"profile_version": 1},
+    }
+    assert state_ops[0]._filter["version"] == 2
+    assert state_ops[0]._upsert is False
+
+
+def test_bulk_write_errors_are_reported_not_raised():
+    collection = MagicMock()
+    collection.bulk_write.side_effect = BulkWriteError(
+        {
+            "nMatched": 3,
+            "nUpserted": 1,
+            "writeErrors": [{"index": 2, "code": 11000, "errmsg": "duplicate key"}],
+        }
+    )
+
+    written, errors = bulk_write_tolerant(collection, [object()] * 5)
+
+    assert written == 4
+    assert errors == [{"index": 2, "code": 11000, "errmsg": "duplicate key"}]
+
+
+def test_chunk_pipeline_resumes_after_last_email():
+    pipeline = build_chunk_pipeline("m@x.com", 100, 4, date(2026, 3, 1))
+
+    assert pipeline[0] == {"$match": {"email": {"$gt": "m@x.com"}}}
+    assert pipeline[2] == {"$limit": 100}
+    lookups = [stage["$lookup"]["as"] for stage in pipeline if "$lookup" in stage]
+    assert lookups == [
+        "window_weights",
+        "recent_weights",
+        "window_nutrition",
+        "recent_nutrition",
+        "plans",
+        "tdee_states",
+    ]
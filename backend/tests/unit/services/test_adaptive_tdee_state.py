@@ -0,0 +1,196 @@
+"""Golden-output tests for the persisted Adaptive TDEE state."""
+
+from copy import deepcopy
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.api.models.nutrition_log import NutritionLog
+from src.api.models.user_profile import UserProfile
+from src.api.models.weight_log import WeightLog
+from src.services.adaptive_tdee import AdaptiveTDEEService
+
+USER = "state@test.com"
+
+
+def _day(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+class LogsOnlyDatabase:
+    """Database surface without TDEE state support (pre-state behaviour)."""
+
+    def __init__(self, weights, nutrition, profile):
+        self.weights = weights
+        self.nutrition = nutrition
+        self.profile = profile
+        self.log_reads = 0
+        self.coaching_updates = []
+
+    def get_weight_logs_by_date_range(self, _email, start, end):
+        self.log_reads += 1
+        return [log for log in self.weights if start <= log.date <= end]
+
+    def get_nutrition_logs_by_date_range(self, _email, start, end):
+        return [log for log in self.nutrition if start.date() <= _day(log.date) <= end.date()]
+
+    def get_weight_logs(self, _email, limit=30):
+        return sorted(self.weights, key=lambda log: log.date, reverse=True)[:limit]
+
+    def get_nutrition_logs(self, _email, limit=30):
+        return sorted(self.nutrition, key=lambda log: log.date, reverse=True)[:limit]
+
+    def get_user_profile(self, _email):
+        return self.profile.model_copy()
+
+    def get_plan(self, _email):
+        return None
+
+    def update_user_coaching_target(self, _email, target, check_in_date):
+        self.coaching_updates.append(target)
+        self.profile.tdee_last_target = target
+        self.profile.tdee_last_check_in = check_in_date
+
+
+class StatefulDatabase(LogsOnlyDatabase):
+    """Adds an in-memory TDEE state store mirroring TdeeStateRepository."""
+
+    def __init__(self, weights, nutrition, profile):
+        super().__init__(weights, nutrition, profile)
+        self.states: dict[tuple[str, int], dict] = {}
+
+    def get_tdee_state(self, email, lookback_weeks):
+        state = self.states.get((email, lookback_weeks))
+        return deepcopy(state) if state else None
+
+    def save_tdee_state(self, email, lookback_weeks, state, expected_version=None):
+        current = self.states.get((email, lookback_weeks))
+        version = current.get("version", 0) if current else 0
+        if expected_version is not None and version != expected_version:
+            return False
+        self.states[(email, lookback_weeks)] = {
+            **deepcopy(state),
+            "stale": False,
+            "version": version,
+        }
+        return True
+
+    def mark_stale(self, email):
+        for (state_email, _), state in self.states.items():
+            if state_email == email:
+                state["stale"] = True
+                state["version"] = state.get("version", 0) + 1
+
+    def save_weight_log(self, log):
+        self.weights = [item for item in self.weights if item.date != log.date] + [log]
+        self.mark_stale(log.user_email)
+
+
+def _build_dataset(days: int = 28):
+    today = date.today()
+    start = today - timedelta(days=days - 1)
+    weights = []
+    nutrition = []
+    for i in range(days):
+        day = start + timedelta(days=i)
+        if i % 3 != 1:
+            weights.append(
+                WeightLog(
+                    user_email=USER,
+                    date=day,
+                    weight_kg=round(85.0 - 0.07 * i + (0.3 if i % 4 == 0 else -0.1), 2),
+                    body_fat_pct=24.0 - 0.02 * i,
+                )
+            )
+        if i % 5 != 2:
+            nutrition.append(
+                NutritionLog(
+                    user_email=USER,
+                    date=day,
+                    calories=2100 + (i % 4) * 60,
+                    protein_grams=160,
+                    carbs_grams=210,
+                    fat_grams=70,
+                )
+            )
+    profile = UserProfile(
+        email=USER,
+        gender="Masculino",
+        age=34,
+        weight=85,
+        height=180,
+        goal_type="lose",
+        weekly_rate=0.5,
+    )
+    return weights, nutrition, profile
+
+
+@pytest.fixture
+def dataset():
+    return _build_dataset()
+
+
+def test_persisted_state_matches_full_v3_computation(dataset):
+    weights, nutrition, profile = dataset
+    golden = AdaptiveTDEEService(
+        LogsOnlyDatabase(list(weights), list(nutrition), profile.model_copy())
+    ).calculate_tdee(USER)
+
+    database = StatefulDatabase(list(weights), list(nutrition), profile.model_copy())
+    first = AdaptiveTDEEService(database).calculate_tdee(USER)
+    reads_after_rebuild = database.log_reads
+    second = AdaptiveTDEEService(database).calculate_tdee(USER)
+
+    assert first == golden
+    assert second == golden
+    assert database.log_reads == reads_after_rebuild
+    state = database.states[(USER, 4)]
+    assert state["computed_on"] == date.today().isoformat()
+    assert state["last_processed_date"] == date.today().isoformat()
+    assert {"last_trend_kg", "observation_ema", "span"} <= set(state)
+
+
+def test_new_weight_day_marks_state_stale_and_rebuilds(dataset):
+    weights, nutrition, profile = dataset
+    database = StatefulDatabase(list(weights), list(nutrition), profile.model_copy())
+    service = AdaptiveTDEEService(database)
+    service.calculate_tdee(USER)
+
+    database.save_weight_log(
+        WeightLog(user_email=USER, date=date.today(), weight_kg=82.4)
+    )
+    rebuilt = service.calculate_tdee(USER)
+
+    golden = AdaptiveTDEEService(
+        LogsOnlyDatabase(list(database.weights), list(nutrition), database.profile.model_copy())
+    ).calculate_tdee(USER)
+    assert rebuilt == golden
+    assert database.states[(USER, 4)]["stale"] is False
+
+
+def test_tdee_start_date_change_invalidates_state(dataset):
+    weights, nutrition, profile = dataset
+    database = StatefulDatabase(list(weights), list(nutrition), profile.model_copy())
+    service = AdaptiveTDEEService(database)
+    service.calculate_tdee(USER)
+    reads = database.log_reads
+
+    database.profile.tdee_start_date = (date.today() - timedelta(days=3)).isoformat()
+    service.calculate_tdee(USER)
+
+    assert database.log_reads == reads + 1
+
+
+def test_state_from_previous_day_is_rebuilt(dataset):
+    weights, nutrition, profile = dataset
+    database = StatefulDatabase(list(weights), list(nutrition), profile.model_copy())
+    service = AdaptiveTDEEService(database)
+    service.calculate_tdee(USER)
+    database.states[(USER, 4)]["computed_on"] = (
+        date.today() - timedelta(days=1)
+    ).isoformat()
+    reads = database.log_reads
+
+    service.calculate_tdee(USER)
+
+    assert database.log_reads == reads + 1
@@ -0,0 +1,56 @@
+"""Tests for the chat runtime context load graph."""
+
+import asyncio
+
+import pytest
+
+from src.services.ai_chat.context import run_load_graph
+
+
+@pytest.mark.asyncio
+async def test_independent_loads_overlap_and_dependents_get_inputs():
+    events = []
+
+    async def load(name, value, delay=0.05):
+        events.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        events.append(f"end:{name}")
+        return value
+
+    timings = {}
+    results = await run_load_graph(
+        {
+            "a": ((), lambda: load("a", 1)),
+            "b": ((), lambda: load("b", 2)),
+            "sum": (("a", "b"), lambda a, b: load("sum", a + b, delay=0)),
+        },
+        timings,
+    )
+
+    assert results == {"a": 1, "b": 2, "sum": 3}
+    assert events[:2] == ["start:a", "start:b"]
+    assert events.index("start:sum") > events.index("end:b")
+    # Time waiting for inputs is not charged to the dependent load.
+    assert timings["a"] >= 40 and timings["sum"] < 40
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_returned_and_fails_its_dependents():
+    async def boom():
+        raise RuntimeError("store unavailable")
+
+    async def ok():
+        return "fine"
+
+    results = await run_load_graph(
+        {
+            "plan": ((), boom),
+            "agenda": ((), ok),
+            "nutrition": (("plan",), lambda plan: ok()),
+        },
+        {},
+    )
+
+    assert isinstance(results["plan"], RuntimeError)
+    assert results["nutrition"] is results["plan"]
+    assert results["agenda"] == "fine"
@@ -1,8 +1,14 @@
 """Tests for the Pydantic AI chat runner facade."""
 
+import asyncio
+import json
+import threading
+import time
 from types import SimpleNamespace
 
 import pytest
+from pydantic_ai import Agent
+from pydantic_ai.models.function import DeltaToolCall, FunctionModel
 
 from src.api.models.chat_history import ChatHistory
 from src.api.models.sender import Sender
@@ -14,7 +20,9 @@ from src.services.ai_chat.models import (
     ToolAuditEntry,
     ToolResult,
 )
+from src.services.ai_chat.deps import ChatAgentDeps
 from src.services.ai_chat.runner import ChatTurnRunner
+from src.services.ai_chat.streaming import STREAM_DEBOUNCE_SECONDS, partial_public_message
 
 
 class FakeAgent:
@@ -232,3 +240,274 @@ def test_runner_logs_openrouter_cache_usage_tokens():
     logged = database.logged_prompts[0][1]
     assert logged["cache_read_tokens"] == 80
     assert logged["cache_write_tokens"] == 40
+
+
+class SlowDatabase(FakeDatabase):
+    """FakeDatabase whose profile read blocks like a slow pymongo query."""
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def get_user_profile(self, email):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.2)
+        with self.lock:
+            self.in_flight -= 1
+        return super().get_user_profile(email)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_turns_overlap_without_blocking_the_loop(loop_blocking_monitor):
+    database = SlowDatabase()
+    runner = ChatTurnRunner(database=database, qdrant_client=None, agent=FakeAgent())
+
+    async def run_turn():
+        return [
+            chunk
+            async for chunk in runner.stream_turn(
+                user_email="test@test.com",
+                user_input="oi",
+                background_tasks=None,
+                message_options=None,
+            )
+        ]
+
+    async with loop_blocking_monitor() as monitor:
+        first, second = await asyncio.gather(run_turn(), run_turn())
+
+    assert '"persisted":true' in "".join(first)
+    assert '"persisted":true' in "".join(second)
+    assert database.max_in_flight == 2
+    # Worker threads still contend for the GIL; a blocked loop would show
+    # the full 200ms sleep.
+    assert monitor.max_lag_ms < 150
+
+
+class FakeAsyncDatabase:
+    """Async chat-path surface backed by FakeDatabase, with awaited reads."""
+
+    def __init__(self, sync_database: FakeDatabase):
+        self.sync = sync_database
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _read(self, value):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return value
+
+    async def get_user_profile(self, email):
+        return await self._read(self.sync.get_user_profile(email))
+
+    async def get_trainer_profile(self, email):
+        return await self._read(self.sync.get_trainer_profile(email))
+
+    async def get_chat_history(self, *_args, **_kwargs):
+        return await self._read(self.sync.history)
+
+    async def get_plan(self, _email):
+        return await self._read(self.sync.plan)
+
+    async def get_plan_discovery(self, _email):
+        return await self._read(self.sync.discovery)
+
+    async def get_weight_logs(self, *_args, **_kwargs):
+        return await self._read([])
+
+    async def get_workout_logs(self, *_args, **_kwargs):
+        return await self._read([])
+
+    async def get_active_events(self, _email):
+        return await self._read([])
+
+    async def get_nutrition_stats(self, _email, period_stats, _plan):
+        return await self._read({"total_logs": 0, **(period_stats or {})})
+
+    async def add_many_to_history(self, messages, session_id, trainer_type=None):
+        self.sync.add_many_to_history(messages, session_id, trainer_type)
+
+    async def increment_user_message_counts(self, *_args, **_kwargs):
+        return None
+
+    async def log_prompt(self, user_email, prompt_data):
+        self.sync.log_prompt(user_email, prompt_data)
+
+
+@pytest.mark.asyncio
+async def test_async_database_path_loads_context_concurrently():
+    database = FakeDatabase()
+    async_database = FakeAsyncDatabase(database)
+    runner = ChatTurnRunner(
+        database=database,
+        qdrant_client=None,
+        agent=FakeAgent(),
+        async_database_factory=lambda: async_database,
+    )
+
+    payload = "".join(
+        [
+            chunk
+            async for chunk in runner.stream_turn(
+                user_email="test@test.com",
+                user_input="oi",
+                background_tasks=None,
+                message_options=None,
+            )
+        ]
+    )
+
+    assert '"persisted":true' in payload
+    # Profile, trainer, history and the context sections share one wave.
+    assert async_database.max_in_flight >= 8
+    assert [m.sender for m in database.saved_messages[0][0]] == [
+        Sender.STUDENT,
+        Sender.TRAINER,
+    ]
+    logged = database.logged_prompts[0][1]
+    assert logged["status"] == "success"
+    assert {"profile", "history", "plan", "nutrition", "agenda"} <= set(
+        logged["context_section_ms"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_history_is_read_once_and_reused_for_the_agent():
+    agent = FakeAgent()
+    database = FakeDatabase()
+    database.history = [
+        ChatHistory(text="oi", sender=Sender.STUDENT, timestamp="2026-06-27T10:00:00"),
+        ChatHistory(text="ola", sender=Sender.TRAINER, timestamp="2026-06-27T10:00:01"),
+    ]
+    database.get_pydantic_ai_history = lambda *_args, **_kwargs: pytest.fail(
+        "agent history must come from the public history read"
+    )
+    runner = ChatTurnRunner(database=database, qdrant_client=None, agent=agent)
+
+    async for _chunk in runner.stream_turn(
+        user_email="test@test.com",
+        user_input="tudo bem?",
+        background_tasks=None,
+        message_options=None,
+    ):
+        pass
+
+    assert len(agent.kwargs["message_history"]) == 2
+    assert "history" in database.logged_prompts[0][1]["context_section_ms"]
+
+
+def _streaming_agent(chunks, *, fail_after=None):
+    """Real agent on a FunctionModel that writes the output tool args in chunks."""
+
+    async def stream_function(_messages, info):
+        for index, chunk in enumerate(chunks):
+            if fail_after is not None and index == fail_after:
+                raise RuntimeError("provider dropped the stream")
+            yield {
+                0: DeltaToolCall(
+                    name=info.output_tools[0].name if index == 0 else None,
+                    json_args=chunk,
+                )
+            }
+            await asyncio.sleep(STREAM_DEBOUNCE_SECONDS * 1.5)
+
+    return Agent(
+        FunctionModel(stream_function=stream_function),
+        deps_type=ChatAgentDeps,
+        output_type=CoachTurnOutput,
+    )
+
+
+async def _run_turn(runner, user_input="oi"):
+    return [
+        chunk
+        async for chunk in runner.stream_turn(
+            user_email="test@test.com",
+            user_input=user_input,
+            background_tasks=None,
+            message_options=None,
+        )
+    ]
+
+
+def _events(chunks, name):
+    return [
+        json.loads(chunk.split("data:", 1)[1])
+        for chunk in chunks
+        if chunk.startswith(f"event: {name}\n")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_agent_emits_reply_as_incremental_deltas():
+    database = FakeDatabase()
+    agent = _streaming_agent(
+        ['{"public_message": "Bom ', "treino ", 'hoje!", "operation_status": "no_action"}']
+    )
+    runner = ChatTurnRunner(database=database, qdrant_client=None, agent=agent)
+
+    chunks = await _run_turn(runner)
+
+    deltas = [event["text"] for event in _events(chunks, "delta")]
+    assert len(deltas) >= 2
+    assert "".join(deltas) == "Bom treino hoje!"
+    assert not _events(chunks, "replace")
+    assert _events(chunks, "done")[0]["text"] == "Bom treino hoje!"
+    assert database.saved_messages[0][0][1].text == "Bom treino hoje!"
+    assert database.logged_prompts[0][1]["time_to_first_token_ms"] is not None
+
+
+@pytest.mark.asyncio
+async def test_streamed_reply_overridden_by_validation_is_replaced():
+    database = FakeDatabase()
+    database.plan = object()
+    database.history = [
+        ChatHistory(
+            text="Posso atualizar seu plano para reduzir o volume de pernas.",
+            sender=Sender.TRAINER,
+            timestamp="2026-06-27T10:00:00",
+        )
+    ]
+    agent = _streaming_agent(
+        ['{"public_message": "Plano ', 'atualizado!", "operation_status": "no_action"}']
+    )
+    runner = ChatTurnRunner(database=database, qdrant_client=None, agent=agent)
+
+    chunks = await _run_turn(runner, "ok, pode aplicar")
+
+    [replace] = _events(chunks, "replace")
+    assert replace["text"].startswith("Nao executei a mudanca solicitada.")
+    assert _events(chunks, "done")[0]["text"] == replace["text"]
+    assert database.saved_messages[0][0][1].text == replace["text"]
+
+
+@pytest.mark.asyncio
+async def test_stream_failure_after_partial_text_reports_error_and_persists_nothing():
+    database = FakeDatabase()
+    agent = _streaming_agent(
+        ['{"public_message": "Comecei ', "a responder ", 'e..."}'], fail_after=2
+    )
+    runner = ChatTurnRunner(database=database, qdrant_client=None, agent=agent)
+
+    chunks = await _run_turn(runner)
+
+    assert _events(chunks, "delta")
+    assert _events(chunks, "error")
+    assert not _events(chunks, "done")
+    assert not database.saved_messages
+    assert database.logged_prompts[0][1]["status"] == "error"
+
+
+def test_partial_public_message_reads_unfinished_tool_args():
+    response = SimpleNamespace(
+        parts=[SimpleNamespace(args='{"public_message": "Ola, tud')]
+    )
+
+    assert partial_public_message(response) == "Ola, tud"
+    assert partial_public_message(SimpleNamespace(parts=[])) is None
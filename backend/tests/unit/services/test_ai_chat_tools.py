@@ -127,11 +127,12 @@ def test_domain_tool_missing_required_action_parameter_raises_model_retry():
     assert "save_workout" in str(exc_info.value)
 
 
-def test_plan_ops_returns_structured_validation_error_for_missing_payload():
+@pytest.mark.asyncio
+async def test_plan_ops_returns_structured_validation_error_for_missing_payload():
     ctx = DummyContext()
     request = PlanOpsRequest(action=PlanOpsAction.UPDATE_SECTION, payload=None)
 
-    result = plan_ops(ctx, request)
+    result = await plan_ops(ctx, request)
 
     assert isinstance(result, ToolResult)
     assert result.status == "validation_error"
@@ -0,0 +1,172 @@
+"""Tests for the pooled, rate-limited Hevy client against a fake Hevy server."""
+
+import asyncio
+import time
+import uuid
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from src.services.hevy_client import HevyClient, HevyClientOptions, TokenBucket
+from src.services.hevy_service import HevyService
+
+
+class FakeHevy:
+    """Local stand-in for the Hevy API with failure injection."""
+
+    def __init__(self, routines=23, templates=250, delay=0.01):
+        self.routines = [
+            {"id": f"r{i}", "title": f"Routine {i}", "exercises": []} for i in range(routines)
+        ]
+        self.templates = [
+            {"id": f"t{i}", "title": f"Exercise {i}", "type": "weight_reps"}
+            for i in range(templates)
+        ]
+        self.delay = delay
+        self.failures: list[int] = []  # statuses answered before succeeding
+        self.requests: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.app = FastAPI()
+        self.app.add_api_route("/v1/routines", self.list_routines)
+        self.app.add_api_route("/v1/exercise_templates", self.list_templates)
+        self.app.add_api_route("/v1/routines", self.create_routine, methods=["POST"])
+
+    async def _serve(self, request: Request, key: str, items: list) -> JSONResponse:
+        self.requests.append((request.method, str(request.url.query)))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                return JSONResponse({}, self.failures.pop(0), headers={"Retry-After": "0"})
+            page = int(request.query_params["page"])
+            size = int(request.query_params["pageSize"])
+            page_count = max(1, -(-len(items) // size))
+            return JSONResponse(
+                {
+                    "page": page,
+                    "page_count": page_count,
+                    key: items[(page - 1) * size : page * size],
+                }
+            )
+        finally:
+            self.in_flight -= 1
+
+    async def list_routines(self, request: Request):
+        return await self._serve(request, "routines", self.routines)
+
+    async def list_templates(self, request: Request):
+        return await self._serve(request, "exercise_templates", self.templates)
+
+    async def create_routine(self, request: Request):
+        self.requests.append((request.method, ""))
+        if self.failures:
+            return JSONResponse({}, self.failures.pop(0), headers={"Retry-After": "0"})
+        return JSONResponse({"routine": [{"id": "new", "title": "New", "exercises": []}]}, 201)
+
+
+def _service(server: FakeHevy, **client_kwargs) -> HevyService:
+    client_kwargs.setdefault("rate_per_second", 1000)
+    client_kwargs.setdefault("burst", 1000)
+    client = HevyClient(
+        HevyClientOptions(backoff_seconds=0, **client_kwargs),
+        transport=httpx.ASGITransport(app=server.app),
+    )
+    return HevyService(workout_repository=Mock(), http_client=client)
+
+
+def _key() -> str:
+    # HevyService caches listings per API key at class level.
+    return uuid.uuid4().hex
+
+
+@pytest.mark.asyncio
+async def test_remaining_pages_are_fetched_concurrently_in_order(monkeypatch):
+    monkeypatch.setattr("src.services.hevy_service.settings", Mock(HEVY_PAGE_CONCURRENCY=3))
+    server = FakeHevy(routines=47)
+    service = _service(server)
+
+    routines = await service.get_all_routines(_key())
+    templates = await service.get_all_exercise_templates(_key())
+
+    assert [r.id for r in routines] == [f"r{i}" for i in range(47)]
+    assert len(templates) == 250
+    assert len(server.requests) == 5 + 3
+    assert server.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_is_reused_across_calls():
+    service = _service(FakeHevy(routines=3))
+
+    await service.get_routines(_key())
+    pooled = service.http._client()  # pylint: disable=protected-access
+    await service.get_routines(_key())
+
+    assert service.http._client() is pooled  # pylint: disable=protected-access
+    await service.http.aclose()
+    assert pooled.is_closed
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_and_server_errors_are_retried():
+    server = FakeHevy(routines=3)
+    server.failures = [429, 503]
+    service = _service(server, max_retries=3)
+
+    response = await service.get_routines(_key())
+
+    assert response is not None and len(response.routines) == 3
+    assert len(server.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_post_is_retried_on_429_but_not_on_5xx():
+    routine = Mock()
+    routine.title = "New"
+    routine.folder_id = None
+    routine.model_dump.return_value = {"title": "New", "exercises": []}
+
+    server = FakeHevy()
+    server.failures = [429]
+    created, error = await _service(server).create_routine(_key(), routine)
+    assert error is None and created.id == "new"
+    assert len(server.requests) == 2
+
+    server = FakeHevy()
+    server.failures = [502]
+    created, error = await _service(server).create_routine(_key(), routine)
+    assert created is None and "502" in error
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests_per_api_key():
+    server = FakeHevy(routines=3, delay=0)
+    service = _service(server, rate_per_second=50, burst=1)
+    slow_key, other_key = _key(), _key()
+
+    started = time.monotonic()
+    await asyncio.gather(*(service.get_routines(slow_key) for _ in range(6)))
+    elapsed = time.monotonic() - started
+
+    other_started = time.monotonic()
+    await service.get_routines(other_key)
+    other_elapsed = time.monotonic() - other_started
+
+    assert elapsed >= 5 / 50 * 0.9
+    assert other_elapsed < 5 / 50
+
+
+def test_token_bucket_reservations():
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    delays = [bucket.reserve() for _ in range(4)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
@@ -5,6 +5,13 @@ Tests the _prepare_routine_payload method to ensure it correctly
 removes forbidden fields before sending to Hevy API.
 """
 
+import threading
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from pymongo.errors import BulkWriteError
+
 from src.services.hevy_service import HevyService
 
 
@@ -401,3 +408,290 @@ class TestTransformToWorkoutLogCardio:
         assert cardio.weights_per_set == []  # Empty for pure cardio
         assert cardio.distance_meters_per_set == [2000.0]
         assert cardio.duration_seconds_per_set == [480]
+
+
+class FakeWorkoutCollection:
+    """Just enough of a collection for WorkoutRepository's import path."""
+
+    def __init__(self, docs=(), fail_external_ids=()):
+        self.docs = [dict(doc) for doc in docs]
+        self.find_calls = 0
+        self.bulk_calls = 0
+        self.fail_external_ids = set(fail_external_ids)
+        self.threads = set()
+
+    def create_index(self, *_args, **_kwargs):
+        return None
+
+    def find(self, query, projection=None):
+        self.find_calls += 1
+        self.threads.add(threading.get_ident())
+        ids = query.get("_id", {}).get("$in")
+        return [
+            ({key: doc.get(key) for key in projection} if projection else dict(doc))
+            for doc in self.docs
+            if doc["user_email"] == query["user_email"] and (ids is None or doc["_id"] in ids)
+        ]
+
+    def bulk_write(self, operations, ordered=True):
+        assert ordered is False
+        self.bulk_calls += 1
+        self.threads.add(threading.get_ident())
+        write_errors = []
+        # pylint: disable=protected-access
+        for index, op in enumerate(operations):
+            name = type(op).__name__
+            if (getattr(op, "_doc", None) or {}).get("external_id") in self.fail_external_ids:
+                write_errors.append({"index": index, "code": 11000, "errmsg": "dup"})
+            elif name == "InsertOne":
+                self.docs.append(dict(op._doc))
+            elif name == "DeleteMany":
+                self.docs = [d for d in self.docs if d["_id"] not in op._filter["_id"]["$in"]]
+            else:
+                target = op._filter["_id"]
+                self.docs = [
+                    {**op._doc, "_id": target} if d["_id"] == target else d
+                    for d in self.docs
+                ]
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors})
+
+
+def _hevy_workout(workout_id, start_time, weight=60):
+    return {
+        "id": workout_id,
+        "title": f"Workout {workout_id}",
+        "start_time": start_time,
+        "exercises": [{"title": "Squat", "sets": [{"reps": 5, "weight_kg": weight}]}],
+    }
+
+
+def _profile(cursor):
+    return SimpleNamespace(email="u@test.com", hevy_api_key="key", hevy_sync_cursor=cursor)
+
+
+def _import_service(existing=(), batch_size=500, fail_external_ids=()):
+    from src.repositories.workout_repository import WorkoutRepository
+
+    collection = FakeWorkoutCollection(existing, fail_external_ids)
+    database = {"workout_logs": collection}
+    repository = WorkoutRepository(database)
+    service = HevyService(workout_repository=repository)
+    service.IMPORT_BATCH_SIZE = batch_size
+    return service, collection
+
+
+class TestImportWorkouts:
+    """Test the prefetch + bulk write import"""
+
+    EXISTING_ID = None
+
+    def _existing(self):
+        from bson import ObjectId
+
+        self.EXISTING_ID = ObjectId()
+        return [
+            {
+                "_id": self.EXISTING_ID,
+                "user_email": "u@test.com",
+                "external_id": "h1",
+                "date": datetime(2024, 1, 10, 9, 0),
+                "workout_type": "Old",
+            },
+            {
+                "_id": ObjectId(),
+                "user_email": "u@test.com",
+                "external_id": None,
+                "date": datetime(2024, 1, 11, 20, 0),
+                "workout_type": "Manual",
+            },
+        ]
+
+    def _pages(self):
+        return [
+            [
+                _hevy_workout("h1", "2024-01-10T09:00:00Z", weight=80),
+                _hevy_workout("h2", "2024-01-11T07:00:00Z"),
+                _hevy_workout("h3", "2024-01-12T07:00:00Z"),
+                # Before from_date; fills the page so the import asks for the next one.
+                *(_hevy_workout(f"old{i}", "2023-06-01T07:00:00Z") for i in range(7)),
+            ],
+            [
+                _hevy_workout("h4", "2024-01-12T18:00:00Z"),
+                {"id": "bad", "start_time": "2024-01-13T07:00:00Z", "exercises": []},
+                _hevy_workout("h5", "2023-12-01T07:00:00Z"),
+            ],
+        ]
+
+    async def _run(self, mode, batch_size=500, fail_external_ids=()):
+        from unittest.mock import AsyncMock
+
+        service, collection = _import_service(self._existing(), batch_size, fail_external_ids)
+        pages = self._pages()
+        service.fetch_workouts = AsyncMock(side_effect=lambda *_a: pages.pop(0) if pages else [])
+        result = await service.import_workouts(
+            "u@test.com", "key", from_date=datetime(2024, 1, 1), mode=mode
+        )
+        return result, collection
+
+    @pytest.mark.asyncio
+    async def test_skip_duplicates_checks_in_memory(self):
+        result, collection = await self._run("skip_duplicates")
+
+        # h1 by external id, h2 on a manual log's day, h4 on h3's day (same run).
+        assert result == {"imported": 1, "skipped": 3, "failed": 1}
+        assert sorted(d.get("external_id") or "" for d in collection.docs) == ["", "h1", "h3"]
+        assert collection.find_calls == 1
+        assert collection.bulk_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_overwrite_replaces_and_deletes_in_bulk(self):
+        result, collection = await self._run("overwrite", batch_size=1)
+
+        assert result == {"imported": 4, "skipped": 0, "failed": 1}
+        by_external_id = {d.get("external_id"): d for d in collection.docs}
+        assert sorted(by_external_id) == ["h1", "h2", "h4"]
+        # Same Hevy workout keeps its log id.
+        assert by_external_id["h1"]["_id"] == self.EXISTING_ID
+        assert by_external_id["h1"]["exercises"][0]["weights_per_set"] == [80.0]
+        # h3 was written with the first page and removed again by h4.
+        assert collection.bulk_calls == 2
+        assert collection.find_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_mongo_work_runs_off_the_event_loop(self):
+        _result, collection = await self._run("overwrite", batch_size=1)
+
+        assert collection.threads
+        assert threading.get_ident() not in collection.threads
+
+    @pytest.mark.asyncio
+    async def test_failed_writes_are_counted_and_forgotten(self):
+        result, collection = await self._run(
+            "skip_duplicates", batch_size=1, fail_external_ids={"h3"}
+        )
+
+        # h3 was not written, so h4 on the same day is no duplicate of it.
+        assert result == {"imported": 1, "skipped": 2, "failed": 2}
+        assert sorted(d.get("external_id") or "" for d in collection.docs) == ["", "h1", "h4"]
+
+
+class TestSyncWorkouts:
+    """Test the incremental, event-driven Hevy sync"""
+
+    SINCE = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+    def _existing(self):
+        from bson import ObjectId
+
+        return [
+            {
+                "_id": ObjectId(),
+                "user_email": "u@test.com",
+                "external_id": external_id,
+                "date": datetime(2024, 2, day, 9, 0),
+            }
+            for external_id, day in (("h1", 10), ("h2", 12), ("h3", 14))
+        ]
+
+    @staticmethod
+    def _updated(workout_id, start_time, updated_at, weight=60):
+        return {
+            "type": "updated",
+            "workout": {**_hevy_workout(workout_id, start_time, weight), "updated_at": updated_at},
+        }
+
+    @pytest.mark.asyncio
+    async def test_applies_changes_until_the_cursor_and_advances_it(self):
+        from unittest.mock import AsyncMock
+
+        service, collection = _import_service(self._existing())
+        events = [
+            self._updated("h9", "2024-03-04T07:00:00Z", "2024-03-04T08:00:00Z"),
+            {"type": "deleted", "id": "h2", "deleted_at": "2024-03-03T10:00:00Z"},
+            self._updated("h1", "2024-02-10T09:00:00Z", "2024-03-02T10:00:00Z", weight=90),
+            # Older event of a workout already handled above: ignored.
+            self._updated("h9", "2024-03-04T07:00:00Z", "2024-03-02T09:00:00Z"),
+            # Already applied by the previous sync: pagination stops here.
+            self._updated("h3", "2024-02-14T09:00:00Z", "2024-02-28T10:00:00Z"),
+        ]
+        service.fetch_workout_events = AsyncMock(
+            return_value={"page": 1, "page_count": 40, "events": events}
+        )
+
+        result = await service.sync_workouts(_profile(self.SINCE))
+
+        assert result == {
+            "imported": 1,
+            "updated": 1,
+            "deleted": 1,
+            "skipped": 0,
+            "failed": 0,
+            "cursor": datetime(2024, 3, 4, 8, 0, tzinfo=timezone.utc),
+        }
+        service.fetch_workout_events.assert_awaited_once()
+        by_external_id = {doc["external_id"]: doc for doc in collection.docs}
+        assert sorted(by_external_id) == ["h1", "h3", "h9"]
+        assert by_external_id["h1"]["exercises"][0]["weights_per_set"] == [90.0]
+        assert collection.find_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cursor_does_not_move_when_hevy_cannot_be_read(self):
+        from unittest.mock import AsyncMock
+
+        service, collection = _import_service(self._existing())
+        page = self._updated("h9", "2024-03-04T07:00:00Z", "2024-03-04T08:00:00Z")
+        service.fetch_workout_events = AsyncMock(
+            side_effect=[{"page": 1, "page_count": 2, "events": [page]}, None]
+        )
+
+        result = await service.sync_workouts(_profile(self.SINCE))
+
+        assert result["imported"] == 1
+        assert result["cursor"] == self.SINCE
+        assert len(collection.docs) == 4
+
+    @pytest.mark.asyncio
+    async def test_cursor_does_not_move_past_failed_workouts(self):
+        from unittest.mock import AsyncMock
+
+        service, collection = _import_service(self._existing())
+        events = [
+            self._updated("h9", "2024-03-04T07:00:00Z", "2024-03-04T08:00:00Z"),
+            {
+                "type": "updated",
+                "workout": {
+                    "id": "bad",
+                    "start_time": "2024-03-03T07:00:00Z",
+                    "exercises": [],
+                    "updated_at": "2024-03-03T08:00:00Z",
+                },
+            },
+        ]
+        service.fetch_workout_events = AsyncMock(
+            return_value={"page": 1, "page_count": 1, "events": events}
+        )
+
+        result = await service.sync_workouts(_profile(self.SINCE))
+
+        assert result["imported"] == 1 and result["failed"] == 1
+        assert result["cursor"] == self.SINCE
+        assert len(collection.docs) == 4
+
+    @pytest.mark.asyncio
+    async def test_without_a_cursor_falls_back_to_a_full_import(self):
+        from unittest.mock import AsyncMock
+
+        service, _ = _import_service()
+        service.import_workouts = AsyncMock(
+            return_value={"imported": 2, "skipped": 0, "failed": 0}
+        )
+        before = datetime.now(timezone.utc)
+
+        result = await service.sync_workouts(_profile(None))
+
+        service.import_workouts.assert_awaited_once_with(
+            "u@test.com", "key", None, "skip_duplicates"
+        )
+        assert result["imported"] == 2 and result["deleted"] == 0
+        assert result["cursor"] >= before
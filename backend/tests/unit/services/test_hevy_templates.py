@@ -0,0 +1,119 @@
+"""Tests for the indexed Hevy template catalog and its shared cache."""
+
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.api.models.routine import ExerciseTemplateListResponse, HevyExerciseTemplate
+from src.services.hevy_service import HevyService
+from src.services.hevy_templates import HevyTemplateCatalog
+
+
+def _template(template_id, title, muscle=None):
+    return HevyExerciseTemplate(
+        id=template_id, title=title, type="weight_reps", primary_muscle_group=muscle
+    )
+
+
+def _linear_search(templates, query):
+    """The scan search_hevy_exercises used before the catalog index."""
+    query = query.lower().replace("-", " ")
+    parts = query.split()
+    exact = [ex for ex in templates if query == ex.title.lower().replace("-", " ")]
+    words = [ex for ex in templates if all(p in ex.title.lower().replace("-", " ") for p in parts)]
+    matches = exact + [m for m in words if m not in exact]
+    if not matches:
+        matches = [ex for ex in templates if query in (ex.primary_muscle_group or "").lower()]
+    return matches
+
+
+def test_search_matches_linear_scan():
+    rng = random.Random(3)
+    words = ["bench", "press", "incline", "squat", "row", "curl", "leg", "pull-up", "chest"]
+    muscles = ["chest", "quadriceps", "lats", "biceps", None]
+    templates = [
+        _template(
+            f"T{i}",
+            " ".join(rng.sample(words, rng.randint(1, 3))).title(),
+            rng.choice(muscles),
+        )
+        for i in range(300)
+    ]
+    catalog = HevyTemplateCatalog(templates)
+
+    queries = ["bench press", "press", "pull-up", "ul", "quad", "lats", "zzz", "Leg Curl", ""]
+    queries += [" ".join(rng.sample(words, 2)) for _ in range(30)]
+    for query in queries:
+        assert catalog.search(query) == _linear_search(templates, query), query
+
+
+def test_resolve_by_title_alias_and_id():
+    catalog = HevyTemplateCatalog(
+        [
+            _template("A1", "Bench Press (Barbell)", "chest"),
+            _template("A2", "Bench Press (Dumbbell)", "chest"),
+            _template("A3", "Elevação Pélvica", "glutes"),
+        ]
+    )
+
+    assert catalog.get("A2").title == "Bench Press (Dumbbell)"
+    assert catalog.resolve("bench press (dumbbell)").id == "A2"
+    # Without the equipment suffix the first catalog entry wins.
+    assert catalog.resolve("Bench Press").id == "A1"
+    assert catalog.resolve("elevacao pelvica").id == "A3"
+    assert catalog.resolve("Deadlift") is None
+
+
+class FakeTemplateRepository:
+    def __init__(self):
+        self.docs = {}
+
+    def get_catalog(self, key):
+        return self.docs.get(key)
+
+    def save_catalog(self, key, templates):
+        fetched_at = datetime.now(timezone.utc)
+        self.docs[key] = {"templates": templates, "fetched_at": fetched_at.replace(tzinfo=None)}
+        return fetched_at
+
+
+def _worker(repository):
+    """A fresh process: empty in-process cache, shared Mongo copy."""
+    HevyService._template_catalogs.clear()  # pylint: disable=protected-access
+    service = HevyService(Mock(), http_client=Mock(), template_repository=repository)
+    service.get_exercise_templates = AsyncMock(
+        return_value=ExerciseTemplateListResponse(
+            page=1, page_count=1, exercise_templates=[_template("S1", "Squat", "quadriceps")]
+        )
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_shared_across_workers_and_refreshed_in_background():
+    repository = FakeTemplateRepository()
+
+    first = _worker(repository)
+    catalog = await first.get_exercise_catalog("key")
+    assert catalog.resolve("squat").id == "S1"
+    await first.get_exercise_catalog("key")
+    assert first.get_exercise_templates.await_count == 1
+
+    second = _worker(repository)
+    assert (await second.get_exercise_catalog("key")).get("S1") is not None
+    second.get_exercise_templates.assert_not_awaited()
+
+    # An expired shared copy is served immediately and refreshed behind it.
+    doc = next(iter(repository.docs.values()))
+    doc["fetched_at"] -= timedelta(seconds=HevyService.CACHE_DURATION + 1)
+    stale_at = doc["fetched_at"]
+    third = _worker(repository)
+    assert len(await third.get_exercise_catalog("key")) == 1
+    await asyncio.gather(*HevyService._catalog_refreshes.values())  # pylint: disable=protected-access
+    third.get_exercise_templates.assert_awaited_once()
+    assert doc is not next(iter(repository.docs.values()))
+    assert next(iter(repository.docs.values()))["fetched_at"] > stale_at
+    assert "key" not in repository.docs  # raw API keys are not stored
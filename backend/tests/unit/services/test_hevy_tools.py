@@ -11,6 +11,7 @@ from src.services.hevy_tools import (
     create_get_hevy_routine_detail_tool,
     create_set_routine_rest_and_ranges_tool,
 )
+from src.services.hevy_templates import HevyTemplateCatalog
 
 
 @pytest.fixture
@@ -18,6 +19,11 @@ def mock_hevy_service():
     """Mock HevyService."""
     service = MagicMock()
     service.get_all_exercise_templates = AsyncMock()
+    service.get_exercise_catalog = AsyncMock(
+        side_effect=lambda _api_key: HevyTemplateCatalog(
+            service.get_all_exercise_templates.return_value
+        )
+    )
     service.create_routine = AsyncMock()
     service.get_routines = AsyncMock()
     return service
@@ -591,6 +597,41 @@ class TestReplaceHevyExercise:
         assert "ambíguo" in result.lower() or "ambiguo" in result.lower()
         mock_hevy_service.update_routine.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_replace_exercise_resolves_new_exercise_by_name(
+        self, mock_hevy_service, mock_database, sample_exercises
+    ):
+        profile = MagicMock()
+        profile.hevy_enabled = True
+        profile.hevy_api_key = "api_key"
+        mock_database.get_user_profile.return_value = profile
+        mock_hevy_service.get_all_exercise_templates.return_value = sample_exercises
+
+        routine = MagicMock(id="R001", title="Push Day")
+        routine.exercises = [MagicMock(exercise_template_id="EX001", title="Bench Press")]
+        mock_hevy_service.get_all_routines = AsyncMock(return_value=[routine])
+        mock_hevy_service.get_routine_by_id = AsyncMock(return_value=routine)
+        mock_hevy_service.update_routine = AsyncMock(return_value=routine)
+
+        tool = create_replace_hevy_exercise_tool(
+            mock_hevy_service, mock_database, "user@test.com"
+        )
+        result = await tool.ainvoke({
+            "routine_title": "Push Day",
+            "old_exercise_name_or_id": "EX001",
+            "new_exercise_id": "leg press",
+        })
+        assert "EX004" in result
+        assert routine.exercises[0].exercise_template_id == "EX004"
+
+        unknown = await tool.ainvoke({
+            "routine_title": "Push Day",
+            "old_exercise_name_or_id": "EX004",
+            "new_exercise_id": "NOPE",
+        })
+        assert "não existe no catálogo" in unknown
+        mock_hevy_service.update_routine.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_replace_exercise_not_found(self, mock_hevy_service, mock_database):
         """Test replacement fails when old exercise not found."""
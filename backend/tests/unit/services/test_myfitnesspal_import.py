@@ -1,4 +1,7 @@
+import io
+
 import pytest
+from pymongo.errors import BulkWriteError
 from unittest.mock import MagicMock
 from src.services.myfitnesspal_import_service import (
     parse_csv_content,
@@ -40,7 +43,7 @@ class TestMyFitnessPalImport:
     def test_import_process_db_calls(self):
         """Test the full import process with mock DB."""
         mock_db = MagicMock()
-        mock_db.save_nutrition_log.return_value = ("id123", True)
+        mock_db.save_nutrition_logs.return_value = (2, 0)
 
         user_email = "test@user.com"
         result = import_nutrition_from_csv(user_email, CSV_CONTENT_VALID, mock_db)
@@ -50,13 +53,11 @@ class TestMyFitnessPalImport:
         assert result.updated == 0
         assert result.errors == 0
 
-        # Verify DB was called correctly
-        assert mock_db.save_nutrition_log.call_count == 2
-
-        # Check first call arg
-        call_args = mock_db.save_nutrition_log.call_args_list
-        log1 = call_args[0][0][0]  # First call, first arg
-        # Since we sort by date, 2024-01-01 comes first
+        # Both days go out in one bulk write
+        mock_db.save_nutrition_logs.assert_called_once()
+        logs = mock_db.save_nutrition_logs.call_args[0][0]
+        assert len(logs) == 2
+        log1 = logs[0]
         assert isinstance(log1, NutritionLog)
         assert log1.user_email == user_email
         assert log1.calories == 900
@@ -65,8 +66,7 @@ class TestMyFitnessPalImport:
     def test_import_updates(self):
         """Test that existing logs count as updates."""
         mock_db = MagicMock()
-        # First call new, Second call update
-        mock_db.save_nutrition_log.side_effect = [("id1", True), ("id2", False)]
+        mock_db.save_nutrition_logs.return_value = (1, 1)
 
         result = import_nutrition_from_csv("u", CSV_CONTENT_VALID, mock_db)
 
@@ -76,10 +76,55 @@ class TestMyFitnessPalImport:
     def test_import_db_error(self):
         """Test handling of DB errors during save."""
         mock_db = MagicMock()
-        mock_db.save_nutrition_log.side_effect = Exception("DB Bomb")
+        mock_db.save_nutrition_logs.side_effect = Exception("DB Bomb")
 
         result = import_nutrition_from_csv("u", CSV_CONTENT_VALID, mock_db)
 
         assert result.errors == 2
         assert len(result.error_messages) == 2
         assert "DB Bomb" in result.error_messages[0]
+
+    def test_import_streams_in_chunks_and_reports_bulk_errors(self, monkeypatch):
+        """Days are written in chunks while the stream is read."""
+        monkeypatch.setattr("src.services.import_utils.BULK_CHUNK_SIZE", 2)
+        rows = [
+            f"2024-01-{day:02d},{meal},100,1,10,5"
+            for day in range(1, 6)
+            for meal in ("Almoço", "Jantar")
+        ]
+        # A straggler row for an already written day.
+        rows.append("2024-01-01,Lanche,50,1,5,5")
+        header = "Data,Refeição,Calorias,Gorduras (g),Carboidratos (g),Proteínas (g)"
+        stream = io.TextIOWrapper(
+            io.BytesIO("\r\n".join([header, *rows]).encode("utf-8")),
+            encoding="utf-8",
+            newline="",
+        )
+        writes = []
+        stored = set()
+
+        def save_logs(logs):
+            writes.append([(log.date.day, log.calories) for log in logs])
+            if len(writes) == 2:
+                stored.add(logs[0].date)
+                raise BulkWriteError(
+                    {
+                        "nUpserted": 1,
+                        "nMatched": 0,
+                        "writeErrors": [{"index": 1, "errmsg": "duplicate key"}],
+                    }
+                )
+            new = {log.date for log in logs} - stored
+            stored.update(new)
+            return len(new), len(logs) - len(new)
+
+        mock_db = MagicMock()
+        mock_db.save_nutrition_logs.side_effect = save_logs
+
+        result = import_nutrition_from_csv("u", stream, mock_db)
+
+        assert writes == [[(1, 200), (2, 200)], [(3, 200), (4, 200)], [(5, 200), (1, 250)]]
+        assert result.total_days == 5
+        assert result.created == 4
+        assert result.updated == 0
+        assert result.error_messages == ["Erro em 2024-01-04: duplicate key"]
@@ -0,0 +1,65 @@
+"""Tests for the buffered prompt log writer."""
+
+import threading
+from unittest.mock import MagicMock
+
+from src.services.prompt_log_writer import PromptLogWriter, PromptLogWriterOptions
+
+
+def test_submit_returns_without_touching_mongo_and_flushes_in_batches():
+    repository = MagicMock()
+    written = threading.Event()
+    repository.write_batch.side_effect = lambda *_args: written.set()
+    writer = PromptLogWriter(
+        repository, PromptLogWriterOptions(max_logs=5, flush_interval=60, batch_size=3)
+    )
+
+    writer.submit("a@test.com", {"tokens_input": 1})
+    writer.submit("b@test.com", {"tokens_input": 2})
+    repository.write_batch.assert_not_called()
+
+    # A full batch wakes the writer before the flush interval.
+    writer.submit("a@test.com", {"tokens_input": 3})
+    assert written.wait(2)
+
+    batch, max_logs = repository.write_batch.call_args[0]
+    assert max_logs == 5
+    assert [(email, entry["tokens_input"]) for email, entry in batch] == [
+        ("a@test.com", 1),
+        ("b@test.com", 2),
+        ("a@test.com", 3),
+    ]
+    assert "timestamp" in batch[0][1]
+    writer.close()
+
+
+def test_close_flushes_pending_and_write_errors_are_swallowed():
+    repository = MagicMock()
+    repository.write_batch.side_effect = [RuntimeError("mongo down"), None]
+    writer = PromptLogWriter(
+        repository, PromptLogWriterOptions(max_logs=5, flush_interval=60, batch_size=2)
+    )
+
+    for index in range(3):
+        writer.submit("a@test.com", {"tokens_input": index})
+    writer.close()
+
+    assert repository.write_batch.call_count == 2
+    assert not writer._thread.is_alive()  # pylint: disable=protected-access
+
+
+def test_buffer_is_bounded_and_drops_oldest():
+    repository = MagicMock()
+    writer = PromptLogWriter(
+        repository,
+        PromptLogWriterOptions(max_logs=5, flush_interval=60, batch_size=100, max_pending=2),
+    )
+
+    for index in range(4):
+        writer.submit("a@test.com", {"tokens_input": index})
+    writer.flush()
+
+    batch, _ = repository.write_batch.call_args[0]
+    assert [entry["tokens_input"] for _, entry in batch] == [2, 3]
+    assert writer.dropped == 2
+    writer.close()
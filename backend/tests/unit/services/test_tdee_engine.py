@@ -0,0 +1,135 @@
+"""Equivalence tests between the array TDEE engine and the dict-based reference."""
+
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.api.models.nutrition_log import NutritionLog
+from src.api.models.weight_log import WeightLog
+from src.services import tdee_engine
+from src.services.adaptive_tdee import AdaptiveTDEEService
+
+START = date(2025, 1, 1)
+
+
+@pytest.fixture
+def service():
+    return AdaptiveTDEEService(None)  # type: ignore[arg-type]
+
+
+def _weights(seed: int, days: int, skip_every: int = 3) -> list[WeightLog]:
+    rng = random.Random(seed)
+    logs = []
+    for i in range(days):
+        # Regular misses plus a 16-day hole every 37 days (longer than the
+        # interpolation limit) so both gap paths are covered.
+        if i % skip_every == 1 or 20 <= i % 37 < 36:
+            continue
+        logs.append(
+            WeightLog(
+                user_email="a@b.com",
+                date=START + timedelta(days=i),
+                weight_kg=round(90 - 0.03 * i + rng.uniform(-0.6, 0.6), 2),
+            )
+        )
+    return logs
+
+
+def _nutrition(seed: int, days: int) -> list[NutritionLog]:
+    rng = random.Random(seed)
+    return [
+        NutritionLog(
+            user_email="a@b.com",
+            date=START + timedelta(days=i),
+            calories=rng.randint(1600, 2900),
+            protein_grams=150,
+            carbs_grams=200,
+            fat_grams=70,
+        )
+        for i in range(days)
+        if rng.random() > 0.35
+    ]
+
+
+def test_interpolation_matches_reference_including_long_gaps(service):
+    logs = _weights(1, 400)
+
+    series = tdee_engine.interpolate_weights(logs, service.MAX_INTERPOLATION_GAP)
+    reference = service.interpolate_weight_gaps(logs)
+
+    assert series.dates() == list(reference)
+    assert np.array_equal(series.values, np.array(list(reference.values())))
+
+
+def test_interpolation_keeps_last_log_of_duplicate_day(service):
+    logs = [
+        WeightLog(user_email="a@b.com", date=START, weight_kg=80),
+        WeightLog(user_email="a@b.com", date=START, weight_kg=81),
+        WeightLog(user_email="a@b.com", date=START + timedelta(days=4), weight_kg=79),
+    ]
+
+    series = tdee_engine.interpolate_weights(logs, service.MAX_INTERPOLATION_GAP)
+
+    assert series.values.tolist() == list(service.interpolate_weight_gaps(logs).values())
+
+
+def test_trend_matches_reference(service):
+    logs = _weights(2, 720)
+    series = tdee_engine.interpolate_weights(logs, service.MAX_INTERPOLATION_GAP)
+
+    trend = tdee_engine.daily_trend(series, service.EMA_SPAN)
+    reference = service.compute_daily_trend(service.interpolate_weight_gaps(logs))
+
+    np.testing.assert_allclose(trend, list(reference.values()), rtol=1e-12)
+
+
+@pytest.mark.parametrize("fallback", [None, 2200])
+def test_observations_and_smoothing_match_reference(service, fallback):
+    logs = _weights(3, 365)
+    nutrition = _nutrition(4, 365)
+    series = tdee_engine.interpolate_weights(logs, service.MAX_INTERPOLATION_GAP)
+    trend = tdee_engine.daily_trend(series, service.EMA_SPAN)
+
+    days, observed = tdee_engine.window_observations(
+        trend, tdee_engine.calories_on_days(series, nutrition), 7700, fallback
+    )
+    reference = service.compute_tdee_observations(
+        service.compute_daily_trend(service.interpolate_weight_gaps(logs)),
+        {log.date: log.calories for log in nutrition},
+        7700,
+        fallback,
+    )
+
+    assert [series.start + timedelta(days=int(i)) for i in days] == [
+        obs_date for obs_date, _ in reference
+    ]
+    np.testing.assert_allclose(observed, [value for _, value in reference], rtol=1e-10)
+    assert tdee_engine.smooth_observations(observed, 2000, 14) == pytest.approx(
+        service._compute_tdee_from_observations(reference, 2000, span=14),
+        rel=1e-12,
+    )
+
+
+def test_short_series_yield_no_observations():
+    trend = np.linspace(80, 79, 7)
+
+    days, observed = tdee_engine.window_observations(trend, np.full(7, 2000.0), 7700)
+
+    assert not len(days) and not len(observed)
+
+
+def test_ema_filter_handles_series_longer_than_one_block():
+    values = np.random.default_rng(0).uniform(1500, 3000, 5000)
+    alpha = 2 / 8
+
+    expected = []
+    previous = 2000.0
+    for value in values:
+        previous = value * alpha + previous * (1 - alpha)
+        expected.append(previous)
+
+    np.testing.assert_allclose(
+        tdee_engine.ema_filter(values, alpha, 2000.0), expected, rtol=1e-11
+    )
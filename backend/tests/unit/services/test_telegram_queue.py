@@ -0,0 +1,167 @@
+"""Tests for the background Telegram update queue."""
+
+import asyncio
+
+import pytest
+
+from src.services.telegram_queue import TelegramUpdateQueue, update_chat_id
+
+
+class FakeQueueRepository:
+    def __init__(self, queued=None):
+        self.seen = set()
+        self.queue = {item["update_id"]: dict(item, status="pending") for item in queued or []}
+        self.completed = []
+
+    def enqueue_update(self, update_id, chat_id, payload):
+        if update_id in self.seen:
+            return False
+        self.seen.add(update_id)
+        self.queue[update_id] = {
+            "update_id": update_id,
+            "chat_id": chat_id,
+            "payload": payload,
+            "status": "pending",
+        }
+        return True
+
+    def claim_update(self, update_id, _worker_id, _lease_seconds):
+        item = self.queue.get(update_id)
+        if item is None or item["status"] != "pending":
+            return False
+        item["status"] = "processing"
+        return True
+
+    def release_update(self, update_id):
+        self.queue[update_id]["status"] = "pending"
+
+    def complete_update(self, update_id):
+        self.queue.pop(update_id)
+        self.completed.append(update_id)
+
+    def get_queued_updates(self, _lease_seconds, limit=500):
+        return sorted(self.queue.values(), key=lambda item: item["update_id"])[:limit]
+
+
+class SlowService:
+    def __init__(self, delay=0.02, fail_on=()):
+        self.delay = delay
+        self.fail_on = set(fail_on)
+        self.handled = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def process_update(self, update_data):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if update_data["update_id"] in self.fail_on:
+                raise RuntimeError("bot failed")
+            self.handled.append((update_chat_id(update_data), update_data["update_id"]))
+        finally:
+            self.in_flight -= 1
+
+
+def _update(update_id, chat_id):
+    return {"update_id": update_id, "message": {"text": "oi", "chat": {"id": chat_id}}}
+
+
+async def _drain(queue):
+    while queue._tasks:  # pylint: disable=protected-access
+        await asyncio.gather(*list(queue._tasks))  # pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_before_processing_and_keeps_chat_order():
+    service = SlowService()
+    repository = FakeQueueRepository()
+    queue = TelegramUpdateQueue(service, repository, max_concurrency=2, lease_seconds=60)
+
+    for update_id in range(1, 13):
+        assert await queue.submit(_update(update_id, chat_id=update_id % 3))
+    assert not service.handled
+
+    await _drain(queue)
+
+    assert len(service.handled) == 12
+    for chat_id in range(3):
+        ids = [update_id for chat, update_id in service.handled if chat == chat_id]
+        assert ids == sorted(ids)
+    assert service.max_in_flight == 2
+    assert not repository.queue
+
+
+@pytest.mark.asyncio
+async def test_duplicates_and_chatless_updates_are_not_queued():
+    service = SlowService(delay=0)
+    queue = TelegramUpdateQueue(service, FakeQueueRepository(), max_concurrency=4, lease_seconds=60)
+
+    assert await queue.submit(_update(7, chat_id=1))
+    assert not await queue.submit(_update(7, chat_id=1))
+    assert not await queue.submit({"update_id": 8, "my_chat_member": {}})
+    await _drain(queue)
+
+    assert service.handled == [(1, 7)]
+
+
+@pytest.mark.asyncio
+async def test_failed_update_is_completed_and_chat_continues():
+    service = SlowService(delay=0, fail_on={1})
+    repository = FakeQueueRepository()
+    queue = TelegramUpdateQueue(service, repository, max_concurrency=1, lease_seconds=60)
+
+    await queue.submit(_update(1, chat_id=5))
+    await queue.submit(_update(2, chat_id=5))
+    await _drain(queue)
+
+    assert service.handled == [(5, 2)]
+    assert repository.completed == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_queue_errors_are_logged_and_the_chat_keeps_draining():
+    service = SlowService(delay=0)
+    repository = FakeQueueRepository()
+    claim = repository.claim_update
+
+    def flaky_claim(update_id, worker_id, lease_seconds):
+        if update_id == 1:
+            raise RuntimeError("mongo down")
+        return claim(update_id, worker_id, lease_seconds)
+
+    repository.claim_update = flaky_claim
+    queue = TelegramUpdateQueue(service, repository, max_concurrency=1, lease_seconds=60)
+
+    await queue.submit(_update(1, chat_id=5))
+    await queue.submit(_update(2, chat_id=5))
+    await queue.submit(_update(3, chat_id=5))
+    await _drain(queue)
+
+    assert service.handled == [(5, 2), (5, 3)]
+    assert repository.queue[1]["status"] == "pending"
+    assert not queue._chats  # pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_recover_resumes_persisted_updates_and_close_hands_back_in_flight():
+    repository = FakeQueueRepository(
+        [
+            {"update_id": 3, "chat_id": 9, "payload": _update(3, 9)},
+            {"update_id": 4, "chat_id": 9, "payload": _update(4, 9)},
+        ]
+    )
+    service = SlowService(delay=0)
+    queue = TelegramUpdateQueue(service, repository, max_concurrency=1, lease_seconds=60)
+
+    assert await queue.recover() == 2
+    await _drain(queue)
+    assert service.handled == [(9, 3), (9, 4)]
+
+    slow = SlowService(delay=5)
+    queue = TelegramUpdateQueue(slow, repository, max_concurrency=1, lease_seconds=60)
+    await queue.submit(_update(5, chat_id=9))
+    await asyncio.sleep(0.05)
+    await queue.close(timeout=0.01)
+
+    assert repository.queue[5]["status"] == "pending"
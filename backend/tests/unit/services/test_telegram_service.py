@@ -7,6 +7,7 @@ class TestTelegramService(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.mock_repo = MagicMock()
         self.mock_brain = MagicMock()
+        self.mock_brain.send_message_async = AsyncMock()
         self.mock_token = "TEST_TOKEN"
         
         # We need to patch 'src.services.telegram_service.Bot' class
@@ -34,7 +35,7 @@ class TestTelegramService(unittest.IsolatedAsyncioTestCase):
         mock_update.effective_chat.id = 12345
         MockUpdate.de_json.return_value = mock_update
         
-        await service.handle_update({})
+        await service.process_update({})
         
         mock_bot_instance.send_message.assert_called_once()
         args, kwargs = mock_bot_instance.send_message.call_args
@@ -57,7 +58,7 @@ class TestTelegramService(unittest.IsolatedAsyncioTestCase):
         # Mock Repo success
         self.mock_repo.validate_and_consume_code.return_value = "user@test.com"
         
-        await service.handle_update({})
+        await service.process_update({})
         
         self.mock_repo.validate_and_consume_code.assert_called_with("ABC12", 12345, "user1")
         mock_bot_instance.send_message.assert_called_with(
@@ -80,7 +81,7 @@ class TestTelegramService(unittest.IsolatedAsyncioTestCase):
         # Mock Repo fail
         self.mock_repo.validate_and_consume_code.return_value = None
         
-        await service.handle_update({})
+        await service.process_update({})
         
         mock_bot_instance.send_message.assert_called()
         args, kwargs = mock_bot_instance.send_message.call_args
@@ -101,7 +102,7 @@ class TestTelegramService(unittest.IsolatedAsyncioTestCase):
         # Mock Repo: No link found
         self.mock_repo.get_link_by_chat_id.return_value = None
         
-        await service.handle_update({})
+        await service.process_update({})
         
         mock_bot_instance.send_message.assert_called()
         args, kwargs = mock_bot_instance.send_message.call_args
@@ -131,17 +132,17 @@ class TestTelegramService(unittest.IsolatedAsyncioTestCase):
         self.mock_repo.get_link_by_chat_id.return_value = mock_link
         
         # Mock Brain
-        self.mock_brain.send_message_sync.return_value = "AI Response"
+        self.mock_brain.send_message_async.return_value = "AI Response"
         
         # Patch safe_telegram_send to avoid markdown complexity in test
         with patch("src.services.telegram_service.safe_telegram_send") as mock_safe_send:
             mock_safe_send.return_value = ("AI Response Formatted", "MarkdownV2")
             
-            await service.handle_update({})
+            await service.process_update({})
             
             # 1. Processing message sent
             # 2. AI called
-            self.mock_brain.send_message_sync.assert_called_with(
+            self.mock_brain.send_message_async.assert_called_with(
                 user_email="user@test.com",
                 user_input="Hello AI",
                 is_telegram=True,
@@ -155,38 +156,6 @@ class TestTelegramService(unittest.IsolatedAsyncioTestCase):
             # Check deletion of first message
             mock_processing_msg.delete.assert_called_once()
 
-    @patch("src.services.telegram_service.Bot")
-    @patch("src.services.telegram_service.Update")
-    async def test_handle_update_idempotency(self, MockUpdate, MockBot):
-        mock_bot_instance = MockBot.return_value
-        mock_bot_instance.send_message = AsyncMock()
-        service = TelegramBotService(self.mock_token, self.mock_repo, self.mock_brain)
-        
-        mock_update = MagicMock()
-        mock_update.update_id = 123
-        mock_update.message.text = "Hello"
-        mock_update.effective_chat.id = 555
-        MockUpdate.de_json.return_value = mock_update
-        
-        # First call: newly recorded
-        self.mock_repo.try_record_update.return_value = True
-        # Mock Repo: Linked
-        mock_link = MagicMock()
-        mock_link.user_email = "user@test.com"
-        self.mock_repo.get_link_by_chat_id.return_value = mock_link
-        self.mock_brain.send_message_sync.return_value = "Resp"
-
-        await service.handle_update({})
-        self.assertEqual(self.mock_brain.send_message_sync.call_count, 1)
-
-        # Second call: already recorded
-        self.mock_repo.try_record_update.return_value = False
-        await service.handle_update({})
-        
-        # Should still be 1
-        self.assertEqual(self.mock_brain.send_message_sync.call_count, 1)
-        self.assertEqual(self.mock_repo.try_record_update.call_count, 2)
-
     @patch("src.services.telegram_service.Bot")
     @patch("src.services.telegram_service.Update")
     async def test_handle_message_photo_allowed_plan_calls_ai(
@@ -213,21 +182,20 @@ class TestTelegramService(unittest.IsolatedAsyncioTestCase):
         mock_update.effective_chat.id = 12345
         MockUpdate.de_json.return_value = mock_update
 
-        self.mock_repo.try_record_update.return_value = True
         mock_link = MagicMock()
         mock_link.user_email = "user@test.com"
         self.mock_repo.get_link_by_chat_id.return_value = mock_link
         self.mock_brain.get_user_profile.return_value = MagicMock(
             subscription_plan="Pro"
         )
-        self.mock_brain.send_message_sync.return_value = "AI Response"
+        self.mock_brain.send_message_async.return_value = "AI Response"
 
         with patch("src.services.telegram_service.safe_telegram_send") as mock_safe_send:
             mock_safe_send.return_value = ("AI Response", "MarkdownV2")
-            await service.handle_update({})
+            await service.process_update({})
 
-        self.mock_brain.send_message_sync.assert_called_once()
-        kwargs = self.mock_brain.send_message_sync.call_args.kwargs
+        self.mock_brain.send_message_async.assert_called_once()
+        kwargs = self.mock_brain.send_message_async.call_args.kwargs
         self.assertEqual(kwargs["user_email"], "user@test.com")
         self.assertEqual(kwargs["is_telegram"], True)
         self.assertIn("image_payloads", kwargs)
@@ -255,7 +223,6 @@ class TestTelegramService(unittest.IsolatedAsyncioTestCase):
         mock_update.effective_chat.id = 12345
         MockUpdate.de_json.return_value = mock_update
 
-        self.mock_repo.try_record_update.return_value = True
         mock_link = MagicMock()
         mock_link.user_email = "user@test.com"
         self.mock_repo.get_link_by_chat_id.return_value = mock_link
@@ -263,9 +230,9 @@ class TestTelegramService(unittest.IsolatedAsyncioTestCase):
             subscription_plan="Basic"
         )
 
-        await service.handle_update({})
+        await service.process_update({})
 
-        self.mock_brain.send_message_sync.assert_not_called()
+        self.mock_brain.send_message_async.assert_not_called()
         self.assertTrue(mock_bot_instance.send_message.called)
         _, kwargs = mock_bot_instance.send_message.call_args
         self.assertIn("Pro e Premium", kwargs["text"])
@@ -1,3 +1,4 @@
+import io
 from datetime import date
 from src.services.zepp_life_import_service import (
     parse_zepp_life_csv,
@@ -65,8 +66,8 @@ def test_parse_zepp_life_csv_duplicate_logic():
 def test_import_zepp_life_data():
     """Test the full import service function."""
     mock_db = MagicMock()
-    # Setup mock to return (doc_id, is_new)
-    mock_db.save_weight_log.side_effect = [("id1", True), ("id2", False)]
+    # Setup mock to return (created, updated) of the bulk write
+    mock_db.save_weight_logs.return_value = (1, 1)
 
     result = import_zepp_life_data("test@example.com", SAMPLE_CSV, mock_db)
 
@@ -75,14 +76,31 @@ def test_import_zepp_life_data():
     assert result.errors == 0
     assert result.total_days == 2
 
-    # Verify DB calls
-    assert mock_db.save_weight_log.call_count == 2
+    # Verify a single bulk DB call
+    mock_db.save_weight_logs.assert_called_once()
 
-    # Check first call args
-    call_args = mock_db.save_weight_log.call_args_list[0]
-    log = call_args[0][0]
+    # Check first log
+    log = mock_db.save_weight_logs.call_args[0][0][0]
     assert isinstance(log, WeightLog)
     assert log.user_email == "test@example.com"
     assert log.date == date(2025, 1, 1)
     assert log.weight_kg == 80.5
     assert log.source == "zepp_life_import"
+
+
+def test_import_zepp_life_data_reports_invalid_days():
+    """Days failing validation are reported without blocking the others."""
+    csv_content = """time,weight
+2025-01-01 08:00:00,80.0
+2025-13-01 08:00:00,81.0
+"""
+    mock_db = MagicMock()
+    mock_db.save_weight_logs.return_value = (1, 0)
+
+    result = import_zepp_life_data("test@example.com", io.StringIO(csv_content), mock_db)
+
+    assert result.created == 1
+    assert result.errors == 1
+    assert result.total_days == 2
+    assert result.error_messages[0].startswith("Error on 2025-13-01")
+    assert len(mock_db.save_weight_logs.call_args[0][0]) == 1
@@ -0,0 +1,64 @@
+"""Tests for the cursor pagination helpers."""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from src.repositories.base import BaseRepository
+from src.utils.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_cursor,
+    next_page_cursor,
+)
+
+
+def test_cursor_roundtrip_keeps_bson_types():
+    doc_id = ObjectId()
+    token = encode_cursor(datetime(2026, 1, 2, 3, 4), doc_id)
+
+    assert "=" not in token
+    assert decode_cursor(token) == [datetime(2026, 1, 2, 3, 4), doc_id]
+    for bad in ["", "not-a-cursor", encode_cursor()[:-2] + "!!"]:
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(bad)
+
+
+def test_keyset_cursor_accepts_serialized_documents():
+    doc_id = ObjectId()
+
+    token = keyset_cursor({"id": str(doc_id), "date": date(2026, 3, 1)})
+
+    assert decode_cursor(token) == [datetime(2026, 3, 1), doc_id]
+    assert next_page_cursor([{"_id": doc_id, "date": None}], has_more=False) is None
+    assert next_page_cursor([], has_more=True) is None
+
+
+def test_get_keyset_page_filters_after_cursor_and_detects_more():
+    database = MagicMock()
+    repository = BaseRepository(database, "logs")
+    collection = repository.collection
+    docs = [{"_id": ObjectId(), "date": datetime(2026, 1, d)} for d in (9, 8, 7)]
+    collection.find.return_value.sort.return_value.limit.return_value = docs
+    anchor = ObjectId()
+
+    page, has_more = repository.get_keyset_page(
+        {"user_email": "a@x.com"}, page_size=2, cursor=encode_cursor(datetime(2026, 1, 10), anchor)
+    )
+
+    assert page == docs[:2]
+    assert has_more is True
+    query = collection.find.call_args.args[0]
+    assert query["$and"][0] == {"user_email": "a@x.com"}
+    assert query["$and"][1] == {
+        "$or": [
+            {"date": {"$lt": datetime(2026, 1, 10)}},
+            {"date": datetime(2026, 1, 10), "_id": {"$lt": anchor}},
+        ]
+    }
+    collection.find.return_value.sort.assert_called_once_with([("date", -1), ("_id", -1)])
+    collection.find.return_value.sort.return_value.limit.assert_called_once_with(3)
+    collection.count_documents.assert_not_called()
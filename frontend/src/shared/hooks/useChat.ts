@@ -305,6 +305,14 @@ export const useChatStore = create<ChatStore>((set, _get) => ({
             continue;
           }
 
+          if (parsed.event === 'replace') {
+            accumulatedText = parsed.payload.text ?? accumulatedText;
+            set((state) => ({
+              messages: upsertPendingTrainerMessage(state.messages, accumulatedText, true),
+            }));
+            continue;
+          }
+
           if (parsed.event === 'done') {
             sawDoneEvent = true;
             accumulatedText = parsed.payload.text ?? accumulatedText;